@@ -0,0 +1,619 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The backend_benchmarks.py file consists of the offline benchmarks of the insert, select, export, update and  #
+#                           delete paths of every operations class against local stand-ins, measuring the rows per second and the peak #
+#                           RSS of every case in its own subprocess and writing the results as JSON, so that the throughput of two     #
+#                           branches can be compared before deploying.                                                                   #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import argparse
+import datetime
+import functools
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCHMARK_BACKENDS = ["mysql", "sqlserver", "cassandra", "mongodb"]
+BENCHMARK_OPERATIONS = ["single_insert", "bulk_insert", "select", "export", "update", "delete"]
+BENCHMARK_ROW_COUNTS = [10000, 100000, 1000000]
+BENCHMARK_TABLE_NAME = "benchmark_employees"
+BENCHMARK_DATABASE_NAME = "benchmark"
+BENCHMARK_FETCH_SIZE = 10000
+BENCHMARK_SEED_BATCH_SIZE = 10000
+DEFAULT_CASE_TIMEOUT_SECONDS = 1800
+DEFAULT_REGRESSION_TOLERANCE = 0.1
+
+EMPLOYEE_HEADERS = ["emp_id", "emp_name", "emp_salary", "emp_dept"]
+EMPLOYEE_DEPARTMENTS = ["Engineering", "Finance", "Marketing", "Operations", "Sales"]
+
+TABLE_FIELDS = {
+    "mysql": {"emp_id": "INT PRIMARY KEY", "emp_name": "VARCHAR(100)", "emp_salary": "INT", "emp_dept": "VARCHAR(50)"},
+    "sqlserver": {"emp_id": "INT PRIMARY KEY", "emp_name": "VARCHAR(100)", "emp_salary": "INT", "emp_dept": "VARCHAR(50)"},
+    "cassandra": {"emp_id": "int PRIMARY KEY", "emp_name": "text", "emp_salary": "int", "emp_dept": "text"}
+}
+
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Benchmark Case Functions :                                               #
+##########################################################################################################################################
+
+################################################
+#     1) Generate Employee Rows :              #
+################################################
+
+def generate_employee_rows(row_count):
+
+    '''
+
+    Functionality : Generating the employee rows of a benchmark case as lists of string values, the way the rows of an uploaded CSV file
+                    reach the operations classes.
+    :param row_count: The number of rows to be generated.
+    :return: generator --> Yields the row value lists.
+
+    '''
+
+    for idx in range(row_count):
+        yield [str(idx), "employee_" + str(idx), str(30000 + (idx * 7919) % 90000), EMPLOYEE_DEPARTMENTS[idx % len(EMPLOYEE_DEPARTMENTS)]]
+
+
+################################################
+#     2) Open Operations Object :              #
+################################################
+
+def open_operations_object(backend):
+
+    '''
+
+    Functionality : Creating a new operations object of a backend, as every route does for every request. The real servers are connected
+                    to through the BENCHMARK_* environment variables, the stand-ins ignore the connection details.
+    :param backend: The backend to be benchmarked.
+    :return: operations_object
+
+    '''
+
+    if backend == "mysql":
+        from src.mysql_operations import MySqlOperations
+        return MySqlOperations(os.environ.get("BENCHMARK_MYSQL_USER", "root"), os.environ.get("BENCHMARK_MYSQL_PASSWORD", ""),
+                               BENCHMARK_DATABASE_NAME, os.environ.get("BENCHMARK_MYSQL_HOST", "localhost"))
+
+    if backend == "sqlserver":
+        from src.sql_server_operations import MicrosoftSQLServerOperations
+        return MicrosoftSQLServerOperations(os.environ.get("BENCHMARK_SQLSERVER_USER", ""), os.environ.get("BENCHMARK_SQLSERVER_PASSWORD", ""),
+                                            BENCHMARK_DATABASE_NAME, os.environ.get("BENCHMARK_SQLSERVER_SERVER", "localhost"))
+
+    if backend == "cassandra":
+        from src.cassandra_operations import CassandraOperations
+        return CassandraOperations("benchmark", "benchmark", "secure-connect-benchmark.zip", BENCHMARK_DATABASE_NAME)
+
+    from src.mongodb_operations import MongoDBOperations
+    return MongoDBOperations(os.environ.get("BENCHMARK_MONGODB_URI", "mongodb://localhost:27017"), "", "", BENCHMARK_DATABASE_NAME)
+
+
+################################################
+#     3) Prepare Benchmark Table :             #
+################################################
+
+def prepare_benchmark_table(backend, seed_row_count, rows_function):
+
+    '''
+
+    Functionality : Creating an empty benchmark table through the operations class and seeding it with rows outside of the measured section,
+                    using parameterised batches so that the seeding does not dominate the run time of the case.
+    :param backend: The backend to be benchmarked.
+    :param seed_row_count: The number of rows the table needs to hold before the measured operation.
+    :param rows_function: The function generating the given number of employee rows.
+    :return: None
+
+    '''
+
+    if backend == "mongodb":
+
+        operations_object = open_operations_object(backend)
+        collection_object = operations_object.client[BENCHMARK_DATABASE_NAME][BENCHMARK_TABLE_NAME]
+        collection_object.drop()
+
+        batch = []
+
+        for row in rows_function(seed_row_count):
+
+            batch.append(dict(zip(EMPLOYEE_HEADERS, row)))
+
+            if len(batch) == BENCHMARK_SEED_BATCH_SIZE:
+                collection_object.insert_many(batch)
+                batch = []
+
+        if len(batch) > 0:
+            collection_object.insert_many(batch)
+
+        operations_object.client.close()
+        return
+
+    open_operations_object(backend).create_table(BENCHMARK_TABLE_NAME, TABLE_FIELDS[backend])
+
+    if seed_row_count == 0:
+        return
+
+    operations_object = open_operations_object(backend)
+    placeholder = "?" if backend == "sqlserver" else "%s"
+    insert_statement = "INSERT INTO " + BENCHMARK_TABLE_NAME + " (" + ",".join(EMPLOYEE_HEADERS) + ") VALUES (" + \
+                       ",".join([placeholder] * len(EMPLOYEE_HEADERS)) + ")"
+
+    batch = []
+
+    for row in rows_function(seed_row_count):
+
+        batch.append((int(row[0]), row[1], int(row[2]), row[3]))
+
+        if len(batch) == BENCHMARK_SEED_BATCH_SIZE:
+            _seed_batch(backend, operations_object, insert_statement, batch)
+            batch = []
+
+    if len(batch) > 0:
+        _seed_batch(backend, operations_object, insert_statement, batch)
+
+    if backend == "cassandra":
+        operations_object.cluster.shutdown()
+    else:
+        operations_object.conn.commit()
+        operations_object.conn.close()
+
+
+################################################
+#     4) Seed Batch :                          #
+################################################
+
+def _seed_batch(backend, operations_object, insert_statement, batch):
+
+    '''
+
+    Functionality : Writing a batch of seed rows over the connection of an operations object.
+    :param backend: The backend to be benchmarked.
+    :param operations_object: The operations object holding the open connection.
+    :param insert_statement: The parameterised insert statement.
+    :param batch: The list of row value tuples.
+    :return: None
+
+    '''
+
+    if backend == "cassandra":
+
+        for row in batch:
+            operations_object.session.execute(insert_statement, row)
+
+    else:
+        operations_object.cursor.executemany(insert_statement, batch)
+
+
+################################################
+#     5) Run Benchmark Operation :             #
+################################################
+
+def run_benchmark_operation(backend, operation, row_count, rows_function):
+
+    '''
+
+    Functionality : Running the measured operation of a benchmark case the way its route does, opening a new operations object per call.
+    :param backend: The backend to be benchmarked.
+    :param operation: The operation to be benchmarked.
+    :param row_count: The number of rows of the case.
+    :param rows_function: The function generating the given number of employee rows.
+    :return: processed_rows --> The number of rows processed by the operation.
+
+    '''
+
+    if operation == "single_insert":
+
+        for row in rows_function(row_count):
+
+            if backend == "mongodb":
+                open_operations_object(backend).insert_single_record(BENCHMARK_TABLE_NAME, dict(zip(EMPLOYEE_HEADERS, row)))
+            else:
+                open_operations_object(backend).insert_into_table_single_record(BENCHMARK_TABLE_NAME, dict(zip(EMPLOYEE_HEADERS, row)))
+
+        return row_count
+
+    if operation == "bulk_insert":
+
+        if backend == "mongodb":
+            open_operations_object(backend).insert_multiple_records(BENCHMARK_TABLE_NAME, [dict(zip(EMPLOYEE_HEADERS, row))
+                                                                                           for row in rows_function(row_count)])
+        else:
+            open_operations_object(backend).insert_into_table_multiple_records(BENCHMARK_TABLE_NAME, EMPLOYEE_HEADERS,
+                                                                               list(rows_function(row_count)))
+
+        return row_count
+
+    if operation == "select":
+
+        if backend == "mongodb":
+            open_operations_object(backend).select_records(BENCHMARK_TABLE_NAME, {}, {}, "")
+        else:
+            open_operations_object(backend).select_records(BENCHMARK_TABLE_NAME, [], "")
+
+        return row_count
+
+    if operation == "export":
+
+        if backend == "mongodb":
+            batches = open_operations_object(backend).select_records(BENCHMARK_TABLE_NAME, {}, {}, "", BENCHMARK_FETCH_SIZE)
+        else:
+            batches = open_operations_object(backend).select_records(BENCHMARK_TABLE_NAME, [], "", BENCHMARK_FETCH_SIZE)[-1]
+
+        return sum([len(batch[0]) if backend == "cassandra" else len(batch) for batch in batches])
+
+    if operation == "update":
+
+        if backend == "mongodb":
+            open_operations_object(backend).update_records(BENCHMARK_TABLE_NAME, {"emp_dept": "Updated"}, {})
+        else:
+            open_operations_object(backend).update_table(BENCHMARK_TABLE_NAME, {"emp_dept": "Updated"}, [])
+
+        return row_count
+
+    if operation == "delete":
+
+        if backend == "mongodb":
+            open_operations_object(backend).delete_records(BENCHMARK_TABLE_NAME, {})
+        else:
+            open_operations_object(backend).delete_records(BENCHMARK_TABLE_NAME, [])
+
+        return row_count
+
+    raise Exception("The operation " + operation + " is not a known benchmark operation.")
+
+
+################################################
+#     6) Run Benchmark Case :                  #
+################################################
+
+def run_benchmark_case(backend, operation, row_count, rows_function=generate_employee_rows):
+
+    '''
+
+    Functionality : Running a single benchmark case inside the current process, which is expected to be a fresh subprocess, so that its
+                    peak RSS is not inflated by the other cases. The stand-in of the backend is installed, the table is prepared outside of
+                    the measured section and the peak RSS is reset before the measured operation where the platform allows it.
+    :param backend: The backend to be benchmarked.
+    :param operation: The operation to be benchmarked.
+    :param row_count: The number of rows of the case.
+    :param rows_function: The function generating the given number of employee rows.
+    :return: result --> The dictionary of the case measurements.
+
+    '''
+
+    from benchmarks.stand_ins import install_stand_ins
+
+    work_directory = tempfile.mkdtemp(prefix="dbapp_benchmark_")
+    os.environ["DBAPP_DATA_DIRECTORY"] = os.path.join(work_directory, "app_data")
+    os.chdir(work_directory)
+
+    result = {"backend": backend, "operation": operation, "rows": row_count}
+
+    try:
+
+        result["standIn"] = install_stand_ins(backend, work_directory)
+
+        prepare_benchmark_table(backend, 0 if operation in ["single_insert", "bulk_insert"] else row_count, rows_function)
+
+        peak_rss_reset = _reset_peak_rss()
+        start_rss_bytes = _read_rss_bytes("VmRSS")
+        start_time = time.perf_counter()
+
+        processed_rows = run_benchmark_operation(backend, operation, row_count, rows_function)
+
+        elapsed_seconds = time.perf_counter() - start_time
+
+        result.update({
+            "status": "ok",
+            "processedRows": processed_rows,
+            "elapsedSeconds": round(elapsed_seconds, 4),
+            "rowsPerSecond": round(processed_rows / elapsed_seconds, 1) if elapsed_seconds > 0 else None,
+            "startRssBytes": start_rss_bytes,
+            "peakRssBytes": _read_rss_bytes("VmHWM"),
+            "peakRssIncludesSetup": not peak_rss_reset
+        })
+
+    except Exception as e:
+        result.update({"status": "error", "error": type(e).__name__ + " : " + str(e)})
+
+    return result
+
+
+################################################
+#     7) Reset Peak RSS :                      #
+################################################
+
+def _reset_peak_rss():
+
+    '''
+
+    Functionality : Resetting the peak RSS of the current process on Linux, so that the table preparation is not counted in the peak of the
+                    measured operation.
+    :return: reset --> Whether the peak RSS could be reset.
+
+    '''
+
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+        return True
+
+    except OSError:
+        return False
+
+
+################################################
+#     8) Read RSS Bytes :                      #
+################################################
+
+def _read_rss_bytes(field_name):
+
+    '''
+
+    Functionality : Reading the current (VmRSS) or the peak (VmHWM) RSS of the current process, falling back to the peak reported by
+                    getrusage where /proc is not available.
+    :param field_name: The field of /proc/self/status to be read.
+    :return: rss_bytes
+
+    '''
+
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith(field_name + ":"):
+                    return int(line.split()[1]) * 1024
+
+    except OSError:
+        pass
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+################################################
+#     9) Get Rows Function :                   #
+################################################
+
+def get_rows_function(dataset, seed, skew):
+
+    '''
+
+    Functionality : Choosing the function generating the employee rows of the cases, being either the sequential rows, which keep the
+                    reports comparable with the earlier runs, or the synthetic rows of the dataset generator with the given seed and skew.
+    :param dataset: The kind of rows. Possible values are : "sequential" and "synthetic".
+    :param seed: The seed of the synthetic rows.
+    :param skew: The Zipf exponent of the name and department distributions of the synthetic rows.
+    :return: rows_function
+
+    '''
+
+    if dataset == "sequential":
+        return generate_employee_rows
+
+    if dataset != "synthetic":
+        raise Exception("The dataset " + dataset + " is not a known benchmark dataset.")
+
+    from benchmarks.dataset_generator import generate_dataset_rows
+
+    return functools.partial(generate_dataset_rows, seed=seed, skew=skew)
+
+##########################################################################################################################################
+#                                                 End Block : Benchmark Case Functions :                                                 #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Benchmark Suite Functions :                                              #
+##########################################################################################################################################
+
+################################################
+#     10) Run Benchmark Suite :                #
+################################################
+
+def run_benchmark_suite(backends, operations, row_counts, case_timeout, dataset="sequential", seed=0, skew=0.0):
+
+    '''
+
+    Functionality : Running every combination of backend, operation and row count in its own subprocess, collecting their results along
+                    with the metadata identifying the branch being measured.
+    :param backends: The list of backends to be benchmarked.
+    :param operations: The list of operations to be benchmarked.
+    :param row_counts: The list of row counts to be benchmarked.
+    :param case_timeout: The number of seconds after which a case gets stopped and reported as timed out.
+    :param dataset: The kind of rows the cases run with. Possible values are : "sequential" and "synthetic".
+    :param seed: The seed of the synthetic rows.
+    :param skew: The Zipf exponent of the synthetic rows.
+    :return: report --> The dictionary of the metadata and the case results.
+
+    '''
+
+    results = []
+
+    for backend in backends:
+        for operation in operations:
+            for row_count in row_counts:
+
+                print("Running " + backend + " " + operation + " with " + str(row_count) + " rows....", file=sys.stderr, flush=True)
+
+                try:
+                    completed_process = subprocess.run([sys.executable, "-m", "benchmarks.backend_benchmarks", "--case", backend, operation,
+                                                        str(row_count), "--dataset", dataset, "--seed", str(seed), "--skew", str(skew)],
+                                                       cwd=REPOSITORY_DIRECTORY,
+                                                       capture_output=True, text=True, timeout=case_timeout)
+
+                    output_lines = completed_process.stdout.strip().splitlines()
+
+                    if completed_process.returncode != 0 or len(output_lines) == 0:
+                        result = {"backend": backend, "operation": operation, "rows": row_count, "status": "error",
+                                  "error": completed_process.stderr.strip()[-2000:]}
+                    else:
+                        result = json.loads(output_lines[-1])
+
+                except subprocess.TimeoutExpired:
+                    result = {"backend": backend, "operation": operation, "rows": row_count, "status": "timeout",
+                              "error": "The case did not finish within " + str(case_timeout) + " seconds."}
+
+                results.append(result)
+
+    metadata = get_run_metadata()
+    metadata.update({"dataset": dataset, "seed": seed, "skew": skew} if dataset == "synthetic" else {"dataset": dataset})
+
+    return {"metadata": metadata, "results": results}
+
+
+################################################
+#     11) Get Run Metadata :                   #
+################################################
+
+def get_run_metadata():
+
+    '''
+
+    Functionality : Collecting the metadata identifying a benchmark run, so that the results of two branches can be told apart.
+    :return: metadata
+
+    '''
+
+    metadata = {
+        "createdAt": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpuCount": os.cpu_count()
+    }
+
+    for key, command in [("gitCommit", ["git", "rev-parse", "HEAD"]), ("gitBranch", ["git", "rev-parse", "--abbrev-ref", "HEAD"])]:
+
+        try:
+            metadata[key] = subprocess.run(command, cwd=REPOSITORY_DIRECTORY, capture_output=True, text=True, timeout=30).stdout.strip()
+
+        except (OSError, subprocess.SubprocessError):
+            metadata[key] = ""
+
+    return metadata
+
+
+################################################
+#     12) Compare Benchmark Reports :          #
+################################################
+
+def compare_benchmark_reports(baseline_report, current_report, tolerance):
+
+    '''
+
+    Functionality : Comparing the throughput of every case of a run with the same case of a baseline run, flagging the cases whose rows per
+                    second dropped by more than the tolerance, or which stopped succeeding.
+    :param baseline_report: The report of the baseline run.
+    :param current_report: The report of the current run.
+    :param tolerance: The accepted relative drop of the rows per second, such as 0.1 for 10 percent.
+    :return: comparisons, regression_found
+
+    '''
+
+    baseline_results = {(i["backend"], i["operation"], i["rows"]): i for i in baseline_report["results"]}
+    comparisons = []
+    regression_found = False
+
+    for result in current_report["results"]:
+
+        baseline_result = baseline_results.get((result["backend"], result["operation"], result["rows"]))
+
+        if baseline_result is None or baseline_result.get("status") != "ok":
+            continue
+
+        comparison = {"backend": result["backend"], "operation": result["operation"], "rows": result["rows"],
+                      "baselineRowsPerSecond": baseline_result.get("rowsPerSecond"), "rowsPerSecond": result.get("rowsPerSecond"),
+                      "baselinePeakRssBytes": baseline_result.get("peakRssBytes"), "peakRssBytes": result.get("peakRssBytes")}
+
+        if result.get("status") != "ok":
+            comparison["regression"] = True
+
+        else:
+            comparison["throughputChange"] = round(result["rowsPerSecond"] / baseline_result["rowsPerSecond"] - 1, 4)
+            comparison["regression"] = comparison["throughputChange"] < -tolerance
+
+        regression_found = regression_found or comparison["regression"]
+        comparisons.append(comparison)
+
+    return comparisons, regression_found
+
+##########################################################################################################################################
+#                                                 End Block : Benchmark Suite Functions :                                                #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                               Start Block : Driver Code :                                                              #
+##########################################################################################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Benchmarks the insert, select, export, update and delete paths of the operations classes.")
+    parser.add_argument("--backends", default=",".join(BENCHMARK_BACKENDS), help="The comma separated backends to be benchmarked.")
+    parser.add_argument("--operations", default=",".join(BENCHMARK_OPERATIONS), help="The comma separated operations to be benchmarked.")
+    parser.add_argument("--rows", default=",".join([str(i) for i in BENCHMARK_ROW_COUNTS]), help="The comma separated row counts.")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_CASE_TIMEOUT_SECONDS, help="The timeout of every case in seconds.")
+    parser.add_argument("--output", default="", help="The JSON file the report gets written to, instead of the standard output.")
+    parser.add_argument("--baseline", default="", help="The JSON report of a baseline run to compare the throughput with.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_REGRESSION_TOLERANCE, help="The accepted relative throughput drop.")
+    parser.add_argument("--dataset", default="sequential", choices=["sequential", "synthetic"], help="The kind of employee rows.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the synthetic rows.")
+    parser.add_argument("--skew", type=float, default=0.0, help="The Zipf exponent of the names and departments of the synthetic rows.")
+    parser.add_argument("--case", nargs=3, metavar=("BACKEND", "OPERATION", "ROWS"), help=argparse.SUPPRESS)
+
+    arguments = parser.parse_args()
+
+    if arguments.case is not None:
+        print(json.dumps(run_benchmark_case(arguments.case[0], arguments.case[1], int(arguments.case[2]),
+                                            get_rows_function(arguments.dataset, arguments.seed, arguments.skew))))
+        sys.exit(0)
+
+    report = run_benchmark_suite([i.strip() for i in arguments.backends.split(",") if i.strip() != ""],
+                                 [i.strip() for i in arguments.operations.split(",") if i.strip() != ""],
+                                 [int(i) for i in arguments.rows.split(",") if i.strip() != ""], arguments.timeout,
+                                 arguments.dataset, arguments.seed, arguments.skew)
+
+    exit_code = 0
+
+    if arguments.baseline != "":
+
+        with open(arguments.baseline) as file:
+            report["comparisons"], regression_found = compare_benchmark_reports(json.load(file), report, arguments.tolerance)
+
+        exit_code = 1 if regression_found else 0
+
+    if arguments.output != "":
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=4)
+    else:
+        print(json.dumps(report, indent=4))
+
+    sys.exit(exit_code)
+
+##########################################################################################################################################
+#                                               End Block : Driver Code :                                                                #
+##########################################################################################################################################
@@ -0,0 +1,281 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The dataset_generator.py file consists of the generator of the synthetic employee datasets, shaped like the  #
+#                           bundled employee samples, of any size as CSV, JSON array or NDJSON files, optionally gzip or zstd          #
+#                           compressed, the rows being deterministic for a seed and their width and value skew being configurable.    #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import argparse
+import bisect
+import csv
+import gzip
+import io
+import itertools
+import json
+import random
+import sys
+from benchmarks.backend_benchmarks import EMPLOYEE_DEPARTMENTS, EMPLOYEE_HEADERS
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DATASET_FORMATS = {"csv": ".csv", "json": ".json", "ndjson": ".ndjson"}
+DATASET_COMPRESSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+DEFAULT_DATASET_SEED = 0
+DEFAULT_VALUE_WIDTH = 16
+MIN_SALARY = 30000
+MAX_SALARY = 120000
+
+EMPLOYEE_NAMES = ["Navin", "Kushal", "Harry", "Xeno", "Liam", "Rohit", "Manoj", "Aditi", "Priya", "Noah", "Emma", "Olivia", "Arjun",
+                  "Sofia", "Mateo", "Isabella", "Lucas", "Mia", "Ethan", "Ava", "Kabir", "Zara", "Omar", "Yuki", "Chen", "Anika",
+                  "Diego", "Elena", "Farhan", "Grace", "Hiro", "Ines"]
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Dataset Row Functions :                                                  #
+##########################################################################################################################################
+
+################################################
+#     1) Build Dataset Headers :               #
+################################################
+
+def build_dataset_headers(extra_columns=0):
+
+    '''
+
+    Functionality : Building the headers of a synthetic dataset, being the employee fields of the benchmark tables followed by the padding
+                    columns widening every row.
+    :param extra_columns: The number of padding columns.
+    :return: headers
+
+    '''
+
+    return EMPLOYEE_HEADERS + ["emp_attr_" + str(idx + 1) for idx in range(extra_columns)]
+
+
+################################################
+#     2) Build Skewed Weights :                #
+################################################
+
+def build_skewed_weights(value_count, skew):
+
+    '''
+
+    Functionality : Building the cumulative Zipf weights of a list of values, the value at rank k being drawn with a weight of 1 / k^skew,
+                    so that a skew of 0 draws the values uniformly and a higher skew concentrates the rows on the first values.
+    :param value_count: The number of values.
+    :param skew: The Zipf exponent, 0 or above.
+    :return: cumulative_weights
+
+    '''
+
+    if skew < 0:
+        raise Exception("The skew of a dataset cannot be negative.")
+
+    return list(itertools.accumulate([1 / ((idx + 1) ** skew) for idx in range(value_count)]))
+
+
+################################################
+#     3) Generate Dataset Rows :               #
+################################################
+
+def generate_dataset_rows(row_count, seed=DEFAULT_DATASET_SEED, extra_columns=0, value_width=DEFAULT_VALUE_WIDTH, skew=0.0, first_id=0):
+
+    '''
+
+    Functionality : Generating the rows of a synthetic employee dataset as lists of string values, the way the rows of an uploaded CSV file
+                    reach the operations classes. The employee ids are sequential and unique, the names and departments are drawn with
+                    the given skew and the padding columns hold random hexadecimal strings of the given width. The rows only depend on the
+                    seed and the arguments, so that the same dataset can be generated again on another machine, and are generated one at
+                    a time, so that datasets of millions of rows are never held in memory.
+    :param row_count: The number of rows to be generated.
+    :param seed: The seed of the random values, an integer or a string.
+    :param extra_columns: The number of padding columns.
+    :param value_width: The number of characters of every padding value.
+    :param skew: The Zipf exponent of the name and department distributions, 0 for uniform distributions.
+    :param first_id: The employee id of the first row.
+    :return: generator --> Yields the row value lists.
+
+    '''
+
+    random_object = random.Random(seed)
+    name_weights = build_skewed_weights(len(EMPLOYEE_NAMES), skew)
+    department_weights = build_skewed_weights(len(EMPLOYEE_DEPARTMENTS), skew)
+    value_bits = value_width * 4
+
+    for idx in range(row_count):
+
+        row = [str(first_id + idx),
+               EMPLOYEE_NAMES[bisect.bisect_left(name_weights, random_object.random() * name_weights[-1])],
+               str(random_object.randint(MIN_SALARY, MAX_SALARY)),
+               EMPLOYEE_DEPARTMENTS[bisect.bisect_left(department_weights, random_object.random() * department_weights[-1])]]
+
+        for _ in range(extra_columns):
+            row.append("%0*x" % (value_width, random_object.getrandbits(value_bits)))
+
+        yield row
+
+##########################################################################################################################################
+#                                                 End Block : Dataset Row Functions :                                                    #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Dataset Writer Functions :                                               #
+##########################################################################################################################################
+
+################################################
+#     4) Write Dataset :                       #
+################################################
+
+def write_dataset(binary_file, headers, rows, file_format, compression="none"):
+
+    '''
+
+    Functionality : Writing the rows of a dataset into a binary file object as a CSV file with a header line, a JSON array of documents or
+                    newline delimited JSON documents, compressing them on the fly when a compression was chosen. The document values are
+                    kept as strings, the way the bundled MongoDB sample and the CSV to JSON conversion of the application hold them. The
+                    file object is left open, so that an in memory buffer can be read afterwards.
+    :param binary_file: The binary file object the dataset is written to.
+    :param headers: The list of the field headers.
+    :param rows: The iterable of row value lists.
+    :param file_format: The file format. Possible values are : "csv", "json" and "ndjson".
+    :param compression: The compression format. Possible values are : "none", "gzip" and "zstd".
+    :return: row_count --> The number of rows written.
+
+    '''
+
+    if file_format not in DATASET_FORMATS:
+        raise Exception("The dataset format " + file_format + " is not supported.")
+
+    if compression == "gzip":
+        compressed_file = gzip.GzipFile(fileobj=binary_file, mode="wb", compresslevel=6, mtime=0)
+
+    elif compression == "zstd":
+
+        if zstandard is None:
+            raise Exception("The zstd compression requires the zstandard library : pip install zstandard")
+
+        compressed_file = zstandard.ZstdCompressor().stream_writer(binary_file, closefd=False)
+
+    elif compression == "none":
+        compressed_file = None
+
+    else:
+        raise Exception("The dataset compression " + compression + " is not supported.")
+
+    text_file = io.TextIOWrapper(binary_file if compressed_file is None else compressed_file, encoding="utf-8", newline="")
+    row_count = 0
+
+    if file_format == "csv":
+
+        writer = csv.writer(text_file, lineterminator="\n")
+        writer.writerow(headers)
+
+        for row in rows:
+            writer.writerow(row)
+            row_count += 1
+
+    else:
+
+        text_file.write("[" if file_format == "json" else "")
+
+        for row in rows:
+
+            if file_format == "json":
+                text_file.write(("\n" if row_count == 0 else ",\n") + json.dumps(dict(zip(headers, row))))
+            else:
+                text_file.write(json.dumps(dict(zip(headers, row))) + "\n")
+
+            row_count += 1
+
+        text_file.write("\n]\n" if file_format == "json" else "")
+
+    text_file.flush()
+    text_file.detach()
+
+    if compressed_file is not None:
+        compressed_file.close()
+
+    return row_count
+
+
+################################################
+#     5) Encode Dataset :                      #
+################################################
+
+def encode_dataset(headers, rows, file_format, compression="none"):
+
+    '''
+
+    Functionality : Writing the rows of a dataset into memory, for the uploads of the load test.
+    :param headers: The list of the field headers.
+    :param rows: The iterable of row value lists.
+    :param file_format: The file format. Possible values are : "csv", "json" and "ndjson".
+    :param compression: The compression format. Possible values are : "none", "gzip" and "zstd".
+    :return: content, file_extension
+
+    '''
+
+    buffer = io.BytesIO()
+    write_dataset(buffer, headers, rows, file_format, compression)
+
+    return buffer.getvalue(), DATASET_FORMATS[file_format] + DATASET_COMPRESSIONS[compression]
+
+##########################################################################################################################################
+#                                                 End Block : Dataset Writer Functions :                                                 #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                               Start Block : Driver Code :                                                              #
+##########################################################################################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Generates a synthetic employee dataset shaped like the bundled employee samples.")
+    parser.add_argument("--rows", type=int, required=True, help="The number of rows of the dataset.")
+    parser.add_argument("--format", default="csv", choices=list(DATASET_FORMATS.keys()), help="The file format of the dataset.")
+    parser.add_argument("--compression", default="none", choices=list(DATASET_COMPRESSIONS.keys()), help="The compression of the file.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_DATASET_SEED, help="The seed of the random values.")
+    parser.add_argument("--extra-columns", type=int, default=0, help="The number of padding columns widening every row.")
+    parser.add_argument("--value-width", type=int, default=DEFAULT_VALUE_WIDTH, help="The number of characters of every padding value.")
+    parser.add_argument("--skew", type=float, default=0.0, help="The Zipf exponent of the name and department distributions.")
+    parser.add_argument("--first-id", type=int, default=0, help="The employee id of the first row.")
+    parser.add_argument("--output", default="", help="The file the dataset gets written to, named after the rows and format if not given.")
+
+    arguments = parser.parse_args()
+
+    output_path = arguments.output or ("employees_" + str(arguments.rows) + DATASET_FORMATS[arguments.format] +
+                                       DATASET_COMPRESSIONS[arguments.compression])
+
+    with open(output_path, "wb") as file:
+        written_rows = write_dataset(file, build_dataset_headers(arguments.extra_columns),
+                                     generate_dataset_rows(arguments.rows, arguments.seed, arguments.extra_columns, arguments.value_width,
+                                                           arguments.skew, arguments.first_id),
+                                     arguments.format, arguments.compression)
+
+    print("Wrote " + str(written_rows) + " rows to " + output_path, file=sys.stderr)
+
+##########################################################################################################################################
+#                                               End Block : Driver Code :                                                                #
+##########################################################################################################################################
@@ -0,0 +1,761 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The load_test.py file consists of the HTTP load generator replaying the multipart form posts of the routes    #
+#                           of main.py at a configurable concurrency, against the application served with the local stand-in databases #
+#                           or against a running server, and reporting the latency percentiles, error rate and throughput per route.   #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import argparse
+import http.client
+import json
+import math
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from benchmarks.backend_benchmarks import BENCHMARK_DATABASE_NAME, BENCHMARK_TABLE_NAME, EMPLOYEE_DEPARTMENTS, EMPLOYEE_HEADERS, \
+    REPOSITORY_DIRECTORY, TABLE_FIELDS, get_rows_function, get_run_metadata
+from benchmarks.dataset_generator import encode_dataset, generate_dataset_rows
+
+LOAD_TEST_BACKENDS = ["mysql", "sqlserver", "cassandra", "mongodb"]
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5055
+DEFAULT_CONCURRENCY = 8
+DEFAULT_REQUESTS_PER_ROUTE = 20
+DEFAULT_SEED_ROWS = 1000
+DEFAULT_UPLOAD_ROWS = 100
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 300
+SERVER_START_TIMEOUT_SECONDS = 120
+SINGLE_INSERT_ID_OFFSET = 5000000
+MULTIPLE_INSERT_ID_OFFSET = 10000000
+
+FORM_ROUTES = {
+    "create_table": {"mysql": "/create_table/", "sqlserver": "/create_table_sql_server/", "cassandra": "/create_table_cassandra/"},
+    "insert_single": {"mysql": "/insert_table_single_record/", "sqlserver": "/insert_table_single_record_sql_server/",
+                      "cassandra": "/insert_table_single_record_cassandra/", "mongodb": "/insert_table_single_record_mongodb/"},
+    "insert_multiple": {"mysql": "/insert_table_mutliple_records", "sqlserver": "/insert_table_mutliple_records_sql_server",
+                        "cassandra": "/insert_table_mutliple_records_cassandra", "mongodb": "/insert_table_multiple_records_mongodb/"},
+    "download": {"mysql": "/download_table_data/", "sqlserver": "/download_table_data_sql_server/",
+                 "cassandra": "/download_table_data_cassandra/", "mongodb": "/download_table_data_mongodb/"},
+    "delete": {"mysql": "/delete_data_from_table/", "sqlserver": "/delete_data_from_table_sql_server/",
+               "cassandra": "/delete_data_from_table_cassandra/", "mongodb": "/delete_data_from_table_mongodb/"},
+    "update": {"mysql": "/update_table_record/", "sqlserver": "/update_table_record_sql_server/",
+               "cassandra": "/update_table_record_cassandra/", "mongodb": "/update_table_record_mongodb/"},
+    "browse": {"mysql": "/browse_table_data/", "sqlserver": "/browse_table_data_sql_server/",
+               "cassandra": "/browse_table_data_cassandra/", "mongodb": "/browse_table_data_mongodb/"},
+    "preview": {"mysql": "/preview_table_data/", "sqlserver": "/preview_table_data_sql_server/",
+                "cassandra": "/preview_table_data_cassandra/", "mongodb": "/preview_table_data_mongodb/"},
+    "aggregate": {"mysql": "/aggregate_table_data/", "sqlserver": "/aggregate_table_data_sql_server/",
+                  "mongodb": "/aggregate_table_data_mongodb/"},
+    "manage_index": {"mysql": "/manage_index/", "sqlserver": "/manage_index_sql_server/", "cassandra": "/manage_index_cassandra/",
+                     "mongodb": "/manage_index_mongodb/"}
+}
+
+FORM_PAGE_NAMES = {
+    "mysql": ["create_table", "insert_table_single_record", "insert_table_multiple_records", "download_data", "delete_from_table",
+              "update_table"],
+    "sqlserver": ["create_table_sql_server", "insert_table_single_record_sql_server", "insert_table_multiple_records_sql_server",
+                  "download_data_sql_server", "delete_from_table_sql_server", "update_table_sql_server"],
+    "cassandra": ["create_table_cassandra", "insert_table_single_record_cassandra", "insert_table_multiple_records_cassandra",
+                  "download_data_cassandra", "delete_from_table_cassandra", "update_table_cassandra"],
+    "mongodb": ["insert_table_single_record_mongodb", "insert_table_multiple_records_mongodb", "download_data_mongodb",
+                "delete_from_table_mongodb", "update_table_mongodb"]
+}
+
+DB_SELECTED_NAMES = {"mysql": "MySQL", "sqlserver": "Microsoft SQL Server", "cassandra": "Cassandra", "mongodb": "MongoDB"}
+ADMIN_PAGE_ROUTES = ["/", "/metrics", "/admin/index-advice/", "/admin/slow-queries/", "/admin/profiles/"]
+
+TEMPLATE_ERROR_PATTERN = re.compile(r'\[true, "ERROR", ("(?:[^"\\]|\\.)*")\]')
+HTML_TITLE_PATTERN = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Form Scenario Functions :                                                #
+##########################################################################################################################################
+
+################################################
+#     1) Get Connection Fields :               #
+################################################
+
+def get_connection_fields(backend):
+
+    '''
+
+    Functionality : Preparing the connection form fields of a backend, as filled in on its form pages. The real servers are connected to
+                    through the BENCHMARK_* environment variables, the stand-ins ignore the connection details.
+    :param backend: The backend the routes are to be called for.
+    :return: fields
+
+    '''
+
+    if backend == "mysql":
+        return {"username": os.environ.get("BENCHMARK_MYSQL_USER", "root"), "password": os.environ.get("BENCHMARK_MYSQL_PASSWORD", ""),
+                "database_name": BENCHMARK_DATABASE_NAME, "host_name": os.environ.get("BENCHMARK_MYSQL_HOST", "localhost"),
+                "table_name": BENCHMARK_TABLE_NAME}
+
+    if backend == "sqlserver":
+        return {"username": os.environ.get("BENCHMARK_SQLSERVER_USER", ""), "password": os.environ.get("BENCHMARK_SQLSERVER_PASSWORD", ""),
+                "database_name": BENCHMARK_DATABASE_NAME, "server_name": os.environ.get("BENCHMARK_SQLSERVER_SERVER", "localhost"),
+                "table_name": BENCHMARK_TABLE_NAME}
+
+    if backend == "cassandra":
+        return {"clientId": "benchmark", "clientSecret": "benchmark", "keySpaceName": BENCHMARK_DATABASE_NAME,
+                "tableName": BENCHMARK_TABLE_NAME}
+
+    return {"username": "", "password": "", "hostName": os.environ.get("BENCHMARK_MONGODB_URI", "mongodb://localhost:27017"),
+            "databaseName": BENCHMARK_DATABASE_NAME, "collectionName": BENCHMARK_TABLE_NAME}
+
+
+################################################
+#     2) Build Employee Upload :               #
+################################################
+
+def build_employee_upload(backend, first_id, row_count, dataset_options):
+
+    '''
+
+    Functionality : Building the content of an uploaded bulk insert file with the dataset generator, a CSV file with a header line for the
+                    table backends and a JSON or NDJSON file, optionally gzip compressed, for MongoDB, with employee ids starting at the
+                    given id. Every upload gets its own rows, seeded from the dataset seed and its first id.
+    :param backend: The backend the file is uploaded to.
+    :param first_id: The employee id of the first row.
+    :param row_count: The number of rows of the file.
+    :param dataset_options: The dictionary of the seed, skew, MongoDB upload format and MongoDB upload compression of the dataset.
+    :return: content, extension, content_type
+
+    '''
+
+    rows = generate_dataset_rows(row_count, str(dataset_options["seed"]) + ":" + str(first_id), skew=dataset_options["skew"],
+                                 first_id=first_id)
+
+    if backend == "mongodb":
+
+        content, extension = encode_dataset(EMPLOYEE_HEADERS, rows, dataset_options["mongodbFormat"], dataset_options["mongodbCompression"])
+
+        return content, extension, "application/gzip" if dataset_options["mongodbCompression"] == "gzip" else "application/json"
+
+    content, extension = encode_dataset(EMPLOYEE_HEADERS, rows, "csv")
+
+    return content, extension, "text/csv"
+
+
+################################################
+#     3) Build Condition Fields :              #
+################################################
+
+def build_condition_fields(backend, field_name, value):
+
+    '''
+
+    Functionality : Building the filter of a form, as the numbered condition fields for the table backends and as a conditional query for
+                    MongoDB, whose seeded values are stored as strings.
+    :param backend: The backend the form is posted to.
+    :param field_name: The field to be filtered on.
+    :param value: The value the field needs to be equal to.
+    :return: fields
+
+    '''
+
+    if backend == "mongodb":
+        return {"conditionalQuery": json.dumps({field_name: value})}
+
+    return {"fieldName1": field_name, "fieldOperator1": "equals", "fieldValue1": value, "recordOperator1": ""}
+
+
+################################################
+#     4) Build Form Request :                  #
+################################################
+
+def build_form_request(backend, operation, sequence_number, seed_rows, upload_rows, unique_upload_names, dataset_options):
+
+    '''
+
+    Functionality : Building the multipart form post of an operation route, as the form page of the route would submit it. The inserted
+                    employee ids are offset by the sequence number so that the inserts never collide with each other or the seeded rows,
+                    while the uploaded file names are shared between the requests, as they are between users uploading the same file,
+                    unless unique upload names are asked for.
+    :param backend: The backend of the route.
+    :param operation: The operation of the route, as listed in FORM_ROUTES.
+    :param sequence_number: The number of the request among the requests of the route.
+    :param seed_rows: The number of rows the table got seeded with.
+    :param upload_rows: The number of rows of an uploaded bulk insert file.
+    :param unique_upload_names: Whether every request uploads its files under its own file name.
+    :param dataset_options: The dictionary of the options of the uploaded datasets.
+    :return: path, fields, files --> The files map the field names to (file name, content, content type) tuples.
+
+    '''
+
+    fields = get_connection_fields(backend)
+    files = {}
+    table_key = {"mysql": "table_name", "sqlserver": "table_name", "cassandra": "tableName", "mongodb": "collectionName"}[backend]
+    name_suffix = "_" + backend + "_" + operation + "_" + str(sequence_number) if unique_upload_names else ""
+    seeded_id = str(sequence_number % max(seed_rows, 1))
+    department = EMPLOYEE_DEPARTMENTS[sequence_number % len(EMPLOYEE_DEPARTMENTS)]
+
+    if backend == "cassandra":
+        files["connectionBundle"] = ("secure-connect-benchmark" + name_suffix + ".zip", b"PK\x05\x06" + b"\x00" * 18, "application/zip")
+
+    if operation == "create_table":
+
+        fields[table_key] = "load_created_" + str(sequence_number)
+
+        for idx, (field_name, field_type) in enumerate(TABLE_FIELDS[backend].items()):
+            fields["fieldName" + str(idx + 1)] = field_name
+            fields["fieldType" + str(idx + 1)] = field_type
+
+    elif operation == "insert_single":
+
+        row = [str(SINGLE_INSERT_ID_OFFSET + sequence_number), "employee_load_" + str(sequence_number), "45000", department]
+
+        if backend == "mongodb":
+            fields["documentData"] = json.dumps(dict(zip(EMPLOYEE_HEADERS, row)))
+        else:
+            fields.update({header + "_field": value for header, value in zip(EMPLOYEE_HEADERS, row)})
+
+    elif operation == "insert_multiple":
+
+        content, extension, content_type = build_employee_upload(backend, MULTIPLE_INSERT_ID_OFFSET + sequence_number * upload_rows,
+                                                                 upload_rows, dataset_options)
+
+        if backend == "mongodb":
+            files["documentFile"] = ("employees" + name_suffix + extension, content, content_type)
+        else:
+            fields["includeHeaders"] = "on"
+            files["insert_file"] = ("employees" + name_suffix + extension, content, content_type)
+
+    elif operation == "download":
+
+        fields["rowLimit"] = "100"
+        fields.update(build_condition_fields(backend, "emp_dept", department))
+
+        if backend == "mongodb":
+            fields["projectionQuery"] = ""
+
+    elif operation == "delete":
+
+        fields.update(build_condition_fields(backend, "emp_id", str(max(seed_rows - 1 - sequence_number, 0))))
+
+    elif operation == "update":
+
+        fields.update(build_condition_fields(backend, "emp_id", seeded_id))
+
+        if backend == "mongodb":
+            fields["updateFieldData"] = json.dumps({"emp_salary": str(50000 + sequence_number)})
+        else:
+            fields["emp_salary_field"] = str(50000 + sequence_number)
+
+    elif operation in ["browse", "preview"]:
+
+        fields["pageSize"] = "100"
+        fields.update(build_condition_fields(backend, "emp_dept", department))
+
+    elif operation == "aggregate":
+
+        fields["groupByFields"] = "emp_dept"
+        fields["aggregations"] = "count(*), sum(emp_salary)"
+
+    elif operation == "manage_index":
+
+        fields.update({"action": "create", "indexName": "load_idx_" + str(sequence_number), "indexFields": "emp_dept"})
+
+    return FORM_ROUTES[operation][backend], fields, files
+
+
+################################################
+#     5) Build Route Scenarios :               #
+################################################
+
+def build_route_scenarios(backends, seed_rows, upload_rows, unique_upload_names, dataset_options, route_filter=""):
+
+    '''
+
+    Functionality : Building the scenarios of every route of main.py for the given backends, being the form posts of the operation and API
+                    routes, the form pages, the home page redirect and the admin and metrics pages.
+    :param backends: The list of backends whose routes are to be called.
+    :param seed_rows: The number of rows the tables got seeded with.
+    :param upload_rows: The number of rows of an uploaded bulk insert file.
+    :param unique_upload_names: Whether every request uploads its files under its own file name.
+    :param dataset_options: The dictionary of the options of the uploaded datasets.
+    :param route_filter: The substring the route names need to contain, if required.
+    :return: scenarios --> The list of (route name, request builder) tuples, the builder taking the sequence number of the request and
+                           returning the method, path, fields and files of the request.
+
+    '''
+
+    scenarios = []
+
+    for backend in backends:
+
+        for operation, routes in FORM_ROUTES.items():
+
+            if backend in routes:
+                scenarios.append((routes[backend], lambda sequence_number, backend=backend, operation=operation:
+                                  ("POST",) + build_form_request(backend, operation, sequence_number, seed_rows, upload_rows,
+                                                                 unique_upload_names, dataset_options)))
+
+        for page_name in FORM_PAGE_NAMES[backend]:
+
+            path = "/dboperation/" + urllib.parse.quote(DB_SELECTED_NAMES[backend]) + "/" + page_name + "/"
+            scenarios.append((path, lambda sequence_number, path=path: ("GET", path, {}, {})))
+
+    scenarios.append(("/response", lambda sequence_number: ("POST", "/response", {"dbtype": "MySQL", "dbActiontype": "SELECT"}, {})))
+
+    for path in ADMIN_PAGE_ROUTES:
+        scenarios.append((path, lambda sequence_number, path=path: ("GET", path, {}, {})))
+
+    return [i for i in scenarios if route_filter in i[0]]
+
+##########################################################################################################################################
+#                                                 End Block : Form Scenario Functions :                                                  #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Load Generator Functions :                                               #
+##########################################################################################################################################
+
+################################################
+#     6) Encode Multipart Form :               #
+################################################
+
+def encode_multipart_form(fields, files):
+
+    '''
+
+    Functionality : Encoding the form fields and files as a multipart/form-data body, the way a browser posts the forms of the application.
+    :param fields: The dictionary of the form field values.
+    :param files: The dictionary of the (file name, content, content type) tuples of the file fields.
+    :return: body, content_type
+
+    '''
+
+    boundary = uuid.uuid4().hex
+    parts = []
+
+    for name, value in fields.items():
+        parts.append(("--" + boundary + "\r\nContent-Disposition: form-data; name=\"" + name + "\"\r\n\r\n").encode("utf-8") +
+                     str(value).encode("utf-8") + b"\r\n")
+
+    for name, (file_name, content, content_type) in files.items():
+        parts.append(("--" + boundary + "\r\nContent-Disposition: form-data; name=\"" + name + "\"; filename=\"" + file_name +
+                      "\"\r\nContent-Type: " + content_type + "\r\n\r\n").encode("utf-8") + content + b"\r\n")
+
+    parts.append(("--" + boundary + "--\r\n").encode("utf-8"))
+
+    return b"".join(parts), "multipart/form-data; boundary=" + boundary
+
+
+################################################
+#     7) Send Request :                        #
+################################################
+
+def send_request(base_url, method, path, fields, files, timeout):
+
+    '''
+
+    Functionality : Sending a request and reading its whole response body, so that the latency of the streamed downloads covers the full
+                    download. A request counts as failed on a connection error, on an HTTP error status, and on a page rendered with an
+                    ERROR status, as the routes of the HTML forms report their failures with a 200 response.
+    :param base_url: The URL of the application.
+    :param method: The HTTP method of the request.
+    :param path: The path of the route.
+    :param fields: The dictionary of the form field values.
+    :param files: The dictionary of the file fields.
+    :param timeout: The number of seconds after which the request is given up.
+    :return: result --> The dictionary of the elapsed seconds, response status, error kind and error message of the request.
+
+    '''
+
+    body, content_type = encode_multipart_form(fields, files) if method == "POST" else (None, None)
+    request_object = urllib.request.Request(base_url + path, data=body, method=method,
+                                            headers={"Content-Type": content_type} if content_type is not None else {})
+
+    start_time = time.perf_counter()
+
+    try:
+
+        with urllib.request.urlopen(request_object, timeout=timeout) as response:
+            status_code = response.status
+            content_type = response.headers.get("Content-Type", "")
+            response_body = response.read()
+
+        result = {"elapsedSeconds": time.perf_counter() - start_time, "status": status_code, "bytes": len(response_body), "error": None}
+
+        if content_type.startswith("text/html"):
+
+            error_match = TEMPLATE_ERROR_PATTERN.search(response_body.decode("utf-8", "replace"))
+
+            if error_match is not None:
+                result.update({"error": "page error", "message": json.loads(error_match.group(1))})
+
+        return result
+
+    except urllib.error.HTTPError as e:
+
+        response_body = e.read().decode("utf-8", "replace")
+
+        try:
+            message = json.loads(response_body).get("message", "")
+        except ValueError:
+            title_match = HTML_TITLE_PATTERN.search(response_body)
+            message = title_match.group(1) if title_match is not None else response_body[:500]
+
+        return {"elapsedSeconds": time.perf_counter() - start_time, "status": e.code, "bytes": len(response_body),
+                "error": "http " + str(e.code), "message": message}
+
+    except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+
+        return {"elapsedSeconds": time.perf_counter() - start_time, "status": None, "bytes": 0, "error": "connection",
+                "message": type(e).__name__ + " : " + str(e)}
+
+
+################################################
+#     8) Run Load Test :                       #
+################################################
+
+def run_load_test(base_url, scenarios, requests_per_route, concurrency, timeout):
+
+    '''
+
+    Functionality : Replaying the requests of every route from a pool of concurrent clients. The requests of the routes are interleaved, so
+                    that the routes run alongside each other as they do under real traffic.
+    :param base_url: The URL of the application.
+    :param scenarios: The list of (route name, request builder) tuples.
+    :param requests_per_route: The number of requests to be sent to every route.
+    :param concurrency: The number of concurrent clients.
+    :param timeout: The number of seconds after which a request is given up.
+    :return: results, elapsed_seconds --> The results map the route names to the lists of request results.
+
+    '''
+
+    results = {route: [] for route, _ in scenarios}
+    results_lock = threading.Lock()
+
+    def run_request(route, builder, sequence_number):
+
+        start_time = time.perf_counter()
+
+        try:
+            method, path, fields, files = builder(sequence_number)
+            result = send_request(base_url, method, path, fields, files, timeout)
+
+        except Exception as e:
+            result = {"elapsedSeconds": time.perf_counter() - start_time, "status": None, "bytes": 0, "error": "client",
+                      "message": type(e).__name__ + " : " + str(e)}
+
+        result["startedAt"] = time.perf_counter() - result["elapsedSeconds"]
+
+        with results_lock:
+            results[route].append(result)
+
+    start_time = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+        for sequence_number in range(requests_per_route):
+            for route, builder in scenarios:
+                executor.submit(run_request, route, builder, sequence_number)
+
+    return results, time.perf_counter() - start_time
+
+
+################################################
+#     9) Summarise Results :                   #
+################################################
+
+def summarise_results(results, elapsed_seconds):
+
+    '''
+
+    Functionality : Summarising the request results of every route into its latency percentiles, error rate and throughput, the
+                    throughput being measured over the span between the first request start and the last response of the route.
+    :param results: The dictionary of the request results of every route.
+    :param elapsed_seconds: The duration of the whole load test in seconds.
+    :return: summary --> The list of the route summaries along with the total.
+
+    '''
+
+    summary = []
+
+    for route, route_results in list(results.items()) + [("TOTAL", [i for j in results.values() for i in j])]:
+
+        if len(route_results) == 0:
+            continue
+
+        latencies = sorted([i["elapsedSeconds"] for i in route_results])
+        errors = [i for i in route_results if i["error"] is not None]
+        error_kinds = {}
+
+        for error in errors:
+            error_kinds[error["error"]] = error_kinds.get(error["error"], 0) + 1
+
+        if route == "TOTAL":
+            span_seconds = elapsed_seconds
+        else:
+            span_seconds = max([i["startedAt"] + i["elapsedSeconds"] for i in route_results]) - min([i["startedAt"] for i in route_results])
+
+        summary.append({
+            "route": route,
+            "requests": len(route_results),
+            "errors": len(errors),
+            "errorRate": round(len(errors) / len(route_results), 4),
+            "p50Seconds": round(_percentile(latencies, 0.50), 4),
+            "p95Seconds": round(_percentile(latencies, 0.95), 4),
+            "p99Seconds": round(_percentile(latencies, 0.99), 4),
+            "maxSeconds": round(latencies[-1], 4),
+            "requestsPerSecond": round(len(route_results) / span_seconds, 2) if span_seconds > 0 else None,
+            "errorKinds": error_kinds,
+            "firstError": errors[0].get("message", "")[:500] if len(errors) > 0 else ""
+        })
+
+    return summary
+
+
+################################################
+#     10) Percentile :                         #
+################################################
+
+def _percentile(sorted_values, percentile):
+
+    '''
+
+    Functionality : Calculating the nearest rank percentile of the sorted values.
+    :param sorted_values: The ascending sorted list of values.
+    :param percentile: The percentile between 0 and 1.
+    :return: value
+
+    '''
+
+    return sorted_values[max(int(math.ceil(percentile * len(sorted_values))) - 1, 0)]
+
+
+################################################
+#     11) Print Summary :                      #
+################################################
+
+def print_summary(summary):
+
+    '''
+
+    Functionality : Printing the route summaries as a table, followed by the first error message of every failing route.
+    :param summary: The list of the route summaries.
+    :return: None
+
+    '''
+
+    route_width = max([len(i["route"]) for i in summary] + [5])
+
+    print("ROUTE".ljust(route_width) + "  REQS  ERR%     P50(s)   P95(s)   P99(s)   REQ/S")
+
+    for item in summary:
+        print(item["route"].ljust(route_width) + "  " + str(item["requests"]).rjust(4) + "  " +
+              ("%5.1f" % (item["errorRate"] * 100)) + "  " +
+              "".join([("%9.3f" % item[i]) for i in ["p50Seconds", "p95Seconds", "p99Seconds"]]) +
+              "  " + ("%6.2f" % item["requestsPerSecond"] if item["requestsPerSecond"] is not None else "     -"))
+
+    for item in summary:
+        if item["route"] != "TOTAL" and item["errors"] > 0:
+            print("\n" + item["route"] + " " + json.dumps(item["errorKinds"]) + " : " + item["firstError"])
+
+##########################################################################################################################################
+#                                                 End Block : Load Generator Functions :                                                 #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Stand-in Server Functions :                                              #
+##########################################################################################################################################
+
+################################################
+#     12) Serve Application :                  #
+################################################
+
+def serve_application(host, port, backends, seed_rows, seed, skew):
+
+    '''
+
+    Functionality : Serving the application with the threaded Flask server from a temporary working directory, after installing the local
+                    stand-ins of the backends and seeding their benchmark tables with synthetic rows. A backend whose driver or stand-in
+                    is not available is left out, so that its routes get reported with their errors instead of stopping the load test.
+    :param host: The host the server listens on.
+    :param port: The port the server listens on.
+    :param backends: The list of backends to be prepared.
+    :param seed_rows: The number of rows the benchmark tables are to be seeded with.
+    :param seed: The seed of the synthetic rows.
+    :param skew: The Zipf exponent of the names and departments of the synthetic rows.
+    :return: None
+
+    '''
+
+    from benchmarks.stand_ins import install_stand_ins
+    from benchmarks.backend_benchmarks import prepare_benchmark_table
+
+    work_directory = tempfile.mkdtemp(prefix="dbapp_load_test_")
+    os.environ["DBAPP_DATA_DIRECTORY"] = os.path.join(work_directory, "app_data")
+    os.chdir(work_directory)
+
+    for backend in backends:
+
+        try:
+            stand_in = install_stand_ins(backend, work_directory)
+            prepare_benchmark_table(backend, seed_rows, get_rows_function("synthetic", seed, skew))
+            print("Prepared " + backend + " with " + stand_in + " in " + work_directory, file=sys.stderr, flush=True)
+
+        except Exception as e:
+            print("The backend " + backend + " could not be prepared : " + type(e).__name__ + " : " + str(e), file=sys.stderr, flush=True)
+
+    import main
+
+    # The routes write their download files into the working directory but send_file resolves relative paths against the application
+    # root, so the root is moved to the working directory, keeping the templates and static files of the repository.
+    main.app.template_folder = os.path.join(REPOSITORY_DIRECTORY, "templates")
+    main.app.static_folder = os.path.join(REPOSITORY_DIRECTORY, "static")
+    main.app.root_path = work_directory
+
+    main.app.run(host=host, port=port, threaded=True)
+
+
+################################################
+#     13) Start Stand-in Server :              #
+################################################
+
+def start_stand_in_server(host, port, backends, seed_rows, seed, skew):
+
+    '''
+
+    Functionality : Starting the stand-in server in a subprocess and waiting until it accepts connections. The server output is written to
+                    a log file, whose path is returned so that it can be looked into after the run.
+    :param host: The host the server listens on.
+    :param port: The port the server listens on.
+    :param backends: The list of backends to be prepared.
+    :param seed_rows: The number of rows the benchmark tables are to be seeded with.
+    :param seed: The seed of the synthetic rows.
+    :param skew: The Zipf exponent of the names and departments of the synthetic rows.
+    :return: process, log_path
+
+    '''
+
+    log_file = tempfile.NamedTemporaryFile(prefix="dbapp_load_test_server_", suffix=".log", delete=False)
+
+    process = subprocess.Popen([sys.executable, "-m", "benchmarks.load_test", "--serve", "--host", host, "--port", str(port),
+                                "--backends", ",".join(backends), "--seed-rows", str(seed_rows), "--seed", str(seed), "--skew", str(skew)],
+                               cwd=REPOSITORY_DIRECTORY, stdout=log_file, stderr=subprocess.STDOUT)
+    log_file.close()
+
+    deadline = time.time() + SERVER_START_TIMEOUT_SECONDS
+
+    while time.time() < deadline:
+
+        if process.poll() is not None:
+            with open(log_file.name) as file:
+                raise Exception("The stand-in server exited during its startup : " + file.read()[-2000:])
+
+        try:
+            socket.create_connection((host, port), timeout=1).close()
+            return process, log_file.name
+
+        except OSError:
+            time.sleep(0.5)
+
+    process.terminate()
+    raise Exception("The stand-in server did not start within " + str(SERVER_START_TIMEOUT_SECONDS) + " seconds.")
+
+##########################################################################################################################################
+#                                                 End Block : Stand-in Server Functions :                                                #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                               Start Block : Driver Code :                                                              #
+##########################################################################################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Replays the form posts of every route of the application at a configurable concurrency.")
+    parser.add_argument("--url", default="", help="The URL of a running application, instead of starting the stand-in server.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="The host of the stand-in server.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="The port of the stand-in server.")
+    parser.add_argument("--backends", default=",".join(LOAD_TEST_BACKENDS), help="The comma separated backends whose routes are called.")
+    parser.add_argument("--routes", default="", help="The substring the called route names need to contain.")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="The number of concurrent clients.")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS_PER_ROUTE, help="The number of requests sent to every route.")
+    parser.add_argument("--seed-rows", type=int, default=DEFAULT_SEED_ROWS, help="The number of rows the tables are seeded with.")
+    parser.add_argument("--upload-rows", type=int, default=DEFAULT_UPLOAD_ROWS, help="The number of rows of an uploaded file.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the seeded and uploaded synthetic rows.")
+    parser.add_argument("--skew", type=float, default=0.0, help="The Zipf exponent of the names and departments of the synthetic rows.")
+    parser.add_argument("--mongodb-upload-format", default="json", choices=["json", "ndjson"], help="The format of the MongoDB uploads.")
+    parser.add_argument("--mongodb-upload-compression", default="none", choices=["none", "gzip"],
+                        help="The compression of the MongoDB uploads.")
+    parser.add_argument("--unique-upload-names", action="store_true", help="Uploads every file under its own file name.")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_REQUEST_TIMEOUT_SECONDS, help="The timeout of every request in seconds.")
+    parser.add_argument("--output", default="", help="The JSON file the report gets written to, in addition to the printed summary.")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+
+    arguments = parser.parse_args()
+    backends = [i.strip() for i in arguments.backends.split(",") if i.strip() != ""]
+
+    if arguments.serve:
+        serve_application(arguments.host, arguments.port, backends, arguments.seed_rows, arguments.seed, arguments.skew)
+        sys.exit(0)
+
+    server_process = None
+    base_url = arguments.url.rstrip("/")
+
+    if base_url == "":
+        server_process, server_log_path = start_stand_in_server(arguments.host, arguments.port, backends, arguments.seed_rows,
+                                                                arguments.seed, arguments.skew)
+        base_url = "http://" + arguments.host + ":" + str(arguments.port)
+        print("The stand-in server is logging to " + server_log_path, file=sys.stderr, flush=True)
+
+    try:
+        dataset_options = {"seed": arguments.seed, "skew": arguments.skew, "mongodbFormat": arguments.mongodb_upload_format,
+                           "mongodbCompression": arguments.mongodb_upload_compression}
+        scenarios = build_route_scenarios(backends, arguments.seed_rows, arguments.upload_rows, arguments.unique_upload_names,
+                                          dataset_options, arguments.routes)
+        results, elapsed_seconds = run_load_test(base_url, scenarios, arguments.requests, arguments.concurrency, arguments.timeout)
+
+    finally:
+        if server_process is not None:
+            server_process.terminate()
+            server_process.wait()
+
+    summary = summarise_results(results, elapsed_seconds)
+    print_summary(summary)
+
+    if arguments.output != "":
+
+        report = {"metadata": get_run_metadata(), "settings": vars(arguments), "elapsedSeconds": round(elapsed_seconds, 3),
+                  "routes": summary}
+
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=4)
+
+##########################################################################################################################################
+#                                               End Block : Driver Code :                                                                #
+##########################################################################################################################################
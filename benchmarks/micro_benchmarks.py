@@ -0,0 +1,569 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The micro_benchmarks.py file consists of the micro benchmarks of the filter and query builders and of the CSV #
+#                           and JSON parsing functions run on every request, measuring the time and the traced allocations per call    #
+#                           over representative inputs, along with a comparison mode running the same cases against a baseline git    #
+#                           revision of the source tree.                                                                                 #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import argparse
+import csv
+import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_RUN_SECONDS = 0.2
+DEFAULT_REGRESSION_TOLERANCE = 0.1
+CONDITION_COUNT = 20
+WIDE_CSV_COLUMNS = 100
+WIDE_CSV_ROWS = 10000
+NARROW_CSV_ROWS = 100000
+DEEP_JSON_DEPTH = 50
+FLAT_JSON_DOCUMENTS = 10000
+
+CONDITION_OPERATORS = ["equals", "not equals", "greater than", "greater than equals", "less than", "less than equals", "like", "in"]
+
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Micro Benchmark Input Functions :                                        #
+##########################################################################################################################################
+
+################################################
+#     1) Build Conditional Fields :            #
+################################################
+
+def build_conditional_fields(condition_count, integer_values=False):
+
+    '''
+
+    Functionality : Building a list of conditional fields as prepared from the form of a download or delete route, cycling through all the
+                    supported operators.
+    :param condition_count: The number of conditional fields.
+    :param integer_values: Whether the values need to be integers, for the operators compared against integer columns.
+    :return: conditional_fields
+
+    '''
+
+    conditional_fields = []
+
+    for idx in range(condition_count):
+
+        operator_name = CONDITION_OPERATORS[idx % len(CONDITION_OPERATORS)]
+
+        if integer_values and operator_name in ["not equals", "like"]:
+            operator_name = "equals"
+
+        if operator_name == "in":
+            value = ",".join([str(idx * 10 + i) for i in range(5)])
+        else:
+            value = str(idx * 10)
+
+        conditional_fields.append(["field_" + str(idx), operator_name, value, "AND" if idx != condition_count - 1 else ""])
+
+    return conditional_fields
+
+
+################################################
+#     2) Write CSV Fixture :                   #
+################################################
+
+def write_csv_fixture(file_path, column_count, row_count):
+
+    '''
+
+    Functionality : Writing a CSV file with a header row and the given number of columns and rows of mixed text and number values.
+    :param file_path: The path of the CSV file to be written.
+    :param column_count: The number of columns.
+    :param row_count: The number of rows after the header row.
+    :return: file_path
+
+    '''
+
+    with open(file_path, "w", encoding="utf-8", newline="") as file:
+
+        writer_object = csv.writer(file)
+        writer_object.writerow(["column_" + str(i) for i in range(column_count)])
+
+        for row_idx in range(row_count):
+            writer_object.writerow([str(row_idx * column_count + i) if i % 2 == 0 else "value, " + str(row_idx) + " of " + str(i)
+                                    for i in range(column_count)])
+
+    return file_path
+
+
+################################################
+#     3) Build Deep JSON String :              #
+################################################
+
+def build_deep_json_string(depth):
+
+    '''
+
+    Functionality : Building the JSON text of a document nested to the given depth, with a small list and a few scalar fields at every level,
+                    as sent in the conditional and projection fields of the MongoDB routes.
+    :param depth: The nesting depth of the document.
+    :return: json_string
+
+    '''
+
+    document = {"leaf": True}
+
+    for level in range(depth):
+        document = {"level": level, "name": "level_" + str(level), "values": [level, level + 1, level + 2], "child": document}
+
+    return json.dumps(document)
+
+##########################################################################################################################################
+#                                                 End Block : Micro Benchmark Input Functions :                                          #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Micro Benchmark Case Functions :                                         #
+##########################################################################################################################################
+
+################################################
+#     4) Build Micro Benchmark Cases :         #
+################################################
+
+def build_micro_benchmark_cases(work_directory):
+
+    '''
+
+    Functionality : Preparing the inputs of every micro benchmark case and returning the functions to be measured. The cases going through
+                    an operations class run against the SQLite stand-in of the backend, with an empty table, and are left out when the
+                    driver of the backend is not installed.
+    :param work_directory: The directory where the input files are written.
+    :return: cases --> The dictionary of case names and the functions running a single call.
+
+    '''
+
+    from src.query_operations import QueryOperations
+    from src.file_operations import FileOperations
+
+    query_object = QueryOperations()
+    file_object = FileOperations()
+
+    conditional_fields = build_conditional_fields(CONDITION_COUNT)
+    integer_conditional_fields = build_conditional_fields(CONDITION_COUNT, integer_values=True)
+    field_types = {"field_" + str(i): "int" for i in range(CONDITION_COUNT)}
+
+    wide_csv_path = write_csv_fixture(os.path.join(work_directory, "wide.csv"), WIDE_CSV_COLUMNS, WIDE_CSV_ROWS)
+    narrow_csv_path = write_csv_fixture(os.path.join(work_directory, "narrow.csv"), 4, NARROW_CSV_ROWS)
+    wide_headers, wide_values = file_object.readCSVFile(wide_csv_path, "on")
+    narrow_headers, narrow_values = file_object.readCSVFile(narrow_csv_path, "on")
+
+    deep_json_string = build_deep_json_string(DEEP_JSON_DEPTH)
+    flat_json_string = json.dumps([{"emp_id": i, "emp_name": "employee_" + str(i), "emp_salary": 30000 + i, "emp_dept": "Sales"}
+                                   for i in range(FLAT_JSON_DOCUMENTS)])
+
+    cases = {
+        "query.build_sql_conditional_string[20 conditions]":
+            lambda: query_object.build_sql_conditional_string(conditional_fields, "%s"),
+        "query.build_cql_conditional_string[20 conditions]":
+            lambda: query_object.build_cql_conditional_string(integer_conditional_fields, field_types),
+        "query.build_keyset_condition[4 key fields]":
+            lambda: query_object.build_keyset_condition(["a", "b", "c", "d"], [1, 2, 3, 4], "%s"),
+        "query.build_mongo_aggregation_pipeline[4 groups, 5 aggregations]":
+            lambda: query_object.build_mongo_aggregation_pipeline({"age": {"$gt": 30}}, ["a", "b.c", "d", "e"],
+                                                                  [(i, "salary", i.lower() + "_salary") for i in ["COUNT", "SUM", "AVG", "MIN", "MAX"]]),
+        "file.readCSVFile[100 columns x 10k rows]": lambda: file_object.readCSVFile(wide_csv_path, "on"),
+        "file.readCSVFile[4 columns x 100k rows]": lambda: file_object.readCSVFile(narrow_csv_path, "on"),
+        "file.csvToJson[100 columns x 10k rows]": lambda: file_object.csvToJson(wide_csv_path),
+        "file.csvToJson[4 columns x 100k rows]": lambda: file_object.csvToJson(narrow_csv_path),
+        "file.convertStringToJson[depth 50]": lambda: file_object.convertStringToJson(deep_json_string),
+        "file.convertStringToJson[10k documents]": lambda: file_object.convertStringToJson(flat_json_string),
+        "file.writeToCSV[100 columns x 10k rows]":
+            lambda: file_object.writeToCSV(os.path.join(work_directory, "written_wide.csv"), wide_values, wide_headers),
+        "file.writeToCSV[4 columns x 100k rows]":
+            lambda: file_object.writeToCSV(os.path.join(work_directory, "written_narrow.csv"), narrow_values, narrow_headers)
+    }
+
+    cases.update(_build_where_builder_cases(work_directory, conditional_fields, integer_conditional_fields))
+
+    return cases
+
+
+################################################
+#     5) Build WHERE Builder Cases :           #
+################################################
+
+def _build_where_builder_cases(work_directory, conditional_fields, integer_conditional_fields):
+
+    '''
+
+    Functionality : Preparing the cases of the WHERE clauses concatenated inside the select and delete operations, which cannot be called
+                    on their own, by running the operations against an empty table of the SQLite stand-ins. The index advisor and the
+                    slow query log are turned off, so that the measured time is the clause building and the connection to the stand-in.
+    :param work_directory: The directory holding the SQLite database files of the stand-ins.
+    :param conditional_fields: The list of conditional fields with text values.
+    :param integer_conditional_fields: The list of conditional fields with integer values, for the integer columns of Cassandra.
+    :return: cases
+
+    '''
+
+    from benchmarks.stand_ins import install_stand_ins
+
+    os.environ["DBAPP_INDEX_ADVISOR_ENABLED"] = "false"
+    os.environ["DBAPP_SLOW_QUERY_LOG_ENABLED"] = "false"
+
+    column_string = ", ".join(["field_" + str(i) + " int" for i in range(CONDITION_COUNT)])
+    cases = {}
+
+    for backend in ["mysql", "cassandra"]:
+
+        try:
+            install_stand_ins(backend, work_directory)
+
+        except ImportError:
+            print("Skipping the " + backend + " WHERE builder case as its driver is not installed....", file=sys.stderr)
+            continue
+
+        import sqlite3
+
+        with sqlite3.connect(os.path.join(work_directory, backend + ".sqlite")) as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS micro_benchmark (" + column_string.replace("field_0 int", "field_0 int PRIMARY KEY") + ")")
+
+        if backend == "mysql":
+
+            from src.mysql_operations import MySqlOperations
+
+            cases["mysql.select_records[20 conditions, empty table]"] = \
+                lambda: MySqlOperations("root", "", "benchmark", "localhost").select_records("micro_benchmark", conditional_fields, "")
+
+        else:
+
+            from src.cassandra_operations import CassandraOperations
+
+            cases["cassandra.select_records[20 conditions, empty table]"] = \
+                lambda: CassandraOperations("benchmark", "benchmark", "secure-connect-benchmark.zip", "benchmark").select_records(
+                    "micro_benchmark", [i for i in integer_conditional_fields if i[1] != "in"], "")
+
+    return cases
+
+
+################################################
+#     6) Measure Micro Benchmark Case :        #
+################################################
+
+def measure_micro_benchmark_case(case_function, repeat, min_run_seconds):
+
+    '''
+
+    Functionality : Measuring a case by calling it in loops of a calibrated number of calls lasting at least the minimum run time, repeated
+                    the given number of times, followed by a single traced call measuring the peak of the traced allocations and the
+                    number of memory blocks allocated by the call and still alive at its end, including its result.
+    :param case_function: The function running a single call of the case.
+    :param repeat: The number of measured loops.
+    :param min_run_seconds: The minimum duration of a measured loop.
+    :return: measurements
+
+    '''
+
+    case_function()
+
+    loop_calls = 1
+
+    while True:
+
+        start_time = time.perf_counter()
+
+        for _ in range(loop_calls):
+            case_function()
+
+        if time.perf_counter() - start_time >= min_run_seconds or loop_calls >= 1000000:
+            break
+
+        loop_calls *= 2
+
+    call_seconds = []
+
+    for _ in range(repeat):
+
+        gc.collect()
+        start_time = time.perf_counter()
+
+        for _ in range(loop_calls):
+            case_function()
+
+        call_seconds.append((time.perf_counter() - start_time) / loop_calls)
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        before_snapshot = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        traced_memory_before = tracemalloc.get_traced_memory()[0]
+
+        result = case_function()
+
+        peak_traced_bytes = tracemalloc.get_traced_memory()[1] - traced_memory_before
+        after_snapshot = tracemalloc.take_snapshot()
+
+    finally:
+        tracemalloc.stop()
+
+    del result
+
+    return {
+        "callsPerLoop": loop_calls,
+        "minSeconds": min(call_seconds),
+        "medianSeconds": statistics.median(call_seconds),
+        "maxSeconds": max(call_seconds),
+        "peakAllocatedBytes": peak_traced_bytes,
+        "liveAllocatedBlocks": sum([i.count_diff for i in after_snapshot.compare_to(before_snapshot, "filename")])
+    }
+
+
+################################################
+#     7) Run Micro Benchmarks :                #
+################################################
+
+def run_micro_benchmarks(case_filter, repeat, min_run_seconds):
+
+    '''
+
+    Functionality : Running every micro benchmark case whose name contains the filter, inside a temporary work directory which also
+                    receives the application log.
+    :param case_filter: The text the case names need to contain, or an empty string for all the cases.
+    :param repeat: The number of measured loops per case.
+    :param min_run_seconds: The minimum duration of a measured loop.
+    :return: report --> The dictionary of the metadata and the case results.
+
+    '''
+
+    work_directory = tempfile.mkdtemp(prefix="dbapp_micro_benchmark_")
+    os.environ["DBAPP_DATA_DIRECTORY"] = os.path.join(work_directory, "app_data")
+    os.chdir(work_directory)
+
+    results = []
+
+    for case_name, case_function in build_micro_benchmark_cases(work_directory).items():
+
+        if case_filter not in case_name:
+            continue
+
+        print("Measuring " + case_name + "....", file=sys.stderr, flush=True)
+
+        result = {"case": case_name}
+
+        try:
+            result.update(measure_micro_benchmark_case(case_function, repeat, min_run_seconds))
+            result["status"] = "ok"
+
+        except Exception as e:
+            result.update({"status": "error", "error": type(e).__name__ + " : " + str(e)})
+
+        results.append(result)
+
+    return {"metadata": {"createdAt": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "python": platform.python_version(),
+                         "platform": platform.platform(), "sourceRoot": sys.path[0]}, "results": results}
+
+##########################################################################################################################################
+#                                                 End Block : Micro Benchmark Case Functions :                                           #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Micro Benchmark Comparison Functions :                                   #
+##########################################################################################################################################
+
+################################################
+#     8) Run Baseline Revision :               #
+################################################
+
+def run_baseline_revision(revision, arguments):
+
+    '''
+
+    Functionality : Running the micro benchmarks against the source tree of a git revision, checked out into a temporary worktree, with
+                    the benchmark code of the current tree, so that both sides measure the same cases.
+    :param revision: The git revision of the baseline, such as a branch name or a commit hash.
+    :param arguments: The list of the command line arguments forwarded to the baseline run.
+    :return: report
+
+    '''
+
+    worktree_directory = tempfile.mkdtemp(prefix="dbapp_micro_benchmark_baseline_")
+
+    subprocess.run(["git", "worktree", "add", "--detach", worktree_directory, revision], cwd=REPOSITORY_DIRECTORY, check=True,
+                   capture_output=True)
+
+    try:
+        completed_process = subprocess.run([sys.executable, os.path.abspath(__file__), "--source-root", worktree_directory] + arguments,
+                                           cwd=REPOSITORY_DIRECTORY, capture_output=True, text=True)
+
+        if completed_process.returncode != 0:
+            raise Exception("The baseline run failed : " + completed_process.stderr.strip()[-2000:])
+
+        return json.loads(completed_process.stdout)
+
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", worktree_directory], cwd=REPOSITORY_DIRECTORY, capture_output=True)
+
+
+################################################
+#     9) Compare Micro Benchmark Reports :     #
+################################################
+
+def compare_micro_benchmark_reports(baseline_report, current_report, tolerance):
+
+    '''
+
+    Functionality : Comparing the time and the allocations per call of every case with the baseline. A case only counts as faster or slower
+                    when the change of its median exceeds the tolerance and its fastest and slowest loops do not overlap with the ones of
+                    the baseline, so that noise is not reported as an improvement.
+    :param baseline_report: The report of the baseline run.
+    :param current_report: The report of the current run.
+    :param tolerance: The relative change of the median below which a case counts as unchanged.
+    :return: comparisons, regression_found
+
+    '''
+
+    baseline_results = {i["case"]: i for i in baseline_report["results"] if i.get("status") == "ok"}
+    comparisons = []
+    regression_found = False
+
+    for result in current_report["results"]:
+
+        baseline_result = baseline_results.get(result["case"])
+
+        if baseline_result is None or result.get("status") != "ok":
+            continue
+
+        change = result["medianSeconds"] / baseline_result["medianSeconds"] - 1
+
+        if change < -tolerance and result["maxSeconds"] < baseline_result["minSeconds"]:
+            verdict = "faster"
+        elif change > tolerance and result["minSeconds"] > baseline_result["maxSeconds"]:
+            verdict = "slower"
+        else:
+            verdict = "unchanged"
+
+        regression_found = regression_found or verdict == "slower"
+
+        comparisons.append({
+            "case": result["case"],
+            "baselineMedianSeconds": baseline_result["medianSeconds"],
+            "medianSeconds": result["medianSeconds"],
+            "timeChange": round(change, 4),
+            "baselinePeakAllocatedBytes": baseline_result["peakAllocatedBytes"],
+            "peakAllocatedBytes": result["peakAllocatedBytes"],
+            "verdict": verdict
+        })
+
+    return comparisons, regression_found
+
+
+################################################
+#     10) Print Comparisons :                  #
+################################################
+
+def print_comparisons(comparisons):
+
+    '''
+
+    Functionality : Printing the comparison of every case as a table on the standard error, next to the JSON report.
+    :param comparisons: The list of the case comparisons.
+    :return: None
+
+    '''
+
+    print("{:<70} {:>14} {:>14} {:>9} {:>14} {:>14} {:>10}".format("Case", "Baseline (s)", "Current (s)", "Change", "Baseline Peak",
+                                                                    "Current Peak", "Verdict"), file=sys.stderr)
+
+    for comparison in comparisons:
+        print("{:<70} {:>14.6f} {:>14.6f} {:>8.1f}% {:>14} {:>14} {:>10}".format(comparison["case"][:70], comparison["baselineMedianSeconds"],
+                                                                                comparison["medianSeconds"], comparison["timeChange"] * 100,
+                                                                                comparison["baselinePeakAllocatedBytes"],
+                                                                                comparison["peakAllocatedBytes"], comparison["verdict"]),
+              file=sys.stderr)
+
+##########################################################################################################################################
+#                                                 End Block : Micro Benchmark Comparison Functions :                                     #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                               Start Block : Driver Code :                                                              #
+##########################################################################################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Micro benchmarks of the filter and query builders and the CSV and JSON parsing functions.")
+    parser.add_argument("--filter", default="", help="The text the names of the cases to be run need to contain.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="The number of measured loops per case.")
+    parser.add_argument("--min-run-seconds", type=float, default=DEFAULT_MIN_RUN_SECONDS, help="The minimum duration of a measured loop.")
+    parser.add_argument("--output", default="", help="The JSON file the report gets written to, instead of the standard output.")
+    parser.add_argument("--baseline", default="", help="The JSON report of a baseline run to compare with.")
+    parser.add_argument("--baseline-ref", default="", help="The git revision to be measured as the baseline before the current tree.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_REGRESSION_TOLERANCE, help="The relative change counted as noise.")
+    parser.add_argument("--source-root", default=REPOSITORY_DIRECTORY, help=argparse.SUPPRESS)
+
+    arguments = parser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(arguments.source_root))
+
+    if arguments.source_root != REPOSITORY_DIRECTORY:
+        sys.path.insert(1, REPOSITORY_DIRECTORY)
+
+    forwarded_arguments = ["--filter", arguments.filter, "--repeat", str(arguments.repeat), "--min-run-seconds", str(arguments.min_run_seconds)]
+    baseline_report = None
+
+    if arguments.baseline_ref != "":
+        baseline_report = run_baseline_revision(arguments.baseline_ref, forwarded_arguments)
+
+    elif arguments.baseline != "":
+        with open(arguments.baseline) as file:
+            baseline_report = json.load(file)
+
+    report = run_micro_benchmarks(arguments.filter, arguments.repeat, arguments.min_run_seconds)
+    exit_code = 0
+
+    if baseline_report is not None:
+
+        report["comparisons"], regression_found = compare_micro_benchmark_reports(baseline_report, report, arguments.tolerance)
+        print_comparisons(report["comparisons"])
+
+        exit_code = 1 if regression_found else 0
+
+    if arguments.output != "":
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=4)
+    else:
+        print(json.dumps(report, indent=4))
+
+    sys.exit(exit_code)
+
+##########################################################################################################################################
+#                                               End Block : Driver Code :                                                                #
+##########################################################################################################################################
@@ -0,0 +1,402 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The stand_ins.py file consists of the local stand-ins of the database servers used by the benchmarks, which   #
+#                           are a SQLite adapter speaking the statements of the MySQL and SQL Server operations, a fake Cassandra      #
+#                           session over SQLite, and mongomock for MongoDB, unless a real server is configured for the backend.        #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import itertools
+import os
+import re
+import sqlite3
+
+SQL_STATEMENT_TRANSLATIONS = [
+    (re.compile(r"^\s*CREATE DATABASE\b.*$", re.IGNORECASE | re.DOTALL), "SELECT 1 WHERE 0"),
+    (re.compile(r"^\s*USE\b.*$", re.IGNORECASE | re.DOTALL), "SELECT 1 WHERE 0"),
+    (re.compile(r"^\s*SET SESSION\b.*$", re.IGNORECASE | re.DOTALL), "SELECT 1 WHERE 0"),
+    (re.compile(r"^\s*KILL QUERY\b.*$", re.IGNORECASE | re.DOTALL), "SELECT 1 WHERE 0"),
+    (re.compile(r"^\s*SELECT \* FROM sys\.databases\b.*$", re.IGNORECASE | re.DOTALL), "SELECT 'benchmark'"),
+    (re.compile(r"^\s*SHOW TABLES\s*$", re.IGNORECASE), "SELECT name FROM sqlite_master WHERE type = 'table'"),
+    (re.compile(r"^\s*SHOW KEYS FROM (\w+) WHERE Key_name = 'PRIMARY'\s*$", re.IGNORECASE),
+     r"SELECT '\1', 0, 'PRIMARY', pk, name FROM pragma_table_info('\1') WHERE pk > 0"),
+    (re.compile(r"^\s*SELECT \* FROM INFORMATION_SCHEMA\.TABLES WHERE TABLE_NAME = N'([^']*)'\s*$", re.IGNORECASE),
+     r"SELECT name FROM sqlite_master WHERE type = 'table' AND name = '\1'")
+]
+
+SQL_TOP_PATTERN = re.compile(r"^\s*SELECT TOP\s+(\d+)\s+(.*)$", re.IGNORECASE | re.DOTALL)
+CQL_ALLOW_FILTERING_PATTERN = re.compile(r"\s+ALLOW FILTERING\s*$", re.IGNORECASE)
+CQL_SCHEMA_PATTERN = re.compile(r"^\s*SELECT \* FROM system_schema\.columns WHERE table_name = '([^']*)'", re.IGNORECASE)
+CQL_NOOP_PATTERN = re.compile(r"^\s*(USE\b|SELECT release_version FROM system\.local)", re.IGNORECASE)
+CONNECTION_IDS = itertools.count(1)
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : SQLite Adapter Functions :                                               #
+##########################################################################################################################################
+
+class SQLiteConnection :
+
+    '''
+
+    Functionality : Standing in for a mysql.connector or pyodbc connection over a SQLite database file, translating the server specific
+                    statements issued by the operations classes into their SQLite equivalents.
+
+    '''
+
+    def __init__(self, database_path, *args, **kwargs):
+
+        self.connection = sqlite3.connect(database_path, timeout=60, check_same_thread=False)
+        self.connection_id = next(CONNECTION_IDS)
+        self.timeout = 0
+
+    def cursor(self, *args, **kwargs):
+
+        return SQLiteCursor(self.connection.cursor())
+
+    def commit(self):
+
+        self.connection.commit()
+
+    def rollback(self):
+
+        self.connection.rollback()
+
+    def close(self):
+
+        self.connection.commit()
+        self.connection.close()
+
+
+class SQLiteCursor :
+
+    '''
+
+    Functionality : Standing in for a mysql.connector or pyodbc cursor, passing the translated statements to a SQLite cursor.
+
+    '''
+
+    def __init__(self, cursor):
+
+        self.cursor = cursor
+
+    @property
+    def description(self):
+
+        return self.cursor.description
+
+    @property
+    def rowcount(self):
+
+        return self.cursor.rowcount
+
+    def execute(self, statement, *parameters):
+
+        statement = translate_sql_statement(statement)
+
+        if len(parameters) == 1 and isinstance(parameters[0], (list, tuple)):
+            parameters = parameters[0]
+
+        self.cursor.execute(statement.replace("%s", "?"), tuple(parameters))
+
+        return self
+
+    def executemany(self, statement, parameters):
+
+        self.cursor.executemany(translate_sql_statement(statement).replace("%s", "?"), parameters)
+
+    def fetchone(self):
+
+        return self.cursor.fetchone()
+
+    def fetchmany(self, size):
+
+        return self.cursor.fetchmany(size)
+
+    def fetchall(self):
+
+        return self.cursor.fetchall()
+
+    def cancel(self):
+
+        self.cursor.connection.interrupt()
+
+    def close(self):
+
+        self.cursor.close()
+
+
+def translate_sql_statement(statement):
+
+    '''
+
+    Functionality : Translating a MySQL or SQL Server statement into its SQLite equivalent. The statements which only make sense on a server,
+                    such as creating and using a database, become statements returning no rows.
+    :param statement: The statement issued by the operations class.
+    :return: statement
+
+    '''
+
+    for pattern, replacement in SQL_STATEMENT_TRANSLATIONS:
+
+        if pattern.match(statement):
+            return pattern.sub(replacement, statement)
+
+    top_match = SQL_TOP_PATTERN.match(statement)
+
+    if top_match is not None:
+        return "SELECT " + top_match.group(2).rstrip().rstrip(";") + " LIMIT " + top_match.group(1)
+
+    return statement
+
+##########################################################################################################################################
+#                                                 End Block : SQLite Adapter Functions :                                                 #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Fake Cassandra Session Functions :                                       #
+##########################################################################################################################################
+
+class FakeCassandraCluster :
+
+    '''
+
+    Functionality : Standing in for a cassandra.cluster.Cluster, handing out fake sessions over a shared SQLite database file.
+
+    '''
+
+    def __init__(self, database_path, *args, **kwargs):
+
+        self.database_path = database_path
+        self.sessions = []
+
+    def connect(self, *args, **kwargs):
+
+        session = FakeCassandraSession(self.database_path)
+        self.sessions.append(session)
+
+        return session
+
+    def shutdown(self):
+
+        for session in self.sessions:
+            session.shutdown()
+
+
+class FakeCassandraSession :
+
+    '''
+
+    Functionality : Standing in for a Cassandra session, running the CQL issued by the operations class on SQLite. The system_schema.columns
+                    rows are emulated with the column name at index 2, the column kind at index 5 and the column type at index 8, which are
+                    the positions read by the Cassandra operations. Paged statements are paged by row offset.
+
+    '''
+
+    def __init__(self, database_path):
+
+        self.connection = sqlite3.connect(database_path, timeout=60, check_same_thread=False)
+
+    def execute(self, statement, parameters=None, paging_state=None, **kwargs):
+
+        query = getattr(statement, "query_string", statement)
+        fetch_size = getattr(statement, "fetch_size", None)
+
+        if CQL_NOOP_PATTERN.match(query):
+            return FakeResultSet(["release_version"], [("4.0.0",)] if "release_version" in query else [], None, 0)
+
+        schema_match = CQL_SCHEMA_PATTERN.match(query)
+
+        if schema_match is not None:
+            return FakeResultSet(["keyspace_name", "table_name", "column_name", "clustering_order", "column_name_bytes", "kind",
+                                  "position", "type_text", "type"], self._describe_table(schema_match.group(1)), None, 0)
+
+        cursor = self.connection.execute(CQL_ALLOW_FILTERING_PATTERN.sub("", query).replace("%s", "?"), tuple(parameters or ()))
+        self.connection.commit()
+
+        if cursor.description is None:
+            return FakeResultSet([], [], None, 0)
+
+        return FakeResultSet([i[0] for i in cursor.description], cursor.fetchall(), fetch_size, 0 if paging_state is None else
+                             int(bytes(paging_state).decode("ascii")))
+
+    def execute_async(self, statement, parameters=None, **kwargs):
+
+        return FakeResponseFuture(self, statement, parameters)
+
+    def _describe_table(self, table_name):
+
+        columns = self.connection.execute("PRAGMA table_info(" + table_name + ")").fetchall()
+
+        return [("benchmark", table_name, column[1], "none", column[1].encode("utf-8"),
+                 "partition_key" if column[5] > 0 else "regular", -1 if column[5] > 0 else column[0],
+                 column[2].lower(), column[2].lower()) for column in columns]
+
+    def shutdown(self):
+
+        self.connection.close()
+
+
+class FakeResultSet :
+
+    '''
+
+    Functionality : Standing in for a Cassandra result set, exposing the rows either all at once or page by page when the statement carries
+                    a fetch size.
+
+    '''
+
+    def __init__(self, column_names, rows, fetch_size, offset):
+
+        self.column_names = column_names
+        self.rows = rows
+        self.fetch_size = fetch_size
+        self.offset = offset
+        self.page_end = len(rows) if fetch_size is None else min(offset + int(fetch_size), len(rows))
+
+    def __iter__(self):
+
+        return iter(self.rows[self.offset:])
+
+    def __getitem__(self, idx):
+
+        return self.rows[self.offset + idx]
+
+    def __bool__(self):
+
+        return len(self.rows) > self.offset
+
+    @property
+    def current_rows(self):
+
+        return self.rows[self.offset:self.page_end]
+
+    @property
+    def has_more_pages(self):
+
+        return self.page_end < len(self.rows)
+
+    @property
+    def paging_state(self):
+
+        return str(self.page_end).encode("ascii") if self.has_more_pages else None
+
+    def fetch_next_page(self):
+
+        self.offset = self.page_end
+        self.page_end = min(self.offset + int(self.fetch_size), len(self.rows))
+
+class FakeResponseFuture :
+
+    '''
+
+    Functionality : Standing in for a Cassandra response future, running the statement on the fake session once the callbacks get added and
+                    handing all its rows to the page callback as a single page.
+
+    '''
+
+    def __init__(self, session, statement, parameters):
+
+        self.session = session
+        self.statement = statement
+        self.parameters = parameters
+        self.has_more_pages = False
+
+    def add_callbacks(self, callback, errback):
+
+        try:
+            rows = list(self.session.execute(self.statement, self.parameters))
+
+        except Exception as e:
+            errback(e)
+            return
+
+        callback(rows)
+
+##########################################################################################################################################
+#                                                 End Block : Fake Cassandra Session Functions :                                         #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Stand-in Installation Functions :                                        #
+##########################################################################################################################################
+
+def install_stand_ins(backend, work_directory):
+
+    '''
+
+    Functionality : Replacing the connect function of the driver of a backend with its local stand-in, unless a real server is configured
+                    for it through the BENCHMARK_MYSQL_HOST, BENCHMARK_SQLSERVER_SERVER or BENCHMARK_MONGODB_URI environment variables.
+                    There is no local Cassandra stand-in other than the fake session.
+    :param backend: The backend to be benchmarked. Possible values are : "mysql", "sqlserver", "cassandra" and "mongodb".
+    :param work_directory: The directory holding the SQLite database file of the stand-ins.
+    :return: stand_in --> The name of the stand-in being used.
+
+    '''
+
+    database_path = os.path.join(work_directory, backend + ".sqlite")
+
+    if backend == "mysql":
+
+        if os.environ.get("BENCHMARK_MYSQL_HOST"):
+            return "mysql server"
+
+        import mysql.connector
+        mysql.connector.connect = lambda *args, **kwargs: SQLiteConnection(database_path)
+
+        return "sqlite"
+
+    if backend == "sqlserver":
+
+        if os.environ.get("BENCHMARK_SQLSERVER_SERVER"):
+            return "sql server"
+
+        import pyodbc
+        pyodbc.connect = lambda *args, **kwargs: SQLiteConnection(database_path)
+
+        return "sqlite"
+
+    if backend == "cassandra":
+
+        import src.cassandra_operations
+        src.cassandra_operations.Cluster = lambda *args, **kwargs: FakeCassandraCluster(database_path)
+
+        return "fake session over sqlite"
+
+    if backend == "mongodb":
+
+        if os.environ.get("BENCHMARK_MONGODB_URI"):
+            return "mongod"
+
+        import mongomock
+        import pymongo
+
+        shared_client = mongomock.MongoClient()
+        shared_client.close = lambda: None
+        pymongo.MongoClient = lambda *args, **kwargs: shared_client
+
+        return "mongomock"
+
+    raise Exception("The backend " + backend + " is not a known benchmark backend.")
+
+##########################################################################################################################################
+#                                                 End Block : Stand-in Installation Functions :                                          #
+##########################################################################################################################################
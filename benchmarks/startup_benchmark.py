@@ -0,0 +1,355 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The startup_benchmark.py file consists of the benchmark of the application startup, measuring the import time #
+#                           of main.py and the RSS of a fresh worker for several sets of enabled backends, along with the time and the #
+#                           RSS the first use of every backend adds, optionally against a baseline git revision of the source tree.    #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from benchmarks.backend_benchmarks import BENCHMARK_BACKENDS, REPOSITORY_DIRECTORY, _read_rss_bytes, get_run_metadata
+
+DEFAULT_REPEAT = 5
+DEFAULT_CASE_TIMEOUT_SECONDS = 300
+
+BACKEND_OPERATIONS_CLASSES = {
+    "mysql": "MySqlOperations",
+    "sqlserver": "MicrosoftSQLServerOperations",
+    "mongodb": "MongoDBOperations",
+    "cassandra": "CassandraOperations"
+}
+
+DRIVER_MODULES = {
+    "mysql": "mysql.connector",
+    "sqlserver": "pyodbc",
+    "mongodb": "pymongo",
+    "cassandra": "cassandra.cluster"
+}
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Startup Case Functions :                                                 #
+##########################################################################################################################################
+
+################################################
+#     1) Run Startup Case :                    #
+################################################
+
+def run_startup_case(backends):
+
+    '''
+
+    Functionality : Importing main.py in the current (fresh) process with the given backends enabled, measuring the import time and the
+                    RSS of the worker, the modules and drivers the import pulled in, and then the time and the RSS added by the first use
+                    of every enabled backend whose operations class gets loaded on demand.
+    :param backends: The list of the enabled backends.
+    :return: result
+
+    '''
+
+    work_directory = tempfile.mkdtemp(prefix="dbapp_startup_benchmark_")
+    os.environ["DBAPP_DATA_DIRECTORY"] = os.path.join(work_directory, "app_data")
+    os.environ["DBAPP_ENABLED_BACKENDS"] = ",".join(backends)
+    os.chdir(work_directory)
+
+    rss_before_import = _read_rss_bytes("VmRSS")
+    modules_before_import = len(sys.modules)
+
+    start_time = time.perf_counter()
+    import main
+    import_seconds = time.perf_counter() - start_time
+
+    result = {
+        "backends": backends,
+        "importSeconds": import_seconds,
+        "rssBeforeImportBytes": rss_before_import,
+        "rssAfterImportBytes": _read_rss_bytes("VmRSS"),
+        "importedModules": len(sys.modules) - modules_before_import,
+        "driversImported": [i for i in BENCHMARK_BACKENDS if DRIVER_MODULES[i] in sys.modules],
+        "firstUse": {}
+    }
+
+    for backend in backends:
+
+        operations_class = getattr(main, BACKEND_OPERATIONS_CLASSES[backend])
+
+        if not hasattr(operations_class, "load"):
+            continue
+
+        start_time = time.perf_counter()
+
+        try:
+            operations_class.load()
+            result["firstUse"][backend] = {"seconds": time.perf_counter() - start_time, "rssAfterBytes": _read_rss_bytes("VmRSS")}
+
+        except Exception as e:
+            result["firstUse"][backend] = {"error": type(e).__name__ + " : " + str(e)}
+
+    result["rssAfterFirstUseBytes"] = _read_rss_bytes("VmRSS")
+
+    return result
+
+
+################################################
+#     2) Run Startup Configuration :           #
+################################################
+
+def run_startup_configuration(source_root, backends, repeat, case_timeout):
+
+    '''
+
+    Functionality : Running the startup case of a set of enabled backends several times, every time in a fresh subprocess, and summarising
+                    the samples with their minimum and median, so that the noise of a single interpreter start does not decide.
+    :param source_root: The directory of the source tree whose main.py gets imported.
+    :param backends: The list of the enabled backends.
+    :param repeat: The number of fresh subprocesses.
+    :param case_timeout: The number of seconds after which a subprocess gets stopped and reported as timed out.
+    :return: result
+
+    '''
+
+    samples = []
+
+    for _ in range(repeat):
+
+        try:
+            completed_process = subprocess.run([sys.executable, "-m", "benchmarks.startup_benchmark", "--case", ",".join(backends),
+                                                "--source-root", source_root], cwd=REPOSITORY_DIRECTORY, capture_output=True, text=True,
+                                               timeout=case_timeout)
+
+            output_lines = completed_process.stdout.strip().splitlines()
+
+            if completed_process.returncode != 0 or len(output_lines) == 0:
+                return {"backends": backends, "status": "error", "error": completed_process.stderr.strip()[-2000:]}
+
+            samples.append(json.loads(output_lines[-1]))
+
+        except subprocess.TimeoutExpired:
+            return {"backends": backends, "status": "timeout", "error": "The case did not finish within " + str(case_timeout) + " seconds."}
+
+    result = {
+        "backends": backends,
+        "status": "ok",
+        "samples": repeat,
+        "minImportSeconds": min([i["importSeconds"] for i in samples]),
+        "medianImportSeconds": statistics.median([i["importSeconds"] for i in samples]),
+        "medianRssAfterImportBytes": statistics.median([i["rssAfterImportBytes"] for i in samples]),
+        "medianRssAfterFirstUseBytes": statistics.median([i["rssAfterFirstUseBytes"] for i in samples]),
+        "importedModules": samples[-1]["importedModules"],
+        "driversImported": samples[-1]["driversImported"],
+        "firstUse": {}
+    }
+
+    for backend, first_use in samples[-1]["firstUse"].items():
+
+        if "error" in first_use:
+            result["firstUse"][backend] = first_use
+        else:
+            result["firstUse"][backend] = {"medianSeconds": statistics.median([i["firstUse"][backend]["seconds"] for i in samples]),
+                                           "medianRssAfterBytes": statistics.median([i["firstUse"][backend]["rssAfterBytes"]
+                                                                                     for i in samples])}
+
+    return result
+
+##########################################################################################################################################
+#                                                 End Block : Startup Case Functions :                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Startup Suite Functions :                                                #
+##########################################################################################################################################
+
+################################################
+#     3) Run Startup Suite :                   #
+################################################
+
+def run_startup_suite(source_root, configurations, repeat, case_timeout):
+
+    '''
+
+    Functionality : Running the startup cases of every set of enabled backends against a source tree.
+    :param source_root: The directory of the source tree whose main.py gets imported.
+    :param configurations: The list of the enabled backend lists.
+    :param repeat: The number of fresh subprocesses per set of backends.
+    :param case_timeout: The number of seconds after which a subprocess gets stopped and reported as timed out.
+    :return: report --> The dictionary of the metadata and the configuration results.
+
+    '''
+
+    results = []
+
+    for backends in configurations:
+
+        print("Starting the application with " + ",".join(backends) + " enabled....", file=sys.stderr, flush=True)
+        results.append(run_startup_configuration(source_root, backends, repeat, case_timeout))
+
+    metadata = get_run_metadata()
+    metadata["sourceRoot"] = source_root
+
+    return {"metadata": metadata, "results": results}
+
+
+################################################
+#     4) Run Baseline Revision :               #
+################################################
+
+def run_baseline_revision(revision, configurations, repeat, case_timeout):
+
+    '''
+
+    Functionality : Running the startup cases against the source tree of a git revision, checked out into a temporary worktree, with the
+                    benchmark code of the current tree, so that both sides measure the same cases.
+    :param revision: The git revision of the baseline, such as a branch name or a commit hash.
+    :param configurations: The list of the enabled backend lists.
+    :param repeat: The number of fresh subprocesses per set of backends.
+    :param case_timeout: The number of seconds after which a subprocess gets stopped and reported as timed out.
+    :return: report
+
+    '''
+
+    worktree_directory = tempfile.mkdtemp(prefix="dbapp_startup_benchmark_baseline_")
+
+    subprocess.run(["git", "worktree", "add", "--detach", worktree_directory, revision], cwd=REPOSITORY_DIRECTORY, check=True,
+                   capture_output=True)
+
+    try:
+        report = run_startup_suite(worktree_directory, configurations, repeat, case_timeout)
+        report["metadata"]["revision"] = revision
+
+        return report
+
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", worktree_directory], cwd=REPOSITORY_DIRECTORY, capture_output=True)
+
+
+################################################
+#     5) Print Startup Report :                #
+################################################
+
+def print_startup_report(report, baseline_report=None):
+
+    '''
+
+    Functionality : Printing the import time and the worker RSS of every set of enabled backends, next to the baseline ones when a
+                    baseline was measured.
+    :param report: The report of the current tree.
+    :param baseline_report: The report of the baseline revision, or None.
+    :return: None
+
+    '''
+
+    baseline_results = {}
+
+    if baseline_report is not None:
+        baseline_results = {",".join(i["backends"]): i for i in baseline_report["results"]}
+
+    print("{:<40} {:>16} {:>16} {:>16} {:>16}  {}".format("Enabled Backends", "Import (s)", "Baseline (s)", "RSS (MB)", "Baseline (MB)",
+                                                          "Drivers Imported"), file=sys.stderr)
+
+    for result in report["results"]:
+
+        name = ",".join(result["backends"])
+        baseline_result = baseline_results.get(name, {})
+        baseline_ok = baseline_result.get("status") == "ok"
+
+        if result["status"] != "ok":
+            print("{:<40} {}".format(name[:40], result["status"] + " : " + result["error"].splitlines()[-1][:120]), file=sys.stderr)
+            continue
+
+        print("{:<40} {:>16.4f} {:>16} {:>16.1f} {:>16}  {}".format(
+            name[:40], result["medianImportSeconds"],
+            "%.4f" % baseline_result["medianImportSeconds"] if baseline_ok else baseline_result.get("status", "-"),
+            result["medianRssAfterImportBytes"] / 1048576,
+            "%.1f" % (baseline_result["medianRssAfterImportBytes"] / 1048576) if baseline_ok else baseline_result.get("status", "-"),
+            ",".join(result["driversImported"]) or "none"), file=sys.stderr)
+
+        for backend, first_use in result["firstUse"].items():
+
+            if "error" in first_use:
+                print("    first use of " + backend + " : " + first_use["error"][:120], file=sys.stderr)
+            else:
+                print("    first use of {} : {:.4f} s, RSS {:.1f} MB".format(backend, first_use["medianSeconds"],
+                                                                            first_use["medianRssAfterBytes"] / 1048576), file=sys.stderr)
+
+##########################################################################################################################################
+#                                                 End Block : Startup Suite Functions :                                                  #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                               Start Block : Driver Code :                                                              #
+##########################################################################################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Benchmark of the application startup time and worker RSS per set of enabled backends.")
+    parser.add_argument("--configurations", default=";".join([",".join(BENCHMARK_BACKENDS)] + BENCHMARK_BACKENDS),
+                        help="The semicolon separated sets of comma separated backends to be enabled.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="The number of fresh processes per set of backends.")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_CASE_TIMEOUT_SECONDS, help="The timeout of a single process in seconds.")
+    parser.add_argument("--baseline-ref", default="", help="The git revision to be measured as the baseline before the current tree.")
+    parser.add_argument("--output", default="", help="The JSON file the report gets written to, instead of the standard output.")
+    parser.add_argument("--case", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--source-root", default=REPOSITORY_DIRECTORY, help=argparse.SUPPRESS)
+
+    arguments = parser.parse_args()
+
+    if arguments.case is not None:
+
+        sys.path.insert(0, os.path.abspath(arguments.source_root))
+
+        print(json.dumps(run_startup_case([i for i in arguments.case.split(",") if i != ""])))
+        sys.exit(0)
+
+    startup_configurations = [[j.strip() for j in i.split(",") if j.strip() != ""] for i in arguments.configurations.split(";")]
+
+    for configuration in startup_configurations:
+        for backend in configuration:
+            if backend not in BENCHMARK_BACKENDS:
+                raise Exception("The backend " + backend + " is not a known backend.")
+
+    baseline = None
+
+    if arguments.baseline_ref != "":
+        baseline = run_baseline_revision(arguments.baseline_ref, startup_configurations, arguments.repeat, arguments.timeout)
+
+    startup_report = run_startup_suite(REPOSITORY_DIRECTORY, startup_configurations, arguments.repeat, arguments.timeout)
+
+    if baseline is not None:
+        startup_report["baseline"] = baseline
+
+    print_startup_report(startup_report, baseline)
+
+    if arguments.output != "":
+        with open(arguments.output, "w") as file:
+            json.dump(startup_report, file, indent=4)
+    else:
+        print(json.dumps(startup_report, indent=4))
+
+##########################################################################################################################################
+#                                               End Block : Driver Code :                                                                #
+##########################################################################################################################################
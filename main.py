@@ -17,22 +17,572 @@
 ##########################################################################################################################################
 
 import datetime
+import functools
+import hmac
+import inspect
+import itertools
+import os
+import time
 from src.setup_logger import logger
-from src.file_operations import FileOperations
-from src.mysql_operations import MySqlOperations
-from src.sql_server_operations import MicrosoftSQLServerOperations
-from src.mongodb_operations import MongoDBOperations
-from src.cassandra_operations import CassandraOperations
-from flask import Flask, redirect, jsonify, request, render_template,url_for,send_file
+from src.setup_config import config
+from src.query_operations import QueryOperations
+from src.index_advisor_operations import IndexAdvisorOperations
+from src.metrics_operations import MetricsOperations
+from src.slow_query_operations import SlowQueryOperations
+from src.profiling_operations import ProfilingOperations, profiles_requests
+from src.admission_operations import AdmissionOperations
+from src.file_operations import FileOperations, COLUMNAR_FORMATS, STREAM_COMPRESSIONS
+from src.backend_loader import BackendLoader, BACKEND_DISPLAY_NAMES, get_enabled_backends
+from flask import Flask, redirect, jsonify, request, render_template,url_for,send_file,Response,g,make_response
 import re
 
 app = Flask(__name__)
+app.wsgi_app = profiles_requests(app.wsgi_app)
+
+log_object = logger()
+
+MySqlOperations = BackendLoader("mysql", "src.mysql_operations", "MySqlOperations")
+MicrosoftSQLServerOperations = BackendLoader("sqlserver", "src.sql_server_operations", "MicrosoftSQLServerOperations")
+MongoDBOperations = BackendLoader("mongodb", "src.mongodb_operations", "MongoDBOperations")
+CassandraOperations = BackendLoader("cassandra", "src.cassandra_operations", "CassandraOperations")
+AsyncMongoDBOperations = BackendLoader("mongodb", "src.async_mongodb_operations", "AsyncMongoDBOperations")
+AsyncCassandraOperations = BackendLoader("cassandra", "src.async_cassandra_operations", "AsyncCassandraOperations")
+json_util = BackendLoader(None, "bson.json_util")
+
+MAX_BROWSE_PAGE_SIZE = 10000
+DEFAULT_EXPORT_WORKERS = 8
+MAX_EXPORT_WORKERS = 32
+MAX_EXPORT_PARTITIONS = 4096
+DEFAULT_FETCH_SIZE = 10000
+MAX_PIPELINE_BATCH_SIZE = 100000
+DEFAULT_INSERT_BATCH_SIZE = 1000
+DEFAULT_ASYNC_CONCURRENCY = 64
+MAX_ASYNC_CONCURRENCY = 512
 
 ##########################################################################################################################################
 #                                                 End Block : Importing Libraries & Initializing Variables :                             #
 ##########################################################################################################################################
 
 
+##########################################################################################################################################
+#                                                 Start Block : Request Helper Functions :                                               #
+##########################################################################################################################################
+
+################################################
+#     1) Prepare Conditional Fields :          #
+################################################
+
+def prepare_conditional_fields(form):
+
+    '''
+
+    Functionality : Preparing the conditional fields list from the numbered fieldName, fieldOperator, fieldValue and recordOperator form fields.
+    :param form: The request form (or values) dictionary.
+    :return: conditional_fields
+
+    '''
+
+    conditional_fields = []
+
+    for element in form.keys():
+        if element.find("fieldName") > -1:
+            field_no = re.findall('[0-9]+', element)[0]
+            conditional_fields.append([form.get(element), form.get("fieldOperator" + str(field_no)),
+                                       form.get("fieldValue" + str(field_no)),
+                                       form.get("recordOperator" + str(field_no))])
+
+    return conditional_fields
+
+
+################################################
+#     2) Prepare Browse Page Size :            #
+################################################
+
+def prepare_page_size(form):
+
+    '''
+
+    Functionality : Reading the requested page size for table browsing, bounded between 1 and the maximum browse page size.
+    :param form: The request form (or values) dictionary.
+    :return: page_size
+
+    '''
+
+    page_size = form.get('pageSize', '100')
+
+    if page_size.strip() == "" or not page_size.strip().isdigit():
+        raise Exception("The page size provided is not a valid positive number.")
+
+    return min(max(int(page_size), 1), MAX_BROWSE_PAGE_SIZE)
+
+
+################################################
+#     3) Prepare Export Parallelism :          #
+################################################
+
+def prepare_export_parallelism(form):
+
+    '''
+
+    Functionality : Reading the requested number of parallel export workers and partitions, bounded by the maximum number of export workers.
+    :param form: The request form dictionary.
+    :return: worker_count, partition_count --> The partition count defaults to eight partitions per worker.
+
+    '''
+
+    workerCount = form.get('workerCount', '').strip()
+    partitionCount = form.get('partitionCount', '').strip()
+
+    worker_count = int(workerCount) if workerCount.isdigit() else DEFAULT_EXPORT_WORKERS
+    worker_count = min(max(worker_count, 1), MAX_EXPORT_WORKERS)
+
+    partition_count = int(partitionCount) if partitionCount.isdigit() else worker_count * 8
+    partition_count = min(max(partition_count, 1), MAX_EXPORT_PARTITIONS)
+
+    return worker_count, partition_count
+
+
+################################################
+#     4) Read Cassandra Page Part :            #
+################################################
+
+def read_cassandra_page_part(pages, page_limit):
+
+    '''
+
+    Functionality : Reading up to the given number of pages of a paged Cassandra fetch, so that a large download can be taken part by part,
+                    every part being resumed from the paging state returned with the previous one.
+    :param pages: The generator of (page records, paging state) tuples.
+    :param page_limit: The maximum number of pages of the part.
+    :return: records, paging_state --> The paging state to resume the next part from is None after the last page.
+
+    '''
+
+    records = []
+    paging_state = None
+
+    try:
+
+        for page_idx, (page_records, paging_state) in enumerate(pages):
+
+            records.extend(page_records)
+
+            if page_idx + 1 >= page_limit:
+                break
+
+    finally:
+        pages.close()
+
+    return records, paging_state
+
+
+################################################
+#     5) Limit Record Batches :                #
+################################################
+
+def limit_record_batches(batches, row_limit):
+
+    '''
+
+    Functionality : Limiting the record batches of a parallel export to the requested row limit, closing the export once the limit got
+                    reached so that the reads still running get stopped.
+    :param batches: The generator of record lists.
+    :param row_limit: The row limit from the request form, all the records being kept when it is empty.
+    :return: batches
+
+    '''
+
+    row_limit = str(row_limit).strip()
+
+    if row_limit == "":
+        return batches
+
+    if not row_limit.isdigit():
+        batches.close()
+        raise Exception("The row limit provided is not a valid positive number.")
+
+    def generate_limited_batches(remaining_rows):
+
+        try:
+
+            while remaining_rows > 0:
+
+                batch = next(batches, None)
+
+                if batch is None:
+                    break
+
+                yield batch[:remaining_rows]
+                remaining_rows -= len(batch)
+
+        finally:
+            batches.close()
+
+    return generate_limited_batches(int(row_limit))
+
+
+################################################
+#     6) Prepare Download Format :             #
+################################################
+
+def prepare_download_format(form, row_formats):
+
+    '''
+
+    Functionality : Reading the requested download format and its compression codec from the form.
+    :param form: The request form dictionary.
+    :param row_formats: The list of row based download formats of the route, the first one being used when no format was chosen.
+    :return: download_format, compression --> The compression is None for the row based download formats.
+
+    '''
+
+    download_format = form.get('downloadFormat', '').strip().lower() or row_formats[0]
+
+    if download_format in row_formats:
+        return download_format, None
+
+    if download_format not in COLUMNAR_FORMATS:
+        raise Exception("The download format " + download_format + " is not supported.")
+
+    compression = form.get('compression', '').strip().lower() or COLUMNAR_FORMATS[download_format]["compressions"][0]
+
+    return download_format, compression
+
+
+################################################
+#     7) Send Columnar File :                  #
+################################################
+
+def send_columnar_file(file_object, file_name, download_format, compression, headers, batches):
+
+    '''
+
+    Functionality : Writing the row batches into a Parquet or Arrow IPC (Feather) file and sending it as an attachment, deleting the file
+                    from the Flask server once the response got closed.
+    :param file_object: The file operations object.
+    :param file_name: The CSV file name of the download, whose extension gets replaced as per the download format.
+    :param download_format: The columnar download format. Possible values are : "parquet" and "feather".
+    :param compression: The compression codec of the columnar file.
+    :param headers: The list of the field headers.
+    :param batches: The iterable of row batches (lists of rows).
+    :return: response
+
+    '''
+
+    base_name = os.path.splitext(file_name)[0]
+    extension = COLUMNAR_FORMATS[download_format]["extension"]
+    columnar_file_name = base_name + "_" + datetime.datetime.now().strftime("%H%M%S%f") + extension
+
+    log_object.logToFile('debug', 'Writing ' + download_format + ' file with table data....')
+    file_object.writeToColumnarFile(columnar_file_name,download_format,headers,batches,compression)
+
+    response = send_file(columnar_file_name, as_attachment=True, download_name=base_name + extension,
+                         mimetype=COLUMNAR_FORMATS[download_format]["mimetype"])
+    response.call_on_close(lambda: file_object.deleteFile(columnar_file_name))
+
+    return response
+
+
+################################################
+#     8) Prepare Stream Compression :          #
+################################################
+
+def prepare_stream_compression(form):
+
+    '''
+
+    Functionality : Reading the requested compression of a streamed CSV or NDJSON download from the form.
+    :param form: The request form dictionary.
+    :return: compression --> None when the download is not to be compressed.
+
+    '''
+
+    compression = form.get('streamCompression', '').strip().lower()
+
+    if compression in ["", "none"]:
+        return None
+
+    if compression not in STREAM_COMPRESSIONS:
+        raise Exception("The compression " + compression + " is not supported for streamed downloads.")
+
+    return compression
+
+
+################################################
+#     9) Send Stream :                         #
+################################################
+
+def send_stream(file_object, file_name, chunks, mimetype, compression):
+
+    '''
+
+    Functionality : Streaming the download chunks as an attachment, compressing them on the fly when a compression was chosen. The
+                    compressed download is sent as a .gz or .zst file rather than with a Content-Encoding header, so that the browser
+                    saves it compressed under a matching file name.
+    :param file_object: The file operations object.
+    :param file_name: The file name of the uncompressed download.
+    :param chunks: The generator of text chunks of the download.
+    :param mimetype: The mimetype of the uncompressed download.
+    :param compression: The compression format, or None for an uncompressed download.
+    :return: response
+
+    '''
+
+    if compression is not None:
+        chunks = file_object.compressStream(chunks,compression)
+        file_name += STREAM_COMPRESSIONS[compression]["extension"]
+        mimetype = STREAM_COMPRESSIONS[compression]["mimetype"]
+
+    return Response(chunks, mimetype=mimetype, headers={'Content-Disposition': 'attachment; filename=' + file_name})
+
+
+################################################
+#     10) Prepare Aggregation Pipeline :       #
+################################################
+
+def prepare_aggregation_pipeline(form, conditional_query, projection_query, row_limit):
+
+    '''
+
+    Functionality : Parsing the aggregation pipeline given in (extended) JSON format, applying the conditional query as a leading $match stage
+                    so that it can use the collection indexes, and the projection and row limit as trailing $project and $limit stages.
+    :param form: The request form (or values) dictionary.
+    :param conditional_query: The parsed conditional query, or an empty dictionary.
+    :param projection_query: The parsed projection query, or an empty dictionary.
+    :param row_limit: The row limit, or an empty string.
+    :return: pipeline, batch_size
+
+    '''
+
+    try:
+        pipeline = json_util.loads(form['aggregationPipeline'])
+
+    except ValueError as e:
+        raise Exception("The aggregation pipeline provided is not in a proper JSON format : " + str(e))
+
+    if not isinstance(pipeline, list) or not all([isinstance(i, dict) and len(i) == 1 for i in pipeline]):
+        raise Exception("The aggregation pipeline provided must be a JSON array of stages, each stage being a single key object.")
+
+    if conditional_query != {}:
+        pipeline.insert(0, {"$match": conditional_query})
+
+    if projection_query != {}:
+        pipeline.append({"$project": projection_query})
+
+    if row_limit.strip() != "":
+        pipeline.append({"$limit": int(row_limit)})
+
+    batch_size = form.get('batchSize', '').strip()
+
+    if batch_size != "" and not batch_size.isdigit():
+        raise Exception("The batch size provided is not a valid positive number.")
+
+    return pipeline, min(max(int(batch_size), 1), MAX_PIPELINE_BATCH_SIZE) if batch_size != "" else DEFAULT_FETCH_SIZE
+
+
+################################################
+#     11) Prepare Async Concurrency :          #
+################################################
+
+def prepare_async_concurrency(form):
+
+    '''
+
+    Functionality : Reading the requested number of statements an async route keeps in flight, bounded by the maximum async concurrency.
+    :param form: The request form dictionary.
+    :return: concurrency
+
+    '''
+
+    concurrency = form.get('concurrency', '').strip()
+
+    if concurrency != "" and not concurrency.isdigit():
+        raise Exception("The concurrency provided is not a valid positive number.")
+
+    return min(max(int(concurrency), 1), MAX_ASYNC_CONCURRENCY) if concurrency != "" else DEFAULT_ASYNC_CONCURRENCY
+
+
+################################################
+#     12) Prepare Admission Host :             #
+################################################
+
+def prepare_admission_host(backend, form, files):
+
+    '''
+
+    Functionality : Reading the database host a request runs against from its connection fields, without the credentials of the MongoDB
+                    connection URI, the Cassandra clusters being told apart by the name of their secure connection bundle.
+    :param backend: The backend of the request.
+    :param form: The request form dictionary.
+    :param files: The request files dictionary.
+    :return: host
+
+    '''
+
+    if backend == "mysql":
+        return form.get('host_name', '').strip().lower()
+
+    if backend == "sqlserver":
+        return form.get('server_name', '').strip().lower()
+
+    if backend == "mongodb":
+        connection_uri = re.sub(r"^[a-zA-Z0-9+]+://([^@/]*@)?", "", form.get('hostName', '').replace("'","").replace('"',"").strip())
+        return re.split(r"[/?]", connection_uri)[0].lower()
+
+    connectionBundle = files.get('connectionBundle')
+
+    return os.path.basename(connectionBundle.filename) if connectionBundle is not None else ""
+
+
+################################################
+#     13) Admission Controlled :               #
+################################################
+
+def admission_controlled(backend, operation_class, unbounded_only=False):
+
+    '''
+
+    Functionality : Decorating the route of a heavy operation, so that it runs within the bulkhead of its backend, database host and
+                    operation class. A request over the limit waits in the bounded queue of the bulkhead and gets a 503 response with a
+                    Retry-After header once the queue is full or its wait timed out. The slot is released once the response got sent, which
+                    is after the last chunk for the streamed downloads.
+    :param backend: The backend of the route, such as mysql or mongodb.
+    :param operation_class: The class of the heavy operation. Possible values are : "bulk_insert", "export" and "bulk_write".
+    :param unbounded_only: Whether only the requests without any conditional field or query are heavy, as for updates and deletes.
+    :return: decorator
+
+    '''
+
+    def decorator(view_function):
+
+        def admit_request():
+
+            if request.method != "POST":
+                return None, None
+
+            if unbounded_only and (len(prepare_conditional_fields(request.form)) > 0 or
+                                   request.form.get('conditionalQuery', '').strip() not in ["", "{}"]):
+                return None, None
+
+            admission_object = AdmissionOperations()
+            bulkhead_key = admission_object.acquire_slot(backend, prepare_admission_host(backend, request.form, request.files), operation_class)
+
+            if bulkhead_key is None:
+
+                response = jsonify({"status": "ERROR", "message": "Too many " + operation_class.replace("_", " ") + " operations are running "
+                                    "against this " + BACKEND_DISPLAY_NAMES[backend] + " host. Please retry after " +
+                                    str(admission_object.retry_after) + " seconds."})
+                response.status_code = 503
+                response.headers["Retry-After"] = str(admission_object.retry_after)
+
+                return None, response
+
+            released = []
+
+            def release_slot():
+
+                if len(released) == 0:
+                    released.append(True)
+                    admission_object.release_slot(bulkhead_key)
+
+            return release_slot, None
+
+        if inspect.iscoroutinefunction(view_function):
+
+            @functools.wraps(view_function)
+            async def async_wrapper(*args, **kwargs):
+
+                release_slot, rejection = admit_request()
+
+                if rejection is not None:
+                    return rejection
+
+                if release_slot is None:
+                    return await view_function(*args, **kwargs)
+
+                try:
+                    response = make_response(await view_function(*args, **kwargs))
+
+                except Exception:
+                    release_slot()
+                    raise
+
+                response.call_on_close(release_slot)
+
+                return response
+
+            return async_wrapper
+
+        @functools.wraps(view_function)
+        def wrapper(*args, **kwargs):
+
+            release_slot, rejection = admit_request()
+
+            if rejection is not None:
+                return rejection
+
+            if release_slot is None:
+                return view_function(*args, **kwargs)
+
+            try:
+                response = make_response(view_function(*args, **kwargs))
+
+            except Exception:
+                release_slot()
+                raise
+
+            response.call_on_close(release_slot)
+
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+################################################
+#     14) Admin Token Required :               #
+################################################
+
+def admin_token_required(view_function):
+
+    '''
+
+    Functionality : Decorating the route of an admin page, so that it is only served to the requests carrying the admin token, either as the
+                    password of the basic authentication or in the X-Admin-Token header. The admin pages are disabled while no admin token
+                    is configured, as they expose the recorded statements, their plans and the request profiles.
+    :param view_function: The route function of the admin page.
+    :return: wrapper
+
+    '''
+
+    @functools.wraps(view_function)
+    def wrapper(*args, **kwargs):
+
+        admin_token = config().getValue("ADMIN_TOKEN")
+
+        if admin_token == "":
+            log_object.logToFile('warn', 'The admin page got requested while no admin token is configured....')
+            return "The admin pages are disabled as no admin token is configured.", 403
+
+        token = request.headers.get("X-Admin-Token", "")
+
+        if token == "" and request.authorization is not None:
+            token = request.authorization.password or ""
+
+        if token == "" or not hmac.compare_digest(token.encode("utf-8"), admin_token.encode("utf-8")):
+            log_object.logToFile('warn', 'The admin page got requested without a valid admin token....')
+            return "A valid admin token is required for the admin pages.", 401, {"WWW-Authenticate": 'Basic realm="Admin Pages"'}
+
+        return view_function(*args, **kwargs)
+
+    return wrapper
+
+##########################################################################################################################################
+#                                                 End Block : Request Helper Functions :                                                 #
+##########################################################################################################################################
+
+
 ##########################################################################################################################################
 #                                                 Start Block : MongoDB Database Operation Functions :                                 #
 ##########################################################################################################################################
@@ -84,6 +634,7 @@ def table_insertion_single_record_schema_input_mongodb():
 ###################################################
 
 @app.route('/insert_table_multiple_records_mongodb/', methods = ["GET","POST"])
+@admission_controlled("mongodb", "bulk_insert")
 def table_insertion_multiple_records_schema_input_mongodb():
 
     try:
@@ -96,29 +647,44 @@ def table_insertion_multiple_records_schema_input_mongodb():
         databaseName = request.form['databaseName']
         collectionName = request.form['collectionName']
         dataFile = request.files['documentFile']
+        upsertKey = request.form.get('upsertKey', '').strip()
+        upsertMode = request.form.get('upsertMode', 'replace')
 
         file_object = FileOperations()
         file_object.saveFile(dataFile,3)
 
-        if dataFile.filename.find(".csv") > -1 :
-
-            data = file_object.csvToJson(dataFile.filename)
+        if dataFile.filename.lower().endswith((".csv", ".csv.gz")) :
 
+            log_object.logToFile('debug', 'Reading the CSV document records in batches....')
+            document_batches = file_object.readCSVDocumentBatches(dataFile.filename,DEFAULT_INSERT_BATCH_SIZE)
 
-        elif dataFile.filename.find(".json") > -1 :
+        elif dataFile.filename.lower().endswith((".json", ".ndjson", ".jsonl", ".gz")) :
 
-            data = file_object.readJsonFile(dataFile.filename)
+            log_object.logToFile('debug', 'Reading the JSON or NDJSON document records in batches....')
+            document_batches = file_object.readJsonDocumentBatches(dataFile.filename,DEFAULT_INSERT_BATCH_SIZE)
 
-        if data == False :
-            raise Exception("The document data provided is not in a proper JSON format.")
+        else :
+            raise Exception("The document file must be a CSV, JSON or NDJSON file, optionally gzip compressed.")
 
         table_object = MongoDBOperations(connection_uri,username,password,databaseName)
-        table_object.insert_multiple_records(collectionName,data)
+
+        if upsertKey != "":
+
+            log_object.logToFile('debug', 'Upserting the document records keyed on the field : ' + upsertKey + '....')
+            counts = table_object.upsert_multiple_records(collectionName,itertools.chain.from_iterable(document_batches),upsertKey,upsertMode)
+
+            log_object.logToFile('info',
+                                 'Rendering the Table Insertion For Multiple Records Form page with status for MongoDB....')
+            return render_template('insertIntoTableMultipleRecordsMongoDB.html', db_type="MongoDB",
+                                   status=[True, "SUCCESS", "All document records got upserted successfully. Upserted : {0}, Modified : {1}, Matched : {2}"
+                                           .format(counts["upserted"], counts["modified"], counts["matched"])])
+
+        inserted_count = table_object.insert_document_batches(collectionName,document_batches)
 
         log_object.logToFile('info',
                              'Rendering the Table Insertion For Multiple Records Form page with status for MongoDB....')
         return render_template('insertIntoTableMultipleRecordsMongoDB.html', db_type="MongoDB",
-                               status=[True, "SUCCESS", "All document records got inserted successfully"])
+                               status=[True, "SUCCESS", "All " + str(inserted_count) + " document records got inserted successfully"])
 
     except Exception as e:
 
@@ -135,6 +701,7 @@ def table_insertion_multiple_records_schema_input_mongodb():
 ###################################################
 
 @app.route('/download_table_data_mongodb/', methods = ["GET","POST"])
+@admission_controlled("mongodb", "export")
 def table_download_data_mongodb():
 
     try:
@@ -171,17 +738,67 @@ def table_download_data_mongodb():
             projectionQuery_data = {}
 
 
+        download_format, compression = prepare_download_format(request.form, ["json", "ndjson"])
+        stream_compression = prepare_stream_compression(request.form)
+
         table_object = MongoDBOperations(connection_uri,username,password,databaseName)
-        result = table_object.select_records(collectionName,conditionalQuery_data,projectionQuery_data,rowLimit)
+        file_name = "MongoDB_" + collectionName + "_" + datetime.datetime.now().strftime("%d%b%Y") + ".json"
+
+        if request.form.get('aggregationPipeline', '').strip() != "":
+
+            log_object.logToFile('debug', 'Streaming the aggregation pipeline results from the collection....')
+            pipeline, batch_size = prepare_aggregation_pipeline(request.form,conditionalQuery_data,projectionQuery_data,rowLimit)
+            document_batches = table_object.run_aggregation_pipeline(collectionName,pipeline,request.form.get('allowDiskUse') == "on",
+                                                                     batch_size)
+
+            if download_format == "ndjson":
+                return send_stream(file_object,file_name.replace(".json", ".ndjson"),
+                                   file_object.generateNDJSONStream(document_batches,json_util.dumps),'application/x-ndjson',
+                                   stream_compression)
+
+            if download_format == "json":
+                return send_stream(file_object,file_name,file_object.generateJSONArrayStream(document_batches,json_util.dumps),
+                                   'application/json',stream_compression)
+
+            headers,batches = file_object.convertDocumentBatchesToRows(document_batches)
+
+            if len(headers) == 0 :
+                raise Exception("No document records are returned by the aggregation pipeline.")
+
+            return send_columnar_file(file_object,file_name,download_format,compression,headers,batches)
+
+        if download_format == "ndjson":
+
+            log_object.logToFile('debug', 'Streaming NDJSON data from the collection....')
+            document_batches = table_object.select_records(collectionName,conditionalQuery_data,projectionQuery_data,rowLimit,
+                                                           DEFAULT_FETCH_SIZE)
+
+            return send_stream(file_object,file_name.replace(".json", ".ndjson"),
+                               file_object.generateNDJSONStream(document_batches,json_util.dumps),'application/x-ndjson',stream_compression)
+
+        if download_format != "json":
+
+            document_batches = table_object.select_records(collectionName,conditionalQuery_data,projectionQuery_data,rowLimit,
+                                                           DEFAULT_FETCH_SIZE)
+            headers,batches = file_object.convertDocumentBatchesToRows(document_batches)
+
+            if len(headers) == 0 :
+                raise Exception("No document records are found for the given parameters in the collection.")
+
+            return send_columnar_file(file_object,file_name,download_format,compression,headers,batches)
+
+        if request.form.get('useCache') == "on":
+            result = table_object.select_cached_records(collectionName,conditionalQuery_data,projectionQuery_data,rowLimit)
+        else:
+            result = table_object.select_records(collectionName,conditionalQuery_data,projectionQuery_data,rowLimit)
 
         if len(result) == 0 :
             raise Exception("No document records are found for the given parameters in the collection.")
 
-        json_file_name = "MongoDB_" + collectionName + "_" + datetime.datetime.now().strftime("%d%b%Y") + ".json"
-        file_object.writeToJsonFile(result,json_file_name)
+        file_object.writeToJsonFile(result,file_name)
 
         log_object.logToFile('debug', 'Downloading file from Flask server....')
-        return send_file(json_file_name, as_attachment=True)
+        return send_file(file_name, as_attachment=True)
 
     except Exception as e:
 
@@ -197,6 +814,7 @@ def table_download_data_mongodb():
 ################################################
 
 @app.route('/delete_data_from_table_mongodb/', methods = ["GET","POST"])
+@admission_controlled("mongodb", "bulk_write", unbounded_only=True)
 def table_delete_data_mongodb():
 
     try:
@@ -243,6 +861,7 @@ def table_delete_data_mongodb():
 #     5) Update Table Function :               #
 ################################################
 @app.route('/update_table_record_mongodb/', methods = ["GET","POST"])
+@admission_controlled("mongodb", "bulk_write", unbounded_only=True)
 def table_update_schema_input_mongodb():
 
     try:
@@ -444,6 +1063,7 @@ def table_insertion_single_record_schema_input_cassandra():
 ################################################
 
 @app.route('/insert_table_mutliple_records_cassandra', methods = ["GET","POST"])
+@admission_controlled("cassandra", "bulk_insert")
 def table_insertion_multiple_records_cassandra():
 
     try:
@@ -514,8 +1134,12 @@ def table_insertion_multiple_records_cassandra():
 ################################################
 
 @app.route('/download_table_data_cassandra/', methods = ["GET","POST"])
+@admission_controlled("cassandra", "export")
 def table_download_data_cassandra():
 
+    file_object = FileOperations()
+    connectionBundle = None
+
     try :
 
         log_object.logToFile('debug', 'Initiating table data download for Cassandra DB....')
@@ -526,8 +1150,11 @@ def table_download_data_cassandra():
         tableName = request.form['tableName']
         connectionBundle = request.files['connectionBundle']
         noOfRows = request.form['rowLimit']
+        fetchSize = request.form.get('fetchSize', '').strip()
+        pagingState = request.form.get('pagingState', '').strip()
+        pageLimit = request.form.get('pageLimit', '').strip()
+        exportMode = request.form.get('exportMode', 'sequential')
 
-        file_object = FileOperations()
         file_object.removeFilesWithExtension('.', 'csv')
 
         file_object.saveFile(connectionBundle, 3)
@@ -544,33 +1171,94 @@ def table_download_data_cassandra():
 
         log_object.logToFile('debug', 'Fetching data from the table for Cassandra DB....')
 
-        table_obj = CassandraOperations(clientID, clientSecret, connectionBundle.filename, keySpaceName)
-        headers,results = table_obj.select_records(tableName,conditional_fields,noOfRows)
+        download_format, compression = prepare_download_format(request.form, ["csv"])
+        stream_compression = prepare_stream_compression(request.form)
 
-        log_object.logToFile('debug', 'Writing CSV file with table data for Cassandra DB....')
+        table_obj = CassandraOperations(clientID, clientSecret, connectionBundle.filename, keySpaceName)
         file_name = "Cassandra_"+tableName+"_"+datetime.datetime.now().strftime("%d%b%Y")+".csv"
 
-        file_object = FileOperations()
+        if exportMode.lower() == "parallel":
+
+            worker_count, partition_count = prepare_export_parallelism(request.form)
+
+            log_object.logToFile('debug', 'Streaming CSV data by parallel token range scans from the table for Cassandra DB....')
+            headers,batches = table_obj.export_records_token_ranges(tableName,conditional_fields,worker_count,
+                                                                    max(partition_count // worker_count, 1))
+            batches = limit_record_batches(batches,noOfRows)
+
+            if download_format != "csv":
+                return send_columnar_file(file_object,file_name,download_format,compression,headers,batches)
+
+            return send_stream(file_object,file_name,file_object.generateCSVStream(headers,batches),'text/csv',stream_compression)
+
+        if pageLimit != "":
+
+            if not pageLimit.isdigit() or int(pageLimit) < 1:
+                raise Exception("The number of pages per part needs to be a positive number.")
+
+            log_object.logToFile('debug', 'Fetching a part of ' + pageLimit + ' pages of table data for Cassandra DB....')
+            headers,pages = table_obj.select_records(tableName,conditional_fields,noOfRows,fetchSize or DEFAULT_FETCH_SIZE,pagingState)
+            records,next_paging_state = read_cassandra_page_part(pages,int(pageLimit))
+
+            file_name = file_name.replace(".csv", "_part.csv")
+
+            if download_format != "csv":
+                response = send_columnar_file(file_object,file_name,download_format,compression,headers,[records])
+            else:
+                response = send_stream(file_object,file_name,file_object.generateCSVStream(headers,[records]),'text/csv',stream_compression)
+
+            response.headers['X-Paging-State'] = next_paging_state or ""
+
+            return response
+
+        if download_format != "csv":
+
+            log_object.logToFile('debug', 'Fetching table data page wise for Cassandra DB....')
+            headers,pages = table_obj.select_records(tableName,conditional_fields,noOfRows,fetchSize or DEFAULT_FETCH_SIZE,pagingState)
+
+            page_batches = (page_records for page_records, paging_state in pages)
+
+            return send_columnar_file(file_object,file_name,download_format,compression,headers,page_batches)
+
+        if fetchSize != "" or stream_compression is not None:
+
+            log_object.logToFile('debug', 'Streaming CSV data page wise from the table for Cassandra DB....')
+            headers,pages = table_obj.select_records(tableName,conditional_fields,noOfRows,fetchSize or DEFAULT_FETCH_SIZE,pagingState)
+
+            page_batches = (page_records for page_records, paging_state in pages)
+
+            return send_stream(file_object,file_name,file_object.generateCSVStream(headers,page_batches),'text/csv',stream_compression)
+
+        if request.form.get('useCache') == "on":
+            headers,results = table_obj.select_cached_records(tableName,conditional_fields,noOfRows)
+        else:
+            headers,results = table_obj.select_records(tableName,conditional_fields,noOfRows)
+
+        log_object.logToFile('debug', 'Writing CSV file with table data for Cassandra DB....')
+
         file_object.writeToCSV(file_name,results,headers)
 
         log_object.logToFile('debug', 'Downloading file from Flask server for Cassandra DB....')
 
-        file_object.deleteFile(str(connectionBundle.filename))
-
         return send_file(file_name, as_attachment=True)
 
     except Exception as e :
 
-        file_object.deleteFile(str(connectionBundle.filename))
         return render_template('downloadData.html', db_type="Cassandra",
                                status=[True, "ERROR", "Table data could not get downloaded due to the following exception: "+str(e)])
 
+    finally :
+
+        if connectionBundle is not None and os.path.exists(str(connectionBundle.filename)):
+            file_object.deleteFile(str(connectionBundle.filename))
+
 
 ################################################
 #   5) Delete Records From Table Function :    #
 ################################################
 
 @app.route('/delete_data_from_table_cassandra/', methods = ["GET","POST"])
+@admission_controlled("cassandra", "bulk_write", unbounded_only=True)
 def table_delete_data_cassandra():
 
     try :
@@ -620,6 +1308,7 @@ def table_delete_data_cassandra():
 ################################################
 
 @app.route('/update_table_record_cassandra/', methods = ["GET","POST"])
+@admission_controlled("cassandra", "bulk_write", unbounded_only=True)
 def table_update_schema_input_cassandra():
 
     try :
@@ -864,6 +1553,7 @@ def table_insertion_single_record_schema_input():
 ################################################
 
 @app.route('/insert_table_mutliple_records', methods = ["GET","POST"])
+@admission_controlled("mysql", "bulk_insert")
 def table_insertion_multiple_records():
 
     try :
@@ -881,6 +1571,13 @@ def table_insertion_multiple_records():
         except Exception as e :
             includeHeaders = 'off'
 
+        try:
+            upsertMode = request.form['upsertMode']
+        except Exception as e :
+            upsertMode = 'off'
+
+        upsertFields = [i.strip() for i in request.form.get('upsertFields', '').split(',') if i.strip() != ""]
+
         data_file = request.files['insert_file']
 
         file_object = FileOperations()
@@ -890,7 +1587,13 @@ def table_insertion_multiple_records():
         try :
 
             table_obj = MySqlOperations(userName, password, database_name,host_name)
-            table_obj.insert_into_table_multiple_records(table_name,headers,values)
+
+            if upsertMode.lower() == 'on':
+                log_object.logToFile('debug', 'Upserting the dataset into the table....')
+                table_obj.upsert_into_table_multiple_records(table_name,headers,values,upsertFields)
+            else:
+                table_obj.insert_into_table_multiple_records(table_name,headers,values)
+
             file_object.deleteFile(str(data_file.filename))
 
             log_object.logToFile('info',
@@ -922,6 +1625,7 @@ def table_insertion_multiple_records():
 ################################################
 
 @app.route('/download_table_data/', methods = ["GET","POST"])
+@admission_controlled("mysql", "export")
 def table_download_data():
 
     try :
@@ -934,6 +1638,7 @@ def table_download_data():
         table_name = request.form['table_name']
         noOfRows = request.form['rowLimit']
         host_name = request.form['host_name']
+        exportMode = request.form.get('exportMode', 'sequential')
 
         conditional_fields = []
 
@@ -947,13 +1652,58 @@ def table_download_data():
 
         log_object.logToFile('debug', 'Fetching data from the table....')
 
-        table_obj = MySqlOperations(userName,password,database_name,host_name)
-        headers,results = table_obj.select_records(table_name,conditional_fields,noOfRows)
+        download_format, compression = prepare_download_format(request.form, ["csv"])
+        stream_compression = prepare_stream_compression(request.form)
 
-        log_object.logToFile('debug', 'Writing CSV file with table data....')
+        table_obj = MySqlOperations(userName,password,database_name,host_name)
         file_name = "MySQL_"+table_name+"_"+datetime.datetime.now().strftime("%d%b%Y")+".csv"
 
         file_object = FileOperations()
+
+        if exportMode.lower() == "parallel":
+
+            worker_count, partition_count = prepare_export_parallelism(request.form)
+
+            log_object.logToFile('debug', 'Exporting table data by parallel key range reads....')
+            headers,batches = table_obj.export_records_key_ranges(table_name,conditional_fields,request.form.get('keyField', '').strip(),
+                                                                  partition_count,worker_count)
+            batches = limit_record_batches(batches,noOfRows)
+
+            if request.form.get('outputMode', 'stream').lower() == "parts":
+
+                zip_file_name = file_name.replace(".csv", "_" + datetime.datetime.now().strftime("%H%M%S%f") + ".zip")
+                file_object.writeToCSVParts(zip_file_name,file_name.replace(".csv", ""),headers,batches)
+
+                response = send_file(zip_file_name, as_attachment=True, download_name=file_name.replace(".csv", ".zip"))
+                response.call_on_close(lambda: file_object.deleteFile(zip_file_name))
+
+                return response
+
+            if download_format != "csv":
+                return send_columnar_file(file_object,file_name,download_format,compression,headers,batches)
+
+            return send_stream(file_object,file_name,file_object.generateCSVStream(headers,batches),'text/csv',stream_compression)
+
+        if download_format != "csv":
+
+            log_object.logToFile('debug', 'Fetching table data in batches....')
+            headers,batches = table_obj.select_records(table_name,conditional_fields,noOfRows,DEFAULT_FETCH_SIZE)
+
+            return send_columnar_file(file_object,file_name,download_format,compression,headers,batches)
+
+        if stream_compression is not None:
+
+            log_object.logToFile('debug', 'Streaming compressed CSV data from the table....')
+            headers,batches = table_obj.select_records(table_name,conditional_fields,noOfRows,DEFAULT_FETCH_SIZE)
+
+            return send_stream(file_object,file_name,file_object.generateCSVStream(headers,batches),'text/csv',stream_compression)
+
+        if request.form.get('useCache') == "on":
+            headers,results = table_obj.select_cached_records(table_name,conditional_fields,noOfRows)
+        else:
+            headers,results = table_obj.select_records(table_name,conditional_fields,noOfRows)
+
+        log_object.logToFile('debug', 'Writing CSV file with table data....')
         file_object.removeFilesWithExtension('.', 'csv')
         file_object.writeToCSV(file_name,results,headers)
 
@@ -974,6 +1724,7 @@ def table_download_data():
 ################################################
 
 @app.route('/delete_data_from_table/', methods = ["GET","POST"])
+@admission_controlled("mysql", "bulk_write", unbounded_only=True)
 def table_delete_data():
 
     try :
@@ -1018,6 +1769,7 @@ def table_delete_data():
 ################################################
 
 @app.route('/update_table_record/', methods = ["GET","POST"])
+@admission_controlled("mysql", "bulk_write", unbounded_only=True)
 def table_update_schema_input():
 
     try :
@@ -1262,6 +2014,7 @@ def table_insertion_single_record_schema_input_sql_server():
 ################################################
 
 @app.route('/insert_table_mutliple_records_sql_server', methods = ["GET","POST"])
+@admission_controlled("sqlserver", "bulk_insert")
 def table_insertion_multiple_records_sql_server():
 
     try :
@@ -1320,6 +2073,7 @@ def table_insertion_multiple_records_sql_server():
 ################################################
 
 @app.route('/download_table_data_sql_server/', methods = ["GET","POST"])
+@admission_controlled("sqlserver", "export")
 def table_download_data_sql_server():
 
     try :
@@ -1332,6 +2086,7 @@ def table_download_data_sql_server():
         table_name = request.form['table_name']
         noOfRows = request.form['rowLimit']
         server_name = request.form['server_name']
+        exportMode = request.form.get('exportMode', 'sequential')
 
         conditional_fields = []
 
@@ -1345,13 +2100,58 @@ def table_download_data_sql_server():
 
         log_object.logToFile('debug', 'Fetching data from the table....')
 
-        table_obj = MicrosoftSQLServerOperations(userName,password,database_name,server_name)
-        headers,results = table_obj.select_records(table_name,conditional_fields,noOfRows)
+        download_format, compression = prepare_download_format(request.form, ["csv"])
+        stream_compression = prepare_stream_compression(request.form)
 
-        log_object.logToFile('debug', 'Writing CSV file with table data....')
+        table_obj = MicrosoftSQLServerOperations(userName,password,database_name,server_name)
         file_name = "MSSQLServer_"+table_name+"_"+datetime.datetime.now().strftime("%d%b%Y")+".csv"
 
         file_object = FileOperations()
+
+        if exportMode.lower() == "parallel":
+
+            worker_count, partition_count = prepare_export_parallelism(request.form)
+
+            log_object.logToFile('debug', 'Exporting table data by parallel key range reads....')
+            headers,batches = table_obj.export_records_key_ranges(table_name,conditional_fields,request.form.get('keyField', '').strip(),
+                                                                  partition_count,worker_count)
+            batches = limit_record_batches(batches,noOfRows)
+
+            if request.form.get('outputMode', 'stream').lower() == "parts":
+
+                zip_file_name = file_name.replace(".csv", "_" + datetime.datetime.now().strftime("%H%M%S%f") + ".zip")
+                file_object.writeToCSVParts(zip_file_name,file_name.replace(".csv", ""),headers,batches)
+
+                response = send_file(zip_file_name, as_attachment=True, download_name=file_name.replace(".csv", ".zip"))
+                response.call_on_close(lambda: file_object.deleteFile(zip_file_name))
+
+                return response
+
+            if download_format != "csv":
+                return send_columnar_file(file_object,file_name,download_format,compression,headers,batches)
+
+            return send_stream(file_object,file_name,file_object.generateCSVStream(headers,batches),'text/csv',stream_compression)
+
+        if download_format != "csv":
+
+            log_object.logToFile('debug', 'Fetching table data in batches....')
+            headers,batches = table_obj.select_records(table_name,conditional_fields,noOfRows,DEFAULT_FETCH_SIZE)
+
+            return send_columnar_file(file_object,file_name,download_format,compression,headers,batches)
+
+        if stream_compression is not None:
+
+            log_object.logToFile('debug', 'Streaming compressed CSV data from the table....')
+            headers,batches = table_obj.select_records(table_name,conditional_fields,noOfRows,DEFAULT_FETCH_SIZE)
+
+            return send_stream(file_object,file_name,file_object.generateCSVStream(headers,batches),'text/csv',stream_compression)
+
+        if request.form.get('useCache') == "on":
+            headers,results = table_obj.select_cached_records(table_name,conditional_fields,noOfRows)
+        else:
+            headers,results = table_obj.select_records(table_name,conditional_fields,noOfRows)
+
+        log_object.logToFile('debug', 'Writing CSV file with table data....')
         file_object.removeFilesWithExtension('.', 'csv')
         file_object.writeToCSV(file_name,results,headers)
 
@@ -1372,6 +2172,7 @@ def table_download_data_sql_server():
 ################################################
 
 @app.route('/delete_data_from_table_sql_server/', methods = ["GET","POST"])
+@admission_controlled("sqlserver", "bulk_write", unbounded_only=True)
 def table_delete_data_sql_server():
 
     try :
@@ -1416,6 +2217,7 @@ def table_delete_data_sql_server():
 ################################################
 
 @app.route('/update_table_record_sql_server/', methods = ["GET","POST"])
+@admission_controlled("sqlserver", "bulk_write", unbounded_only=True)
 def table_update_schema_input_sql_server():
 
     try :
@@ -1517,6 +2319,950 @@ def table_update_schema_input_sql_server():
 ##################################################################################################################################################
 
 
+##########################################################################################################################################
+#                                                 Start Block : Table Browsing API Functions :                                           #
+##########################################################################################################################################
+
+################################################
+#     1) Browse Table Data For MySQL :         #
+################################################
+
+@app.route('/browse_table_data/', methods = ["POST"])
+def table_browse_data():
+
+    try :
+
+        log_object.logToFile('debug', 'Browsing table data page for MySQL....')
+
+        userName = request.form['username']
+        password = request.form['password']
+        database_name = request.form['database_name']
+        table_name = request.form['table_name']
+        host_name = request.form['host_name']
+        continuationToken = request.form.get('continuationToken', '')
+
+        page_size = prepare_page_size(request.form)
+        conditional_fields = prepare_conditional_fields(request.form)
+
+        table_obj = MySqlOperations(userName,password,database_name,host_name)
+        headers,results,next_token = table_obj.browse_records(table_name,conditional_fields,page_size,continuationToken)
+
+        file_object = FileOperations()
+
+        return jsonify({"status": "SUCCESS", "headers": headers, "records": file_object.convertRowsToJson(headers,results),
+                        "continuationToken": next_token})
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Table data could not be browsed due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Table data could not be browsed due to the following exception: " + str(e)}), 400
+
+
+################################################
+#  2) Browse Table Data For MS SQL Server :    #
+################################################
+
+@app.route('/browse_table_data_sql_server/', methods = ["POST"])
+def table_browse_data_sql_server():
+
+    try :
+
+        log_object.logToFile('debug', 'Browsing table data page for Microsoft SQL Server....')
+
+        userName = request.form['username']
+        password = request.form['password']
+        database_name = request.form['database_name']
+        table_name = request.form['table_name']
+        server_name = request.form['server_name']
+        continuationToken = request.form.get('continuationToken', '')
+
+        page_size = prepare_page_size(request.form)
+        conditional_fields = prepare_conditional_fields(request.form)
+
+        table_obj = MicrosoftSQLServerOperations(userName,password,database_name,server_name)
+        headers,results,next_token = table_obj.browse_records(table_name,conditional_fields,page_size,continuationToken)
+
+        file_object = FileOperations()
+
+        return jsonify({"status": "SUCCESS", "headers": headers, "records": file_object.convertRowsToJson(headers,results),
+                        "continuationToken": next_token})
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Table data could not be browsed due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Table data could not be browsed due to the following exception: " + str(e)}), 400
+
+
+################################################
+#     3) Browse Table Data For Cassandra :     #
+################################################
+
+@app.route('/browse_table_data_cassandra/', methods = ["POST"])
+def table_browse_data_cassandra():
+
+    file_object = FileOperations()
+    connectionBundle = None
+
+    try :
+
+        log_object.logToFile('debug', 'Browsing table data page for Cassandra DB....')
+
+        clientID = request.form['clientId']
+        clientSecret = request.form['clientSecret']
+        keySpaceName = request.form['keySpaceName']
+        tableName = request.form['tableName']
+        connectionBundle = request.files['connectionBundle']
+        continuationToken = request.form.get('continuationToken', '')
+
+        page_size = prepare_page_size(request.form)
+        conditional_fields = prepare_conditional_fields(request.form)
+
+        file_object.saveFile(connectionBundle, 3)
+
+        table_obj = CassandraOperations(clientID, clientSecret, connectionBundle.filename, keySpaceName)
+        headers,results,next_token = table_obj.browse_records(tableName,conditional_fields,page_size,continuationToken)
+
+        file_object.deleteFile(str(connectionBundle.filename))
+
+        return jsonify({"status": "SUCCESS", "headers": headers, "records": file_object.convertRowsToJson(headers,results),
+                        "continuationToken": next_token})
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Table data could not be browsed due to the following exception: " + str(e))
+
+        if connectionBundle is not None and os.path.exists(str(connectionBundle.filename)):
+            file_object.deleteFile(str(connectionBundle.filename))
+
+        return jsonify({"status": "ERROR", "message": "Table data could not be browsed due to the following exception: " + str(e)}), 400
+
+
+################################################
+#     4) Browse Collection Data For MongoDB :  #
+################################################
+
+@app.route('/browse_table_data_mongodb/', methods = ["POST"])
+def table_browse_data_mongodb():
+
+    try :
+
+        log_object.logToFile('debug', 'Browsing collection data page for MongoDB....')
+
+        username = request.form['username']
+        password = request.form['password']
+        connection_uri = request.form['hostName']
+        databaseName = request.form['databaseName']
+        collectionName = request.form['collectionName']
+        conditionalQuery = request.form.get('conditionalQuery', '')
+        projectionQuery = request.form.get('projectionQuery', '')
+        continuationToken = request.form.get('continuationToken', '')
+
+        page_size = prepare_page_size(request.form)
+
+        file_object = FileOperations()
+
+        conditionalQuery_data = {}
+        projectionQuery_data = {}
+
+        if conditionalQuery != "":
+            conditionalQuery_data = file_object.convertStringToJson(conditionalQuery)
+
+            if conditionalQuery_data == False :
+                raise Exception("The conditional query provided is not in a proper JSON format.")
+
+        if projectionQuery != "":
+            projectionQuery_data = file_object.convertStringToJson(projectionQuery)
+
+            if projectionQuery_data == False :
+                raise Exception("The projection query provided is not in a proper JSON format.")
+
+        table_object = MongoDBOperations(connection_uri,username,password,databaseName)
+        records,next_token = table_object.browse_records(collectionName,conditionalQuery_data,projectionQuery_data,page_size,continuationToken)
+
+        return Response(json_util.dumps({"status": "SUCCESS", "records": records, "continuationToken": next_token}),
+                        mimetype='application/json')
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Collection data could not be browsed due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Collection data could not be browsed due to the following exception: " + str(e)}), 400
+
+##########################################################################################################################################
+#                                                 End Block : Table Browsing API Functions :                                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Query Preview API Functions :                                            #
+##########################################################################################################################################
+
+################################################
+#     1) Prepare Preview Response :            #
+################################################
+
+def prepare_preview_response(preview):
+
+    '''
+
+    Functionality : Adding the status and the runaway scan warning to the preview returned by the database operation classes.
+    :param preview: The preview dictionary with the estimatedRows and isLowerBound values.
+    :return: preview
+
+    '''
+
+    warning_rows = config().getValue("PREVIEW_WARNING_ROWS")
+    estimated_rows = preview["estimatedRows"]
+
+    preview["status"] = "SUCCESS"
+    preview["warning"] = estimated_rows >= warning_rows or preview["isLowerBound"]
+
+    if preview["warning"]:
+        preview["message"] = "The query is estimated to match " + ("more than " if preview["isLowerBound"] else "") + \
+                             "{:,.0f}".format(estimated_rows) + " records, which may result in a long running scan."
+    else:
+        preview["message"] = "The query is estimated to match " + "{:,.0f}".format(estimated_rows) + " records."
+
+    return preview
+
+
+################################################
+#     2) Preview Table Data For MySQL :        #
+################################################
+
+@app.route('/preview_table_data/', methods = ["POST"])
+def table_preview_data():
+
+    try :
+
+        log_object.logToFile('debug', 'Previewing table data for MySQL....')
+
+        table_obj = MySqlOperations(request.form['username'],request.form['password'],request.form['database_name'],
+                                    request.form['host_name'])
+        preview = table_obj.preview_records(request.form['table_name'],prepare_conditional_fields(request.form))
+
+        return jsonify(prepare_preview_response(preview))
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Table data could not be previewed due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Table data could not be previewed due to the following exception: " + str(e)}), 400
+
+
+################################################
+#  3) Preview Table Data For MS SQL Server :   #
+################################################
+
+@app.route('/preview_table_data_sql_server/', methods = ["POST"])
+def table_preview_data_sql_server():
+
+    try :
+
+        log_object.logToFile('debug', 'Previewing table data for Microsoft SQL Server....')
+
+        table_obj = MicrosoftSQLServerOperations(request.form['username'],request.form['password'],request.form['database_name'],
+                                                 request.form['server_name'])
+        preview = table_obj.preview_records(request.form['table_name'],prepare_conditional_fields(request.form))
+
+        return jsonify(prepare_preview_response(preview))
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Table data could not be previewed due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Table data could not be previewed due to the following exception: " + str(e)}), 400
+
+
+################################################
+#     4) Preview Table Data For Cassandra :    #
+################################################
+
+@app.route('/preview_table_data_cassandra/', methods = ["POST"])
+def table_preview_data_cassandra():
+
+    file_object = FileOperations()
+    connectionBundle = None
+
+    try :
+
+        log_object.logToFile('debug', 'Previewing table data for Cassandra DB....')
+
+        connectionBundle = request.files['connectionBundle']
+        file_object.saveFile(connectionBundle, 3)
+
+        table_obj = CassandraOperations(request.form['clientId'], request.form['clientSecret'], connectionBundle.filename,
+                                        request.form['keySpaceName'])
+        preview = table_obj.preview_records(request.form['tableName'],prepare_conditional_fields(request.form),
+                                            config().getValue("PREVIEW_COUNT_LIMIT"))
+
+        file_object.deleteFile(str(connectionBundle.filename))
+
+        return jsonify(prepare_preview_response(preview))
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Table data could not be previewed due to the following exception: " + str(e))
+
+        if connectionBundle is not None and os.path.exists(str(connectionBundle.filename)):
+            file_object.deleteFile(str(connectionBundle.filename))
+
+        return jsonify({"status": "ERROR", "message": "Table data could not be previewed due to the following exception: " + str(e)}), 400
+
+
+################################################
+#   5) Preview Collection Data For MongoDB :   #
+################################################
+
+@app.route('/preview_table_data_mongodb/', methods = ["POST"])
+def table_preview_data_mongodb():
+
+    try :
+
+        log_object.logToFile('debug', 'Previewing collection data for MongoDB....')
+
+        conditionalQuery = request.form.get('conditionalQuery', '')
+        conditionalQuery_data = {}
+
+        if conditionalQuery != "":
+            conditionalQuery_data = FileOperations().convertStringToJson(conditionalQuery)
+
+            if conditionalQuery_data == False :
+                raise Exception("The conditional query provided is not in a proper JSON format.")
+
+        table_object = MongoDBOperations(request.form['hostName'],request.form['username'],request.form['password'],
+                                         request.form['databaseName'])
+        preview = table_object.preview_records(request.form['collectionName'],conditionalQuery_data,
+                                               config().getValue("PREVIEW_COUNT_LIMIT"))
+
+        return Response(json_util.dumps(prepare_preview_response(preview)), mimetype='application/json')
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Collection data could not be previewed due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Collection data could not be previewed due to the following exception: " + str(e)}), 400
+
+##########################################################################################################################################
+#                                                 End Block : Query Preview API Functions :                                              #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Aggregation API Functions :                                              #
+##########################################################################################################################################
+
+################################################
+#     1) Send Aggregated Records :             #
+################################################
+
+def send_aggregated_records(file_name, headers, results, form):
+
+    '''
+
+    Functionality : Returning the aggregated rows either as JSON records or as a CSV download, as chosen through the aggregationFormat field.
+    :param file_name: The file name of the CSV download.
+    :param headers: The list of the group by field and aggregation headers.
+    :param results: The list of aggregated rows.
+    :param form: The request form dictionary.
+    :return: response
+
+    '''
+
+    file_object = FileOperations()
+    output_format = form.get('aggregationFormat', 'json').strip().lower()
+
+    if output_format == "csv":
+        return send_stream(file_object,file_name,file_object.generateCSVStream(headers,[results]),'text/csv',None)
+
+    if output_format != "json":
+        raise Exception("The aggregation format " + output_format + " is not supported.")
+
+    return jsonify({"status": "SUCCESS", "headers": headers, "records": file_object.convertRowsToJson(headers,results)})
+
+
+################################################
+#     2) Aggregate Table Data For MySQL :      #
+################################################
+
+@app.route('/aggregate_table_data/', methods = ["POST"])
+def table_aggregate_data():
+
+    try :
+
+        log_object.logToFile('debug', 'Aggregating table data for MySQL....')
+
+        group_fields, aggregations = QueryOperations().parse_aggregation_fields(request.form.get('groupByFields', ''),
+                                                                                request.form.get('aggregations', ''))
+
+        table_obj = MySqlOperations(request.form['username'],request.form['password'],request.form['database_name'],
+                                    request.form['host_name'])
+        headers,results = table_obj.aggregate_records(request.form['table_name'],prepare_conditional_fields(request.form),
+                                                      group_fields,aggregations)
+
+        return send_aggregated_records(request.form['table_name'] + "_aggregated.csv",headers,results,request.form)
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Table data could not be aggregated due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Table data could not be aggregated due to the following exception: " + str(e)}), 400
+
+
+################################################
+#  3) Aggregate Table Data For MS SQL Server : #
+################################################
+
+@app.route('/aggregate_table_data_sql_server/', methods = ["POST"])
+def table_aggregate_data_sql_server():
+
+    try :
+
+        log_object.logToFile('debug', 'Aggregating table data for Microsoft SQL Server....')
+
+        group_fields, aggregations = QueryOperations().parse_aggregation_fields(request.form.get('groupByFields', ''),
+                                                                                request.form.get('aggregations', ''))
+
+        table_obj = MicrosoftSQLServerOperations(request.form['username'],request.form['password'],request.form['database_name'],
+                                                 request.form['server_name'])
+        headers,results = table_obj.aggregate_records(request.form['table_name'],prepare_conditional_fields(request.form),
+                                                      group_fields,aggregations)
+
+        return send_aggregated_records(request.form['table_name'] + "_aggregated.csv",headers,results,request.form)
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Table data could not be aggregated due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Table data could not be aggregated due to the following exception: " + str(e)}), 400
+
+
+################################################
+#  4) Aggregate Collection Data For MongoDB :  #
+################################################
+
+@app.route('/aggregate_table_data_mongodb/', methods = ["POST"])
+def table_aggregate_data_mongodb():
+
+    try :
+
+        log_object.logToFile('debug', 'Aggregating collection data for MongoDB....')
+
+        group_fields, aggregations = QueryOperations().parse_aggregation_fields(request.form.get('groupByFields', ''),
+                                                                                request.form.get('aggregations', ''))
+
+        conditionalQuery = request.form.get('conditionalQuery', '')
+        conditionalQuery_data = {}
+
+        if conditionalQuery != "":
+            conditionalQuery_data = FileOperations().convertStringToJson(conditionalQuery)
+
+            if conditionalQuery_data == False :
+                raise Exception("The conditional query provided is not in a proper JSON format.")
+
+        table_object = MongoDBOperations(request.form['hostName'],request.form['username'],request.form['password'],
+                                         request.form['databaseName'])
+        headers,results = table_object.aggregate_records(request.form['collectionName'],conditionalQuery_data,group_fields,aggregations)
+
+        return send_aggregated_records(request.form['collectionName'] + "_aggregated.csv",headers,results,request.form)
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Collection data could not be aggregated due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Collection data could not be aggregated due to the following exception: " + str(e)}), 400
+
+##########################################################################################################################################
+#                                                 End Block : Aggregation API Functions :                                                #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Index Management API Functions :                                         #
+##########################################################################################################################################
+
+################################################
+#     1) Manage Index For MySQL :              #
+################################################
+
+@app.route('/manage_index/', methods = ["POST"])
+def table_manage_index():
+
+    try :
+
+        log_object.logToFile('debug', 'Managing table index for MySQL....')
+
+        index_name, index_fields = QueryOperations().parse_index_definition(request.form['table_name'],request.form.get('indexName', ''),
+                                                                            request.form.get('indexFields', ''))
+
+        table_obj = MySqlOperations(request.form['username'],request.form['password'],request.form['database_name'],
+                                    request.form['host_name'])
+
+        if request.form.get('action', 'create') == "drop":
+            table_obj.drop_index(request.form['table_name'],index_name)
+        else:
+            table_obj.create_index(request.form['table_name'],index_name,index_fields,request.form.get('unique') == "on")
+
+        return jsonify({"status": "SUCCESS", "indexName": index_name, "indexFields": index_fields})
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Table index could not be managed due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Table index could not be managed due to the following exception: " + str(e)}), 400
+
+
+################################################
+#     2) Manage Index For MS SQL Server :      #
+################################################
+
+@app.route('/manage_index_sql_server/', methods = ["POST"])
+def table_manage_index_sql_server():
+
+    try :
+
+        log_object.logToFile('debug', 'Managing table index for Microsoft SQL Server....')
+
+        index_name, index_fields = QueryOperations().parse_index_definition(request.form['table_name'],request.form.get('indexName', ''),
+                                                                            request.form.get('indexFields', ''))
+
+        table_obj = MicrosoftSQLServerOperations(request.form['username'],request.form['password'],request.form['database_name'],
+                                                 request.form['server_name'])
+
+        if request.form.get('action', 'create') == "drop":
+            table_obj.drop_index(request.form['table_name'],index_name)
+        else:
+            table_obj.create_index(request.form['table_name'],index_name,index_fields,request.form.get('unique') == "on")
+
+        return jsonify({"status": "SUCCESS", "indexName": index_name, "indexFields": index_fields})
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Table index could not be managed due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Table index could not be managed due to the following exception: " + str(e)}), 400
+
+
+################################################
+#     3) Manage Index For Cassandra :          #
+################################################
+
+@app.route('/manage_index_cassandra/', methods = ["POST"])
+def table_manage_index_cassandra():
+
+    file_object = FileOperations()
+    connectionBundle = None
+
+    try :
+
+        log_object.logToFile('debug', 'Managing table index for Cassandra DB....')
+
+        index_name, index_fields = QueryOperations().parse_index_definition(request.form['tableName'],request.form.get('indexName', ''),
+                                                                            request.form.get('indexFields', ''))
+
+        connectionBundle = request.files['connectionBundle']
+        file_object.saveFile(connectionBundle, 3)
+
+        table_obj = CassandraOperations(request.form['clientId'], request.form['clientSecret'], connectionBundle.filename,
+                                        request.form['keySpaceName'])
+
+        if request.form.get('action', 'create') == "drop":
+            table_obj.drop_index(request.form['tableName'],index_name)
+        else:
+            table_obj.create_index(request.form['tableName'],index_name,index_fields,request.form.get('indexType', 'secondary'))
+
+        file_object.deleteFile(str(connectionBundle.filename))
+
+        return jsonify({"status": "SUCCESS", "indexName": index_name, "indexFields": index_fields})
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Table index could not be managed due to the following exception: " + str(e))
+
+        if connectionBundle is not None and os.path.exists(str(connectionBundle.filename)):
+            file_object.deleteFile(str(connectionBundle.filename))
+
+        return jsonify({"status": "ERROR", "message": "Table index could not be managed due to the following exception: " + str(e)}), 400
+
+
+################################################
+#     4) Manage Index For MongoDB :            #
+################################################
+
+@app.route('/manage_index_mongodb/', methods = ["POST"])
+def table_manage_index_mongodb():
+
+    try :
+
+        log_object.logToFile('debug', 'Managing collection index for MongoDB....')
+
+        index_name, index_fields = QueryOperations().parse_index_definition(request.form['collectionName'],request.form.get('indexName', ''),
+                                                                            request.form.get('indexFields', ''))
+
+        table_object = MongoDBOperations(request.form['hostName'],request.form['username'],request.form['password'],
+                                         request.form['databaseName'])
+
+        if request.form.get('action', 'create') == "drop":
+            table_object.drop_index(request.form['collectionName'],index_name)
+        else:
+            table_object.create_index(request.form['collectionName'],index_name,index_fields,request.form.get('unique') == "on")
+
+        return jsonify({"status": "SUCCESS", "indexName": index_name, "indexFields": index_fields})
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Collection index could not be managed due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Collection index could not be managed due to the following exception: " + str(e)}), 400
+
+##########################################################################################################################################
+#                                                 End Block : Index Management API Functions :                                           #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Async Operation API Functions :                                          #
+##########################################################################################################################################
+
+################################################
+#  1) Async Insert Records For Cassandra :     #
+################################################
+
+@app.route('/async/insert_table_multiple_records_cassandra/', methods = ["POST"])
+@admission_controlled("cassandra", "bulk_insert")
+async def table_insertion_multiple_records_cassandra_async():
+
+    file_object = FileOperations()
+    connectionBundle = None
+    data_file = None
+
+    try :
+
+        log_object.logToFile('debug', 'Initiating async bulk data insertion for Cassandra DB....')
+
+        concurrency = prepare_async_concurrency(request.form)
+        includeHeaders = request.form.get('includeHeaders', 'off')
+
+        connectionBundle = request.files['connectionBundle']
+        file_object.saveFile(connectionBundle, 3)
+
+        data_file = request.files['insert_file']
+        file_object.saveFile(data_file, 3)
+        headers, values = file_object.readCSVFile(str(data_file.filename),includeHeaders)
+
+        table_obj = AsyncCassandraOperations(request.form['clientId'], request.form['clientSecret'], connectionBundle.filename,
+                                             request.form['keySpaceName'])
+        inserted_count = await table_obj.insert_records_concurrently(request.form['tableName'],headers,values,concurrency)
+
+        file_object.deleteFile(str(connectionBundle.filename))
+        file_object.deleteFile(str(data_file.filename))
+
+        return jsonify({"status": "SUCCESS", "insertedCount": inserted_count})
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Async bulk insertion failed due to the following exception: " + str(e))
+
+        for uploaded_file in [connectionBundle, data_file]:
+            if uploaded_file is not None and os.path.exists(str(uploaded_file.filename)):
+                file_object.deleteFile(str(uploaded_file.filename))
+
+        return jsonify({"status": "ERROR", "message": "Async bulk insertion failed due to the following exception: " + str(e)}), 400
+
+
+################################################
+#  2) Async Read Partitions For Cassandra :    #
+################################################
+
+@app.route('/async/select_partitions_cassandra/', methods = ["POST"])
+async def table_select_partitions_cassandra_async():
+
+    file_object = FileOperations()
+    connectionBundle = None
+
+    try :
+
+        log_object.logToFile('debug', 'Initiating async partition reads for Cassandra DB....')
+
+        concurrency = prepare_async_concurrency(request.form)
+        partitionKeys = file_object.convertStringToJson(request.form['partitionKeys'])
+
+        if not isinstance(partitionKeys, list) or len(partitionKeys) == 0:
+            raise Exception("The partition keys provided must be a non empty JSON array of values, or of value arrays for composite keys.")
+
+        partition_values = [[str(j) for j in i] if isinstance(i, list) else [str(i)] for i in partitionKeys]
+
+        connectionBundle = request.files['connectionBundle']
+        file_object.saveFile(connectionBundle, 3)
+
+        table_obj = AsyncCassandraOperations(request.form['clientId'], request.form['clientSecret'], connectionBundle.filename,
+                                             request.form['keySpaceName'])
+        headers,results = await table_obj.select_partitions_concurrently(request.form['tableName'],partition_values,concurrency)
+
+        file_object.deleteFile(str(connectionBundle.filename))
+
+        return jsonify({"status": "SUCCESS", "headers": headers, "records": file_object.convertRowsToJson(headers,results)})
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Table partitions could not be read due to the following exception: " + str(e))
+
+        if connectionBundle is not None and os.path.exists(str(connectionBundle.filename)):
+            file_object.deleteFile(str(connectionBundle.filename))
+
+        return jsonify({"status": "ERROR", "message": "Table partitions could not be read due to the following exception: " + str(e)}), 400
+
+
+################################################
+#  3) Async Insert Documents For MongoDB :     #
+################################################
+
+@app.route('/async/insert_table_multiple_records_mongodb/', methods = ["POST"])
+@admission_controlled("mongodb", "bulk_insert")
+async def table_insertion_multiple_records_mongodb_async():
+
+    try :
+
+        log_object.logToFile('debug', 'Initiating async bulk data insertion for Mongo DB....')
+
+        concurrency = prepare_async_concurrency(request.form)
+        dataFile = request.files['documentFile']
+
+        file_object = FileOperations()
+        file_object.saveFile(dataFile,3)
+
+        if dataFile.filename.lower().endswith((".csv", ".csv.gz")) :
+
+            log_object.logToFile('debug', 'Reading the CSV document records in batches....')
+            document_batches = file_object.readCSVDocumentBatches(dataFile.filename,DEFAULT_INSERT_BATCH_SIZE)
+
+        elif dataFile.filename.lower().endswith((".json", ".ndjson", ".jsonl", ".gz")) :
+            document_batches = file_object.readJsonDocumentBatches(dataFile.filename,DEFAULT_INSERT_BATCH_SIZE)
+
+        else :
+            raise Exception("The document file must be a CSV, JSON or NDJSON file, optionally gzip compressed.")
+
+        table_object = AsyncMongoDBOperations(request.form['hostName'],request.form['username'],request.form['password'],
+                                              request.form['databaseName'])
+        inserted_count = await table_object.insert_document_batches_concurrently(request.form['collectionName'],document_batches,concurrency)
+
+        return jsonify({"status": "SUCCESS", "insertedCount": inserted_count})
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Async document insertion failed due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Async document insertion failed due to the following exception: " + str(e)}), 400
+
+
+################################################
+#  4) Async Find Documents For MongoDB :       #
+################################################
+
+@app.route('/async/select_records_mongodb/', methods = ["POST"])
+async def table_select_records_mongodb_async():
+
+    try :
+
+        log_object.logToFile('debug', 'Initiating async finds for MongoDB....')
+
+        concurrency = prepare_async_concurrency(request.form)
+        conditionalQueries = json_util.loads(request.form['conditionalQueries'])
+        projectionQuery = request.form.get('projectionQuery', '')
+
+        if not isinstance(conditionalQueries, list) or not all([isinstance(i, dict) for i in conditionalQueries]):
+            raise Exception("The conditional queries provided must be a JSON array of filter objects.")
+
+        projectionQuery_data = {}
+
+        if projectionQuery != "":
+            projectionQuery_data = FileOperations().convertStringToJson(projectionQuery)
+
+            if projectionQuery_data == False :
+                raise Exception("The projection query provided is not in a proper JSON format.")
+
+        table_object = AsyncMongoDBOperations(request.form['hostName'],request.form['username'],request.form['password'],
+                                              request.form['databaseName'])
+        headers,records = await table_object.select_records_concurrently(request.form['collectionName'],conditionalQueries,
+                                                                         projectionQuery_data,concurrency)
+
+        return Response(json_util.dumps({"status": "SUCCESS", "headers": headers, "records": records}), mimetype='application/json')
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "Collection data could not be fetched due to the following exception: " + str(e))
+        return jsonify({"status": "ERROR", "message": "Collection data could not be fetched due to the following exception: " + str(e)}), 400
+
+##########################################################################################################################################
+#                                                 End Block : Async Operation API Functions :                                            #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Admin Page Functions :                                                   #
+##########################################################################################################################################
+
+################################################
+#     1) Index Advice Page :                   #
+################################################
+
+@app.route('/admin/index-advice/')
+@admin_token_required
+def index_advice_page():
+
+    log_object.logToFile('debug', 'Routed to the index advice page....')
+
+    try :
+        advice = IndexAdvisorOperations().get_index_advice(int(request.args.get('limit', '50')))
+        return render_template('indexAdvice.html', advice=advice, status=[False, "", ""])
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "The index advice could not be fetched due to the following exception: " + str(e))
+        return render_template('indexAdvice.html', advice=[],
+                               status=[True, "ERROR", "The index advice could not be fetched due to the following exception: " + str(e)])
+
+
+################################################
+#     2) Slow Queries Page :                   #
+################################################
+
+@app.route('/admin/slow-queries/')
+@admin_token_required
+def slow_queries_page():
+
+    log_object.logToFile('debug', 'Routed to the slow queries page....')
+
+    order_by = request.args.get('order', 'total')
+
+    try :
+        report = SlowQueryOperations().get_slow_query_report(order_by, int(request.args.get('limit', '50')))
+        return render_template('slowQueries.html', report=report, order=order_by, status=[False, "", ""])
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "The slow queries could not be fetched due to the following exception: " + str(e))
+        return render_template('slowQueries.html', report=[], order=order_by,
+                               status=[True, "ERROR", "The slow queries could not be fetched due to the following exception: " + str(e)])
+
+
+################################################
+#     3) Profiles Page :                       #
+################################################
+
+@app.route('/admin/profiles/')
+@admin_token_required
+def profiles_page():
+
+    log_object.logToFile('debug', 'Routed to the profiles page....')
+
+    try :
+        return render_template('profiles.html', profiles=ProfilingOperations().list_profiles(), status=[False, "", ""])
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "The profiles could not be listed due to the following exception: " + str(e))
+        return render_template('profiles.html', profiles=[],
+                               status=[True, "ERROR", "The profiles could not be listed due to the following exception: " + str(e)])
+
+
+################################################
+#     4) Download Profile :                    #
+################################################
+
+@app.route('/admin/profiles/<profile_name>/<file_type>')
+@admin_token_required
+def download_profile(profile_name, file_type):
+
+    log_object.logToFile('debug', 'Routed to the download of the profile : ' + profile_name)
+
+    try :
+
+        profile_path = ProfilingOperations().get_profile_path(profile_name, "." + file_type)
+
+        if file_type == "txt":
+            return send_file(profile_path, mimetype="text/plain")
+
+        return send_file(profile_path, as_attachment=True)
+
+    except Exception as e :
+
+        log_object.logToFile('exception', "The profile could not be downloaded due to the following exception: " + str(e))
+        return jsonify({"error": "The profile could not be downloaded due to the following exception: " + str(e)}), 404
+
+##########################################################################################################################################
+#                                                 End Block : Admin Page Functions :                                                     #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Metrics Functions :                                                      #
+##########################################################################################################################################
+
+################################################
+#     1) Start Request Metrics :               #
+################################################
+
+@app.before_request
+def start_request_metrics():
+
+    '''
+
+    Functionality : Storing the start time of the request and the route it is handled by, so that the operation phases get labelled with it.
+    :return: None
+
+    '''
+
+    g.request_start_time = time.perf_counter()
+    MetricsOperations().set_current_route(request.url_rule.rule if request.url_rule is not None else "unmatched")
+
+
+################################################
+#     2) Record Request Metrics :              #
+################################################
+
+@app.after_request
+def record_request_metrics(response):
+
+    '''
+
+    Functionality : Counting the response bytes and recording the send and request latencies once the response got sent, which is after the
+                    last chunk for the streamed downloads. The direct passthrough of the sent files gets turned off once their body is
+                    wrapped, as werkzeug only runs the close callbacks of the response (these metrics and the bulkhead releases) otherwise.
+    :param response: The response of the request.
+    :return: response
+
+    '''
+
+    metrics_object = MetricsOperations()
+    route = metrics_object.get_current_route()
+    request_labels = (("route", route), ("method", request.method), ("status", str(response.status_code)))
+    request_start_time = g.get("request_start_time", time.perf_counter())
+    send_start_time = time.perf_counter()
+
+    if response.is_streamed:
+        response.response = metrics_object.count_response_bytes(response.response, (("route", route),))
+        response.direct_passthrough = False
+    else:
+        metrics_object.increment_counter("dbapp_response_bytes_total", (("route", route),), response.calculate_content_length() or 0)
+
+    def finish_request_metrics():
+
+        end_time = time.perf_counter()
+
+        metrics_object.observe_latency("dbapp_operation_duration_seconds", (("route", route), ("backend", "http"), ("phase", "send")),
+                                       end_time - send_start_time)
+        metrics_object.observe_latency("dbapp_http_request_duration_seconds", request_labels, end_time - request_start_time)
+        metrics_object.set_current_route(None)
+
+    response.call_on_close(finish_request_metrics)
+
+    return response
+
+
+################################################
+#     3) Metrics Endpoint :                    #
+################################################
+
+@app.route('/metrics')
+def metrics_page():
+
+    return Response(MetricsOperations().render_prometheus_text(), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+##########################################################################################################################################
+#                                                 End Block : Metrics Functions :                                                        #
+##########################################################################################################################################
+
+
 ##########################################################################################################################################
 #                                               Start Block : MySQL Routing Functions :                                                  #
 ##########################################################################################################################################
@@ -1858,7 +3604,7 @@ def home_page_response():
 def home_page():
 
     log_object.logToFile('debug', 'Routed to the home page....')
-    return render_template('index.html')
+    return render_template('index.html', dbTypes=[BACKEND_DISPLAY_NAMES[i] for i in get_enabled_backends()])
 
 ##########################################################################################################################################
 #                                               End Block : MySQL Routing Functions :                                                    #
@@ -1871,7 +3617,6 @@ def home_page():
 
 if __name__ == '__main__':
 
-    log_object = logger()
     log_object.logToFile('info','The process has started....')
 
     log_object.logToFile('info', 'Starting up the flask server....')
@@ -0,0 +1,153 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The admission_operations.py file consists of the bulkheads limiting the number of concurrent heavy operations #
+#                           (bulk inserts, exports and unbounded updates or deletes) per backend, database host and operation class,  #
+#                           the requests over the limit waiting in a bounded queue and being rejected once the queue is full.          #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import threading
+import time
+from src.setup_logger import logger
+from src.setup_config import config
+from src.metrics_operations import MetricsOperations
+
+ADMISSION_LOCK = threading.Lock()
+BULKHEADS = {}
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Admission Operation Functions :                                          #
+##########################################################################################################################################
+
+class AdmissionOperations :
+
+    ################################################
+    #     1) Initialising Function :               #
+    ################################################
+
+    def __init__(self):
+
+        '''
+
+        Functionality : Initialising the logging object and the bulkhead settings.
+
+        '''
+
+        self.log_object = logger()
+        config_object = config()
+
+        self.enabled = config_object.getValue("ADMISSION_CONTROL_ENABLED")
+        self.max_concurrent = max(config_object.getValue("ADMISSION_MAX_CONCURRENT"), 1)
+        self.max_queued = max(config_object.getValue("ADMISSION_MAX_QUEUED"), 0)
+        self.queue_timeout = config_object.getValue("ADMISSION_QUEUE_TIMEOUT_SECONDS")
+        self.retry_after = config_object.getValue("ADMISSION_RETRY_AFTER_SECONDS")
+
+
+    ################################################
+    #     2) Acquire Slot :                        #
+    ################################################
+
+    def acquire_slot(self, backend, host, operation_class):
+
+        '''
+
+        Functionality : Taking a slot of the bulkhead of the backend, host and operation class. When all its slots are taken, the request
+                        waits in the queue of the bulkhead until a slot gets released or the queue timeout passes, and gets rejected right
+                        away when the queue is full as well.
+        :param backend: The backend of the operation, such as mysql or mongodb.
+        :param host: The database host the operation runs against, without any credentials.
+        :param operation_class: The class of the heavy operation, such as bulk_insert, export or bulk_write.
+        :return: bulkhead_key --> The key to release the slot with, or None if the request got rejected.
+
+        '''
+
+        bulkhead_key = (backend, host, operation_class)
+
+        if not self.enabled:
+            return bulkhead_key
+
+        metrics_object = MetricsOperations()
+        labels = (("backend", backend), ("operation", operation_class))
+        start_time = time.perf_counter()
+
+        with ADMISSION_LOCK:
+
+            if bulkhead_key not in BULKHEADS:
+                BULKHEADS[bulkhead_key] = {"active": 0, "queued": 0, "condition": threading.Condition(ADMISSION_LOCK)}
+
+            bulkhead = BULKHEADS[bulkhead_key]
+
+            if bulkhead["active"] >= self.max_concurrent:
+
+                if bulkhead["queued"] >= self.max_queued:
+
+                    metrics_object.increment_counter("dbapp_admission_rejected_total", labels + (("reason", "queue full"),))
+                    self.log_object.logToFile('warn', 'The ' + operation_class + ' operation on the ' + backend + ' host ' + host +
+                                              ' got rejected as its queue is full....')
+                    return None
+
+                bulkhead["queued"] += 1
+
+                try:
+                    admitted = bulkhead["condition"].wait_for(lambda: bulkhead["active"] < self.max_concurrent, self.queue_timeout)
+
+                finally:
+                    bulkhead["queued"] -= 1
+
+                if not admitted:
+
+                    metrics_object.increment_counter("dbapp_admission_rejected_total", labels + (("reason", "queue timeout"),))
+                    self.log_object.logToFile('warn', 'The ' + operation_class + ' operation on the ' + backend + ' host ' + host +
+                                              ' got rejected after waiting ' + str(self.queue_timeout) + ' seconds in its queue....')
+                    return None
+
+            bulkhead["active"] += 1
+
+        metrics_object.observe_latency("dbapp_admission_wait_seconds", labels, time.perf_counter() - start_time)
+
+        return bulkhead_key
+
+
+    ################################################
+    #     3) Release Slot :                        #
+    ################################################
+
+    def release_slot(self, bulkhead_key):
+
+        '''
+
+        Functionality : Releasing a slot taken from a bulkhead and waking up the first request waiting in its queue.
+        :param bulkhead_key: The key returned by acquire_slot.
+        :return: None
+
+        '''
+
+        if not self.enabled:
+            return
+
+        with ADMISSION_LOCK:
+
+            bulkhead = BULKHEADS[bulkhead_key]
+            bulkhead["active"] -= 1
+            bulkhead["condition"].notify()
+
+##########################################################################################################################################
+#                                                 End Block : Admission Operation Functions :                                            #
+##########################################################################################################################################
@@ -0,0 +1,251 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The async_cassandra_operations.py file consists of the asyncio variant of the Cassandra operations, running  #
+#                           the statements through the execute_async function of the driver so that a single coroutine keeps hundreds  #
+#                           of inserts or partition reads in flight without a thread per statement.                                      #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import asyncio
+import time
+from src.cassandra_operations import CassandraOperations
+from src.cache_operations import invalidates_cached_records
+from src.metrics_operations import measures_phase
+from cassandra.query import SimpleStatement
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Async Cassandra Operation Functions :                                    #
+##########################################################################################################################################
+
+class AsyncCassandraOperations(CassandraOperations) :
+
+    ###################################################
+    #     1) Executing Statement Asynchronously :     #
+    ###################################################
+
+    async def execute_statement(self, statement, parameters=None):
+
+        '''
+
+        Functionality : Executing a statement through the execute_async function of the driver and awaiting all its result pages, the page
+                        callbacks of the driver event loop thread being handed over to the asyncio event loop of the caller.
+        :param statement: The CQL query string or statement to be executed.
+        :param parameters: The list of the parameters of the statement, if any.
+        :return: rows --> The list of the rows of all the result pages.
+
+        '''
+
+        event_loop = asyncio.get_running_loop()
+        result_future = event_loop.create_future()
+        response_future = self.session.execute_async(statement, parameters)
+        rows = []
+
+        def set_result(result):
+
+            if not result_future.done():
+                result_future.set_result(result)
+
+        def set_exception(exception):
+
+            if not result_future.done():
+                result_future.set_exception(exception)
+
+        def handle_page(page_rows):
+
+            rows.extend(page_rows)
+
+            if response_future.has_more_pages:
+                response_future.start_fetching_next_page()
+            else:
+                event_loop.call_soon_threadsafe(set_result, rows)
+
+        def handle_error(exception):
+
+            event_loop.call_soon_threadsafe(set_exception, exception)
+
+        response_future.add_callbacks(handle_page, handle_error)
+
+        return await result_future
+
+
+    ###################################################
+    #     2) Describing Table Columns :               #
+    ###################################################
+
+    async def describe_table_columns(self, table_name):
+
+        '''
+
+        Functionality : Fetching the columns of the specified table from the system schema of the keyspace.
+        :param table_name: The name of the table in the keyspace.
+        :return: field_types, partition_fields --> The dictionary of the column types and the list of the partition key columns.
+
+        '''
+
+        cql_query = "SELECT * FROM system_schema.columns WHERE table_name = '" + table_name + "' AND keyspace_name = '" + self.keySpaceName + "' ALLOW FILTERING"
+
+        self.log_object.logToFile('debug', 'CQL query got created as : ' + cql_query)
+
+        records = await self.execute_statement(cql_query)
+
+        field_types = {}
+        partition_fields = []
+
+        for element in records:
+
+            field_types[element[2]] = element[8]
+
+            if element[5] == 'partition_key':
+                partition_fields.append(element[2])
+
+        if len(field_types) == 0:
+            raise Exception("The table " + table_name + " could not be found in the keyspace " + self.keySpaceName + ".")
+
+        return field_types, partition_fields
+
+
+    ###################################################
+    #     3) Inserting Records Concurrently :         #
+    ###################################################
+
+    @measures_phase("cassandra", "query")
+    @invalidates_cached_records
+    async def insert_records_concurrently(self, table_name, headers, values, concurrency):
+
+        '''
+
+        Functionality : Inserting multiple data records in the given table, keeping up to the given number of parameterised inserts in flight
+                        on the event loop instead of waiting for every insert before sending the next one.
+        :param table_name: The name of the table in the keyspace where the records need to be inserted.
+        :param headers: The list of the field headers of the records, or an empty list for all the columns of the table in their order.
+        :param values: The list of all the values of all the records to be inserted in the table.
+        :param concurrency: The maximum number of inserts in flight.
+        :return: inserted_count
+
+        '''
+
+        self.log_object.logToFile('info', 'Inserting multiple records concurrently into the table : ' + table_name + ' using Cassandra DB for the keyspace : ' + self.keySpaceName)
+
+        try:
+
+            await self.execute_statement('USE "' + self.keySpaceName + '"')
+
+            field_types, partition_fields = await self.describe_table_columns(table_name)
+
+            if len(headers) == 0:
+                headers = list(field_types.keys())
+
+            for header in headers:
+                if header not in field_types:
+                    raise Exception("The field " + header + " is not a column of the table " + table_name + ".")
+
+            statement = SimpleStatement("INSERT INTO " + table_name + " (" + ",".join(headers) + ") VALUES (" +
+                                        ",".join(["%s"] * len(headers)) + ")")
+
+            self.log_object.logToFile('debug', 'CQL query got created as : ' + statement.query_string)
+
+            semaphore = asyncio.Semaphore(int(concurrency))
+            start_time = time.perf_counter()
+
+            async def insert_record(record_value):
+
+                async with semaphore:
+                    await self.execute_statement(statement, [int(current_value) if field_types[headers[val_idx]].lower() == 'int' else
+                                                             current_value for val_idx, current_value in enumerate(record_value)])
+
+            await asyncio.gather(*[insert_record(record_value) for record_value in values])
+
+            self._record_slow_query(table_name, statement.query_string, start_time, len(values))
+
+        finally:
+
+            self.log_object.logToFile('info', 'Closing the Cassandra database connection....')
+            self.cluster.shutdown()
+
+        self.log_object.logToFile('info', 'All the ' + str(len(values)) + ' records got inserted successfully in Cassandra DB....')
+
+        return len(values)
+
+
+    ###################################################
+    #     4) Reading Partitions Concurrently :        #
+    ###################################################
+
+    @measures_phase("cassandra", "query")
+    async def select_partitions_concurrently(self, table_name, partition_values, concurrency, fetch_size=5000):
+
+        '''
+
+        Functionality : Reading the partitions of the given partition key values of the specified table, keeping up to the given number of
+                        partition reads in flight on the event loop, the records being returned in the order of the partition key values.
+        :param table_name: The name of the table in the keyspace from where the records need to be read.
+        :param partition_values: The list of the partition key values, each a list holding one value per partition key column.
+        :param concurrency: The maximum number of partition reads in flight.
+        :param fetch_size: The number of records fetched per page within a partition.
+        :return: headers, results
+
+        '''
+
+        self.log_object.logToFile('info', 'Reading ' + str(len(partition_values)) + ' partitions concurrently from the table : ' + table_name + ' using Cassandra DB for the keyspace : ' + self.keySpaceName)
+
+        try:
+
+            await self.execute_statement('USE "' + self.keySpaceName + '"')
+
+            field_types, partition_fields = await self.describe_table_columns(table_name)
+            headers = list(field_types.keys())
+
+            statement = SimpleStatement("SELECT " + ",".join(headers) + " FROM " + table_name + " WHERE " +
+                                        " AND ".join([i + " = %s" for i in partition_fields]), fetch_size=int(fetch_size))
+
+            self.log_object.logToFile('debug', 'CQL query got created as : ' + statement.query_string)
+
+            for partition_value in partition_values:
+                if len(partition_value) != len(partition_fields):
+                    raise Exception("Every partition needs a value for each of the partition key columns : " + ", ".join(partition_fields))
+
+            self._apply_statement_timeout(self.query_timeout)
+
+            semaphore = asyncio.Semaphore(int(concurrency))
+            start_time = time.perf_counter()
+
+            async def read_partition(partition_value):
+
+                async with semaphore:
+                    return await self.execute_statement(statement, [int(current_value) if field_types[partition_fields[val_idx]].lower() == 'int'
+                                                                    else current_value for val_idx, current_value in enumerate(partition_value)])
+
+            partitions = await asyncio.gather(*[read_partition(partition_value) for partition_value in partition_values])
+            results = [list(row) for partition in partitions for row in partition]
+
+            self._record_slow_query(table_name, statement.query_string, start_time, len(results))
+
+        finally:
+
+            self.log_object.logToFile('info', 'Closing the Cassandra database connection....')
+            self.cluster.shutdown()
+
+        self.log_object.logToFile('info', 'All the ' + str(len(results)) + ' records of the partitions got fetched successfully from Cassandra DB....')
+
+        return headers, results
+
+##########################################################################################################################################
+#                                                 End Block : Async Cassandra Operation Functions :                                      #
+##########################################################################################################################################
@@ -0,0 +1,241 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The async_mongodb_operations.py file consists of the asyncio variant of the MongoDB operations, running the   #
+#                           commands through the Motor driver so that a single coroutine keeps several insert_many chunks or finds in  #
+#                           flight without a thread per command.                                                                         #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import asyncio
+import time
+from src.setup_logger import logger
+from src.mongodb_operations import MongoDBOperations
+from src.cache_operations import invalidates_cached_records
+from src.metrics_operations import measures_phase
+from src.slow_query_operations import SlowQueryOperations
+from src.setup_config import config
+
+try:
+    import motor.motor_asyncio
+except ImportError:
+    motor = None
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Async MongoDB Operation Functions :                                      #
+##########################################################################################################################################
+
+class AsyncMongoDBOperations(MongoDBOperations) :
+
+    ################################################
+    #     1) Initialising Function :               #
+    ################################################
+
+    def __init__(self, connection_uri, username, password, databaseName):
+
+        '''
+
+        Functionality : Preparing the connection with MongoDB server through the Motor driver, the connection being established by the first
+                        awaited command, on the event loop running it.
+        :param connection_uri: The connection URI required for connecting to the MongoDB cluster on Atlas or the combination of hostname and port number required for
+                               connecting to the local MongoDB server.
+        :param username: The username required for connecting to MongoDB server, if any.
+        :param password: The password required for connecting to MongoDB server, if any.
+        :param databaseName: The database name in the MongoDB server where the operations need to be performed.
+
+        '''
+
+        if motor is None:
+            raise Exception("The async MongoDB operations require the motor library : pip install motor")
+
+        self.username = username
+        self.password = password
+        self.databaseName = databaseName
+
+        self.log_object = logger()
+        self.connection_uri = self._prepare_connection_uri(connection_uri, username, password)
+
+        config_object = config()
+        self.query_timeout = config_object.getValue("QUERY_TIMEOUT_SECONDS")
+        self.export_timeout = config_object.getValue("EXPORT_TIMEOUT_SECONDS")
+
+        self.client = None
+
+
+    ################################################
+    #     2) Connecting :                          #
+    ################################################
+
+    @measures_phase("mongodb", "connect")
+    async def connect(self):
+
+        '''
+
+        Functionality : Creating the Motor client on the running event loop and checking the connection with the MongoDB server.
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('info', 'Establishing connection to the MongoDB server....')
+
+        self.client = motor.motor_asyncio.AsyncIOMotorClient(self.connection_uri)
+        await self.client.server_info()
+
+        self.log_object.logToFile('info', 'The connection got established successfully to the MongoDB server....')
+
+
+    #######################################################
+    #     3) Inserting Document Batches Concurrently :    #
+    #######################################################
+
+    @measures_phase("mongodb", "query")
+    @invalidates_cached_records
+    async def insert_document_batches_concurrently(self, collectionName, documentBatches, concurrency):
+
+        '''
+
+        Functionality : Inserting the document records batch by batch in the given collection, keeping up to the given number of insert_many
+                        chunks in flight, so that at most that many batches are held in memory at a time.
+        :param collectionName: The name of the collection in the database where the records need to be inserted.
+        :param documentBatches: The iterable of document batches (lists of JSON document records) to be inserted in the collection.
+        :param concurrency: The maximum number of insert_many chunks in flight.
+        :return: inserted_count
+
+        '''
+
+        self.log_object.logToFile('info',
+                                  'Inserting document batches concurrently into the collection : ' + collectionName + ' using MongoDB for the database : ' + self.databaseName)
+
+        inserted_count = 0
+        running_inserts = set()
+
+        try:
+
+            if self.client is None:
+                await self.connect()
+
+            collection_object = self.client[self.databaseName][collectionName]
+
+            async def insert_batch(batch):
+
+                await collection_object.insert_many(batch, ordered=False)
+                return len(batch)
+
+            for batch in documentBatches:
+
+                if len(batch) == 0:
+                    continue
+
+                running_inserts.add(asyncio.ensure_future(insert_batch(batch)))
+
+                if len(running_inserts) >= int(concurrency):
+
+                    completed_inserts, running_inserts = await asyncio.wait(running_inserts, return_when=asyncio.FIRST_COMPLETED)
+                    inserted_count += sum([i.result() for i in completed_inserts])
+
+                    self.log_object.logToFile('debug', str(inserted_count) + ' document records got inserted so far....')
+
+            if len(running_inserts) > 0:
+
+                completed_inserts, running_inserts = await asyncio.wait(running_inserts)
+                inserted_count += sum([i.result() for i in completed_inserts])
+
+        finally:
+
+            for running_insert in running_inserts:
+                running_insert.cancel()
+
+            if self.client is not None:
+                self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
+                self.client.close()
+
+        self.log_object.logToFile('info', 'All the ' + str(inserted_count) + ' records got inserted successfully in MongoDB....')
+
+        return inserted_count
+
+
+    ###################################################
+    #     4) Finding Documents Concurrently :         #
+    ###################################################
+
+    @measures_phase("mongodb", "query")
+    async def select_records_concurrently(self, collectionName, conditionalQueries, projectionQuery, concurrency):
+
+        '''
+
+        Functionality : Running a find for every filter of the list in the given collection, keeping up to the given number of finds in flight,
+                        the documents being returned in the order of the filters. The slow finds get logged without their plan, which would need
+                        another round trip.
+        :param collectionName: The name of the collection in the database from where the records need to be fetched.
+        :param conditionalQueries: The list of the filters to be run.
+        :param projectionQuery: The projection of the fetched documents, if any.
+        :param concurrency: The maximum number of finds in flight.
+        :return: headers, results --> The headers are the union of the fields of the fetched documents.
+
+        '''
+
+        self.log_object.logToFile('info',
+                                  'Running ' + str(len(conditionalQueries)) + ' finds concurrently on the collection : ' + collectionName + ' using MongoDB for the database : ' + self.databaseName)
+
+        try:
+
+            if self.client is None:
+                await self.connect()
+
+            collection_object = self.client[self.databaseName][collectionName]
+            semaphore = asyncio.Semaphore(int(concurrency))
+            slow_query_object = SlowQueryOperations()
+
+            async def find_documents(conditionalQuery):
+
+                async with semaphore:
+
+                    start_time = time.perf_counter()
+                    documents = await collection_object.find(conditionalQuery, projectionQuery or None).max_time_ms(
+                        self._get_max_time_ms(self.query_timeout)).to_list(length=None)
+
+                    slow_query_object.record_query(*self._get_index_advisor_table(collectionName), "find " + collectionName + " " +
+                                                   slow_query_object.shape_mongo_query(conditionalQuery), time.perf_counter() - start_time,
+                                                   len(documents))
+
+                    return documents
+
+            result_sets = await asyncio.gather(*[find_documents(conditionalQuery) for conditionalQuery in conditionalQueries])
+            results = [document for result_set in result_sets for document in result_set]
+
+        finally:
+
+            if self.client is not None:
+                self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
+                self.client.close()
+
+        headers = []
+
+        for document in results:
+            for key in document.keys():
+                if key not in headers:
+                    headers.append(key)
+
+        self.log_object.logToFile('info', 'All the ' + str(len(results)) + ' document records got fetched successfully from MongoDB....')
+
+        return headers, results
+
+##########################################################################################################################################
+#                                                 End Block : Async MongoDB Operation Functions :                                        #
+##########################################################################################################################################
@@ -0,0 +1,162 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The backend_loader.py file consists of the loader importing an operations class and its database driver on  #
+#                           the first use of its backend, instead of at the start of the application, and refusing the backends that    #
+#                           were disabled through the ENABLED_BACKENDS setting.                                                          #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import importlib
+import threading
+import time
+from src.setup_logger import logger
+from src.setup_config import config
+
+BACKEND_DISPLAY_NAMES = {
+    "mysql": "MySQL",
+    "sqlserver": "Microsoft SQL Server",
+    "mongodb": "MongoDB",
+    "cassandra": "Cassandra"
+}
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Backend Loader Functions :                                               #
+##########################################################################################################################################
+
+################################################
+#     1) Get Enabled Backends :                #
+################################################
+
+def get_enabled_backends():
+
+    '''
+
+    Functionality : Fetching the backends enabled through the ENABLED_BACKENDS setting, in the order of BACKEND_DISPLAY_NAMES.
+    :return: enabled_backends --> The list of the enabled backend names.
+
+    '''
+
+    enabled_backends = [i.lower() for i in config().getValue("ENABLED_BACKENDS")]
+
+    for backend in enabled_backends:
+        if backend not in BACKEND_DISPLAY_NAMES:
+            raise Exception("The backend " + backend + " in the ENABLED_BACKENDS setting is not a known backend. Possible values are : " +
+                            ", ".join(BACKEND_DISPLAY_NAMES.keys()))
+
+    return [i for i in BACKEND_DISPLAY_NAMES if i in enabled_backends]
+
+
+class BackendLoader :
+
+    ################################################
+    #     2) Initialising Function :               #
+    ################################################
+
+    def __init__(self, backend, module_name, attribute_name=None):
+
+        '''
+
+        Functionality : Initialising the loader of a module, or of an attribute of a module, without importing it yet.
+        :param backend: The backend the module belongs to, or None if the module is needed whatever the enabled backends.
+        :param module_name: The dotted name of the module to be imported.
+        :param attribute_name: The name of the attribute of the module to be returned, or None for the module itself.
+
+        '''
+
+        self.backend = backend
+        self.module_name = module_name
+        self.attribute_name = attribute_name
+        self.loaded_object = None
+        self.load_lock = threading.Lock()
+
+
+    ################################################
+    #     3) Load :                                #
+    ################################################
+
+    def load(self):
+
+        '''
+
+        Functionality : Importing the module on the first call, a single thread importing it while the concurrent requests wait for it, and
+                        returning the loaded object on the next calls.
+        :return: loaded_object --> The module or its attribute.
+
+        '''
+
+        if self.loaded_object is not None:
+            return self.loaded_object
+
+        if self.backend is not None and self.backend not in get_enabled_backends():
+            raise Exception("The " + BACKEND_DISPLAY_NAMES[self.backend] + " backend is disabled by the ENABLED_BACKENDS setting.")
+
+        with self.load_lock:
+
+            if self.loaded_object is None:
+
+                start_time = time.perf_counter()
+                loaded_module = importlib.import_module(self.module_name)
+
+                self.loaded_object = loaded_module if self.attribute_name is None else getattr(loaded_module, self.attribute_name)
+
+                logger().logToFile("info", "Loaded the module " + self.module_name + " in " +
+                                   str(round(time.perf_counter() - start_time, 4)) + " seconds.")
+
+        return self.loaded_object
+
+
+    ################################################
+    #     4) Call :                                #
+    ################################################
+
+    def __call__(self, *args, **kwargs):
+
+        '''
+
+        Functionality : Calling the loaded object, so that a loaded operations class gets instantiated like the class itself.
+        :return: The result of the call.
+
+        '''
+
+        return self.load()(*args, **kwargs)
+
+
+    ################################################
+    #     5) Get Attribute :                       #
+    ################################################
+
+    def __getattr__(self, name):
+
+        '''
+
+        Functionality : Fetching an attribute of the loaded object, so that a loaded module gets used like the module itself.
+        :param name: The name of the attribute.
+        :return: The attribute of the loaded object.
+
+        '''
+
+        if name in ["backend", "module_name", "attribute_name", "loaded_object", "load_lock"]:
+            raise AttributeError(name)
+
+        return getattr(self.load(), name)
+
+##########################################################################################################################################
+#                                                 End Block : Backend Loader Functions :                                                 #
+##########################################################################################################################################
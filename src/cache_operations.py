@@ -0,0 +1,436 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The cache_operations.py file consists of the operations of the on-disk query result cache, which stores the   #
+#                           fetched records keyed on the query fingerprint with a time to live and a size bounded least recently used   #
+#                           eviction, and drops the cached results of a table whenever the table gets written to.                        #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from src.setup_logger import logger
+from src.setup_config import config
+
+CACHE_INDEX_LOCK = threading.Lock()
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Cache Operation Functions :                                              #
+##########################################################################################################################################
+
+class CacheOperations :
+
+    ################################################
+    #     1) Initialising Function :               #
+    ################################################
+
+    def __init__(self):
+
+        '''
+
+        Functionality : Initialising the paths of the cache directory and of the SQLite index of the cached results, along with the cache
+                        limits from the application settings. The directory and the index only get created once a result is cached.
+
+        '''
+
+        self.log_object = logger()
+        config_object = config()
+
+        self.cache_directory = os.path.join(config_object.getValue("DATA_DIRECTORY"), "result_cache")
+        self.index_path = os.path.join(self.cache_directory, "cache_index.sqlite")
+        self.max_bytes = config_object.getValue("RESULT_CACHE_MAX_BYTES")
+        self.ttl_seconds = config_object.getValue("RESULT_CACHE_TTL_SECONDS")
+
+
+    ################################################
+    #     2) Generate Table Key :                  #
+    ################################################
+
+    def generate_table_key(self, *table_parts):
+
+        '''
+
+        Functionality : Generating the key identifying a table across the cache entries, hashed so that no connection details get stored.
+        :param table_parts: The parts identifying the table such as the backend, host, database and table name.
+        :return: table_key
+
+        '''
+
+        table_string = json.dumps([str(i).strip().lower() for i in table_parts])
+
+        return hashlib.sha256(table_string.encode("utf-8")).hexdigest()
+
+
+    ################################################
+    #     3) Get Cached Records :                  #
+    ################################################
+
+    def get_records(self, fingerprint):
+
+        '''
+
+        Functionality : Fetching the cached result of a query, dropping it instead if it is older than the time to live.
+        :param fingerprint: The fingerprint of the query.
+        :return: result --> None if the query result is not cached.
+
+        '''
+
+        if not os.path.exists(self.index_path):
+            return None
+
+        connection = self._connect()
+
+        try:
+
+            entry = connection.execute("SELECT file_name, created_at FROM cache_entries WHERE fingerprint = ?", (fingerprint,)).fetchone()
+
+            if entry is None:
+                return None
+
+            if time.time() - entry[1] > self.ttl_seconds:
+
+                self.log_object.logToFile('debug', 'The cached result ' + fingerprint + ' has expired....')
+                self._delete_entries(connection, [(fingerprint, entry[0])])
+
+                return None
+
+            try:
+
+                with open(os.path.join(self.cache_directory, entry[0]), 'rb') as cache_file:
+                    result = pickle.load(cache_file)
+
+            except (OSError, pickle.UnpicklingError, EOFError) as e:
+
+                self.log_object.logToFile('error', 'The cached result ' + fingerprint + ' could not be read : ' + str(e))
+                self._delete_entries(connection, [(fingerprint, entry[0])])
+
+                return None
+
+            connection.execute("UPDATE cache_entries SET last_access = ? WHERE fingerprint = ?", (time.time(), fingerprint))
+            connection.commit()
+
+        finally:
+            connection.close()
+
+        self.log_object.logToFile('info', 'Serving the query result from the cache : ' + fingerprint)
+
+        return result
+
+
+    ################################################
+    #     4) Put Records Into Cache :              #
+    ################################################
+
+    def put_records(self, fingerprint, table_key, result, generation):
+
+        '''
+
+        Functionality : Storing the result of a query in the cache, evicting the least recently used results once the cache grows beyond
+                        its maximum size. The result does not get cached when the table got invalidated since its generation was read before
+                        the query, as the result may then predate a write.
+        :param fingerprint: The fingerprint of the query.
+        :param table_key: The key of the table the query reads from.
+        :param result: The picklable query result to be cached.
+        :param generation: The generation of the table read through get_table_generation before running the query.
+        :return: None
+
+        '''
+
+        os.makedirs(self.cache_directory, exist_ok=True)
+
+        file_name = fingerprint + ".pkl"
+        file_path = os.path.join(self.cache_directory, file_name)
+        temporary_path = file_path + "." + str(threading.get_ident()) + ".tmp"
+
+        with open(temporary_path, 'wb') as cache_file:
+            pickle.dump(result, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        size_bytes = os.path.getsize(temporary_path)
+
+        if size_bytes > self.max_bytes:
+
+            self.log_object.logToFile('info', 'The query result is larger than the cache and does not get cached....')
+            os.remove(temporary_path)
+
+            return
+
+        connection = self._connect()
+
+        try:
+
+            connection.execute("BEGIN IMMEDIATE")
+
+            if self._read_generation(connection, table_key) != generation:
+
+                connection.rollback()
+                os.remove(temporary_path)
+                self.log_object.logToFile('info', 'The table got written to while the query ran and the result does not get cached....')
+
+                return
+
+            os.replace(temporary_path, file_path)
+
+            current_time = time.time()
+
+            connection.execute("INSERT OR REPLACE INTO cache_entries (fingerprint, table_key, file_name, size_bytes, created_at, last_access) "
+                               "VALUES (?, ?, ?, ?, ?, ?)", (fingerprint, table_key, file_name, size_bytes, current_time, current_time))
+            connection.commit()
+
+            self._evict_entries(connection)
+
+        finally:
+            connection.close()
+
+        self.log_object.logToFile('info', 'The query result got cached : ' + fingerprint)
+
+
+    ################################################
+    #     5) Get Table Generation :                #
+    ################################################
+
+    def get_table_generation(self, table_key):
+
+        '''
+
+        Functionality : Fetching the invalidation generation of a table, which gets bumped on every write to the table. It needs to be read
+                        before running a query whose result is to be cached, and creates the cache index so that the writes running from
+                        then on get to bump it.
+        :param table_key: The key of the table.
+        :return: generation
+
+        '''
+
+        os.makedirs(self.cache_directory, exist_ok=True)
+
+        connection = self._connect()
+
+        try:
+            return self._read_generation(connection, table_key)
+
+        finally:
+            connection.close()
+
+
+    ################################################
+    #     6) Invalidate Table :                    #
+    ################################################
+
+    def invalidate_table(self, table_key):
+
+        '''
+
+        Functionality : Dropping all the cached results of a table and bumping its generation, once the table got written to, so that the
+                        results of the queries which were running during the write do not get cached either.
+        :param table_key: The key of the table.
+        :return: None
+
+        '''
+
+        if not os.path.exists(self.index_path):
+            return
+
+        connection = self._connect()
+
+        try:
+
+            connection.execute("INSERT INTO cache_generations (table_key, generation) VALUES (?, 1) "
+                               "ON CONFLICT (table_key) DO UPDATE SET generation = generation + 1", (table_key,))
+            connection.commit()
+
+            entries = connection.execute("SELECT fingerprint, file_name FROM cache_entries WHERE table_key = ?", (table_key,)).fetchall()
+
+            if len(entries) > 0:
+                self.log_object.logToFile('info', 'Invalidating ' + str(len(entries)) + ' cached query results of the written table....')
+                self._delete_entries(connection, entries)
+
+        finally:
+            connection.close()
+
+
+    ################################################
+    #     7) Evict Entries :                       #
+    ################################################
+
+    def _evict_entries(self, connection):
+
+        '''
+
+        Functionality : Dropping the expired results and then the least recently used results until the cache fits its maximum size.
+        :param connection: The SQLite connection of the cache index.
+        :return: None
+
+        '''
+
+        with CACHE_INDEX_LOCK:
+
+            expired_entries = connection.execute("SELECT fingerprint, file_name FROM cache_entries WHERE created_at < ?",
+                                                 (time.time() - self.ttl_seconds,)).fetchall()
+            self._delete_entries(connection, expired_entries)
+
+            total_bytes = connection.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries").fetchone()[0]
+
+            if total_bytes <= self.max_bytes:
+                return
+
+            evicted_entries = []
+
+            for fingerprint, file_name, size_bytes in connection.execute("SELECT fingerprint, file_name, size_bytes FROM cache_entries "
+                                                                         "ORDER BY last_access ASC").fetchall():
+
+                if total_bytes <= self.max_bytes:
+                    break
+
+                evicted_entries.append((fingerprint, file_name))
+                total_bytes -= size_bytes
+
+            self.log_object.logToFile('debug', 'Evicting ' + str(len(evicted_entries)) + ' least recently used query results....')
+            self._delete_entries(connection, evicted_entries)
+
+
+    ################################################
+    #     8) Delete Entries :                      #
+    ################################################
+
+    def _delete_entries(self, connection, entries):
+
+        '''
+
+        Functionality : Deleting the given cache entries from the index along with their result files.
+        :param connection: The SQLite connection of the cache index.
+        :param entries: The list of (fingerprint, file name) tuples to be deleted.
+        :return: None
+
+        '''
+
+        connection.executemany("DELETE FROM cache_entries WHERE fingerprint = ?", [(i[0],) for i in entries])
+        connection.commit()
+
+        for entry in entries:
+
+            try:
+                os.remove(os.path.join(self.cache_directory, entry[1]))
+
+            except FileNotFoundError:
+                pass
+
+
+    ################################################
+    #     9) Connect To Cache Index :              #
+    ################################################
+
+    def _connect(self):
+
+        '''
+
+        Functionality : Opening a connection to the SQLite index of the cache, creating the index table if required. A connection is opened
+                        per operation, so that the cache can be used from any request thread.
+        :return: connection
+
+        '''
+
+        connection = sqlite3.connect(self.index_path, timeout=30)
+
+        connection.execute("CREATE TABLE IF NOT EXISTS cache_entries (fingerprint TEXT PRIMARY KEY, table_key TEXT NOT NULL, "
+                           "file_name TEXT NOT NULL, size_bytes INTEGER NOT NULL, created_at REAL NOT NULL, last_access REAL NOT NULL)")
+        connection.execute("CREATE INDEX IF NOT EXISTS cache_entries_table_key ON cache_entries (table_key)")
+        connection.execute("CREATE TABLE IF NOT EXISTS cache_generations (table_key TEXT PRIMARY KEY, generation INTEGER NOT NULL)")
+
+        return connection
+
+
+    ################################################
+    #     10) Read Table Generation :              #
+    ################################################
+
+    def _read_generation(self, connection, table_key):
+
+        '''
+
+        Functionality : Reading the invalidation generation of a table from the cache index.
+        :param connection: The SQLite connection of the cache index.
+        :param table_key: The key of the table.
+        :return: generation --> 0 if the table never got invalidated.
+
+        '''
+
+        row = connection.execute("SELECT generation FROM cache_generations WHERE table_key = ?", (table_key,)).fetchone()
+
+        return row[0] if row is not None else 0
+
+
+
+################################################
+#     11) Invalidates Cached Records :         #
+################################################
+
+def invalidates_cached_records(write_function):
+
+    '''
+
+    Functionality : Decorating a write operation of a database operation class, so that the cached results of the written table get dropped
+                    once the operation finished, including when it failed after partially writing. The decorated function, which can be a
+                    coroutine function, must take the table name as its first argument and its class must provide the
+                    _get_cache_table_key function.
+    :param write_function: The write operation to be decorated.
+    :return: wrapper
+
+    '''
+
+    def invalidate_table(self, table_name):
+
+        try:
+            CacheOperations().invalidate_table(self._get_cache_table_key(table_name))
+
+        except Exception as e:
+            self.log_object.logToFile('error', 'The cached query results of the table could not be invalidated : ' + str(e))
+
+    if inspect.iscoroutinefunction(write_function):
+
+        @functools.wraps(write_function)
+        async def async_wrapper(self, table_name, *args, **kwargs):
+
+            try:
+                return await write_function(self, table_name, *args, **kwargs)
+
+            finally:
+                invalidate_table(self, table_name)
+
+        return async_wrapper
+
+    @functools.wraps(write_function)
+    def wrapper(self, table_name, *args, **kwargs):
+
+        try:
+            return write_function(self, table_name, *args, **kwargs)
+
+        finally:
+            invalidate_table(self, table_name)
+
+    return wrapper
+
+##########################################################################################################################################
+#                                                 End Block : Cache Operation Functions :                                                #
+##########################################################################################################################################
@@ -17,9 +17,24 @@
 #                                                 Start Block : Importing Libraries & Initializing Variables :                           #
 ##########################################################################################################################################
 
+import os
+import queue
+import threading
+import time
 from src.setup_logger import logger
+from src.query_operations import QueryOperations
+from src.cache_operations import CacheOperations, invalidates_cached_records
+from src.index_advisor_operations import IndexAdvisorOperations, records_filter_usage
+from src.metrics_operations import measures_phase
+from src.slow_query_operations import SlowQueryOperations
+from src.setup_config import config
+from concurrent.futures import ThreadPoolExecutor
 from cassandra.cluster import Cluster
 from cassandra.auth import PlainTextAuthProvider
+from cassandra.query import SimpleStatement
+
+MURMUR3_MIN_TOKEN = -2 ** 63
+MURMUR3_MAX_TOKEN = 2 ** 63 - 1
 
 ##########################################################################################################################################
 #                                                 End Block : Importing Libraries & Initializing Variables :                             #
@@ -36,6 +51,7 @@ class CassandraOperations :
     #     1) Initialising Function :               #
     ################################################
 
+    @measures_phase("cassandra", "connect")
     def __init__(self, clientID, clientSecret, connectionBundlePath, keySpaceName):
 
         '''
@@ -56,6 +72,10 @@ class CassandraOperations :
         self.log_object = logger()
         self.log_object.logToFile('info', 'Establishing connection to the Cassandra database....')
 
+        config_object = config()
+        self.query_timeout = config_object.getValue("QUERY_TIMEOUT_SECONDS")
+        self.export_timeout = config_object.getValue("EXPORT_TIMEOUT_SECONDS")
+
         cloud_config = {
             'secure_connect_bundle': self.connectionBundlePath
         }
@@ -79,6 +99,8 @@ class CassandraOperations :
     #     2) Creating Table :                      #
     ################################################
 
+    @measures_phase("cassandra", "query")
+    @invalidates_cached_records
     def create_table(self, table_name, fields_dict):
 
         '''
@@ -122,6 +144,7 @@ class CassandraOperations :
     #     3) Generating Table Schema :             #
     ################################################
 
+    @measures_phase("cassandra", "schema lookup")
     def generate_schema(self, table_name):
 
         '''
@@ -162,6 +185,8 @@ class CassandraOperations :
     #     4) Insert Single Record :                #
     ################################################
 
+    @measures_phase("cassandra", "query")
+    @invalidates_cached_records
     def insert_into_table_single_record(self, table_name, insert_fields):
 
         '''
@@ -231,6 +256,8 @@ class CassandraOperations :
     #     5) Insert Multiple Records :             #
     ################################################
 
+    @measures_phase("cassandra", "query")
+    @invalidates_cached_records
     def insert_into_table_multiple_records(self, table_name, headers, values):
 
         '''
@@ -325,7 +352,9 @@ class CassandraOperations :
     #     6) Fetching Records From Collection :       #
     ###################################################
 
-    def select_records(self, table_name, conditional_fields, rowLimit):
+    @measures_phase("cassandra", "query")
+    @records_filter_usage("conditional_fields")
+    def select_records(self, table_name, conditional_fields, rowLimit, fetch_size=None, paging_state=None):
 
         '''
 
@@ -333,7 +362,11 @@ class CassandraOperations :
         :param table_name: The name of the table in the keyspace from where the records need to be fetched.
         :param conditional_fields: The dictionary of conditional fields to be checked while fetching the records, if required.
         :param rowLimit: The row limit defining the number of records to be returned from the table.
-        :return: headers, results
+        :param fetch_size: The number of records to be fetched per page, if required. When given, the pages are fetched lazily instead of
+                           buffering the whole result.
+        :param paging_state: The hexadecimal paging state from where a paged fetch needs to be resumed, if required.
+        :return: headers, results --> When the fetch size is given, the results are a generator of (page records, paging state) tuples,
+                                      the paging state being the one to resume from after that page or None after the last page.
 
         '''
 
@@ -431,12 +464,35 @@ class CassandraOperations :
         self.log_object.logToFile('debug', 'CQL query got created as : ' + cql_query)
         self.log_object.logToFile('debug', 'Executing the query....')
 
+        self._apply_statement_timeout(self.export_timeout)
+
+        if fetch_size is not None:
+
+            self.log_object.logToFile('debug', 'Fetching the records lazily with a fetch size of : ' + str(fetch_size) + '....')
+
+            statement = SimpleStatement(cql_query, fetch_size=int(fetch_size))
+
+            start_time = time.perf_counter()
+
+            if paging_state is not None and paging_state != "":
+                self.log_object.logToFile('debug', 'Resuming the fetch from the given paging state....')
+                records = self.session.execute(statement, paging_state=bytes.fromhex(paging_state))
+            else:
+                records = self.session.execute(statement)
+
+            record_query = lambda row_count, end_time: self._record_slow_query(table_name, cql_query, start_time, row_count, end_time=end_time)
+
+            return list(records.column_names), self._generate_record_pages(records, record_query)
+
+        start_time = time.perf_counter()
         records = self.session.execute(cql_query)
         results = []
 
         for row in records :
             results.append(list(row))
 
+        self._record_slow_query(table_name, cql_query, start_time, len(results))
+
         self.log_object.logToFile('info', 'Closing the Cassandra database connection....')
         self.cluster.shutdown()
 
@@ -446,6 +502,9 @@ class CassandraOperations :
     #     7) Deleting Records :                       #
     ###################################################
 
+    @measures_phase("cassandra", "query")
+    @records_filter_usage("conditional_fields")
+    @invalidates_cached_records
     def delete_records(self,table_name, conditional_fields):
 
         '''
@@ -579,8 +638,11 @@ class CassandraOperations :
         self.log_object.logToFile('debug', 'Delete CQL query got created as : ' + delete_sql_query)
         self.log_object.logToFile('debug', 'Executing the query....')
 
+        start_time = time.perf_counter()
         records = self.session.execute(delete_sql_query)
 
+        self._record_slow_query(table_name, delete_sql_query, start_time, len(results))
+
         self.log_object.logToFile('info', 'Closing the Cassandra database connection....')
         self.cluster.shutdown()
 
@@ -589,6 +651,9 @@ class CassandraOperations :
     #     8) Updating Records :                       #
     ###################################################
 
+    @measures_phase("cassandra", "query")
+    @records_filter_usage("conditional_fields")
+    @invalidates_cached_records
     def update_table(self,table_name, fields_to_be_updated, conditional_fields):
 
         '''
@@ -708,11 +773,591 @@ class CassandraOperations :
         self.log_object.logToFile('debug', 'CQL query got created as : ' + cql_query)
         self.log_object.logToFile('debug', 'Executing the query....')
 
+        start_time = time.perf_counter()
         self.session.execute(cql_query)
 
+        self._record_slow_query(table_name, cql_query, start_time, None)
+
         self.log_object.logToFile('info', 'Closing the Cassandra database connection....')
         self.cluster.shutdown()
 
+
+    ###################################################
+    #     9) Browsing Records Page Wise :             #
+    ###################################################
+
+    @measures_phase("cassandra", "query")
+    def browse_records(self, table_name, conditional_fields, page_size, continuation_token):
+
+        '''
+
+        Functionality : Fetching a single page of records from the specified table using the driver paging state, so that every page
+                        resumes the scan where the previous one stopped.
+        :param table_name: The name of the table in the keyspace from where the records need to be fetched.
+        :param conditional_fields: The list of conditional fields to be checked while fetching the records, if required.
+        :param page_size: The number of records to be returned in the page.
+        :param continuation_token: The continuation token returned with the previous page, or an empty string for the first page.
+        :return: headers, results, next_token --> The next token is None when the last page has been reached.
+
+        '''
+
+        self.log_object.logToFile('info', 'Browsing table data from the table : ' + table_name + ' using Cassandra DB for the keyspace : ' + self.keySpaceName)
+
+        try:
+
+            self.log_object.logToFile('debug', 'Using the keyspace....')
+            self.session.execute('USE "' + self.keySpaceName + '"')
+
+            self.log_object.logToFile('debug', 'Creating the CQL Query for describing table....')
+
+            cql_query = "SELECT * FROM system_schema.columns WHERE table_name = '" + table_name + "' AND keyspace_name = '" + self.keySpaceName + "' ALLOW FILTERING"
+
+            self.log_object.logToFile('debug', 'CQL query got created as : ' + cql_query)
+            self.log_object.logToFile('debug', 'Executing the query....')
+
+            records = self.session.execute(cql_query)
+
+            field_types = {i[2]: i[8] for i in records}
+
+            query_object = QueryOperations()
+
+            fingerprint = query_object.generate_query_fingerprint("Cassandra", self.keySpaceName, table_name, conditional_fields)
+
+            conditional_string, parameters = query_object.build_cql_conditional_string(conditional_fields, field_types)
+
+            paging_state = None
+
+            if continuation_token != "":
+                paging_state = bytes.fromhex(query_object.decode_continuation_token(fingerprint, continuation_token))
+
+            self.log_object.logToFile('debug', 'Creating the CQL Query....')
+
+            cql_query = "SELECT * FROM " + table_name
+
+            if conditional_string != "":
+                cql_query += " WHERE " + conditional_string
+
+            cql_query += " ALLOW FILTERING"
+
+            self.log_object.logToFile('debug', 'CQL query got created as : ' + cql_query)
+            self.log_object.logToFile('debug', 'Executing the query....')
+
+            self._apply_statement_timeout(self.query_timeout)
+
+            statement = SimpleStatement(cql_query, fetch_size=int(page_size))
+            records = self.session.execute(statement, parameters, paging_state=paging_state)
+
+            headers = list(records.column_names)
+            results = [list(row) for row in records.current_rows]
+
+            next_token = None
+
+            if records.paging_state is not None:
+                next_token = query_object.encode_continuation_token(fingerprint, records.paging_state.hex())
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the Cassandra database connection....')
+            self.cluster.shutdown()
+
+        return headers, results, next_token
+
+
+    ###################################################
+    #     10) Generating Record Pages :               #
+    ###################################################
+
+    def _generate_record_pages(self, records, record_query=None):
+
+        '''
+
+        Functionality : Generating the pages of a paged result set one at a time, fetching the next page from the server only once the
+                        previous one has been consumed, and closing the connection once all the pages are read or the generator is closed.
+        :param records: The paged result set returned by the driver.
+        :param record_query: The function recording the query in the slow query log with the fetched row count and the performance counter
+                             value from when the first page got fetched, if required.
+        :return: generator --> Yields (page records, paging state) tuples.
+
+        '''
+
+        try:
+
+            row_count = 0
+            first_page_time = time.perf_counter()
+
+            while True:
+
+                page_records = [list(row) for row in records.current_rows]
+                row_count += len(page_records)
+
+                if records.has_more_pages:
+                    yield page_records, records.paging_state.hex()
+                    records.fetch_next_page()
+
+                else:
+                    yield page_records, None
+                    break
+
+            if record_query is not None:
+                record_query(row_count, first_page_time)
+
+        finally:
+
+            self.log_object.logToFile('info', 'Closing the Cassandra database connection....')
+            self.cluster.shutdown()
+
+
+    ###################################################
+    #     11) Exporting Records By Token Ranges :     #
+    ###################################################
+
+    @measures_phase("cassandra", "query")
+    def export_records_token_ranges(self, table_name, conditional_fields, worker_count, ranges_per_worker=8, fetch_size=5000):
+
+        '''
+
+        Functionality : Exporting all the records of the specified table by splitting the token ring into ranges and scanning them in parallel,
+                        so that the scan is spread over all the nodes of the cluster instead of a single coordinator.
+        :param table_name: The name of the table in the keyspace from where the records need to be exported.
+        :param conditional_fields: The list of conditional fields to be checked while exporting the records, if required.
+        :param worker_count: The maximum number of token ranges scanned in parallel.
+        :param ranges_per_worker: The number of token ranges created per worker, balancing the ranges of uneven size over the workers.
+        :param fetch_size: The number of records fetched per page within a token range.
+        :return: headers, batches --> The batches are a generator of record lists, one per page read, in order of arrival.
+
+        '''
+
+        self.log_object.logToFile('info', 'Exporting table data by token ranges from the table : ' + table_name + ' using Cassandra DB for the keyspace : ' + self.keySpaceName)
+
+        self.log_object.logToFile('debug', 'Using the keyspace....')
+        self.session.execute('USE "' + self.keySpaceName + '"')
+
+        self.log_object.logToFile('debug', 'Creating the CQL Query for describing table....')
+
+        cql_query = "SELECT * FROM system_schema.columns WHERE table_name = '" + table_name + "' AND keyspace_name = '" + self.keySpaceName + "' ALLOW FILTERING"
+
+        self.log_object.logToFile('debug', 'CQL query got created as : ' + cql_query)
+        self.log_object.logToFile('debug', 'Executing the query....')
+
+        records = self.session.execute(cql_query)
+
+        field_types = {}
+        partition_fields = []
+
+        for element in records:
+
+            field_types[element.column_name] = element.type
+
+            if element.kind == 'partition_key':
+                partition_fields.append((element.position, element.column_name))
+
+        if len(partition_fields) == 0:
+            self.cluster.shutdown()
+            raise Exception("The partition key of the table " + table_name + " could not be found in the keyspace " + self.keySpaceName + ".")
+
+        token_string = "token(" + ",".join([i[1] for i in sorted(partition_fields)]) + ")"
+
+        conditional_string, parameters = QueryOperations().build_cql_conditional_string(conditional_fields, field_types)
+
+        cql_query = "SELECT * FROM " + table_name + " WHERE " + token_string + " {0} %s AND " + token_string + " <= %s"
+
+        if conditional_string != "":
+            cql_query += " AND " + conditional_string
+
+        cql_query += " ALLOW FILTERING"
+
+        self.log_object.logToFile('debug', 'CQL query got created as : ' + cql_query)
+
+        self._apply_statement_timeout(self.export_timeout)
+
+        headers = list(self.session.execute("SELECT * FROM " + table_name + " LIMIT 1").column_names)
+
+        range_count = int(worker_count) * int(ranges_per_worker)
+        range_width = (MURMUR3_MAX_TOKEN - MURMUR3_MIN_TOKEN) // range_count
+        token_ranges = []
+
+        for range_idx in range(0, range_count):
+
+            range_start = MURMUR3_MIN_TOKEN + range_idx * range_width
+            range_end = MURMUR3_MAX_TOKEN if range_idx == range_count - 1 else range_start + range_width
+
+            token_ranges.append((range_start, range_end, range_idx == 0))
+
+        self.log_object.logToFile('debug', 'The token ring got split into ' + str(range_count) + ' ranges for ' + str(worker_count) + ' workers....')
+
+        return headers, self._generate_token_range_batches(cql_query, parameters, token_ranges, int(worker_count), int(fetch_size))
+
+
+    ###################################################
+    #     12) Generating Token Range Batches :        #
+    ###################################################
+
+    def _generate_token_range_batches(self, cql_query, parameters, token_ranges, worker_count, fetch_size):
+
+        '''
+
+        Functionality : Scanning the token ranges on a bounded pool of worker threads and generating the records page by page as soon
+                        as they are read. The pages are handed over through a queue bounded to two pages per worker, so a slow reader
+                        holds the scans back instead of letting whole ranges pile up in memory. When the generator gets closed early,
+                        such as on a client disconnect, the running scans stop before requesting their next page.
+        :param cql_query: The CQL query template with the token range comparison operator placeholder.
+        :param parameters: The parameters of the conditional string of the query.
+        :param token_ranges: The list of (range start, range end, inclusive start) tuples to be scanned.
+        :param worker_count: The maximum number of token ranges scanned in parallel.
+        :param fetch_size: The number of records fetched per page within a token range.
+        :return: generator --> Yields the record list of every page read from the token ranges.
+
+        '''
+
+        page_queue = queue.Queue(maxsize=2 * worker_count)
+        scans_stopped = threading.Event()
+
+        def put_page(item):
+
+            while not scans_stopped.is_set():
+
+                try:
+                    page_queue.put(item, timeout=0.5)
+                    return True
+
+                except queue.Full:
+                    continue
+
+            return False
+
+        def scan_token_range(token_range):
+
+            try:
+
+                if scans_stopped.is_set():
+                    return
+
+                statement = SimpleStatement(cql_query.format(">=" if token_range[2] else ">"), fetch_size=fetch_size)
+                records = self.session.execute(statement, [token_range[0], token_range[1]] + parameters)
+
+                while True:
+
+                    if not put_page(("page", [list(row) for row in records.current_rows])):
+                        return
+
+                    if not records.has_more_pages or scans_stopped.is_set():
+                        break
+
+                    records.fetch_next_page()
+
+                put_page(("done", None))
+
+            except Exception as e:
+                put_page(("error", e))
+
+        executor = ThreadPoolExecutor(max_workers=worker_count)
+
+        try:
+
+            for token_range in token_ranges:
+                executor.submit(scan_token_range, token_range)
+
+            completed_ranges = 0
+
+            while completed_ranges < len(token_ranges):
+
+                item_type, item_value = page_queue.get()
+
+                if item_type == "error":
+                    raise item_value
+
+                elif item_type == "done":
+                    completed_ranges += 1
+
+                elif len(item_value) > 0:
+                    yield item_value
+
+            self.log_object.logToFile('info', 'All the token ranges got exported successfully from Cassandra DB....')
+
+        except GeneratorExit:
+
+            self.log_object.logToFile('warn', 'Stopping the token range scans as their records are no longer read....')
+            raise
+
+        finally:
+
+            scans_stopped.set()
+            executor.shutdown(wait=True)
+
+            self.log_object.logToFile('info', 'Closing the Cassandra database connection....')
+            self.cluster.shutdown()
+
+
+    ###################################################
+    #     13) Fetching Cached Records :               #
+    ###################################################
+
+    def select_cached_records(self, table_name, conditional_fields, rowLimit):
+
+        '''
+
+        Functionality : Fetching the records in the same way as select_records, serving them from the query result cache when the same
+                        user ran the same query before and caching them otherwise. The cached results are kept per user, so that nobody
+                        gets served the rows of a table they have no grant to read.
+        :param table_name: The name of the table in the database from where the records need to be fetched.
+        :param conditional_fields: The dictionary of conditional fields to be checked while fetching the records, if required.
+        :param rowLimit: The row limit defining the number of records to be returned from the table.
+        :return: headers, results
+
+        '''
+
+        cache_object = CacheOperations()
+        table_key = self._get_cache_table_key(table_name)
+        fingerprint = QueryOperations().generate_query_fingerprint(table_key, self.clientID, conditional_fields, rowLimit)
+
+        cached_result = cache_object.get_records(fingerprint)
+
+        if cached_result is not None:
+
+            self.log_object.logToFile('info', 'Closing the Cassandra database connection....')
+            self.cluster.shutdown()
+
+            return cached_result
+
+        generation = cache_object.get_table_generation(table_key)
+        headers, results = self.select_records(table_name, conditional_fields, rowLimit)
+        cache_object.put_records(fingerprint, table_key, (headers, [tuple(i) for i in results]), generation)
+
+        return headers, results
+
+
+    ###################################################
+    #     14) Fetching Cache Table Key :              #
+    ###################################################
+
+    def _get_cache_table_key(self, table_name):
+
+        '''
+
+        Functionality : Generating the key identifying the given table in the query result cache.
+        :param table_name: The name of the table.
+        :return: table_key
+
+        '''
+
+        return CacheOperations().generate_table_key("cassandra", os.path.basename(self.connectionBundlePath), self.keySpaceName, table_name)
+
+
+    ###################################################
+    #     15) Previewing Records :                    #
+    ###################################################
+
+    @measures_phase("cassandra", "query")
+    def preview_records(self, table_name, conditional_fields, count_limit):
+
+        '''
+
+        Functionality : Counting the records matched by the conditions up to the given limit, reading only the first partition key field, as
+                        Cassandra has no query plan estimates to be used instead.
+        :param table_name: The name of the table in the keyspace whose records need to be previewed.
+        :param conditional_fields: The dictionary of conditional fields to be checked, if required.
+        :param count_limit: The maximum number of records to be counted.
+        :return: preview --> The dictionary of estimatedRows, isLowerBound, estimatedCost, accessMethod and plan.
+
+        '''
+
+        self.log_object.logToFile('info', 'Previewing table data from the table : ' + table_name + ' using Cassandra DB for the keyspace : ' + self.keySpaceName)
+
+        self.log_object.logToFile('debug', 'Using the keyspace....')
+        self.session.execute('USE "' + self.keySpaceName + '"')
+
+        cql_query = "SELECT * FROM system_schema.columns WHERE table_name = '" + table_name + "' AND keyspace_name = '" + self.keySpaceName + "' ALLOW FILTERING"
+
+        self.log_object.logToFile('debug', 'CQL query got created as : ' + cql_query)
+        self.log_object.logToFile('debug', 'Executing the query....')
+
+        field_types = {}
+        partition_fields = []
+
+        for element in self.session.execute(cql_query):
+
+            field_types[element.column_name] = element.type
+
+            if element.kind == "partition_key":
+                partition_fields.append((element.position, element.column_name))
+
+        if len(partition_fields) == 0:
+            self.cluster.shutdown()
+            raise Exception("The table " + table_name + " could not be found in the keyspace " + self.keySpaceName + ".")
+
+        conditional_string, parameters = QueryOperations().build_cql_conditional_string(conditional_fields, field_types)
+
+        cql_query = "SELECT " + sorted(partition_fields)[0][1] + " FROM " + table_name
+
+        if conditional_string != "":
+            cql_query += " WHERE " + conditional_string
+
+        cql_query += " LIMIT " + str(int(count_limit) + 1) + " ALLOW FILTERING"
+
+        self.log_object.logToFile('debug', 'CQL query got created as : ' + cql_query)
+        self.log_object.logToFile('debug', 'Executing the query....')
+
+        self._apply_statement_timeout(self.query_timeout)
+
+        try:
+            record_count = sum(1 for _ in self.session.execute(SimpleStatement(cql_query, fetch_size=5000), parameters))
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the Cassandra database connection....')
+            self.cluster.shutdown()
+
+        return {
+            "estimatedRows": min(record_count, int(count_limit)),
+            "isLowerBound": record_count > int(count_limit),
+            "estimatedCost": None,
+            "accessMethod": "bounded count",
+            "plan": cql_query
+        }
+
+
+
+    ###################################################
+    #     16) Creating Index :                        #
+    ###################################################
+
+    @measures_phase("cassandra", "query")
+    def create_index(self, table_name, index_name, index_fields, index_type="secondary"):
+
+        '''
+
+        Functionality : Creating a secondary index or a storage attached index (SAI) on a field of the table, so that the filters on the field
+                        do not need to scan every partition.
+        :param table_name: The name of the table in the keyspace where the index needs to be created.
+        :param index_name: The name of the index.
+        :param index_fields: The list holding the single field to be indexed.
+        :param index_type: The type of the index. Possible values are : "secondary" and "sai".
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('info', 'Creating index : ' + index_name + ' on the table : ' + table_name + ' using Cassandra DB for the keyspace : ' +
+                                  self.keySpaceName)
+
+        try:
+
+            if len(index_fields) != 1:
+                raise Exception("Cassandra indexes are created on exactly one field.")
+
+            if index_type == "sai":
+                cql_query = "CREATE CUSTOM INDEX IF NOT EXISTS " + index_name + " ON " + table_name + " (" + index_fields[0] + ") USING 'StorageAttachedIndex'"
+            elif index_type == "secondary":
+                cql_query = "CREATE INDEX IF NOT EXISTS " + index_name + " ON " + table_name + " (" + index_fields[0] + ")"
+            else:
+                raise Exception("The index type " + index_type + " is not supported for Cassandra.")
+
+            self.log_object.logToFile('debug', 'CQL query got created as : ' + cql_query)
+            self.log_object.logToFile('debug', 'Executing the query....')
+
+            self.session.execute('USE "' + self.keySpaceName + '"')
+            self.session.execute(cql_query)
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the Cassandra database connection....')
+            self.cluster.shutdown()
+
+        IndexAdvisorOperations().record_index(*self._get_index_advisor_table(table_name), index_name, index_fields)
+
+        self.log_object.logToFile('info', 'The index has been created in Cassandra DB....')
+
+
+    ###################################################
+    #     17) Dropping Index :                        #
+    ###################################################
+
+    @measures_phase("cassandra", "query")
+    def drop_index(self, table_name, index_name):
+
+        '''
+
+        Functionality : Dropping an index from the keyspace.
+        :param table_name: The name of the table in the keyspace the index belongs to.
+        :param index_name: The name of the index.
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('info', 'Dropping index : ' + index_name + ' using Cassandra DB for the keyspace : ' + self.keySpaceName)
+
+        cql_query = "DROP INDEX IF EXISTS " + index_name
+
+        self.log_object.logToFile('debug', 'CQL query got created as : ' + cql_query)
+        self.log_object.logToFile('debug', 'Executing the query....')
+
+        try:
+            self.session.execute('USE "' + self.keySpaceName + '"')
+            self.session.execute(cql_query)
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the Cassandra database connection....')
+            self.cluster.shutdown()
+
+        IndexAdvisorOperations().remove_index(*self._get_index_advisor_table(table_name), index_name)
+
+        self.log_object.logToFile('info', 'The index has been dropped from Cassandra DB....')
+
+
+    ###################################################
+    #     18) Fetching Index Advisor Table :          #
+    ###################################################
+
+    def _get_index_advisor_table(self, table_name):
+
+        '''
+
+        Functionality : Fetching the backend and the name identifying the table in the index advisor, without any connection credentials.
+        :param table_name: The name of the table.
+        :return: backend, advisor_table
+
+        '''
+
+        return "cassandra", os.path.basename(self.connectionBundlePath) + "/" + self.keySpaceName + "." + table_name
+
+
+    ###################################################
+    #     19) Recording Slow Query :                  #
+    ###################################################
+
+    def _record_slow_query(self, table_name, cql_query, start_time, row_count, end_time=None):
+
+        '''
+
+        Functionality : Recording the executed query in the slow query log. Cassandra does not expose a query plan, so only the timings of
+                        the slow queries are kept.
+        :param table_name: The name of the table the query ran on.
+        :param cql_query: The executed CQL query.
+        :param start_time: The performance counter value from before the query got executed.
+        :param row_count: The number of rows returned or affected by the query, or None if not known.
+        :param end_time: The performance counter value up to which the query gets timed, the current one if not given. A streamed query is
+                         timed up to its first batch, so that the time the client takes to download the rows is left out.
+        :return: None
+
+        '''
+
+        SlowQueryOperations().record_query(*self._get_index_advisor_table(table_name), cql_query, (end_time or time.perf_counter()) - start_time,
+                                           row_count)
+
+
+    ###################################################
+    #     20) Applying Statement Timeout :            #
+    ###################################################
+
+    def _apply_statement_timeout(self, timeout_seconds):
+
+        '''
+
+        Functionality : Setting the request timeout of the session for the next statements, after which the driver gives up on the request.
+                        The timeout applies to every page request of a paged statement rather than to the statement as a whole.
+        :param timeout_seconds: The timeout in seconds, or 0 to disable it.
+        :return: None
+
+        '''
+
+        self.session.default_timeout = timeout_seconds if timeout_seconds > 0 else None
+
 ##########################################################################################################################################
 #                                                 End Block : Cassandra Operation Functions :                                            #
 ##########################################################################################################################################
\ No newline at end of file
@@ -19,11 +19,38 @@
 ##########################################################################################################################################
 
 import csv
+import gzip
+import io
+import re
 import time
+import zipfile
 from werkzeug.utils import secure_filename
 from src import setup_logger
+from src.metrics_operations import measures_phase
 import os
 import json
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+JSON_READ_CHUNK_SIZE = 1024 * 1024
+MAX_JSON_DOCUMENT_SIZE = 64 * 1024 * 1024
+JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+STREAM_COMPRESSIONS = {
+    "gzip": {"extension": ".gz", "mimetype": "application/gzip"},
+    "zstd": {"extension": ".zst", "mimetype": "application/zstd"}
+}
+
+COLUMNAR_FORMATS = {
+    "parquet": {"extension": ".parquet", "mimetype": "application/vnd.apache.parquet",
+                "compressions": ["snappy", "zstd", "gzip", "none"]},
+    "feather": {"extension": ".feather", "mimetype": "application/vnd.apache.arrow.file",
+                "compressions": ["zstd", "lz4", "none"]}
+}
 
 ##########################################################################################################################################
 #                                                 End Block : Importing Libraries & Initializing Variables :                             #
@@ -139,6 +166,7 @@ class FileOperations :
     #     5) Write List Of Headers & Values To CSV File :     #
     ###########################################################
 
+    @measures_phase("file", "file write")
     def writeToCSV(self,filepath,content,header):
 
         '''
@@ -236,8 +264,8 @@ class FileOperations :
             self.log_object.logToFile('info',
                                       'Reading the JSON string from the following file path : ' + jsonFilePath + '....')
 
-            file = open(jsonFilePath,'r')
-            data = json.loads(file.read())
+            with open(jsonFilePath,'r') as json_file:
+                data = json.loads(json_file.read())
 
             return data
 
@@ -290,6 +318,7 @@ class FileOperations :
     #     10) Write JSON Data To JSON File :   #
     ############################################
 
+    @measures_phase("file", "file write")
     def writeToJsonFile(self, jsonData, jsonFileName):
 
         '''
@@ -319,6 +348,629 @@ class FileOperations :
             raise Exception("An error occurred while converting the JSON data into CSV file format with the following details : "+str(e))
 
 
+    ##################################################
+    #     11) Convert Table Rows To JSON Records :   #
+    ##################################################
+
+    @measures_phase("file", "serialize")
+    def convertRowsToJson(self, headers, rows):
+
+        '''
+
+        Functionality : Converting the list of table rows into a list of JSON serialisable records keyed on the field headers.
+        :param headers: The list of the field headers of the table.
+        :param rows: The list of table rows to be converted.
+        :return: records --> The values which are not JSON serialisable (dates, decimals, UUIDs etc.) are converted into strings.
+
+        '''
+
+        records = []
+
+        for row in rows:
+
+            record = {}
+
+            for idx, value in enumerate(row):
+
+                if value is None or isinstance(value, (str, int, float, bool)):
+                    record[headers[idx]] = value
+                else:
+                    record[headers[idx]] = str(value)
+
+            records.append(record)
+
+        return records
+
+
+    ###################################################
+    #     12) Generate CSV Stream From Row Batches :  #
+    ###################################################
+
+    def generateCSVStream(self, headers, row_batches):
+
+        '''
+
+        Functionality : Generating the CSV text of the header and row batches chunk by chunk, so that the data can be streamed to the client
+                        without being written into a file or buffered in memory first.
+        :param headers: The list of header values to be written as the first CSV line.
+        :param row_batches: The iterable of row batches (lists of rows) to be written as CSV lines.
+        :return: generator --> Yields one CSV text chunk for the header and for each row batch.
+
+        '''
+
+        buffer = io.StringIO()
+        writer_object = csv.writer(buffer)
+
+        writer_object.writerow(headers)
+        yield buffer.getvalue()
+
+        for row_batch in row_batches:
+
+            buffer.seek(0)
+            buffer.truncate(0)
+
+            writer_object.writerows(row_batch)
+            yield buffer.getvalue()
+
+
+    ###################################################
+    #     13) Write Row Batches To CSV Part Files :   #
+    ###################################################
+
+    @measures_phase("file", "file write")
+    def writeToCSVParts(self, zipFilePath, partFileName, header, batches):
+
+        '''
+
+        Functionality : Writing every batch of rows into its own CSV part file inside a compressed zip archive, each part having the header line.
+        :param zipFilePath: The file path of the zip archive to be written.
+        :param partFileName: The file name prefix of the part files, which get suffixed with the part number.
+        :param header: The list of header values to be written onto every part file.
+        :param batches: The iterable of row batches, one per part file.
+        :return: part_count
+
+        '''
+
+        self.log_object.logToFile('info',
+                                  'Writing CSV part files into the zip archive with the following path : ' + zipFilePath + '....')
+
+        part_count = 0
+
+        with zipfile.ZipFile(zipFilePath, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file :
+
+            for batch in batches:
+
+                part_count += 1
+
+                with zip_file.open(partFileName + "_part" + str(part_count).zfill(5) + ".csv", 'w') as part_file :
+                    text_file = io.TextIOWrapper(part_file, encoding='UTF8', newline='')
+                    writer_object = csv.writer(text_file)
+                    writer_object.writerow(header)
+                    writer_object.writerows(batch)
+                    text_file.flush()
+                    text_file.detach()
+
+        self.log_object.logToFile('info', str(part_count) + ' CSV part files got written into the zip archive....')
+
+        return part_count
+
+
+    ###################################################
+    #     14) Convert Document Batches To Rows :      #
+    ###################################################
+
+    def convertDocumentBatchesToRows(self, document_batches):
+
+        '''
+
+        Functionality : Converting the batches of MongoDB documents into rows of a fixed set of fields, the fields being the ones present in
+                        the first batch. Nested documents and arrays are converted into JSON strings and other BSON values into strings.
+        :param document_batches: The iterable of document batches (lists of documents).
+        :return: headers, row_batches --> The row batches are returned as a generator.
+
+        '''
+
+        document_batches = iter(document_batches)
+        first_batch = next(document_batches, [])
+
+        headers = []
+
+        for document in first_batch:
+            headers.extend([i for i in document.keys() if i not in headers])
+
+        def generate_row_batches():
+
+            dropped_fields = set()
+
+            if len(first_batch) > 0:
+                yield [self._convertDocumentToRow(i, headers, dropped_fields) for i in first_batch]
+
+            for batch in document_batches:
+                yield [self._convertDocumentToRow(i, headers, dropped_fields) for i in batch]
+
+            if len(dropped_fields) > 0:
+                self.log_object.logToFile('warn', 'The following fields were not present in the first batch of documents and were '
+                                                  'left out of the download : ' + ", ".join(sorted(dropped_fields)))
+
+        return headers, generate_row_batches()
+
+
+    ###################################################
+    #     15) Write Row Batches To Columnar File :    #
+    ###################################################
+
+    @measures_phase("file", "file write")
+    def writeToColumnarFile(self, filePath, fileFormat, headers, batches, compression):
+
+        '''
+
+        Functionality : Writing the batches of rows into a Parquet or Arrow IPC (Feather) file, converting every batch into a columnar record
+                        batch and writing it incrementally so that only one batch is held in memory at a time. The column types are
+                        inferred from the first batch, with the decimal columns widened to the maximum precision. The optional pyarrow
+                        library is imported on the first columnar download only, keeping it out of the application start up. The partially
+                        written file gets removed when a batch fails.
+        :param filePath: The file path of the columnar file to be written.
+        :param fileFormat: The columnar file format. Possible values are : "parquet" and "feather".
+        :param headers: The list of the field headers.
+        :param batches: The iterable of row batches (lists of rows).
+        :param compression: The compression codec, as per the codecs listed for the format in COLUMNAR_FORMATS.
+        :return: row_count
+
+        '''
+
+        try:
+            import pyarrow
+            import pyarrow.ipc
+            import pyarrow.parquet
+
+        except ImportError:
+            raise Exception("The Parquet and Arrow download formats require the optional pyarrow library, which can be installed using : "
+                            "pip install pyarrow")
+
+        if fileFormat not in COLUMNAR_FORMATS:
+            raise Exception("The download format " + fileFormat + " is not supported.")
+
+        if compression not in COLUMNAR_FORMATS[fileFormat]["compressions"]:
+            raise Exception("The compression " + compression + " is not supported for the " + fileFormat + " format.")
+
+        self.log_object.logToFile('info', 'Writing ' + fileFormat + ' file with the following path : ' + filePath + '....')
+
+        schema = None
+        writer = None
+        row_count = 0
+
+        try:
+
+            for batch in batches:
+
+                if len(batch) == 0:
+                    continue
+
+                columns = [list(i) for i in zip(*batch)]
+
+                if schema is None:
+
+                    fields = []
+
+                    for idx, column in enumerate(columns):
+                        field_type = pyarrow.array(column).type
+
+                        if pyarrow.types.is_decimal(field_type):
+                            field_type = pyarrow.decimal128(38, field_type.scale)
+
+                        fields.append(pyarrow.field(headers[idx], pyarrow.string() if pyarrow.types.is_null(field_type) else field_type))
+
+                    schema = pyarrow.schema(fields)
+                    writer = self._openColumnarWriter(filePath, fileFormat, schema, compression)
+
+                record_batch = pyarrow.RecordBatch.from_arrays([self._buildColumnArray(column, schema.field(idx))
+                                                                for idx, column in enumerate(columns)], schema=schema)
+                writer.write_batch(record_batch)
+
+                row_count += len(batch)
+
+            if writer is None:
+                schema = pyarrow.schema([pyarrow.field(i, pyarrow.string()) for i in headers])
+                writer = self._openColumnarWriter(filePath, fileFormat, schema, compression)
+
+            writer.close()
+
+        except Exception:
+
+            self.log_object.logToFile('error', 'Removing the partially written ' + fileFormat + ' file with the following path : ' + filePath)
+
+            if writer is not None:
+
+                try:
+                    writer.close()
+
+                except Exception:
+                    pass
+
+            if os.path.exists(filePath):
+                os.remove(filePath)
+
+            raise
+
+        self.log_object.logToFile('info', str(row_count) + ' rows got written into the ' + fileFormat + ' file....')
+
+        return row_count
+
+
+    ###################################################
+    #     16) Open Columnar File Writer :             #
+    ###################################################
+
+    def _openColumnarWriter(self, filePath, fileFormat, schema, compression):
+
+        '''
+
+        Functionality : Opening the incremental writer for the given columnar file format.
+        :param filePath: The file path of the columnar file to be written.
+        :param fileFormat: The columnar file format. Possible values are : "parquet" and "feather".
+        :param schema: The Arrow schema of the file.
+        :param compression: The compression codec.
+        :return: writer
+
+        '''
+
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        if fileFormat == "parquet":
+            return pyarrow.parquet.ParquetWriter(filePath, schema, compression=compression)
+
+        options = pyarrow.ipc.IpcWriteOptions(compression=None if compression == "none" else compression)
+
+        return pyarrow.ipc.new_file(filePath, schema, options=options)
+
+
+    ###################################################
+    #     17) Build Column Array :                    #
+    ###################################################
+
+    def _buildColumnArray(self, values, field):
+
+        '''
+
+        Functionality : Building the Arrow array of a column batch with the type of the schema field, falling back to the string values for
+                        string columns when the batch holds values of another type.
+        :param values: The list of column values.
+        :param field: The Arrow schema field of the column.
+        :return: array
+
+        '''
+
+        import pyarrow
+
+        try:
+            return pyarrow.array(values, type=field.type)
+
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+
+            if not pyarrow.types.is_string(field.type):
+                raise Exception("The values of the field " + field.name + " do not match its " + str(field.type) +
+                                " type inferred from the first batch : " + str(e))
+
+            return pyarrow.array([None if i is None else str(i) for i in values], type=field.type)
+
+
+    ###################################################
+    #     18) Convert Document To Row :               #
+    ###################################################
+
+    def _convertDocumentToRow(self, document, headers, dropped_fields):
+
+        '''
+
+        Functionality : Converting a MongoDB document into a row of values in the order of the given headers.
+        :param document: The document to be converted.
+        :param headers: The list of the field headers.
+        :param dropped_fields: The set collecting the document fields which are not part of the headers.
+        :return: row
+
+        '''
+
+        dropped_fields.update([i for i in document.keys() if i not in headers])
+
+        row = []
+
+        for header in headers:
+
+            value = document.get(header)
+
+            if isinstance(value, (dict, list)):
+                row.append(json.dumps(value, default=str))
+            elif value is None or isinstance(value, (str, int, float, bool)):
+                row.append(value)
+            else:
+                row.append(str(value))
+
+        return row
+
+
+    ###################################################
+    #     19) Generate NDJSON Stream From Batches :   #
+    ###################################################
+
+    def generateNDJSONStream(self, record_batches, serialiser):
+
+        '''
+
+        Functionality : Generating the newline delimited JSON text of the record batches chunk by chunk, one JSON record per line.
+        :param record_batches: The iterable of record batches (lists of records).
+        :param serialiser: The function converting a record into its JSON string, such as json.dumps or bson.json_util.dumps.
+        :return: generator --> Yields one NDJSON text chunk for each record batch.
+
+        '''
+
+        for record_batch in record_batches:
+
+            if len(record_batch) > 0:
+                yield "\n".join([serialiser(i) for i in record_batch]) + "\n"
+
+
+    ###################################################
+    #     20) Compress Stream :                       #
+    ###################################################
+
+    def compressStream(self, chunks, compression):
+
+        '''
+
+        Functionality : Compressing the text or byte chunks of a streamed download chunk by chunk, so that the compressed data can be sent
+                        without buffering the whole file.
+        :param chunks: The iterable of text or byte chunks to be compressed.
+        :param compression: The compression format. Possible values are : "gzip" and "zstd" (requires the optional zstandard library).
+        :return: generator --> Yields the compressed byte chunks.
+
+        '''
+
+        if compression == "gzip":
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+
+        elif compression == "zstd":
+
+            if zstandard is None:
+                raise Exception("The zstd compression requires the optional zstandard library, which can be installed using : "
+                                "pip install zstandard")
+
+            compressor = zstandard.ZstdCompressor(level=3).compressobj()
+
+        else:
+            raise Exception("The compression " + str(compression) + " is not supported for streamed downloads.")
+
+        for chunk in chunks:
+
+            compressed_chunk = compressor.compress(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+
+            if len(compressed_chunk) > 0:
+                yield compressed_chunk
+
+        yield compressor.flush()
+
+
+    ###################################################
+    #     21) Read JSON File Into Document Batches :  #
+    ###################################################
+
+    def readJsonDocumentBatches(self, jsonFilePath, batchSize):
+
+        '''
+
+        Functionality : Reading a JSON array file or a newline delimited JSON file, either plain or gzip compressed, incrementally into
+                        batches of documents, so that only one batch of documents and one read chunk are held in memory at a time.
+        :param jsonFilePath: The file path of the JSON or NDJSON file, which may be gzip compressed.
+        :param batchSize: The number of documents per batch.
+        :return: generator --> Yields the document list of every batch.
+
+        '''
+
+        self.log_object.logToFile('info', 'Reading the JSON documents incrementally from the following file path : ' + jsonFilePath + '....')
+
+        with open(jsonFilePath, 'rb') as binary_file:
+            is_gzip = binary_file.read(2) == b'\x1f\x8b'
+
+        if is_gzip:
+            json_file = gzip.open(jsonFilePath, 'rt', encoding='utf-8')
+        else:
+            json_file = open(jsonFilePath, 'r', encoding='utf-8')
+
+        with json_file:
+
+            batch = []
+
+            for document_idx, document in enumerate(self._generateJsonValues(json_file)):
+
+                if not isinstance(document, dict):
+                    raise Exception("Document record no. " + str(document_idx) + " is not a JSON object.")
+
+                batch.append(document)
+
+                if len(batch) == int(batchSize):
+                    yield batch
+                    batch = []
+
+            if len(batch) > 0:
+                yield batch
+
+
+    ###################################################
+    #     22) Generate JSON Values From Text File :   #
+    ###################################################
+
+    def _generateJsonValues(self, text_file):
+
+        '''
+
+        Functionality : Decoding the top level values of a JSON array or of a stream of whitespace separated JSON values one by one, reading
+                        the file chunk by chunk and only keeping the undecoded remainder of the chunks in memory. The read size doubles
+                        while a value stays undecodable, so that a large value only gets decoded a logarithmic number of times.
+        :param text_file: The text file object to be read.
+        :return: generator --> Yields the decoded values, the elements of the array in case of a JSON array. A value which is still
+                               undecodable after MAX_JSON_DOCUMENT_SIZE characters is reported as invalid JSON.
+
+        '''
+
+        decoder = json.JSONDecoder()
+        buffer = ""
+        position = 0
+        end_of_file = False
+        layout = None
+        expected = None
+        read_size = JSON_READ_CHUNK_SIZE
+
+        while True:
+
+            position = JSON_WHITESPACE.match(buffer, position).end()
+
+            if position == len(buffer):
+
+                if end_of_file:
+                    break
+
+                chunk = text_file.read(JSON_READ_CHUNK_SIZE)
+                buffer = chunk
+                position = 0
+                end_of_file = chunk == ""
+                continue
+
+            if layout is None:
+
+                layout = "array" if buffer[position] == "[" else "values"
+
+                if layout == "array":
+                    expected = "value_or_end"
+                    position += 1
+                    continue
+
+            if layout == "closed":
+                raise Exception("The document data provided is not in a proper JSON format, data found after the end of the JSON array.")
+
+            if layout == "array":
+
+                if expected == "separator":
+
+                    if buffer[position] not in [",", "]"]:
+                        raise Exception("The document data provided is not in a proper JSON format, a comma is missing between the elements "
+                                        "of the JSON array.")
+
+                    layout = "closed" if buffer[position] == "]" else layout
+                    expected = "value"
+                    position += 1
+                    continue
+
+                if buffer[position] == ",":
+                    raise Exception("The document data provided is not in a proper JSON format, the JSON array has an extra comma.")
+
+                if buffer[position] == "]":
+
+                    if expected == "value":
+                        raise Exception("The document data provided is not in a proper JSON format, the JSON array has a trailing comma.")
+
+                    layout = "closed"
+                    position += 1
+                    continue
+
+            try:
+                value, value_end = decoder.raw_decode(buffer, position)
+
+            except json.JSONDecodeError as e:
+
+                if end_of_file or len(buffer) - position > MAX_JSON_DOCUMENT_SIZE:
+                    raise Exception("The document data provided is not in a proper JSON format : " + str(e))
+
+                value_end = None
+
+            if value_end is None or (value_end == len(buffer) and not end_of_file):
+
+                chunk = text_file.read(read_size)
+                read_size *= 2
+                buffer = buffer[position:] + chunk
+                position = 0
+                end_of_file = chunk == ""
+                continue
+
+            position = value_end
+            read_size = JSON_READ_CHUNK_SIZE
+            expected = "separator"
+
+            yield value
+
+        if layout == "array":
+            raise Exception("The document data provided is not in a proper JSON format, the JSON array is not closed.")
+
+
+    ###################################################
+    #     23) Generate JSON Array Stream :            #
+    ###################################################
+
+    def generateJSONArrayStream(self, record_batches, serialiser):
+
+        '''
+
+        Functionality : Generating the text of a JSON array of the record batches chunk by chunk, so that the records can be streamed to the
+                        client as a single JSON document without being buffered in memory first.
+        :param record_batches: The iterable of record batches (lists of records).
+        :param serialiser: The function converting a record into its JSON string, such as json.dumps or bson.json_util.dumps.
+        :return: generator --> Yields the opening bracket, one JSON text chunk for each record batch and the closing bracket.
+
+        '''
+
+        separator = "\n"
+
+        yield "["
+
+        for record_batch in record_batches:
+
+            if len(record_batch) > 0:
+                yield separator + ",\n".join([serialiser(i) for i in record_batch])
+                separator = ",\n"
+
+        yield "\n]\n"
+
+
+    ###################################################
+    #     24) Read CSV File Into Document Batches :   #
+    ###################################################
+
+    def readCSVDocumentBatches(self, csvFilePath, batchSize):
+
+        '''
+
+        Functionality : Reading a CSV file, either plain or gzip compressed, incrementally into batches of documents keyed by the header
+                        row, so that only one batch of documents is held in memory at a time instead of the whole file as with csvToJson.
+        :param csvFilePath: The file path of the CSV file, which may be gzip compressed.
+        :param batchSize: The number of documents per batch.
+        :return: generator --> Yields the document list of every batch.
+
+        '''
+
+        self.log_object.logToFile('info', 'Reading the CSV documents incrementally from the following file path : ' + csvFilePath + '....')
+
+        with open(csvFilePath, 'rb') as binary_file:
+            is_gzip = binary_file.read(2) == b'\x1f\x8b'
+
+        if is_gzip:
+            csv_file = gzip.open(csvFilePath, 'rt', encoding='utf-8', newline='')
+        else:
+            csv_file = open(csvFilePath, mode='r', encoding='utf-8', newline='')
+
+        with csv_file:
+
+            batch = []
+
+            for row in csv.DictReader(csv_file):
+
+                batch.append(row)
+
+                if len(batch) == int(batchSize):
+                    yield batch
+                    batch = []
+
+            if len(batch) > 0:
+                yield batch
+
 ##########################################################################################################################################
 #                                                 End Block : File Operation Functions :                                                 #
 ##########################################################################################################################################
@@ -0,0 +1,459 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The index_advisor_operations.py file consists of the operations of the index advisor, which records the       #
+#                           fields and operators the users filter on along with the time spent on the filtered queries in a local       #
+#                           SQLite store, and suggests the indexes missing for them ranked by their cumulative query time.               #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import functools
+import inspect
+import os
+import sqlite3
+import threading
+import time
+import types
+from src.setup_logger import logger
+from src.setup_config import config
+
+ADVISOR_STORE_LOCK = threading.Lock()
+
+EQUALITY_OPERATORS = ["equals", "in", "$eq", "$in"]
+RANGE_OPERATORS = ["greater than", "greater than equals", "less than", "less than equals", "$gt", "$gte", "$lt", "$lte"]
+MONGO_LOGICAL_OPERATORS = ["$and", "$or", "$nor"]
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Index Advisor Operation Functions :                                      #
+##########################################################################################################################################
+
+class IndexAdvisorOperations :
+
+    ################################################
+    #     1) Initialising Function :               #
+    ################################################
+
+    def __init__(self):
+
+        '''
+
+        Functionality : Initialising the path of the SQLite store of the index advisor from the application settings. The store only gets
+                        created once the first filter usage is recorded.
+
+        '''
+
+        self.log_object = logger()
+        config_object = config()
+
+        self.enabled = config_object.getValue("INDEX_ADVISOR_ENABLED")
+        self.data_directory = config_object.getValue("DATA_DIRECTORY")
+        self.store_path = os.path.join(self.data_directory, "index_advisor.sqlite")
+
+
+    ################################################
+    #     2) Record Filter Usage :                 #
+    ################################################
+
+    def record_filter_usage(self, backend, table_name, filter_fields, elapsed_seconds):
+
+        '''
+
+        Functionality : Adding the execution time of a filtered query to the usage statistics of its combination of fields and operators.
+        :param backend: The database backend the query ran on.
+        :param table_name: The name identifying the table, without any connection credentials.
+        :param filter_fields: The list of (field, operator) tuples the query filtered on.
+        :param elapsed_seconds: The execution time of the query in seconds.
+        :return: None
+
+        '''
+
+        if not self.enabled or len(filter_fields) == 0:
+            return
+
+        fields = ",".join(sorted(set([i[0] for i in filter_fields])))
+        operators = ",".join(sorted(set([i[0] + " " + i[1] for i in filter_fields])))
+
+        with ADVISOR_STORE_LOCK:
+
+            connection = self._connect()
+
+            try:
+
+                connection.execute("INSERT OR IGNORE INTO filter_usage (backend, table_name, fields, operators, executions, total_seconds, "
+                                   "max_seconds, last_seen) VALUES (?, ?, ?, ?, 0, 0, 0, 0)", (backend, table_name, fields, operators))
+                connection.execute("UPDATE filter_usage SET executions = executions + 1, total_seconds = total_seconds + ?, "
+                                   "max_seconds = MAX(max_seconds, ?), last_seen = ? WHERE backend = ? AND table_name = ? AND "
+                                   "fields = ? AND operators = ?", (elapsed_seconds, elapsed_seconds, time.time(), backend, table_name,
+                                                                    fields, operators))
+                connection.commit()
+
+            finally:
+                connection.close()
+
+
+    ################################################
+    #     3) Record Index :                        #
+    ################################################
+
+    def record_index(self, backend, table_name, index_name, index_fields):
+
+        '''
+
+        Functionality : Storing an index created through the application, so that the filters it covers are no longer suggested.
+        :param backend: The database backend the index got created on.
+        :param table_name: The name identifying the table, without any connection credentials.
+        :param index_name: The name of the index.
+        :param index_fields: The ordered list of the indexed fields.
+        :return: None
+
+        '''
+
+        with ADVISOR_STORE_LOCK:
+
+            connection = self._connect()
+
+            try:
+                connection.execute("INSERT OR REPLACE INTO known_indexes (backend, table_name, index_name, fields) VALUES (?, ?, ?, ?)",
+                                   (backend, table_name, index_name, ",".join(index_fields)))
+                connection.commit()
+
+            finally:
+                connection.close()
+
+
+    ################################################
+    #     4) Remove Index :                        #
+    ################################################
+
+    def remove_index(self, backend, table_name, index_name):
+
+        '''
+
+        Functionality : Removing an index dropped through the application from the known indexes.
+        :param backend: The database backend the index got dropped from.
+        :param table_name: The name identifying the table, without any connection credentials.
+        :param index_name: The name of the index.
+        :return: None
+
+        '''
+
+        if not os.path.exists(self.store_path):
+            return
+
+        with ADVISOR_STORE_LOCK:
+
+            connection = self._connect()
+
+            try:
+                connection.execute("DELETE FROM known_indexes WHERE backend = ? AND table_name = ? AND index_name = ?",
+                                   (backend, table_name, index_name))
+                connection.commit()
+
+            finally:
+                connection.close()
+
+
+    ################################################
+    #     5) Get Index Advice :                    #
+    ################################################
+
+    def get_index_advice(self, limit=50):
+
+        '''
+
+        Functionality : Suggesting the indexes missing for the recorded filters, ranked by the cumulative time spent on the queries using them.
+                        Filters covered by a leading prefix of an index created through the application are left out, indexes created
+                        elsewhere are not known to the advisor.
+        :param limit: The maximum number of suggestions to be returned.
+        :return: advice --> The list of suggestion dictionaries.
+
+        '''
+
+        if not os.path.exists(self.store_path):
+            return []
+
+        connection = self._connect()
+
+        try:
+            usage_rows = connection.execute("SELECT backend, table_name, fields, operators, executions, total_seconds, max_seconds, last_seen "
+                                            "FROM filter_usage ORDER BY total_seconds DESC").fetchall()
+            index_rows = connection.execute("SELECT backend, table_name, index_name, fields FROM known_indexes").fetchall()
+
+        finally:
+            connection.close()
+
+        known_indexes = {}
+
+        for backend, table_name, index_name, fields in index_rows:
+            known_indexes.setdefault((backend, table_name), []).append((index_name, fields.split(",")))
+
+        advice = []
+
+        for backend, table_name, fields, operators, executions, total_seconds, max_seconds, last_seen in usage_rows:
+
+            field_operators = [self._split_field_operator(i) for i in operators.split(",")]
+            suggested_fields, note = self._suggest_index_fields(field_operators)
+
+            covering_index = None
+
+            for index_name, index_fields in known_indexes.get((backend, table_name), []):
+                if len(suggested_fields) > 0 and set(index_fields[:len(suggested_fields)]) == set(suggested_fields):
+                    covering_index = index_name
+                    break
+
+            if covering_index is not None or (backend == "mongodb" and suggested_fields == ["_id"]):
+                continue
+
+            advice.append({
+                "backend": backend,
+                "tableName": table_name,
+                "filterFields": fields.split(","),
+                "operators": operators.split(","),
+                "executions": executions,
+                "totalSeconds": round(total_seconds, 3),
+                "averageSeconds": round(total_seconds / executions, 3) if executions > 0 else 0,
+                "maxSeconds": round(max_seconds, 3),
+                "lastSeen": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(last_seen)),
+                "suggestedIndex": suggested_fields,
+                "note": note
+            })
+
+            if len(advice) == int(limit):
+                break
+
+        return advice
+
+
+    ################################################
+    #     6) Extract Filter Fields :               #
+    ################################################
+
+    def extract_filter_fields(self, filter_value):
+
+        '''
+
+        Functionality : Extracting the filtered fields and their operators from either a conditional fields list (SQL and CQL backends) or
+                        a conditional MQL query (MongoDB), including the fields nested in $and, $or and $nor clauses.
+        :param filter_value: The conditional fields list or the conditional query dictionary.
+        :return: filter_fields --> The list of (field, operator) tuples.
+
+        '''
+
+        if isinstance(filter_value, list):
+            return [(i[0].strip(), i[1].strip().lower()) for i in filter_value if i[0] is not None and i[1] is not None]
+
+        filter_fields = []
+
+        if not isinstance(filter_value, dict):
+            return filter_fields
+
+        for key, value in filter_value.items():
+
+            if key in MONGO_LOGICAL_OPERATORS and isinstance(value, list):
+                for clause in value:
+                    filter_fields.extend(self.extract_filter_fields(clause))
+
+            elif key.startswith("$"):
+                continue
+
+            elif isinstance(value, dict) and len(value) > 0 and all([str(i).startswith("$") for i in value.keys()]):
+                filter_fields.extend([(key, i) for i in value.keys()])
+
+            else:
+                filter_fields.append((key, "$eq"))
+
+        return filter_fields
+
+
+    ################################################
+    #     7) Suggest Index Fields :                #
+    ################################################
+
+    def _suggest_index_fields(self, field_operators):
+
+        '''
+
+        Functionality : Ordering the filtered fields into an index definition, placing the fields compared for equality first and a single
+                        range compared field last, since the fields after a range comparison cannot narrow down an index scan.
+        :param field_operators: The list of (field, operator) tuples of the filter.
+        :return: suggested_fields, note
+
+        '''
+
+        equality_fields = []
+        range_fields = []
+        skipped_fields = []
+
+        for field, operator in field_operators:
+
+            if operator in EQUALITY_OPERATORS:
+                equality_fields.append(field)
+            elif operator in RANGE_OPERATORS:
+                range_fields.append(field)
+            else:
+                skipped_fields.append(field + " (" + operator + ")")
+
+        suggested_fields = sorted(set(equality_fields))
+        suggested_fields += [i for i in sorted(set(range_fields)) if i not in suggested_fields][:1]
+
+        note = ""
+
+        if len(skipped_fields) > 0:
+            note = "Comparisons which cannot be served by an index scan : " + ", ".join(sorted(set(skipped_fields))) + "."
+
+        if len(suggested_fields) == 0:
+            note = "The filter cannot use an index. " + note
+
+        return suggested_fields, note.strip()
+
+
+    ################################################
+    #     8) Split Field Operator :                #
+    ################################################
+
+    def _split_field_operator(self, field_operator):
+
+        '''
+
+        Functionality : Splitting a stored "field operator" string back into the field and the operator. The MongoDB operators are split
+                        off the end since the document fields may contain spaces, while the SQL and CQL operators may contain spaces.
+        :param field_operator: The stored field and operator string.
+        :return: field, operator
+
+        '''
+
+        field, operator = field_operator.rsplit(" ", 1)
+
+        if operator.startswith("$"):
+            return field, operator
+
+        field, operator = field_operator.split(" ", 1)
+
+        return field, operator
+
+
+    ################################################
+    #     9) Connect To Advisor Store :            #
+    ################################################
+
+    def _connect(self):
+
+        '''
+
+        Functionality : Opening a connection to the SQLite store of the index advisor, creating its tables if required. A connection is
+                        opened per operation, so that the advisor can be used from any request thread.
+        :return: connection
+
+        '''
+
+        os.makedirs(self.data_directory, exist_ok=True)
+
+        connection = sqlite3.connect(self.store_path, timeout=30)
+
+        connection.execute("CREATE TABLE IF NOT EXISTS filter_usage (backend TEXT NOT NULL, table_name TEXT NOT NULL, fields TEXT NOT NULL, "
+                           "operators TEXT NOT NULL, executions INTEGER NOT NULL, total_seconds REAL NOT NULL, max_seconds REAL NOT NULL, "
+                           "last_seen REAL NOT NULL, PRIMARY KEY (backend, table_name, fields, operators))")
+        connection.execute("CREATE TABLE IF NOT EXISTS known_indexes (backend TEXT NOT NULL, table_name TEXT NOT NULL, index_name TEXT NOT NULL, "
+                           "fields TEXT NOT NULL, PRIMARY KEY (backend, table_name, index_name))")
+
+        return connection
+
+
+
+################################################
+#     10) Records Filter Usage :               #
+################################################
+
+def records_filter_usage(filter_argument):
+
+    '''
+
+    Functionality : Decorating a filtered operation of a database operation class, so that its execution time gets recorded by the index
+                    advisor. When the operation returns a generator of batches (alone or as the last item of a tuple), the time is measured
+                    until the generator finished. The decorated function must take the table name as its first argument and its class must
+                    provide the _get_index_advisor_table function.
+    :param filter_argument: The name of the argument holding the conditional fields list or the conditional query.
+    :return: decorator
+
+    '''
+
+    def decorator(filtered_function):
+
+        signature = inspect.signature(filtered_function)
+
+        @functools.wraps(filtered_function)
+        def wrapper(self, *args, **kwargs):
+
+            bound_arguments = signature.bind(self, *args, **kwargs)
+            table_name = list(bound_arguments.arguments.values())[1]
+            filter_value = bound_arguments.arguments.get(filter_argument)
+
+            start_time = time.perf_counter()
+
+            def record_usage():
+
+                try:
+                    advisor_object = IndexAdvisorOperations()
+                    backend, advisor_table = self._get_index_advisor_table(table_name)
+
+                    advisor_object.record_filter_usage(backend, advisor_table, advisor_object.extract_filter_fields(filter_value),
+                                                       time.perf_counter() - start_time)
+
+                except Exception as e:
+                    self.log_object.logToFile('error', 'The filter usage could not be recorded by the index advisor : ' + str(e))
+
+            result = filtered_function(self, *args, **kwargs)
+
+            if isinstance(result, types.GeneratorType):
+                return _generate_timed_batches(result, record_usage)
+
+            if isinstance(result, tuple) and len(result) > 0 and isinstance(result[-1], types.GeneratorType):
+                return result[:-1] + (_generate_timed_batches(result[-1], record_usage),)
+
+            record_usage()
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+################################################
+#     11) Generate Timed Batches :             #
+################################################
+
+def _generate_timed_batches(batches, record_usage):
+
+    '''
+
+    Functionality : Passing through the batches of a generator, calling the usage recording function once all the batches got read.
+    :param batches: The generator of batches.
+    :param record_usage: The function recording the execution time.
+    :return: generator
+
+    '''
+
+    yield from batches
+
+    record_usage()
+
+##########################################################################################################################################
+#                                                 End Block : Index Advisor Operation Functions :                                        #
+##########################################################################################################################################
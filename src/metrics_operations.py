@@ -0,0 +1,371 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The metrics_operations.py file consists of the process wide latency histograms and counters recorded per     #
+#                           route, backend and operation phase, along with their rendering into the Prometheus text exposition format.  #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import bisect
+import contextvars
+import functools
+import inspect
+import threading
+import time
+import types
+
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0]
+
+METRIC_DESCRIPTIONS = {
+    "dbapp_http_request_duration_seconds": ("histogram", "The time taken to handle a request until its response got sent."),
+    "dbapp_operation_duration_seconds": ("histogram", "The time taken by an operation phase of a route."),
+    "dbapp_operation_errors_total": ("counter", "The number of operation phases which raised an exception."),
+    "dbapp_rows_processed_total": ("counter", "The number of rows or documents fetched by the database operations."),
+    "dbapp_response_bytes_total": ("counter", "The number of response body bytes sent."),
+    "dbapp_admission_wait_seconds": ("histogram", "The time a heavy operation waited in the queue of its bulkhead before running."),
+    "dbapp_admission_rejected_total": ("counter", "The number of heavy operations rejected by their bulkhead, with a 503 response.")
+}
+
+METRICS_LOCK = threading.Lock()
+HISTOGRAMS = {}
+COUNTERS = {}
+REQUEST_ROUTE = contextvars.ContextVar("request_route", default=None)
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Metrics Operation Functions :                                            #
+##########################################################################################################################################
+
+class MetricsOperations :
+
+    ################################################
+    #     1) Set Current Route :                   #
+    ################################################
+
+    def set_current_route(self, route):
+
+        '''
+
+        Functionality : Storing the route handled by the current thread, so that the operation phases get labelled with it. The route is
+                        kept in a context variable, so that it also reaches the coroutines of the async routes.
+        :param route: The URL rule of the route, or None once the request is finished.
+        :return: None
+
+        '''
+
+        REQUEST_ROUTE.set(route)
+
+
+    ################################################
+    #     2) Get Current Route :                   #
+    ################################################
+
+    def get_current_route(self):
+
+        '''
+
+        Functionality : Fetching the route handled by the current thread or coroutine.
+        :return: route --> "none" outside of a request.
+
+        '''
+
+        return REQUEST_ROUTE.get() or "none"
+
+
+    ################################################
+    #     3) Observe Latency :                     #
+    ################################################
+
+    def observe_latency(self, metric_name, labels, seconds):
+
+        '''
+
+        Functionality : Adding a latency observation to the histogram of the metric and label values.
+        :param metric_name: The name of the histogram metric.
+        :param labels: The tuple of (label name, label value) tuples.
+        :param seconds: The observed latency in seconds.
+        :return: None
+
+        '''
+
+        bucket_idx = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+
+        with METRICS_LOCK:
+
+            histogram = HISTOGRAMS.get((metric_name, labels))
+
+            if histogram is None:
+                histogram = HISTOGRAMS[(metric_name, labels)] = [[0] * (len(LATENCY_BUCKETS) + 1), 0.0, 0]
+
+            histogram[0][bucket_idx] += 1
+            histogram[1] += seconds
+            histogram[2] += 1
+
+
+    ################################################
+    #     4) Increment Counter :                   #
+    ################################################
+
+    def increment_counter(self, metric_name, labels, value=1):
+
+        '''
+
+        Functionality : Incrementing the counter of the metric and label values.
+        :param metric_name: The name of the counter metric.
+        :param labels: The tuple of (label name, label value) tuples.
+        :param value: The value to be added to the counter.
+        :return: None
+
+        '''
+
+        with METRICS_LOCK:
+            COUNTERS[(metric_name, labels)] = COUNTERS.get((metric_name, labels), 0) + value
+
+
+    ################################################
+    #     5) Render Prometheus Text :              #
+    ################################################
+
+    def render_prometheus_text(self):
+
+        '''
+
+        Functionality : Rendering all the histograms and counters in the Prometheus text exposition format, with cumulative histogram buckets.
+        :return: metrics_text
+
+        '''
+
+        with METRICS_LOCK:
+            histograms = [(key, [list(value[0]), value[1], value[2]]) for key, value in HISTOGRAMS.items()]
+            counters = list(COUNTERS.items())
+
+        lines = []
+
+        for metric_name, (metric_type, description) in METRIC_DESCRIPTIONS.items():
+
+            lines.append("# HELP " + metric_name + " " + description)
+            lines.append("# TYPE " + metric_name + " " + metric_type)
+
+            for (name, labels), value in sorted(histograms):
+
+                if name != metric_name:
+                    continue
+
+                cumulative_count = 0
+
+                for bucket_idx, bucket_bound in enumerate(LATENCY_BUCKETS + ["+Inf"]):
+                    cumulative_count += value[0][bucket_idx]
+                    lines.append(metric_name + "_bucket" + self._format_labels(labels + (("le", str(bucket_bound)),)) + " " + str(cumulative_count))
+
+                lines.append(metric_name + "_sum" + self._format_labels(labels) + " " + repr(value[1]))
+                lines.append(metric_name + "_count" + self._format_labels(labels) + " " + str(value[2]))
+
+            for (name, labels), value in sorted(counters):
+
+                if name == metric_name:
+                    lines.append(metric_name + self._format_labels(labels) + " " + str(value))
+
+        return "\n".join(lines) + "\n"
+
+
+    ################################################
+    #     6) Count Response Bytes :                #
+    ################################################
+
+    def count_response_bytes(self, chunks, labels):
+
+        '''
+
+        Functionality : Passing through the chunks of a streamed response body, counting the bytes sent.
+        :param chunks: The iterable of response body chunks.
+        :param labels: The tuple of (label name, label value) tuples of the byte counter.
+        :return: generator
+
+        '''
+
+        sent_bytes = 0
+
+        try:
+
+            for chunk in chunks:
+                sent_bytes += len(chunk)
+                yield chunk
+
+        finally:
+
+            if hasattr(chunks, "close"):
+                chunks.close()
+
+            self.increment_counter("dbapp_response_bytes_total", labels, sent_bytes)
+
+
+    ################################################
+    #     7) Format Labels :                       #
+    ################################################
+
+    def _format_labels(self, labels):
+
+        '''
+
+        Functionality : Formatting the label values of a metric, escaping them as required by the text exposition format.
+        :param labels: The tuple of (label name, label value) tuples.
+        :return: labels_text
+
+        '''
+
+        if len(labels) == 0:
+            return ""
+
+        return "{" + ",".join([name + '="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+                               for name, value in labels]) + "}"
+
+
+
+################################################
+#     8) Measures Phase :                      #
+################################################
+
+def measures_phase(backend, phase):
+
+    '''
+
+    Functionality : Decorating an operation, so that its latency gets recorded for the current route under the given backend and phase. When
+                    the operation returns a generator of batches (alone or as the last item of a tuple), the time spent producing every
+                    batch is recorded under the fetch phase and the rows of the batches are counted. A coroutine function gets recorded
+                    once it was awaited.
+    :param backend: The backend label of the operation, such as mysql or file.
+    :param phase: The phase label of the operation, such as connect, schema lookup, query or file write.
+    :return: decorator
+
+    '''
+
+    def decorator(operation_function):
+
+        if inspect.iscoroutinefunction(operation_function):
+
+            @functools.wraps(operation_function)
+            async def async_wrapper(*args, **kwargs):
+
+                metrics_object = MetricsOperations()
+                labels = (("route", metrics_object.get_current_route()), ("backend", backend), ("phase", phase))
+                start_time = time.perf_counter()
+
+                try:
+                    result = await operation_function(*args, **kwargs)
+
+                except Exception:
+                    metrics_object.increment_counter("dbapp_operation_errors_total", labels)
+                    raise
+
+                finally:
+                    metrics_object.observe_latency("dbapp_operation_duration_seconds", labels, time.perf_counter() - start_time)
+
+                if isinstance(result, tuple) and len(result) > 0 and isinstance(result[-1], list) and phase == "query":
+                    metrics_object.increment_counter("dbapp_rows_processed_total", labels[:2], len(result[-1]))
+
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(operation_function)
+        def wrapper(*args, **kwargs):
+
+            metrics_object = MetricsOperations()
+            labels = (("route", metrics_object.get_current_route()), ("backend", backend), ("phase", phase))
+            start_time = time.perf_counter()
+
+            try:
+                result = operation_function(*args, **kwargs)
+
+            except Exception:
+                metrics_object.increment_counter("dbapp_operation_errors_total", labels)
+                raise
+
+            finally:
+                metrics_object.observe_latency("dbapp_operation_duration_seconds", labels, time.perf_counter() - start_time)
+
+            if isinstance(result, types.GeneratorType):
+                return _generate_measured_batches(result, backend)
+
+            if isinstance(result, tuple) and len(result) > 0 and isinstance(result[-1], types.GeneratorType):
+                return result[:-1] + (_generate_measured_batches(result[-1], backend),)
+
+            if isinstance(result, tuple) and len(result) > 0 and isinstance(result[-1], list) and phase == "query":
+                metrics_object.increment_counter("dbapp_rows_processed_total", labels[:2], len(result[-1]))
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+################################################
+#     9) Generate Measured Batches :           #
+################################################
+
+def _generate_measured_batches(batches, backend):
+
+    '''
+
+    Functionality : Passing through the batches of a generator, recording the time spent producing each of them under the fetch phase and
+                    counting their rows. The time the consumer spends between the batches is not included.
+    :param batches: The generator of batches.
+    :param backend: The backend label of the batches.
+    :return: generator
+
+    '''
+
+    metrics_object = MetricsOperations()
+    labels = (("route", metrics_object.get_current_route()), ("backend", backend), ("phase", "fetch"))
+    fetch_seconds = 0.0
+    row_count = 0
+
+    try:
+
+        while True:
+
+            start_time = time.perf_counter()
+
+            try:
+                batch = next(batches)
+
+            except StopIteration:
+                break
+
+            except Exception:
+                metrics_object.increment_counter("dbapp_operation_errors_total", labels)
+                raise
+
+            finally:
+                fetch_seconds += time.perf_counter() - start_time
+
+            row_count += len(batch) if isinstance(batch, (list, tuple)) else 1
+
+            yield batch
+
+    finally:
+
+        batches.close()
+
+        metrics_object.observe_latency("dbapp_operation_duration_seconds", labels, fetch_seconds)
+        metrics_object.increment_counter("dbapp_rows_processed_total", labels[:2], row_count)
+
+##########################################################################################################################################
+#                                                 End Block : Metrics Operation Functions :                                              #
+##########################################################################################################################################
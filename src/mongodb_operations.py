@@ -18,8 +18,19 @@
 ##########################################################################################################################################
 
 import pymongo
+from pymongo import ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
+from bson import json_util
+import re
+import time
 import urllib.parse
 from src.setup_logger import logger
+from src.query_operations import QueryOperations
+from src.cache_operations import CacheOperations, invalidates_cached_records
+from src.index_advisor_operations import IndexAdvisorOperations, records_filter_usage
+from src.metrics_operations import measures_phase
+from src.slow_query_operations import SlowQueryOperations
+from src.setup_config import config
 
 ##########################################################################################################################################
 #                                                 End Block : Importing Libraries & Initializing Variables :                             #
@@ -36,6 +47,7 @@ class MongoDBOperations:
     #     1) Initialising Function :               #
     ################################################
 
+    @measures_phase("mongodb", "connect")
     def __init__(self, connection_uri, username, password, databaseName):
 
         '''
@@ -55,23 +67,11 @@ class MongoDBOperations:
         self.databaseName = databaseName
 
         self.log_object = logger()
-        self.log_object.logToFile('info', 'Checking mandatory parameters for connection to MongoDB server....')
-
-        self.connection_uri = self.connection_uri.replace("'","").replace('"',"").strip()
+        self.connection_uri = self._prepare_connection_uri(connection_uri, username, password)
 
-        if self.connection_uri.lower().find("<username>") > -1 :
-            if username == "" :
-                self.log_object.logToFile('error', 'Username field is required but was not provided for MongoDB operation....')
-                raise Exception("Missing Mandatory Field : Username field is required but was not provided for MongoDB operation")
-            else :
-                self.connection_uri = connection_uri.replace("<username>", username)
-
-        if self.connection_uri.lower().find("<password>") > -1 :
-            if password == "" :
-                self.log_object.logToFile('error','Password field is required but was not provided for MongoDB operation....')
-                raise Exception("Missing Mandatory Field : Password field is required but was not provided for MongoDB operation")
-            else :
-                self.connection_uri = self.connection_uri.replace("<password>", urllib.parse.quote(password))
+        config_object = config()
+        self.query_timeout = config_object.getValue("QUERY_TIMEOUT_SECONDS")
+        self.export_timeout = config_object.getValue("EXPORT_TIMEOUT_SECONDS")
 
         self.log_object.logToFile('info', 'Establishing connection to the MongoDB server....')
 
@@ -85,6 +85,8 @@ class MongoDBOperations:
     #     2) Inserting Single Document Record :    #
     ################################################
 
+    @measures_phase("mongodb", "query")
+    @invalidates_cached_records
     def insert_single_record(self, collectionName, documentData):
 
         '''
@@ -113,6 +115,8 @@ class MongoDBOperations:
     #     3) Inserting Multiple Document Records :    #
     ###################################################
 
+    @measures_phase("mongodb", "query")
+    @invalidates_cached_records
     def insert_multiple_records(self, collectionName, documentData):
 
         '''
@@ -140,7 +144,9 @@ class MongoDBOperations:
     #     4) Fetching Records From Collection :       #
     ###################################################
 
-    def select_records(self,collectionName,conditionalQuery,projectionQuery,rowLimit):
+    @measures_phase("mongodb", "query")
+    @records_filter_usage("conditionalQuery")
+    def select_records(self,collectionName,conditionalQuery,projectionQuery,rowLimit,fetch_size=None):
 
         '''
 
@@ -150,7 +156,8 @@ class MongoDBOperations:
         :param projectionQuery: The projection MQL statement in JSON format to be checked indicating the fields to be retrieved while fetching document records,
                                 if required.
         :param rowLimit: The number of document records to be fetched, if required.
-        :return: records
+        :param fetch_size: The number of document records to be fetched per batch, if the records need to be fetched in batches.
+        :return: records --> The records are returned as a generator of document batches when a fetch size is given.
 
         '''
 
@@ -160,6 +167,8 @@ class MongoDBOperations:
         database_object = self.client[self.databaseName]
         collection_object = database_object[collectionName]
 
+        start_time = time.perf_counter()
+
         if rowLimit == "" :
             if projectionQuery != {} :
                 results = collection_object.find(conditionalQuery,projectionQuery)
@@ -171,8 +180,17 @@ class MongoDBOperations:
             else :
                 results = collection_object.find(conditionalQuery).limit(int(rowLimit))
 
+        results = results.max_time_ms(self._get_max_time_ms(self.export_timeout))
+
+        if fetch_size is not None:
+            return self._generate_document_batches(results.batch_size(int(fetch_size)), int(fetch_size),
+                                                   lambda row_count, end_time: self._record_slow_query(collectionName, "find", conditionalQuery,
+                                                                                                       start_time, row_count, end_time=end_time))
+
         records = [i for i in results]
 
+        self._record_slow_query(collectionName, "find", conditionalQuery, start_time, len(records))
+
         self.log_object.logToFile('info', 'All the records got fetched successfully in MongoDB....')
         self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
         self.client.close()
@@ -183,6 +201,9 @@ class MongoDBOperations:
     #     5) Deleting Records :                       #
     ###################################################
 
+    @measures_phase("mongodb", "query")
+    @records_filter_usage("conditionalQuery")
+    @invalidates_cached_records
     def delete_records(self, collectionName, conditionalQuery):
 
         '''
@@ -213,7 +234,10 @@ class MongoDBOperations:
                                           'No document record found for the given conditional statement in the collection.')
                 raise Exception("No document record found for the given conditional statement in the collection.")
 
-        collection_object.delete_many(conditionalQuery)
+        start_time = time.perf_counter()
+        result = collection_object.delete_many(conditionalQuery)
+
+        self._record_slow_query(collectionName, "deleteMany", conditionalQuery, start_time, result.deleted_count)
 
         self.log_object.logToFile('info', 'All the records with given condition got deleted successfully in MongoDB....')
         self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
@@ -224,6 +248,9 @@ class MongoDBOperations:
     #     6) Updating Records :                       #
     ###################################################
 
+    @measures_phase("mongodb", "query")
+    @records_filter_usage("conditionalQuery")
+    @invalidates_cached_records
     def update_records(self, collectionName, dataToBeUpdated, conditionalQuery):
 
         '''
@@ -263,13 +290,669 @@ class MongoDBOperations:
 
             data = {"$set" : dataToBeUpdated}
 
-        collection_object.update_many(filter=conditionalQuery,update=data)
+        start_time = time.perf_counter()
+        result = collection_object.update_many(filter=conditionalQuery,update=data)
+
+        self._record_slow_query(collectionName, "updateMany", conditionalQuery, start_time, result.modified_count)
 
         self.log_object.logToFile('info',
                                   'The document records with given condition got updated successfully in MongoDB....')
         self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
         self.client.close()
 
+    ###################################################
+    #     7) Upserting Multiple Document Records :    #
+    ###################################################
+
+    @measures_phase("mongodb", "query")
+    @invalidates_cached_records
+    def upsert_multiple_records(self, collectionName, documentData, keyField, upsertMode, chunkSize=1000):
+
+        '''
+
+        Functionality : Upserting multiple data records in the given collection using unordered bulk writes keyed on the given field, so that
+                        only the documents which are new or have changed get written.
+        :param collectionName: The name of the collection in the database where the records need to be upserted.
+        :param documentData: The list (or any iterable) of JSON document records which need to be upserted in the collection.
+        :param keyField: The document field used to match the incoming document records with the existing ones.
+        :param upsertMode: The upsert mode to be used. Possible values are : "replace" (ReplaceOne) and "update" (UpdateOne with $set).
+        :param chunkSize: The number of write operations to be sent in a single bulk write.
+        :return: counts --> The dictionary of upserted, modified and matched document counts.
+
+        '''
+
+        self.log_object.logToFile('info',
+                                  'Upserting multiple records into the collection : ' + collectionName + ' using MongoDB for the database : ' + self.databaseName)
+
+        if upsertMode.lower() not in ["replace", "update"]:
+            self.client.close()
+            raise Exception("The upsert mode " + upsertMode + " is not supported. Possible values are : replace and update.")
+
+        database_object = self.client[self.databaseName]
+        collection_object = database_object[collectionName]
+
+        counts = {"upserted": 0, "modified": 0, "matched": 0}
+        operations = []
+
+        try:
+
+            for record_idx, document in enumerate(documentData):
+
+                if keyField not in document:
+                    raise Exception("Document record no. " + str(record_idx) + " does not contain the key field : " + keyField)
+
+                if upsertMode.lower() == "replace":
+                    operations.append(ReplaceOne({keyField: document[keyField]}, document, upsert=True))
+                else:
+                    update_data = {field: value for field, value in document.items() if field != "_id"}
+                    operations.append(UpdateOne({keyField: document[keyField]}, {"$set": update_data}, upsert=True))
+
+                if len(operations) == chunkSize:
+                    self._write_upsert_chunk(collection_object, operations, counts)
+                    operations = []
+
+            if len(operations) > 0:
+                self._write_upsert_chunk(collection_object, operations, counts)
+
+        finally:
+
+            self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
+            self.client.close()
+
+        self.log_object.logToFile('info', 'All the records got upserted successfully in MongoDB with the following counts : ' + str(counts))
+
+        return counts
+
+
+    ###################################################
+    #     8) Writing Upsert Chunk :                   #
+    ###################################################
+
+    def _write_upsert_chunk(self, collection_object, operations, counts):
+
+        '''
+
+        Functionality : Sending a chunk of upsert operations through an unordered bulk write and accumulating the result counts.
+        :param collection_object: The collection object where the operations need to be written.
+        :param operations: The list of ReplaceOne / UpdateOne operations to be written.
+        :param counts: The dictionary of upserted, modified and matched document counts to be updated.
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('debug', 'Sending a bulk write of ' + str(len(operations)) + ' upsert operations....')
+
+        try:
+            result = collection_object.bulk_write(operations, ordered=False)
+
+        except BulkWriteError as e:
+            self.log_object.logToFile('error', 'The bulk write failed with the following details : ' + str(e.details["writeErrors"][:5]))
+            raise Exception("The bulk write failed for " + str(len(e.details["writeErrors"])) + " document records : " +
+                            str(e.details["writeErrors"][0]["errmsg"]))
+
+        counts["upserted"] += result.upserted_count
+        counts["modified"] += result.modified_count
+        counts["matched"] += result.matched_count
+
+
+    ###################################################
+    #     9) Browsing Records Page Wise :             #
+    ###################################################
+
+    @measures_phase("mongodb", "query")
+    def browse_records(self, collectionName, conditionalQuery, projectionQuery, page_size, continuation_token):
+
+        '''
+
+        Functionality : Fetching a single page of document records from the specified collection using a cursor on the _id field, so that
+                        every page costs the same as the first one.
+        :param collectionName: The name of the collection in the database from where the records need to be fetched.
+        :param conditionalQuery: The conditional MQL statement in JSON format to be checked while fetching document records, if required.
+        :param projectionQuery: The projection MQL statement in JSON format indicating the fields to be retrieved, if required.
+        :param page_size: The number of document records to be returned in the page.
+        :param continuation_token: The continuation token returned with the previous page, or an empty string for the first page.
+        :return: records, next_token --> The next token is None when the last page has been reached.
+
+        '''
+
+        self.log_object.logToFile('info',
+                                  'Browsing data from collection : ' + collectionName + ' using MongoDB for the database : ' + self.databaseName)
+
+        try:
+
+            database_object = self.client[self.databaseName]
+            collection_object = database_object[collectionName]
+
+            query_object = QueryOperations()
+
+            fingerprint = query_object.generate_query_fingerprint("MongoDB", self.databaseName, collectionName, conditionalQuery, projectionQuery)
+
+            filter_query = conditionalQuery
+
+            if continuation_token != "":
+                last_id = json_util.loads(query_object.decode_continuation_token(fingerprint, continuation_token))
+                filter_query = {"$and": [conditionalQuery, {"_id": {"$gt": last_id}}]}
+
+            projection = dict(projectionQuery)
+            remove_id = projection.get("_id", 1) in [0, False]
+
+            if remove_id:
+                projection.pop("_id")
+
+            if projection != {}:
+                results = collection_object.find(filter_query, projection)
+            else:
+                results = collection_object.find(filter_query)
+
+            records = list(results.sort("_id", pymongo.ASCENDING).limit(int(page_size) + 1).max_time_ms(self._get_max_time_ms(self.query_timeout)))
+
+            next_token = None
+
+            if len(records) > int(page_size):
+                records = records[:int(page_size)]
+                next_token = query_object.encode_continuation_token(fingerprint, json_util.dumps(records[-1]["_id"]))
+
+            if remove_id:
+                for record in records:
+                    record.pop("_id")
+
+            self.log_object.logToFile('info', 'The page of records got fetched successfully in MongoDB....')
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
+            self.client.close()
+
+        return records, next_token
+
+
+    ###################################################
+    #     10) Generating Document Batches :           #
+    ###################################################
+
+    def _generate_document_batches(self, cursor, fetch_size, record_query=None):
+
+        '''
+
+        Functionality : Reading the documents of the cursor batch by batch, closing the MongoDB connection once all the batches got read
+                        or the generator got closed. Closing the cursor kills it on the server, so that a client disconnect stops the query.
+        :param cursor: The cursor of the executed find query.
+        :param fetch_size: The number of document records per batch.
+        :param record_query: The function recording the query in the slow query log with the fetched document count and the performance
+                             counter value from when the first document got fetched, if required.
+        :return: generator --> Yields the document list of every batch.
+
+        '''
+
+        try:
+
+            batch = []
+            row_count = 0
+            first_document_time = None
+
+            for document in cursor:
+
+                if first_document_time is None:
+                    first_document_time = time.perf_counter()
+
+                batch.append(document)
+                row_count += 1
+
+                if len(batch) == fetch_size:
+                    yield batch
+                    batch = []
+
+            if len(batch) > 0:
+                yield batch
+
+            self.log_object.logToFile('info', 'All the document batches got fetched successfully in MongoDB....')
+
+            if record_query is not None:
+                record_query(row_count, first_document_time)
+
+        finally:
+
+            self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
+            cursor.close()
+            self.client.close()
+
+
+    ###################################################
+    #     11) Inserting Document Batches :            #
+    ###################################################
+
+    @measures_phase("mongodb", "query")
+    @invalidates_cached_records
+    def insert_document_batches(self, collectionName, documentBatches):
+
+        '''
+
+        Functionality : Inserting the document records batch by batch in the given collection, so that only one batch needs to be held in
+                        memory at a time.
+        :param collectionName: The name of the collection in the database where the records need to be inserted.
+        :param documentBatches: The iterable of document batches (lists of JSON document records) to be inserted in the collection.
+        :return: inserted_count
+
+        '''
+
+        self.log_object.logToFile('info',
+                                  'Inserting document batches into the collection : ' + collectionName + ' using MongoDB for the database : ' + self.databaseName)
+
+        database_object = self.client[self.databaseName]
+        collection_object = database_object[collectionName]
+
+        inserted_count = 0
+
+        try:
+
+            for batch in documentBatches:
+
+                collection_object.insert_many(batch)
+                inserted_count += len(batch)
+
+                self.log_object.logToFile('debug', str(inserted_count) + ' document records got inserted so far....')
+
+        finally:
+
+            self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
+            self.client.close()
+
+        self.log_object.logToFile('info', 'All the ' + str(inserted_count) + ' records got inserted successfully in MongoDB....')
+
+        return inserted_count
+
+
+    ###################################################
+    #     12) Fetching Cached Records :               #
+    ###################################################
+
+    def select_cached_records(self, collectionName, conditionalQuery, projectionQuery, rowLimit):
+
+        '''
+
+        Functionality : Fetching the records in the same way as select_records, serving them from the query result cache when the same
+                        user ran the same query before and caching them otherwise. The cached results are kept per user, so that nobody
+                        gets served the documents of a collection they have no grant to read.
+        :param collectionName: The name of the collection in the database from where the records need to be fetched.
+        :param conditionalQuery: The conditional MQL statement in JSON format to be checked while fetching document records, if required.
+        :param projectionQuery: The projection MQL statement in JSON format indicating the fields to be retrieved, if required.
+        :param rowLimit: The number of document records to be fetched, if required.
+        :return: records
+
+        '''
+
+        cache_object = CacheOperations()
+        table_key = self._get_cache_table_key(collectionName)
+        user_name = re.search(r"//([^:@/]*)(:[^@/]*)?@", self.connection_uri)
+        fingerprint = QueryOperations().generate_query_fingerprint(table_key, user_name.group(1) if user_name else "", conditionalQuery,
+                                                                   projectionQuery, rowLimit)
+
+        cached_result = cache_object.get_records(fingerprint)
+
+        if cached_result is not None:
+
+            self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
+            self.client.close()
+
+            return cached_result
+
+        generation = cache_object.get_table_generation(table_key)
+        records = self.select_records(collectionName, conditionalQuery, projectionQuery, rowLimit)
+        cache_object.put_records(fingerprint, table_key, records, generation)
+
+        return records
+
+
+    ###################################################
+    #     13) Fetching Cache Table Key :              #
+    ###################################################
+
+    def _get_cache_table_key(self, collectionName):
+
+        '''
+
+        Functionality : Generating the key identifying the given collection in the query result cache, leaving out the credentials of the
+                        connection URI.
+        :param collectionName: The name of the collection.
+        :return: table_key
+
+        '''
+
+        return CacheOperations().generate_table_key("mongodb", re.sub(r"//[^@/]*@", "//", self.connection_uri), self.databaseName, collectionName)
+
+
+    ###################################################
+    #     14) Previewing Records :                    #
+    ###################################################
+
+    @measures_phase("mongodb", "query")
+    def preview_records(self, collectionName, conditionalQuery, count_limit):
+
+        '''
+
+        Functionality : Estimating the number of document records matched by the condition using the collection metadata count, the
+                        queryPlanner explain of the find and a count bounded by the given limit.
+        :param collectionName: The name of the collection in the database whose records need to be previewed.
+        :param conditionalQuery: The conditional MQL statement in JSON format to be checked, if required.
+        :param count_limit: The maximum number of document records to be counted.
+        :return: preview --> The dictionary of estimatedRows, isLowerBound, estimatedCost, accessMethod, totalDocuments and plan.
+
+        '''
+
+        self.log_object.logToFile('info',
+                                  'Previewing data from collection : ' + collectionName + ' using MongoDB for the database : ' + self.databaseName)
+
+        database_object = self.client[self.databaseName]
+        collection_object = database_object[collectionName]
+
+        try:
+
+            total_documents = collection_object.estimated_document_count()
+
+            plan = database_object.command("explain", {"find": collectionName, "filter": conditionalQuery},
+                                           verbosity="queryPlanner")["queryPlanner"]
+
+            if conditionalQuery == {}:
+                matched_documents = total_documents
+            else:
+                matched_documents = collection_object.count_documents(conditionalQuery, limit=int(count_limit) + 1,
+                                                                      **self._get_max_time_options(self.query_timeout))
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
+            self.client.close()
+
+        stages = []
+        plan_stage = plan.get("winningPlan", {})
+
+        while plan_stage:
+            stages.append(plan_stage.get("stage", "") + (" (" + plan_stage["indexName"] + ")" if "indexName" in plan_stage else ""))
+            plan_stage = plan_stage.get("inputStage", {})
+
+        return {
+            "estimatedRows": min(matched_documents, int(count_limit)) if conditionalQuery != {} else matched_documents,
+            "isLowerBound": conditionalQuery != {} and matched_documents > int(count_limit),
+            "estimatedCost": None,
+            "accessMethod": " <- ".join(stages),
+            "totalDocuments": total_documents,
+            "plan": plan
+        }
+
+
+    ###################################################
+    #     15) Aggregating Documents :                 #
+    ###################################################
+
+    @measures_phase("mongodb", "query")
+    def aggregate_records(self, collectionName, conditionalQuery, group_fields, aggregations):
+
+        '''
+
+        Functionality : Computing the aggregations for every group of the documents matching the conditions through an aggregation pipeline,
+                        so that only the aggregated documents get transferred from the database.
+        :param collectionName: The name of the collection in the database whose documents need to be aggregated.
+        :param conditionalQuery: The conditional MQL statement in JSON format to be checked while aggregating the documents, if required.
+        :param group_fields: The list of the fields to group the documents by.
+        :param aggregations: The list of (function, field, alias) aggregation tuples.
+        :return: headers, results
+
+        '''
+
+        self.log_object.logToFile('info', 'Aggregating data from collection : ' + collectionName + ' using MongoDB for the database : ' + self.databaseName)
+
+        pipeline, headers = QueryOperations().build_mongo_aggregation_pipeline(conditionalQuery, group_fields, aggregations)
+
+        self.log_object.logToFile('debug', 'Aggregation pipeline got created as : ' + json_util.dumps(pipeline))
+
+        try:
+            documents = list(self.client[self.databaseName][collectionName].aggregate(pipeline, allowDiskUse=True,
+                                                                                      **self._get_max_time_options(self.query_timeout)))
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
+            self.client.close()
+
+        results = [[document.get(i) for i in headers] for document in documents]
+
+        self.log_object.logToFile('info', str(len(results)) + ' aggregated documents got fetched from MongoDB....')
+
+        return headers, results
+
+
+
+    ###################################################
+    #     16) Running Aggregation Pipeline :          #
+    ###################################################
+
+    @measures_phase("mongodb", "query")
+    def run_aggregation_pipeline(self, collectionName, pipeline, allow_disk_use, batch_size):
+
+        '''
+
+        Functionality : Running an aggregation pipeline on the collection and reading its results batch by batch, so that joins, reshaping and
+                        pre-aggregation happen in the database and the results can be streamed to the client.
+        :param collectionName: The name of the collection in the database the pipeline runs on.
+        :param pipeline: The list of the aggregation pipeline stages.
+        :param allow_disk_use: Whether the pipeline stages are allowed to write temporary files when exceeding their memory limit.
+        :param batch_size: The number of result documents to be fetched per batch.
+        :return: generator --> Yields the document list of every batch.
+
+        '''
+
+        self.log_object.logToFile('info', 'Running aggregation pipeline on collection : ' + collectionName + ' using MongoDB for the database : ' +
+                                  self.databaseName)
+        self.log_object.logToFile('debug', 'Aggregation pipeline : ' + json_util.dumps(pipeline))
+
+        try:
+            cursor = self.client[self.databaseName][collectionName].aggregate(pipeline, allowDiskUse=allow_disk_use, batchSize=int(batch_size),
+                                                                              **self._get_max_time_options(self.export_timeout))
+
+        except Exception:
+
+            self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
+            self.client.close()
+            raise
+
+        return self._generate_document_batches(cursor, int(batch_size))
+
+
+
+    ###################################################
+    #     17) Creating Index :                        #
+    ###################################################
+
+    @measures_phase("mongodb", "query")
+    def create_index(self, collectionName, index_name, index_fields, unique=False):
+
+        '''
+
+        Functionality : Creating an ascending compound index on the given fields of the collection, so that the filters on them do not need
+                        to scan the whole collection.
+        :param collectionName: The name of the collection in the database where the index needs to be created.
+        :param index_name: The name of the index.
+        :param index_fields: The ordered list of the fields to be indexed.
+        :param unique: Whether the index needs to enforce unique values.
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('info', 'Creating index : ' + index_name + ' on the collection : ' + collectionName + ' using MongoDB for the database : ' +
+                                  self.databaseName)
+
+        try:
+
+            if len(index_fields) == 0:
+                raise Exception("At least one field is required for creating an index.")
+
+            self.client[self.databaseName][collectionName].create_index([(i, pymongo.ASCENDING) for i in index_fields], name=index_name,
+                                                                        unique=unique)
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
+            self.client.close()
+
+        IndexAdvisorOperations().record_index(*self._get_index_advisor_table(collectionName), index_name, index_fields)
+
+        self.log_object.logToFile('info', 'The index has been created in MongoDB....')
+
+
+    ###################################################
+    #     18) Dropping Index :                        #
+    ###################################################
+
+    @measures_phase("mongodb", "query")
+    def drop_index(self, collectionName, index_name):
+
+        '''
+
+        Functionality : Dropping an index from the collection.
+        :param collectionName: The name of the collection in the database the index belongs to.
+        :param index_name: The name of the index.
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('info', 'Dropping index : ' + index_name + ' from the collection : ' + collectionName + ' using MongoDB for the database : ' +
+                                  self.databaseName)
+
+        try:
+            self.client[self.databaseName][collectionName].drop_index(index_name)
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the MongoDB server connection....')
+            self.client.close()
+
+        IndexAdvisorOperations().remove_index(*self._get_index_advisor_table(collectionName), index_name)
+
+        self.log_object.logToFile('info', 'The index has been dropped from MongoDB....')
+
+
+    ###################################################
+    #     19) Fetching Index Advisor Table :          #
+    ###################################################
+
+    def _get_index_advisor_table(self, collectionName):
+
+        '''
+
+        Functionality : Fetching the backend and the name identifying the collection in the index advisor, without any connection credentials.
+        :param collectionName: The name of the collection.
+        :return: backend, advisor_table
+
+        '''
+
+        return "mongodb", re.sub(r"//[^@/]*@", "//", self.connection_uri) + "/" + self.databaseName + "." + collectionName
+
+
+    ###################################################
+    #     20) Recording Slow Query :                  #
+    ###################################################
+
+    def _record_slow_query(self, collectionName, operation, conditionalQuery, start_time, row_count, end_time=None):
+
+        '''
+
+        Functionality : Recording the executed operation in the slow query log under the shape of its filter, capturing the query planner
+                        output of the filter over the still open connection when it was slower than the threshold.
+        :param collectionName: The name of the collection the operation ran on.
+        :param operation: The name of the operation, such as find, deleteMany or updateMany.
+        :param conditionalQuery: The filter of the operation.
+        :param start_time: The performance counter value from before the operation got executed.
+        :param row_count: The number of documents returned or affected by the operation.
+        :param end_time: The performance counter value up to which the operation gets timed, the current one if not given. A streamed find is
+                         timed up to its first batch, so that the time the client takes to download the rows is left out.
+        :return: None
+
+        '''
+
+        slow_query_object = SlowQueryOperations()
+
+        slow_query_object.record_query(*self._get_index_advisor_table(collectionName),
+                                       operation + " " + collectionName + " " + slow_query_object.shape_mongo_query(conditionalQuery),
+                                       (end_time or time.perf_counter()) - start_time, row_count,
+                                       lambda: json_util.dumps(self.client[self.databaseName].command(
+                                           "explain", {"find": collectionName, "filter": conditionalQuery}, verbosity="queryPlanner")["queryPlanner"]))
+
+
+    ###################################################
+    #     21) Preparing Connection URI :              #
+    ###################################################
+
+    def _prepare_connection_uri(self, connection_uri, username, password):
+
+        '''
+
+        Functionality : Checking the mandatory parameters of the connection and filling the username and password placeholders of the
+                        connection URI.
+        :param connection_uri: The connection URI, optionally holding the <username> and <password> placeholders.
+        :param username: The username required for connecting to MongoDB server, if any.
+        :param password: The password required for connecting to MongoDB server, if any.
+        :return: connection_uri
+
+        '''
+
+        self.log_object.logToFile('info', 'Checking mandatory parameters for connection to MongoDB server....')
+
+        prepared_uri = connection_uri.replace("'","").replace('"',"").strip()
+
+        if prepared_uri.lower().find("<username>") > -1 :
+            if username == "" :
+                self.log_object.logToFile('error', 'Username field is required but was not provided for MongoDB operation....')
+                raise Exception("Missing Mandatory Field : Username field is required but was not provided for MongoDB operation")
+            else :
+                prepared_uri = connection_uri.replace("<username>", username)
+
+        if prepared_uri.lower().find("<password>") > -1 :
+            if password == "" :
+                self.log_object.logToFile('error','Password field is required but was not provided for MongoDB operation....')
+                raise Exception("Missing Mandatory Field : Password field is required but was not provided for MongoDB operation")
+            else :
+                prepared_uri = prepared_uri.replace("<password>", urllib.parse.quote(password))
+
+        return prepared_uri
+
+
+    ###################################################
+    #     22) Fetching Max Time :                     #
+    ###################################################
+
+    def _get_max_time_ms(self, timeout_seconds):
+
+        '''
+
+        Functionality : Converting a timeout into the max_time_ms of a cursor, after which the server aborts the operation.
+        :param timeout_seconds: The timeout in seconds, or 0 to disable it.
+        :return: max_time_ms --> None when the timeout is disabled.
+
+        '''
+
+        if timeout_seconds > 0:
+            return int(timeout_seconds * 1000)
+
+        return None
+
+
+    ###################################################
+    #     23) Fetching Max Time Options :             #
+    ###################################################
+
+    def _get_max_time_options(self, timeout_seconds):
+
+        '''
+
+        Functionality : Preparing the maxTimeMS option of an aggregate or count command, left out when the timeout is disabled as the driver
+                        passes the command options to the server as they are.
+        :param timeout_seconds: The timeout in seconds, or 0 to disable it.
+        :return: options --> The dictionary of the keyword arguments of the command.
+
+        '''
+
+        max_time_ms = self._get_max_time_ms(timeout_seconds)
+
+        if max_time_ms is None:
+            return {}
+
+        return {"maxTimeMS": max_time_ms}
+
 ##########################################################################################################################################
 #                                                 End Block : MongoDB Operation Functions :                                              #
 ##########################################################################################################################################
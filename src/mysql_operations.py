@@ -18,7 +18,25 @@
 ##########################################################################################################################################
 
 from src.setup_logger import logger
+from src.query_operations import QueryOperations
+from src.cache_operations import CacheOperations, invalidates_cached_records
+from src.index_advisor_operations import IndexAdvisorOperations, records_filter_usage
+from src.metrics_operations import measures_phase
+from src.slow_query_operations import SlowQueryOperations
+from src.setup_config import config
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import hashlib
+import json
+import queue
+import time
+import threading
 import mysql.connector
+from mysql.connector import pooling
+
+CONNECTION_POOLS = {}
+CONNECTION_POOL_SLOTS = {}
+CONNECTION_POOLS_LOCK = threading.Lock()
 
 ##########################################################################################################################################
 #                                                 End Block : Importing Libraries & Initializing Variables :                             #
@@ -35,6 +53,7 @@ class MySqlOperations :
     #     1) Initialising Function :               #
     ################################################
 
+    @measures_phase("mysql", "connect")
     def __init__(self,username,password,db_name,host_name):
 
         '''
@@ -55,6 +74,10 @@ class MySqlOperations :
         self.log_object = logger()
         self.log_object.logToFile('info','Establishing connection to the MySQL database....')
 
+        config_object = config()
+        self.query_timeout = config_object.getValue("QUERY_TIMEOUT_SECONDS")
+        self.export_timeout = config_object.getValue("EXPORT_TIMEOUT_SECONDS")
+
         try:
             self.conn = mysql.connector.connect(host=self.host_name, username=self.username,password=self.password)
             self.cursor = self.conn.cursor()
@@ -70,6 +93,8 @@ class MySqlOperations :
     #     2) Creating Table :                      #
     ################################################
 
+    @measures_phase("mysql", "query")
+    @invalidates_cached_records
     def create_table(self,table_name,fields_dict):
 
         '''
@@ -121,6 +146,7 @@ class MySqlOperations :
     #     3) Generating Table Schema :             #
     ################################################
 
+    @measures_phase("mysql", "schema lookup")
     def generate_schema(self,table_name):
 
         '''
@@ -157,6 +183,8 @@ class MySqlOperations :
     #     4) Insert Single Record :                #
     ################################################
 
+    @measures_phase("mysql", "query")
+    @invalidates_cached_records
     def insert_into_table_single_record(self, table_name, insert_fields):
 
         '''
@@ -206,6 +234,8 @@ class MySqlOperations :
     #     5) Insert Multiple Records :             #
     ################################################
 
+    @measures_phase("mysql", "query")
+    @invalidates_cached_records
     def insert_into_table_multiple_records(self, table_name, headers, values):
 
         '''
@@ -281,7 +311,9 @@ class MySqlOperations :
     #     6) Fetching Records From Collection :       #
     ###################################################
 
-    def select_records(self, table_name, conditional_fields, rowLimit):
+    @measures_phase("mysql", "query")
+    @records_filter_usage("conditional_fields")
+    def select_records(self, table_name, conditional_fields, rowLimit, fetch_size=None):
 
         '''
 
@@ -289,7 +321,8 @@ class MySqlOperations :
         :param table_name: The name of the table in the database from where the records need to be fetched.
         :param conditional_fields: The dictionary of conditional fields to be checked while fetching the records, if required.
         :param rowLimit: The row limit defining the number of records to be returned from the table.
-        :return: headers, results
+        :param fetch_size: The number of rows to be fetched per batch, if the records need to be fetched in batches.
+        :return: headers, results --> The results are returned as a generator of row batches when a fetch size is given.
 
         '''
 
@@ -357,11 +390,23 @@ class MySqlOperations :
         self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
         self.log_object.logToFile('debug', 'Executing the query....')
 
+        if fetch_size is None:
+            self._apply_statement_timeout(self.cursor, self.export_timeout)
+
+        start_time = time.perf_counter()
         self.cursor.execute(sql_query)
 
-        results = list(self.cursor.fetchall())
         headers = [i[0] for i in self.cursor.description]
 
+        if fetch_size is not None:
+            return headers, self._generate_record_batches(int(fetch_size),
+                                                          lambda row_count, end_time: self._record_slow_query(table_name, sql_query, start_time, row_count,
+                                                                                                     end_time=end_time))
+
+        results = list(self.cursor.fetchall())
+
+        self._record_slow_query(table_name, sql_query, start_time, len(results))
+
         self.log_object.logToFile('info', 'Closing the database connection....')
         self.conn.close()
 
@@ -372,6 +417,9 @@ class MySqlOperations :
     #     7) Deleting Records :                       #
     ###################################################
 
+    @measures_phase("mysql", "query")
+    @records_filter_usage("conditional_fields")
+    @invalidates_cached_records
     def delete_records(self,table_name, conditional_fields):
 
         '''
@@ -385,65 +433,24 @@ class MySqlOperations :
 
         self.log_object.logToFile('info', 'Deleting data from the table : ' + table_name)
 
-        initial_string = "DELETE FROM " + table_name
-
-        if len(conditional_fields) == 0:
-            conditional_string = ""
-
-        else:
-            conditional_string = " WHERE "
-
-            for idx, condition in enumerate(conditional_fields):
-
-                conditional_string += condition[0].strip() + " "
-
-                if condition[1].lower() == "equals":
-                    conditional_operator = "="
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "not equals":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "greater than":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "greater than equals":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "less than":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "less than equals":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "like":
-                    conditional_operator = "LIKE"
-                    conditional_string += conditional_operator + " '%" + condition[2] + "%' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "in":
-                    conditional_operator = "IN({0})"
-                    value = ""
-                    for val in condition[2].split(","):
-                        value+=val.replace("'","").strip()+","
-                    value = value.rstrip(",")
-                    conditional_string += conditional_operator.format(str(value)) + \
-                                          condition[3] + " "
+        conditional_string, parameters = QueryOperations().build_sql_conditional_string(conditional_fields, "%s")
 
         self.log_object.logToFile('debug', 'Creating the SQL Query....')
 
-        sql_query = initial_string + conditional_string
+        sql_query = "DELETE FROM " + table_name
+
+        if conditional_string != "":
+            sql_query += " WHERE " + conditional_string
 
         self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
         self.log_object.logToFile('debug', 'Executing the query....')
 
-        self.cursor.execute(sql_query)
+        start_time = time.perf_counter()
+        self.cursor.execute(sql_query, parameters)
         self.conn.commit()
 
+        self._record_slow_query(table_name, sql_query, start_time, self.cursor.rowcount, parameters)
+
         self.log_object.logToFile('info', 'Closing the database connection....')
         self.conn.close()
 
@@ -452,6 +459,9 @@ class MySqlOperations :
     #     8) Updating Records :                       #
     ###################################################
 
+    @measures_phase("mysql", "query")
+    @records_filter_usage("conditional_fields")
+    @invalidates_cached_records
     def update_table(self,table_name, fields_to_be_updated, conditional_fields):
 
         '''
@@ -466,88 +476,908 @@ class MySqlOperations :
 
         self.log_object.logToFile('info', 'Updating table data : ' + table_name)
 
-        initial_string = "UPDATE " + table_name
+        update_fields = [i for i in fields_to_be_updated.keys() if fields_to_be_updated[i].lower() != "no change"]
 
-        update_string = " SET"
+        if len(update_fields) == 0:
+            self.conn.close()
+            raise Exception("At least one field needs to be provided with a new value for updating the records.")
 
-        for idx,element in enumerate(list(fields_to_be_updated.keys())):
+        update_string = ", ".join([i + " = %s" for i in update_fields])
+        conditional_string, parameters = QueryOperations().build_sql_conditional_string(conditional_fields, "%s")
+        parameters = [fields_to_be_updated[i] for i in update_fields] + parameters
 
-            if fields_to_be_updated[element].lower() == "no change" :
-                continue
+        self.log_object.logToFile('debug', 'Creating the SQL Query....')
 
-            else :
+        sql_query = "UPDATE " + table_name + " SET " + update_string
 
-                update_string+= " "+element+" = '"+fields_to_be_updated[element]+"'"
+        if conditional_string != "":
+            sql_query += " WHERE " + conditional_string
 
-                if idx != len(list(fields_to_be_updated)):
-                    update_string+= ","
-                else :
-                    update_string += ""
+        self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
+        self.log_object.logToFile('debug', 'Executing the query....')
 
-            if update_string[-1] == "," :
+        start_time = time.perf_counter()
+        self.cursor.execute(sql_query, parameters)
+        self.conn.commit()
 
-                update_string = update_string.rstrip(",")
+        self._record_slow_query(table_name, sql_query, start_time, self.cursor.rowcount, parameters)
 
-        if len(conditional_fields) == 0:
-            conditional_string = ""
+        self.log_object.logToFile('info', 'Closing the database connection....')
+        self.conn.close()
+
+
+    ###################################################
+    #     9) Upsert Multiple Records :                #
+    ###################################################
+
+    @measures_phase("mysql", "query")
+    @invalidates_cached_records
+    def upsert_into_table_multiple_records(self, table_name, headers, values, update_fields, batch_size=1000):
+
+        '''
+
+        Functionality : Inserting multiple data records in the given table using batched multi-row statements, updating the existing records
+                        in case of a duplicate key conflict.
+        :param table_name: The name of the table in the database where the records need to be upserted.
+        :param headers: The list of the field headers defining the fields in the table. The table fields are used if the list is empty.
+        :param values: The list of all the values of all the records to be upserted in the table.
+        :param update_fields: The list of fields to be overwritten in case of a duplicate key conflict. All the header fields are overwritten if the list is empty.
+        :param batch_size: The number of records to be sent in a single INSERT statement.
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('info', 'Upserting multiple records into the table : ' + table_name)
+
+        if len(headers) == 0:
+
+            self.log_object.logToFile('debug', 'Fetching the field headers of the table....')
+
+            self.cursor.execute("SELECT * FROM " + table_name + " LIMIT 0")
+            self.cursor.fetchall()
+            headers = [i[0] for i in self.cursor.description]
+
+        if len(update_fields) == 0:
+            update_fields = headers
+
+        for field in update_fields:
+            if field not in headers:
+                self.log_object.logToFile('error', 'The update field ' + field + ' is not present in the field headers....')
+                self.conn.close()
+                raise Exception("The update field " + field + " is not present in the field headers of the file.")
+
+        header_string = " (" + ",".join(headers) + ")"
+        record_string = "(" + ",".join(["%s"] * len(headers)) + ")"
+        update_string = " ON DUPLICATE KEY UPDATE " + ",".join([field + " = VALUES(" + field + ")" for field in update_fields])
+
+        for batch_start in range(0, len(values), batch_size):
+
+            batch_values = values[batch_start:batch_start + batch_size]
+            parameters = []
+
+            for record_idx, record_value in enumerate(batch_values):
+
+                if len(record_value) != len(headers):
+                    self.log_object.logToFile('error', 'Record no. : ' + str(batch_start + record_idx) + ' does not match the field headers....')
+                    self.conn.close()
+                    raise Exception("Record no. " + str(batch_start + record_idx) + " has " + str(len(record_value)) +
+                                    " values but " + str(len(headers)) + " fields are expected.")
+
+                parameters.extend(record_value)
+
+            self.log_object.logToFile('debug', 'Creating the SQL Query for the batch starting at record no. : ' + str(batch_start) + '....')
+
+            sql_string = "INSERT INTO " + table_name + header_string + " VALUES " + \
+                         ",".join([record_string] * len(batch_values)) + update_string
+
+            self.log_object.logToFile('debug', 'SQL query got created for ' + str(len(batch_values)) + ' records as : INSERT INTO ' +
+                                      table_name + header_string + ' VALUES ' + record_string + ',...' + update_string)
+            self.log_object.logToFile('debug', 'Executing the query....')
+
+            self.cursor.execute(sql_string, parameters)
+            self.conn.commit()
+
+            self.log_object.logToFile('debug', 'The query got executed successfully....')
+
+        self.log_object.logToFile('info', 'All the records got upserted successfully....')
+        self.log_object.logToFile('info', 'Closing the database connection....')
+        self.conn.close()
+
+
+    ###################################################
+    #     10) Fetching Primary Key Fields :           #
+    ###################################################
+
+    @measures_phase("mysql", "schema lookup")
+    def get_primary_key_fields(self, table_name):
+
+        '''
+
+        Functionality : Fetching the ordered list of the primary key fields of the given table.
+        :param table_name: The name of the table in the database whose primary key fields need to be fetched.
+        :return: key_fields
+
+        '''
+
+        self.log_object.logToFile('debug', 'Fetching the primary key fields of the table : ' + table_name)
+
+        self.cursor.execute("SHOW KEYS FROM " + table_name + " WHERE Key_name = 'PRIMARY'")
+
+        rows = sorted(list(self.cursor.fetchall()), key=lambda row: row[3])
+
+        return [row[4] for row in rows]
+
+
+    ###################################################
+    #     11) Browsing Records Page Wise :            #
+    ###################################################
+
+    @measures_phase("mysql", "query")
+    def browse_records(self, table_name, conditional_fields, page_size, continuation_token):
+
+        '''
+
+        Functionality : Fetching a single page of records from the specified table using keyset pagination on the primary key, so that
+                        every page costs the same as the first one.
+        :param table_name: The name of the table in the database from where the records need to be fetched.
+        :param conditional_fields: The list of conditional fields to be checked while fetching the records, if required.
+        :param page_size: The number of records to be returned in the page.
+        :param continuation_token: The continuation token returned with the previous page, or an empty string for the first page.
+        :return: headers, results, next_token --> The next token is None when the last page has been reached.
+
+        '''
+
+        self.log_object.logToFile('info', 'Browsing table data from the table : ' + table_name)
+
+        try:
+
+            query_object = QueryOperations()
+
+            key_fields = self.get_primary_key_fields(table_name)
+
+            if len(key_fields) == 0:
+                raise Exception("The table " + table_name + " does not have a primary key to paginate on.")
+
+            fingerprint = query_object.generate_query_fingerprint("MySQL", self.host_name, self.db_name, table_name, conditional_fields)
+
+            conditional_string, parameters = query_object.build_sql_conditional_string(conditional_fields, "%s")
+
+            where_clauses = []
+
+            if conditional_string != "":
+                where_clauses.append("(" + conditional_string + ")")
+
+            if continuation_token != "":
+                last_values = query_object.decode_continuation_token(fingerprint, continuation_token)
+                keyset_string, keyset_parameters = query_object.build_keyset_condition(key_fields, last_values, "%s")
+                where_clauses.append(keyset_string)
+                parameters.extend(keyset_parameters)
+
+            self.log_object.logToFile('debug', 'Creating the SQL Query....')
+
+            sql_query = "SELECT * FROM " + table_name
+
+            if len(where_clauses) > 0:
+                sql_query += " WHERE " + " AND ".join(where_clauses)
+
+            sql_query += " ORDER BY " + ",".join(key_fields) + " LIMIT " + str(int(page_size) + 1)
+
+            self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
+            self.log_object.logToFile('debug', 'Executing the query....')
+
+            self._apply_statement_timeout(self.cursor, self.query_timeout)
+            self.cursor.execute(sql_query, parameters)
+
+            results = list(self.cursor.fetchall())
+            headers = [i[0] for i in self.cursor.description]
+
+            next_token = None
+
+            if len(results) > int(page_size):
+                results = results[:int(page_size)]
+                key_indexes = [headers.index(i) for i in key_fields]
+                next_token = query_object.encode_continuation_token(fingerprint, [results[-1][i] for i in key_indexes])
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+        return headers, results, next_token
+
+
+    ###################################################
+    #     12) Fetching Connection Pool :              #
+    ###################################################
+
+    def get_connection_pool(self, pool_size):
+
+        '''
+
+        Functionality : Fetching the connection pool shared by all the operations on the same host, user, password and database, creating it
+                        on first use along with the semaphore its connections are taken through.
+        :param pool_size: The number of connections to be opened in the pool when it gets created, bounded by the connector maximum of 32.
+        :return: connection_pool
+
+        '''
+
+        pool_key = (self.host_name, self.username, hashlib.sha256(self.password.encode("utf-8")).hexdigest(), self.db_name)
+
+        with CONNECTION_POOLS_LOCK:
+
+            if pool_key not in CONNECTION_POOLS:
+
+                self.log_object.logToFile('info', 'Creating a MySQL connection pool of size ' + str(pool_size) + ' for the database : ' + self.db_name)
+
+                pool_name = "dbapp_" + hashlib.sha256("|".join(pool_key).encode("utf-8")).hexdigest()[:16]
+                CONNECTION_POOLS[pool_key] = pooling.MySQLConnectionPool(pool_name=pool_name,
+                                                                         pool_size=min(int(pool_size), pooling.CNX_POOL_MAXSIZE),
+                                                                         host=self.host_name, user=self.username,
+                                                                         password=self.password, database=self.db_name,
+                                                                         consume_results=True)
+                CONNECTION_POOL_SLOTS[pool_name] = threading.BoundedSemaphore(CONNECTION_POOLS[pool_key].pool_size)
+
+            return CONNECTION_POOLS[pool_key]
+
+
+    ###################################################
+    #     13) Fetching Pooled Connection :            #
+    ###################################################
+
+    def get_pooled_connection(self, connection_pool):
+
+        '''
+
+        Functionality : Taking a connection from the connection pool, waiting for one to be given back while all of them are in use, as the
+                        pool itself fails right away once exhausted by the exports running in parallel on the same database.
+        :param connection_pool: The connection pool fetched with get_connection_pool.
+        :return: connection, connection_slots --> The connection slots need to be released once the connection got closed.
+
+        '''
+
+        connection_slots = CONNECTION_POOL_SLOTS[connection_pool.pool_name]
+        connection_slots.acquire()
+
+        try:
+            return connection_pool.get_connection(), connection_slots
+
+        except Exception:
+            connection_slots.release()
+            raise
+
+
+    ###################################################
+    #     14) Exporting Records By Key Ranges :       #
+    ###################################################
+
+    @measures_phase("mysql", "query")
+    def export_records_key_ranges(self, table_name, conditional_fields, key_field, partition_count, worker_count, fetch_size=5000):
+
+        '''
+
+        Functionality : Exporting all the records of the specified table by splitting the key into ranges and reading them in parallel, each
+                        range on its own pooled connection, so that the export scales with the number of connections allowed.
+        :param table_name: The name of the table in the database from where the records need to be exported.
+        :param conditional_fields: The list of conditional fields to be checked while exporting the records, if required.
+        :param key_field: The integer or ordered key field the ranges are defined on. The first primary key field is used if empty.
+        :param partition_count: The number of key ranges to be created.
+        :param worker_count: The maximum number of key ranges read in parallel.
+        :param fetch_size: The number of records fetched per batch within a key range.
+        :return: headers, batches --> The batches are a generator of record lists, one per fetched batch, in key order.
+
+        '''
+
+        self.log_object.logToFile('info', 'Exporting table data by key ranges from the table : ' + table_name)
+
+        query_object = QueryOperations()
+
+        if key_field == "":
+
+            key_fields = self.get_primary_key_fields(table_name)
+
+            if len(key_fields) == 0:
+                self.conn.close()
+                raise Exception("The table " + table_name + " does not have a primary key, please provide the key field to partition on.")
+
+            key_field = key_fields[0]
+
+        conditional_string, parameters = query_object.build_sql_conditional_string(conditional_fields, "%s")
+
+        where_string = " WHERE (" + conditional_string + ")" if conditional_string != "" else ""
+
+        self.cursor.execute("SELECT * FROM " + table_name + " LIMIT 0")
+        self.cursor.fetchall()
+        headers = [i[0] for i in self.cursor.description]
+
+        self.log_object.logToFile('debug', 'Fetching the key range of the field : ' + key_field + '....')
+
+        self._apply_statement_timeout(self.cursor, self.export_timeout)
+        self.cursor.execute("SELECT MIN(" + key_field + "), MAX(" + key_field + ") FROM " + table_name + where_string, parameters)
+        min_value, max_value = self.cursor.fetchone()
+
+        if min_value is None:
+            boundaries = []
+
+        elif isinstance(min_value, int) and isinstance(max_value, int) and not isinstance(min_value, bool):
+            boundaries = query_object.split_integer_key_range(min_value, max_value, partition_count)
 
         else:
-            conditional_string = " WHERE "
 
-            for idx, condition in enumerate(conditional_fields):
+            self.log_object.logToFile('debug', 'The key field is not an integer, sampling the range boundaries....')
 
-                conditional_string += condition[0].strip() + " "
+            self.cursor.execute("SELECT COUNT(*) FROM " + table_name + where_string, parameters)
+            record_count = self.cursor.fetchone()[0]
 
-                if condition[1].lower() == "equals":
-                    conditional_operator = "="
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "not equals":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "greater than":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "greater than equals":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "less than":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "less than equals":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "like":
-                    conditional_operator = "LIKE"
-                    conditional_string += conditional_operator + " '%" + condition[2] + "%' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "in":
-                    conditional_operator = "IN({0})"
-                    value = ""
-                    for val in condition[2].split(","):
-                        value+=val.replace("'","").strip()+","
-                    value = value.rstrip(",")
-                    conditional_string += conditional_operator.format(str(value)) + \
-                                          condition[3] + " "
+            boundaries = []
 
-        self.log_object.logToFile('debug', 'Creating the SQL Query....')
+            for partition_idx in range(1, int(partition_count)):
 
-        sql_query = initial_string + update_string + conditional_string
+                self.cursor.execute("SELECT " + key_field + " FROM " + table_name + where_string + " ORDER BY " + key_field +
+                                    " LIMIT 1 OFFSET " + str(record_count * partition_idx // int(partition_count)), parameters)
+                boundary = self.cursor.fetchone()
 
-        self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
-        self.log_object.logToFile('debug', 'Executing the query....')
+                if boundary is not None and (len(boundaries) == 0 or boundary[0] > boundaries[-1]):
+                    boundaries.append(boundary[0])
 
-        self.cursor.execute(sql_query)
-        self.conn.commit()
+        range_queries = []
+
+        for range_string, range_parameters in query_object.build_key_range_conditions(key_field, boundaries, "%s"):
+
+            sql_query = "SELECT * FROM " + table_name + " WHERE " + \
+                        ("(" + conditional_string + ") AND " if conditional_string != "" else "") + \
+                        "(" + range_string + ") ORDER BY " + key_field
+
+            range_queries.append((sql_query, parameters + range_parameters))
+
+        self.log_object.logToFile('debug', 'The key got split into ' + str(len(range_queries)) + ' ranges, first range query : ' + range_queries[0][0])
+
+        connection_pool = self.get_connection_pool(worker_count)
 
         self.log_object.logToFile('info', 'Closing the database connection....')
         self.conn.close()
 
+        return headers, self._generate_key_range_batches(connection_pool, range_queries, min(int(worker_count), connection_pool.pool_size),
+                                                         int(fetch_size))
+
+
+    ###################################################
+    #     15) Generating Key Range Batches :          #
+    ###################################################
+
+    def _generate_key_range_batches(self, connection_pool, range_queries, worker_count, fetch_size):
+
+        '''
+
+        Functionality : Reading the key ranges on a bounded pool of worker threads, each using its own pooled connection, and generating the
+                        records batch by batch in key order. Every range hands its batches over through a queue bounded to two batches, so
+                        the ranges read ahead of the one being generated wait instead of piling up in memory. When the generator gets closed
+                        early, such as on a client disconnect, the range queries still running get killed so that their connections go back
+                        to the pool right away.
+        :param connection_pool: The connection pool the worker connections are taken from.
+        :param range_queries: The list of (SQL query, parameters) tuples, one per key range, in key order.
+        :param worker_count: The maximum number of key ranges read in parallel.
+        :param fetch_size: The number of records fetched per batch within a key range.
+        :return: generator --> Yields the record list of every fetched batch.
+
+        '''
+
+        running_connection_ids = set()
+        reads_stopped = threading.Event()
+
+        def put_batch(range_queue, item):
+
+            while not reads_stopped.is_set():
+
+                try:
+                    range_queue.put(item, timeout=0.5)
+                    return True
+
+                except queue.Full:
+                    continue
+
+            return False
+
+        def read_key_range(range_queue, range_query):
+
+            try:
+
+                if reads_stopped.is_set():
+                    return
+
+                connection, connection_slots = self.get_pooled_connection(connection_pool)
+
+                try:
+                    cursor = connection.cursor()
+
+                    connection_id = connection.connection_id
+                    running_connection_ids.add(connection_id)
+
+                    try:
+                        cursor.execute(range_query[0], range_query[1])
+
+                        while True:
+
+                            batch = cursor.fetchmany(fetch_size)
+
+                            if len(batch) == 0:
+                                break
+
+                            if not put_batch(range_queue, ("batch", batch)):
+                                return
+
+                    finally:
+                        running_connection_ids.discard(connection_id)
+
+                finally:
+
+                    try:
+                        connection.close()
+
+                    finally:
+                        connection_slots.release()
+
+                put_batch(range_queue, ("done", None))
+
+            except Exception as e:
+                put_batch(range_queue, ("error", e))
+
+        executor = ThreadPoolExecutor(max_workers=worker_count)
+        pending_queries = deque(range_queries)
+        running_queues = deque()
+
+        try:
+
+            while len(pending_queries) > 0 or len(running_queues) > 0:
+
+                while len(pending_queries) > 0 and len(running_queues) < worker_count:
+
+                    range_queue = queue.Queue(maxsize=2)
+                    executor.submit(read_key_range, range_queue, pending_queries.popleft())
+                    running_queues.append(range_queue)
+
+                item_type, item_value = running_queues[0].get()
+
+                if item_type == "error":
+                    raise item_value
+
+                elif item_type == "done":
+                    running_queues.popleft()
+
+                else:
+                    yield item_value
+
+            self.log_object.logToFile('info', 'All the key ranges got exported successfully....')
+
+        except GeneratorExit:
+
+            for connection_id in list(running_connection_ids):
+                self._cancel_running_query(connection_id)
+
+            raise
+
+        finally:
+
+            reads_stopped.set()
+            executor.shutdown(wait=True)
+
+
+    ###################################################
+    #     16) Generating Record Batches :             #
+    ###################################################
+
+    def _generate_record_batches(self, fetch_size, record_query=None):
+
+        '''
+
+        Functionality : Fetching the rows of the executed query batch by batch with fetchmany, closing the database connection once all the
+                        batches got fetched or the generator got closed. When the generator gets closed early, such as on a client disconnect,
+                        the query gets killed first so that the server stops producing its rows.
+        :param fetch_size: The number of rows to be fetched per batch.
+        :param record_query: The function recording the query in the slow query log with the fetched row count and the performance counter
+                             value from when the first batch got fetched, if required.
+        :return: generator --> Yields the row list of every batch.
+
+        '''
+
+        try:
+
+            row_count = 0
+            first_batch_time = None
+
+            while True:
+
+                batch = self.cursor.fetchmany(fetch_size)
+
+                if first_batch_time is None:
+                    first_batch_time = time.perf_counter()
+
+                if len(batch) == 0:
+                    break
+
+                row_count += len(batch)
+
+                yield batch
+
+            self.log_object.logToFile('info', 'All the record batches got fetched successfully....')
+
+            if record_query is not None:
+                record_query(row_count, first_batch_time)
+
+        except GeneratorExit:
+
+            self._cancel_running_query(self.conn.connection_id)
+            raise
+
+        finally:
+
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+
+    ###################################################
+    #     17) Fetching Cached Records :               #
+    ###################################################
+
+    def select_cached_records(self, table_name, conditional_fields, rowLimit):
+
+        '''
+
+        Functionality : Fetching the records in the same way as select_records, serving them from the query result cache when the same
+                        user ran the same query before and caching them otherwise. The cached results are kept per user, so that nobody
+                        gets served the rows of a table they have no grant to read.
+        :param table_name: The name of the table in the database from where the records need to be fetched.
+        :param conditional_fields: The dictionary of conditional fields to be checked while fetching the records, if required.
+        :param rowLimit: The row limit defining the number of records to be returned from the table.
+        :return: headers, results
+
+        '''
+
+        cache_object = CacheOperations()
+        table_key = self._get_cache_table_key(table_name)
+        fingerprint = QueryOperations().generate_query_fingerprint(table_key, self.username, conditional_fields, rowLimit)
+
+        cached_result = cache_object.get_records(fingerprint)
+
+        if cached_result is not None:
+
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+            return cached_result
+
+        generation = cache_object.get_table_generation(table_key)
+        headers, results = self.select_records(table_name, conditional_fields, rowLimit)
+        cache_object.put_records(fingerprint, table_key, (headers, [tuple(i) for i in results]), generation)
+
+        return headers, results
+
+
+    ###################################################
+    #     18) Fetching Cache Table Key :              #
+    ###################################################
+
+    def _get_cache_table_key(self, table_name):
+
+        '''
+
+        Functionality : Generating the key identifying the given table in the query result cache.
+        :param table_name: The name of the table.
+        :return: table_key
+
+        '''
+
+        return CacheOperations().generate_table_key("mysql", self.host_name, self.db_name, table_name)
+
+
+    ###################################################
+    #     19) Previewing Records :                    #
+    ###################################################
+
+    @measures_phase("mysql", "query")
+    def preview_records(self, table_name, conditional_fields):
+
+        '''
+
+        Functionality : Estimating the number of records matched by the conditions and the cost of reading them from the EXPLAIN plan of
+                        the query, without running the query itself.
+        :param table_name: The name of the table in the database whose records need to be previewed.
+        :param conditional_fields: The dictionary of conditional fields to be checked, if required.
+        :return: preview --> The dictionary of estimatedRows, isLowerBound, estimatedCost, accessMethod and plan.
+
+        '''
+
+        self.log_object.logToFile('info', 'Previewing table data from the table : ' + table_name)
+
+        conditional_string, parameters = QueryOperations().build_sql_conditional_string(conditional_fields, "%s")
+
+        sql_query = "EXPLAIN FORMAT=JSON SELECT * FROM " + table_name
+
+        if conditional_string != "":
+            sql_query += " WHERE " + conditional_string
+
+        self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
+        self.log_object.logToFile('debug', 'Executing the query....')
+
+        try:
+            self.cursor.execute(sql_query, parameters)
+            plan = json.loads(self.cursor.fetchone()[0])
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+        query_block = plan.get("query_block", {})
+        table_plan = query_block.get("table", {})
+
+        if "message" in query_block:
+            estimated_rows = 0
+            access_method = query_block["message"]
+        else:
+            estimated_rows = table_plan.get("rows_produced_per_join")
+            access_method = table_plan.get("access_type", "")
+
+            if "key" in table_plan:
+                access_method += " (" + table_plan["key"] + ")"
+
+        return {
+            "estimatedRows": estimated_rows,
+            "isLowerBound": False,
+            "estimatedCost": float(query_block.get("cost_info", {}).get("query_cost", 0)),
+            "accessMethod": access_method,
+            "plan": plan
+        }
+
+
+    ###################################################
+    #     20) Aggregating Records :                   #
+    ###################################################
+
+    @measures_phase("mysql", "query")
+    def aggregate_records(self, table_name, conditional_fields, group_fields, aggregations):
+
+        '''
+
+        Functionality : Computing the aggregations for every group of the records matching the conditions through a GROUP BY query, so that
+                        only the aggregated rows get transferred from the database.
+        :param table_name: The name of the table in the database whose records need to be aggregated.
+        :param conditional_fields: The dictionary of conditional fields to be checked while aggregating the records, if required.
+        :param group_fields: The list of the fields to group the records by.
+        :param aggregations: The list of (function, field, alias) aggregation tuples.
+        :return: headers, results
+
+        '''
+
+        self.log_object.logToFile('info', 'Aggregating table data from the table : ' + table_name)
+
+        query_object = QueryOperations()
+        conditional_string, parameters = query_object.build_sql_conditional_string(conditional_fields, "%s")
+        select_string, group_string = query_object.build_sql_aggregation_string(group_fields, aggregations)
+
+        sql_query = "SELECT " + select_string + " FROM " + table_name
+
+        if conditional_string != "":
+            sql_query += " WHERE " + conditional_string
+
+        if group_string != "":
+            sql_query += " GROUP BY " + group_string + " ORDER BY " + group_string
+
+        self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
+        self.log_object.logToFile('debug', 'Executing the query....')
+
+        try:
+            self._apply_statement_timeout(self.cursor, self.query_timeout)
+            self.cursor.execute(sql_query, parameters)
+
+            headers = [i[0] for i in self.cursor.description]
+            results = [list(i) for i in self.cursor.fetchall()]
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+        self.log_object.logToFile('info', str(len(results)) + ' aggregated rows got fetched from the MySQL database....')
+
+        return headers, results
+
+
+
+    ###################################################
+    #     21) Creating Index :                        #
+    ###################################################
+
+    @measures_phase("mysql", "query")
+    def create_index(self, table_name, index_name, index_fields, unique=False):
+
+        '''
+
+        Functionality : Creating an index on the given fields of the table, so that the filters on them do not need to scan the whole table.
+        :param table_name: The name of the table in the database where the index needs to be created.
+        :param index_name: The name of the index.
+        :param index_fields: The ordered list of the fields to be indexed.
+        :param unique: Whether the index needs to enforce unique values.
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('info', 'Creating index : ' + index_name + ' on the table : ' + table_name)
+
+        try:
+
+            if len(index_fields) == 0:
+                raise Exception("At least one field is required for creating an index.")
+
+            sql_query = "CREATE " + ("UNIQUE " if unique else "") + "INDEX " + index_name + " ON " + table_name + " (" + ", ".join(index_fields) + ")"
+
+            self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
+            self.log_object.logToFile('debug', 'Executing the query....')
+
+            self.cursor.execute(sql_query)
+            self.conn.commit()
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+        IndexAdvisorOperations().record_index(*self._get_index_advisor_table(table_name), index_name, index_fields)
+
+        self.log_object.logToFile('info', 'The index has been created in the MySQL database....')
+
+
+    ###################################################
+    #     22) Dropping Index :                        #
+    ###################################################
+
+    @measures_phase("mysql", "query")
+    def drop_index(self, table_name, index_name):
+
+        '''
+
+        Functionality : Dropping an index from the table.
+        :param table_name: The name of the table in the database the index belongs to.
+        :param index_name: The name of the index.
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('info', 'Dropping index : ' + index_name + ' from the table : ' + table_name)
+
+        sql_query = "DROP INDEX " + index_name + " ON " + table_name
+
+        self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
+        self.log_object.logToFile('debug', 'Executing the query....')
+
+        try:
+            self.cursor.execute(sql_query)
+            self.conn.commit()
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+        IndexAdvisorOperations().remove_index(*self._get_index_advisor_table(table_name), index_name)
+
+        self.log_object.logToFile('info', 'The index has been dropped from the MySQL database....')
+
+
+    ###################################################
+    #     23) Fetching Index Advisor Table :          #
+    ###################################################
+
+    def _get_index_advisor_table(self, table_name):
+
+        '''
+
+        Functionality : Fetching the backend and the name identifying the table in the index advisor, without any connection credentials.
+        :param table_name: The name of the table.
+        :return: backend, advisor_table
+
+        '''
+
+        return "mysql", self.host_name + "/" + self.db_name + "." + table_name
+
+
+    ###################################################
+    #     24) Recording Slow Query :                  #
+    ###################################################
+
+    def _record_slow_query(self, table_name, sql_query, start_time, row_count, parameters=None, end_time=None):
+
+        '''
+
+        Functionality : Recording the executed query in the slow query log, capturing its plan over the still open connection when it was
+                        slower than the threshold.
+        :param table_name: The name of the table the query ran on.
+        :param sql_query: The executed SQL query.
+        :param start_time: The performance counter value from before the query got executed.
+        :param row_count: The number of rows returned or affected by the query.
+        :param parameters: The parameters of the query, if any.
+        :param end_time: The performance counter value up to which the query gets timed, the current one if not given. A streamed query is
+                         timed up to its first batch, so that the time the client takes to download the rows is left out.
+        :return: None
+
+        '''
+
+        SlowQueryOperations().record_query(*self._get_index_advisor_table(table_name), sql_query, (end_time or time.perf_counter()) - start_time, row_count,
+                                           lambda: self._explain_statement(sql_query, parameters))
+
+
+    ###################################################
+    #     25) Explaining Statement :                  #
+    ###################################################
+
+    def _explain_statement(self, sql_query, parameters=None):
+
+        '''
+
+        Functionality : Fetching the estimated execution plan of a statement without executing it.
+        :param sql_query: The SQL statement to be explained.
+        :param parameters: The parameters of the statement, if any.
+        :return: plan
+
+        '''
+
+        explain_cursor = self.conn.cursor()
+
+        try:
+            explain_cursor.execute("EXPLAIN FORMAT=JSON " + sql_query, parameters or [])
+            return SlowQueryOperations().shape_mysql_plan(explain_cursor.fetchone()[0])
+
+        finally:
+            explain_cursor.close()
+
+
+    ###################################################
+    #     26) Applying Statement Timeout :            #
+    ###################################################
+
+    def _apply_statement_timeout(self, cursor, timeout_seconds):
+
+        '''
+
+        Functionality : Limiting the execution time of the next SELECT statements of the session through MAX_EXECUTION_TIME, after which the
+                        server interrupts them. A pooled connection gets its session reset when going back to the pool. As the execution
+                        time includes the time spent sending the rows, the streamed reads are left without it and get killed on a client
+                        disconnect instead, so that a slow client does not get its download cut.
+        :param cursor: The cursor of the session the timeout applies to.
+        :param timeout_seconds: The timeout in seconds, or 0 to keep the server default.
+        :return: None
+
+        '''
+
+        if timeout_seconds > 0:
+            cursor.execute("SET SESSION MAX_EXECUTION_TIME = " + str(int(timeout_seconds * 1000)))
+
+
+    ###################################################
+    #     27) Cancelling Running Query :              #
+    ###################################################
+
+    def _cancel_running_query(self, connection_id):
+
+        '''
+
+        Functionality : Killing the statement running on the given connection through a separate connection, leaving the connection itself
+                        open so that it can be closed or go back to its pool. A failure only gets logged, the statement then running until
+                        its timeout.
+        :param connection_id: The server side id of the connection whose statement needs to be killed.
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('warn', 'Killing the query running on the MySQL connection ' + str(connection_id) + ' as its results are no longer read....')
+
+        try:
+
+            kill_connection = mysql.connector.connect(host=self.host_name, username=self.username, password=self.password)
+
+            try:
+                kill_connection.cursor().execute("KILL QUERY " + str(int(connection_id)))
+
+            finally:
+                kill_connection.close()
+
+        except Exception as e:
+            self.log_object.logToFile('error', 'The query running on the MySQL connection ' + str(connection_id) + ' could not be killed : ' + str(e))
+
 ##########################################################################################################################################
 #                                                 End Block : MySQL Operation Functions :                                                #
 ##########################################################################################################################################
@@ -0,0 +1,413 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The profiling_operations.py file consists of the on demand profiling of single requests, which runs a guarded #
+#                           request along with its streamed response under cProfile and optionally tracemalloc, and writes the pstats  #
+#                           and the top allocation sites into the profiles directory.                                                   #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import cProfile
+import datetime
+import hmac
+import io
+import json
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from src.setup_logger import logger
+from src.setup_config import config
+
+PROFILE_TOKEN_HEADER = "HTTP_X_PROFILE_TOKEN"
+PROFILE_MEMORY_HEADER = "HTTP_X_PROFILE_MEMORY"
+PROFILE_NAME_PATTERN = re.compile(r"^[0-9]{8}_[0-9]{6}_[0-9]{6}_[A-Za-z0-9_]+$")
+APPLICATION_CODE_PATTERN = r"(src[\\/][a-z_]+\.py|main\.py)"
+PROFILE_STATS_LINES = 60
+PROFILE_ALLOCATION_SITES = 25
+TRACEMALLOC_FRAMES = 10
+
+PROFILING_LOCK = threading.Lock()
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Profiling Operation Functions :                                          #
+##########################################################################################################################################
+
+class ProfilingOperations :
+
+    ################################################
+    #     1) Initialising Function :               #
+    ################################################
+
+    def __init__(self):
+
+        '''
+
+        Functionality : Initialising the profiling token and the profiles directory from the application settings. Profiling stays off
+                        while no token is configured.
+
+        '''
+
+        self.log_object = logger()
+        config_object = config()
+
+        self.token = config_object.getValue("PROFILING_TOKEN")
+        self.max_profiles = config_object.getValue("PROFILES_MAX_COUNT")
+        self.profiles_directory = os.path.join(config_object.getValue("DATA_DIRECTORY"), "profiles")
+
+
+    ################################################
+    #     2) Check Profiling Request :             #
+    ################################################
+
+    def is_profiling_requested(self, environ):
+
+        '''
+
+        Functionality : Checking whether the request carries the profiling token in the X-Profile-Token header, and whether its allocations
+                        need to be traced as well. The token is not accepted from the query string, so that it never shows up in the access
+                        logs, the browser history or the Referer header.
+        :param environ: The WSGI environment of the request.
+        :return: profiling_requested, memory_requested
+
+        '''
+
+        token = environ.get(PROFILE_TOKEN_HEADER, "")
+
+        if self.token == "" or token == "" or not hmac.compare_digest(token.encode("utf-8"), self.token.encode("utf-8")):
+            return False, False
+
+        memory_flag = environ.get(PROFILE_MEMORY_HEADER, "")
+
+        return True, memory_flag.strip().lower() in ["1", "true", "yes", "on"]
+
+
+    ################################################
+    #     3) Write Profile :                       #
+    ################################################
+
+    def write_profile(self, profiler, allocation_snapshot, peak_memory, environ, status, elapsed_seconds):
+
+        '''
+
+        Functionality : Writing the pstats of a profiled request along with a text report of its slowest functions, the application code
+                        functions and its top allocation sites, and a JSON summary listed on the profiles page. The oldest profiles are
+                        removed once more than the maximum number of profiles are kept.
+        :param profiler: The disabled cProfile profiler of the request.
+        :param allocation_snapshot: The tracemalloc snapshot taken at the end of the request, or None if the allocations were not traced.
+        :param peak_memory: The peak traced memory of the request in bytes, or None if the allocations were not traced.
+        :param environ: The WSGI environment of the request.
+        :param status: The response status line of the request.
+        :param elapsed_seconds: The wall clock time of the request until its response got sent.
+        :return: profile_name
+
+        '''
+
+        os.makedirs(self.profiles_directory, exist_ok=True)
+
+        path = environ.get("PATH_INFO", "/")
+        method = environ.get("REQUEST_METHOD", "GET")
+        profile_name = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f") + "_" + method.lower() + "_" + \
+                       (re.sub(r"[^A-Za-z0-9]+", "_", path).strip("_")[:80] or "root")
+
+        profile_path = os.path.join(self.profiles_directory, profile_name)
+
+        profiler.dump_stats(profile_path + ".pstats")
+
+        report = io.StringIO()
+        report.write("Request : " + method + " " + path + "\n")
+        report.write("Status : " + str(status) + "\n")
+        report.write("Elapsed Seconds : " + str(round(elapsed_seconds, 3)) + "\n\n")
+
+        report.write("Slowest Functions By Cumulative Time :\n")
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(PROFILE_STATS_LINES)
+
+        report.write("Application Functions By Cumulative Time :\n")
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(APPLICATION_CODE_PATTERN, PROFILE_STATS_LINES)
+
+        if allocation_snapshot is not None:
+
+            report.write("Peak Traced Memory : " + str(peak_memory) + " bytes\n\n")
+            report.write("Top Allocation Sites :\n")
+
+            for statistic in allocation_snapshot.statistics("traceback")[:PROFILE_ALLOCATION_SITES]:
+
+                report.write(str(statistic.size) + " bytes in " + str(statistic.count) + " blocks\n")
+
+                for line in statistic.traceback.format():
+                    report.write(line + "\n")
+
+                report.write("\n")
+
+        with open(profile_path + ".txt", "w") as file:
+            file.write(report.getvalue())
+
+        with open(profile_path + ".json", "w") as file:
+            json.dump({
+                "name": profile_name,
+                "method": method,
+                "path": path,
+                "status": str(status),
+                "elapsedSeconds": round(elapsed_seconds, 3),
+                "peakMemoryBytes": peak_memory,
+                "createdAt": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }, file)
+
+        for old_profile in self.list_profiles()[int(self.max_profiles):]:
+            for extension in [".pstats", ".txt", ".json"]:
+                if os.path.exists(os.path.join(self.profiles_directory, old_profile["name"] + extension)):
+                    os.remove(os.path.join(self.profiles_directory, old_profile["name"] + extension))
+
+        self.log_object.logToFile('info', 'The profile of the request got written as : ' + profile_name)
+
+        return profile_name
+
+
+    ################################################
+    #     4) List Profiles :                       #
+    ################################################
+
+    def list_profiles(self):
+
+        '''
+
+        Functionality : Listing the summaries of the written profiles, the most recent first.
+        :return: profiles --> The list of profile summary dictionaries.
+
+        '''
+
+        if not os.path.isdir(self.profiles_directory):
+            return []
+
+        profiles = []
+
+        for file_name in sorted(os.listdir(self.profiles_directory), reverse=True):
+
+            if not file_name.endswith(".json"):
+                continue
+
+            try:
+                with open(os.path.join(self.profiles_directory, file_name)) as file:
+                    profiles.append(json.load(file))
+
+            except (OSError, ValueError) as e:
+                self.log_object.logToFile('error', 'The profile summary ' + file_name + ' could not be read : ' + str(e))
+
+        return profiles
+
+
+    ################################################
+    #     5) Get Profile Path :                    #
+    ################################################
+
+    def get_profile_path(self, profile_name, extension):
+
+        '''
+
+        Functionality : Fetching the path of a profile file, making sure that the name cannot point outside of the profiles directory.
+        :param profile_name: The name of the profile.
+        :param extension: The extension of the profile file. Possible values are : ".pstats" and ".txt".
+        :return: profile_path
+
+        '''
+
+        if extension not in [".pstats", ".txt"] or PROFILE_NAME_PATTERN.match(profile_name) is None:
+            raise Exception("The profile " + profile_name + " is not a valid profile name.")
+
+        profile_path = os.path.join(self.profiles_directory, profile_name + extension)
+
+        if not os.path.exists(profile_path):
+            raise Exception("The profile " + profile_name + " does not exist.")
+
+        return profile_path
+
+
+
+################################################
+#     6) Profiles Requests :                   #
+################################################
+
+def profiles_requests(wsgi_app):
+
+    '''
+
+    Functionality : Wrapping a WSGI application, so that the requests carrying the profiling token run under cProfile, and under tracemalloc
+                    when asked for, until their response got sent. The application is returned unwrapped while no profiling token is
+                    configured, and only one request is profiled at a time since tracemalloc traces the whole process.
+    :param wsgi_app: The WSGI application.
+    :return: wsgi_app
+
+    '''
+
+    profiling_object = ProfilingOperations()
+
+    if profiling_object.token == "":
+        return wsgi_app
+
+    def profiled_wsgi_app(environ, start_response):
+
+        profiling_requested, memory_requested = profiling_object.is_profiling_requested(environ)
+
+        if not profiling_requested:
+            return wsgi_app(environ, start_response)
+
+        if not PROFILING_LOCK.acquire(blocking=False):
+            profiling_object.log_object.logToFile('warn', 'Another request is being profiled, so the request is served without profiling....')
+            return wsgi_app(environ, start_response)
+
+        response_status = []
+
+        def recording_start_response(status, headers, exc_info=None):
+            response_status.append(status)
+            return start_response(status, headers, exc_info)
+
+        profiler = cProfile.Profile()
+
+        if memory_requested:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+
+        start_time = time.perf_counter()
+
+        try:
+
+            profiler.enable()
+
+            try:
+                response_chunks = wsgi_app(environ, recording_start_response)
+
+            finally:
+                profiler.disable()
+
+        except Exception:
+            _finish_profile(profiling_object, profiler, memory_requested, environ, "500 INTERNAL SERVER ERROR", start_time)
+            raise
+
+        return _generate_profiled_chunks(profiling_object, profiler, memory_requested, environ, response_chunks, response_status, start_time)
+
+    return profiled_wsgi_app
+
+
+################################################
+#     7) Generate Profiled Chunks :            #
+################################################
+
+def _generate_profiled_chunks(profiling_object, profiler, memory_requested, environ, response_chunks, response_status, start_time):
+
+    '''
+
+    Functionality : Passing through the chunks of a profiled response, profiling the production of every chunk and the closing of the
+                    response, so that the streamed downloads are covered until their last batch. The time the server spends sending the
+                    chunks is not profiled.
+    :param profiling_object: The profiling operations object.
+    :param profiler: The cProfile profiler of the request.
+    :param memory_requested: Whether the allocations of the request are being traced.
+    :param environ: The WSGI environment of the request.
+    :param response_chunks: The response iterable returned by the WSGI application.
+    :param response_status: The list holding the response status line once the response got started.
+    :param start_time: The performance counter value from before the request got handled.
+    :return: generator
+
+    '''
+
+    try:
+
+        chunk_iterator = iter(response_chunks)
+
+        while True:
+
+            profiler.enable()
+
+            try:
+                chunk = next(chunk_iterator)
+
+            except StopIteration:
+                break
+
+            finally:
+                profiler.disable()
+
+            yield chunk
+
+    finally:
+
+        try:
+
+            if hasattr(response_chunks, "close"):
+
+                profiler.enable()
+
+                try:
+                    response_chunks.close()
+
+                finally:
+                    profiler.disable()
+
+        finally:
+            _finish_profile(profiling_object, profiler, memory_requested, environ,
+                            response_status[-1] if len(response_status) > 0 else "", start_time)
+
+
+################################################
+#     8) Finish Profile :                      #
+################################################
+
+def _finish_profile(profiling_object, profiler, memory_requested, environ, status, start_time):
+
+    '''
+
+    Functionality : Stopping the allocation tracing of a profiled request, writing its profile and releasing the profiling lock. Failures
+                    to write the profile are logged and never raised, so that they cannot fail the request.
+    :param profiling_object: The profiling operations object.
+    :param profiler: The disabled cProfile profiler of the request.
+    :param memory_requested: Whether the allocations of the request are being traced.
+    :param environ: The WSGI environment of the request.
+    :param status: The response status line of the request.
+    :param start_time: The performance counter value from before the request got handled.
+    :return: None
+
+    '''
+
+    try:
+
+        elapsed_seconds = time.perf_counter() - start_time
+        allocation_snapshot = None
+        peak_memory = None
+
+        if memory_requested:
+            allocation_snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        profiling_object.write_profile(profiler, allocation_snapshot, peak_memory, environ, status, elapsed_seconds)
+
+    except Exception as e:
+        profiling_object.log_object.logToFile('error', 'The profile of the request could not be written : ' + str(e))
+
+    finally:
+
+        if tracemalloc.is_tracing() and memory_requested:
+            tracemalloc.stop()
+
+        PROFILING_LOCK.release()
+
+##########################################################################################################################################
+#                                                 End Block : Profiling Operation Functions :                                            #
+##########################################################################################################################################
@@ -0,0 +1,556 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The query_operations.py file consists of the shared query building operations used by the database          #
+#                           operation classes, such as compiling the conditional fields list into parameterised filter clauses and       #
+#                           generating the continuation tokens used for paginated table browsing.                                        #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import base64
+import hashlib
+import json
+import re
+from src.setup_logger import logger
+
+SQL_OPERATORS = {
+    "equals": "=",
+    "not equals": "<>",
+    "greater than": ">",
+    "greater than equals": ">=",
+    "less than": "<",
+    "less than equals": "<=",
+    "like": "LIKE",
+    "in": "IN"
+}
+
+CQL_INTEGER_TYPES = ["int", "bigint", "varint", "smallint", "tinyint", "counter"]
+CQL_FLOAT_TYPES = ["float", "double", "decimal"]
+
+AGGREGATE_FUNCTIONS = ["COUNT", "SUM", "AVG", "MIN", "MAX"]
+AGGREGATE_PATTERN = re.compile(r"^([A-Za-z]+)\s*\(\s*(\*|[A-Za-z_][A-Za-z0-9_.]*)\s*\)$")
+FIELD_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Query Operation Functions :                                              #
+##########################################################################################################################################
+
+class QueryOperations :
+
+    ################################################
+    #     1) Initialising Function :               #
+    ################################################
+
+    def __init__(self):
+
+        '''
+
+        Functionality : Initialising the logging object required for generating logs for different query building operations.
+
+        '''
+
+        self.log_object = logger()
+
+
+    ###########################################################
+    #     2) Build SQL Conditional String :                   #
+    ###########################################################
+
+    def build_sql_conditional_string(self, conditional_fields, placeholder):
+
+        '''
+
+        Functionality : Compiling the list of conditional fields into a parameterised SQL WHERE clause body.
+        :param conditional_fields: The list of conditional fields, each being [field name, field operator, field value, record operator].
+        :param placeholder: The parameter placeholder used by the database driver. Possible values are : "%s" (MySQL) and "?" (SQL Server).
+        :return: conditional_string, parameters --> The conditional string is empty if there are no conditional fields.
+
+        '''
+
+        conditional_string = ""
+        parameters = []
+
+        for idx, condition in enumerate(conditional_fields):
+
+            operator_name = condition[1].lower()
+
+            if operator_name not in SQL_OPERATORS:
+                raise Exception("The conditional operator " + condition[1] + " is not supported.")
+
+            conditional_string += condition[0].strip() + " " + SQL_OPERATORS[operator_name] + " "
+
+            if operator_name == "in":
+                values = [i.replace("'", "").strip() for i in condition[2].split(",")]
+                conditional_string += "(" + ",".join([placeholder] * len(values)) + ")"
+                parameters.extend(values)
+
+            elif operator_name == "like":
+                conditional_string += placeholder
+                parameters.append("%" + condition[2] + "%")
+
+            else:
+                conditional_string += placeholder
+                parameters.append(condition[2])
+
+            if idx != len(conditional_fields) - 1:
+                conditional_string += " " + self._get_record_operator(condition) + " "
+
+        return conditional_string, parameters
+
+
+    ###########################################################
+    #     3) Build CQL Conditional String :                   #
+    ###########################################################
+
+    def build_cql_conditional_string(self, conditional_fields, field_types):
+
+        '''
+
+        Functionality : Compiling the list of conditional fields into a parameterised CQL WHERE clause body, converting the values as per the
+                        column data types of the table.
+        :param conditional_fields: The list of conditional fields, each being [field name, field operator, field value, record operator].
+        :param field_types: The dictionary of the table fields and their CQL data types.
+        :return: conditional_string, parameters --> The conditional string is empty if there are no conditional fields.
+
+        '''
+
+        conditional_string = ""
+        parameters = []
+
+        for idx, condition in enumerate(conditional_fields):
+
+            operator_name = condition[1].lower()
+
+            if operator_name not in SQL_OPERATORS or operator_name in ["not equals", "like"]:
+                raise Exception("The conditional operator " + condition[1] + " is not supported for Cassandra.")
+
+            field_type = field_types.get(condition[0].strip(), "text")
+
+            conditional_string += condition[0].strip() + " " + SQL_OPERATORS[operator_name] + " "
+
+            if operator_name == "in":
+                values = [self._convert_cql_value(i.replace("'", "").strip(), field_type) for i in condition[2].split(",")]
+                conditional_string += "(" + ",".join(["%s"] * len(values)) + ")"
+                parameters.extend(values)
+
+            else:
+                conditional_string += "%s"
+                parameters.append(self._convert_cql_value(condition[2], field_type))
+
+            if idx != len(conditional_fields) - 1:
+                conditional_string += " AND "
+
+        return conditional_string, parameters
+
+
+    ###########################################################
+    #     4) Build Keyset Pagination Condition :              #
+    ###########################################################
+
+    def build_keyset_condition(self, key_fields, last_values, placeholder):
+
+        '''
+
+        Functionality : Building the condition selecting the records placed after the last returned key in key order, which lets every page
+                        be read through the key index instead of skipping the previous pages with an OFFSET.
+        :param key_fields: The ordered list of the primary key fields of the table.
+        :param last_values: The list of the key values of the last record of the previous page.
+        :param placeholder: The parameter placeholder used by the database driver.
+        :return: keyset_string, parameters
+
+        '''
+
+        if len(key_fields) != len(last_values):
+            raise Exception("The continuation token does not match the primary key of the table.")
+
+        alternatives = []
+        parameters = []
+
+        for key_idx in range(0, len(key_fields)):
+
+            comparisons = []
+
+            for prefix_idx in range(0, key_idx):
+                comparisons.append(key_fields[prefix_idx] + " = " + placeholder)
+                parameters.append(last_values[prefix_idx])
+
+            comparisons.append(key_fields[key_idx] + " > " + placeholder)
+            parameters.append(last_values[key_idx])
+
+            alternatives.append("(" + " AND ".join(comparisons) + ")")
+
+        return "(" + " OR ".join(alternatives) + ")", parameters
+
+
+    ###########################################################
+    #     5) Generate Query Fingerprint :                     #
+    ###########################################################
+
+    def generate_query_fingerprint(self, *query_parts):
+
+        '''
+
+        Functionality : Generating a stable fingerprint for the given query parts, normalising the string parts so that the same filter
+                        always produces the same fingerprint.
+        :param query_parts: The parts defining the query such as the backend, database, table name, conditional fields and row limit.
+        :return: fingerprint --> The hexadecimal SHA-256 digest of the normalised query parts.
+
+        '''
+
+        normalised_parts = [self._normalise_query_part(i) for i in query_parts]
+        normalised_string = json.dumps(normalised_parts, sort_keys=True, default=str)
+
+        return hashlib.sha256(normalised_string.encode("utf-8")).hexdigest()
+
+
+    ###########################################################
+    #     6) Encode Continuation Token :                      #
+    ###########################################################
+
+    def encode_continuation_token(self, fingerprint, state):
+
+        '''
+
+        Functionality : Encoding the pagination state of a query into an opaque continuation token.
+        :param fingerprint: The query fingerprint the token belongs to.
+        :param state: The JSON serialisable pagination state, such as the last key values of the page.
+        :return: token
+
+        '''
+
+        token_data = json.dumps({"q": fingerprint[:16], "s": state}, default=str, separators=(",", ":"))
+
+        return base64.urlsafe_b64encode(token_data.encode("utf-8")).decode("ascii")
+
+
+    ###########################################################
+    #     7) Decode Continuation Token :                      #
+    ###########################################################
+
+    def decode_continuation_token(self, fingerprint, token):
+
+        '''
+
+        Functionality : Decoding an opaque continuation token back into the pagination state, checking that it was generated for the same query.
+        :param fingerprint: The fingerprint of the query being paginated.
+        :param token: The continuation token returned with the previous page.
+        :return: state
+
+        '''
+
+        try:
+            token_data = json.loads(base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8"))
+
+        except Exception as e:
+            self.log_object.logToFile('error', 'The continuation token could not be decoded : ' + str(e))
+            raise Exception("The continuation token provided is not valid.")
+
+        if token_data.get("q") != fingerprint[:16]:
+            raise Exception("The continuation token provided does not belong to this table and filter combination.")
+
+        return token_data["s"]
+
+
+    ###########################################################
+    #     8) Split Integer Key Range :                        #
+    ###########################################################
+
+    def split_integer_key_range(self, min_value, max_value, partition_count):
+
+        '''
+
+        Functionality : Splitting the range between the minimum and maximum values of an integer key into equally wide partitions.
+        :param min_value: The minimum key value.
+        :param max_value: The maximum key value.
+        :param partition_count: The number of partitions to be created.
+        :return: boundaries --> The sorted list of the lower key values of every partition except the first one.
+
+        '''
+
+        range_width = max(-(-(max_value - min_value + 1) // int(partition_count)), 1)
+
+        return [i for i in range(min_value + range_width, max_value + 1, range_width)]
+
+
+    ###########################################################
+    #     9) Build Key Range Conditions :                     #
+    ###########################################################
+
+    def build_key_range_conditions(self, key_field, boundaries, placeholder):
+
+        '''
+
+        Functionality : Building the conditions selecting the key ranges delimited by the given boundaries, which together cover every key
+                        value exactly once.
+        :param key_field: The name of the key field the ranges are defined on.
+        :param boundaries: The sorted list of the lower key values of every range except the first one.
+        :param placeholder: The parameter placeholder used by the database driver.
+        :return: range_conditions --> The list of (range string, parameters) tuples in key order.
+
+        '''
+
+        if len(boundaries) == 0:
+            return [(key_field + " IS NOT NULL", [])]
+
+        range_conditions = [(key_field + " < " + placeholder, [boundaries[0]])]
+
+        for boundary_idx in range(1, len(boundaries)):
+            range_conditions.append((key_field + " >= " + placeholder + " AND " + key_field + " < " + placeholder,
+                                     [boundaries[boundary_idx - 1], boundaries[boundary_idx]]))
+
+        range_conditions.append((key_field + " >= " + placeholder, [boundaries[-1]]))
+
+        return range_conditions
+
+
+    ###########################################################
+    #     10) Get Record Operator :                           #
+    ###########################################################
+
+    def _get_record_operator(self, condition):
+
+        '''
+
+        Functionality : Fetching the record operator joining the condition with the next one, defaulting to AND when none was chosen.
+        :param condition: The conditional field list.
+        :return: record_operator
+
+        '''
+
+        if condition[3] is None or condition[3].strip().upper() not in ["AND", "OR"]:
+            return "AND"
+
+        return condition[3].strip().upper()
+
+
+    ###########################################################
+    #     11) Convert CQL Value :                             #
+    ###########################################################
+
+    def _convert_cql_value(self, value, field_type):
+
+        '''
+
+        Functionality : Converting the string value from the form into the Python type matching the CQL data type of the field.
+        :param value: The string value to be converted.
+        :param field_type: The CQL data type of the field.
+        :return: value
+
+        '''
+
+        if field_type.lower() in CQL_INTEGER_TYPES:
+            return int(value)
+
+        if field_type.lower() in CQL_FLOAT_TYPES:
+            return float(value)
+
+        return value
+
+
+    ###########################################################
+    #     12) Normalise Query Part :                          #
+    ###########################################################
+
+    def _normalise_query_part(self, query_part):
+
+        '''
+
+        Functionality : Normalising a query part by stripping the surrounding whitespace of its string values, including the ones nested
+                        inside the conditional fields list.
+        :param query_part: The query part to be normalised.
+        :return: normalised_part
+
+        '''
+
+        if isinstance(query_part, list):
+            return [self._normalise_query_part(i) for i in query_part]
+
+        if isinstance(query_part, str):
+            return query_part.strip()
+
+        return query_part
+
+
+    ###########################################################
+    #     13) Parse Aggregation Fields :                      #
+    ###########################################################
+
+    def parse_aggregation_fields(self, group_by_string, aggregation_string):
+
+        '''
+
+        Functionality : Parsing the comma separated group by fields and aggregations (for example "count(*), sum(salary)") into validated
+                        lists, since the field names get placed into the query text and cannot be passed as parameters.
+        :param group_by_string: The comma separated list of the fields to group the records by, if required.
+        :param aggregation_string: The comma separated list of the aggregations to be computed for every group.
+        :return: group_fields, aggregations --> The aggregations are (function, field, alias) tuples.
+
+        '''
+
+        group_fields = [i.strip() for i in group_by_string.split(",") if i.strip() != ""]
+
+        for field in group_fields:
+            if FIELD_NAME_PATTERN.match(field) is None:
+                raise Exception("The group by field " + field + " is not a valid field name.")
+
+        aggregations = []
+
+        for aggregation in [i.strip() for i in aggregation_string.split(",") if i.strip() != ""]:
+
+            match = AGGREGATE_PATTERN.match(aggregation)
+
+            if match is None:
+                raise Exception("The aggregation " + aggregation + " is not in the function(field) format.")
+
+            function_name = match.group(1).upper()
+            field = match.group(2)
+
+            if function_name not in AGGREGATE_FUNCTIONS:
+                raise Exception("The aggregate function " + match.group(1) + " is not supported.")
+
+            if field == "*" and function_name != "COUNT":
+                raise Exception("Only the COUNT aggregate function can be applied to all the fields.")
+
+            alias = function_name.lower() + "_" + ("all" if field == "*" else field.replace(".", "_"))
+            aggregations.append((function_name, field, alias))
+
+        if len(aggregations) == 0:
+            raise Exception("At least one aggregation is required.")
+
+        return group_fields, aggregations
+
+
+    ###########################################################
+    #     14) Build SQL Aggregation String :                  #
+    ###########################################################
+
+    def build_sql_aggregation_string(self, group_fields, aggregations, average_type=None):
+
+        '''
+
+        Functionality : Building the SELECT list and the GROUP BY clause body computing the aggregations for every group.
+        :param group_fields: The list of the fields to group the records by.
+        :param aggregations: The list of (function, field, alias) aggregation tuples.
+        :param average_type: The data type the averaged fields are cast to, for the databases averaging integers as integers.
+        :return: select_string, group_string --> The group string is empty if there are no group by fields.
+
+        '''
+
+        select_parts = list(group_fields)
+
+        for function_name, field, alias in aggregations:
+
+            if function_name == "AVG" and average_type is not None:
+                field = "CAST(" + field + " AS " + average_type + ")"
+
+            select_parts.append(function_name + "(" + field + ") AS " + alias)
+
+        return ", ".join(select_parts), ", ".join(group_fields)
+
+
+    ###########################################################
+    #     15) Build MongoDB Aggregation Pipeline :            #
+    ###########################################################
+
+    def build_mongo_aggregation_pipeline(self, conditional_query, group_fields, aggregations):
+
+        '''
+
+        Functionality : Building the aggregation pipeline which filters the documents, groups them and computes the aggregations, with the
+                        group by fields flattened back into top level fields named like the SQL result columns.
+        :param conditional_query: The conditional MQL statement in JSON format filtering the documents, if required.
+        :param group_fields: The list of the fields to group the documents by.
+        :param aggregations: The list of (function, field, alias) aggregation tuples.
+        :return: pipeline, headers
+
+        '''
+
+        group_names = [i.replace(".", "_") for i in group_fields]
+
+        group_stage = {"_id": {group_names[idx]: "$" + field for idx, field in enumerate(group_fields)} if len(group_fields) > 0 else None}
+        project_stage = {"_id": 0}
+
+        for idx, field in enumerate(group_fields):
+            project_stage[group_names[idx]] = "$_id." + group_names[idx]
+
+        for function_name, field, alias in aggregations:
+
+            if function_name == "COUNT" and field == "*":
+                group_stage[alias] = {"$sum": 1}
+            elif function_name == "COUNT":
+                group_stage[alias] = {"$sum": {"$cond": [{"$gt": ["$" + field, None]}, 1, 0]}}
+            else:
+                group_stage[alias] = {"$" + function_name.lower(): "$" + field}
+
+            project_stage[alias] = 1
+
+        pipeline = []
+
+        if conditional_query != {}:
+            pipeline.append({"$match": conditional_query})
+
+        pipeline.append({"$group": group_stage})
+        pipeline.append({"$project": project_stage})
+
+        if len(group_names) > 0:
+            pipeline.append({"$sort": {i: 1 for i in group_names}})
+
+        return pipeline, group_names + [i[2] for i in aggregations]
+
+
+    ###########################################################
+    #     16) Parse Index Definition :                        #
+    ###########################################################
+
+    def parse_index_definition(self, table_name, index_name, index_field_string):
+
+        '''
+
+        Functionality : Parsing the comma separated index fields into a validated list, naming the index after the table and its fields when
+                        no index name was given, since the names get placed into the statement text and cannot be passed as parameters.
+        :param table_name: The name of the table the index belongs to.
+        :param index_name: The name of the index, if required.
+        :param index_field_string: The comma separated list of the fields to be indexed, in index order.
+        :return: index_name, index_fields
+
+        '''
+
+        index_fields = [i.strip() for i in index_field_string.split(",") if i.strip() != ""]
+
+        for field in index_fields:
+            if FIELD_NAME_PATTERN.match(field) is None:
+                raise Exception("The index field " + field + " is not a valid field name.")
+
+        if index_name.strip() == "":
+
+            if len(index_fields) == 0:
+                raise Exception("Either the index name or the index fields are required.")
+
+            index_name = "idx_" + table_name.split(".")[-1] + "_" + "_".join(index_fields).replace(".", "_")
+
+        index_name = index_name.strip()
+
+        if re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", index_name) is None:
+            raise Exception("The index name " + index_name + " is not a valid index name.")
+
+        return index_name, index_fields
+
+##########################################################################################################################################
+#                                                 End Block : Query Operation Functions :                                                #
+##########################################################################################################################################
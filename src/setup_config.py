@@ -0,0 +1,130 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The setup_config.py file consists of the application settings along with their default values, which can be  #
+#                           overridden through environment variables prefixed with DBAPP_ (for example DBAPP_DATA_DIRECTORY).            #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import os
+
+ENVIRONMENT_PREFIX = "DBAPP_"
+
+CONFIG_DEFAULTS = {
+    "DATA_DIRECTORY": "app_data",
+    "RESULT_CACHE_MAX_BYTES": 256 * 1024 * 1024,
+    "RESULT_CACHE_TTL_SECONDS": 3600,
+    "PREVIEW_COUNT_LIMIT": 1000000,
+    "PREVIEW_WARNING_ROWS": 1000000,
+    "INDEX_ADVISOR_ENABLED": True,
+    "SLOW_QUERY_LOG_ENABLED": True,
+    "SLOW_QUERY_THRESHOLD_SECONDS": 1.0,
+    "SLOW_QUERY_MAX_EXECUTIONS": 100000,
+    "PROFILING_TOKEN": "",
+    "PROFILES_MAX_COUNT": 50,
+    "ADMIN_TOKEN": "",
+    "ENABLED_BACKENDS": ["mysql", "sqlserver", "mongodb", "cassandra"],
+    "ADMISSION_CONTROL_ENABLED": True,
+    "ADMISSION_MAX_CONCURRENT": 4,
+    "ADMISSION_MAX_QUEUED": 8,
+    "ADMISSION_QUEUE_TIMEOUT_SECONDS": 30.0,
+    "ADMISSION_RETRY_AFTER_SECONDS": 10,
+    "QUERY_TIMEOUT_SECONDS": 300.0,
+    "EXPORT_TIMEOUT_SECONDS": 3600.0
+}
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Config Operation Functions :                                             #
+##########################################################################################################################################
+
+class config :
+
+    ################################################
+    #     1) Initialising Function :               #
+    ################################################
+
+    def __init__(self):
+
+        '''
+
+        Functionality : Initialising the application settings from their default values and the environment variables overriding them.
+
+        '''
+
+        self.values = {}
+
+        for key, default_value in CONFIG_DEFAULTS.items():
+            self.values[key] = self.convertValue(os.environ.get(ENVIRONMENT_PREFIX + key), default_value)
+
+
+    ################################################
+    #     2) Get Config Value :                    #
+    ################################################
+
+    def getValue(self, key):
+
+        '''
+
+        Functionality : Fetching the value of an application setting.
+        :param key: The name of the setting, as listed in CONFIG_DEFAULTS.
+        :return: value
+
+        '''
+
+        if key not in self.values:
+            raise Exception("The setting " + key + " is not a known application setting.")
+
+        return self.values[key]
+
+
+    ################################################
+    #     3) Convert Config Value :                #
+    ################################################
+
+    def convertValue(self, value, default_value):
+
+        '''
+
+        Functionality : Converting the string value of an environment variable into the type of the default value of the setting.
+        :param value: The string value of the environment variable, or None if it is not set.
+        :param default_value: The default value of the setting.
+        :return: value
+
+        '''
+
+        if value is None:
+            return default_value
+
+        if isinstance(default_value, bool):
+            return value.strip().lower() in ["1", "true", "yes", "on"]
+
+        if isinstance(default_value, int):
+            return int(value)
+
+        if isinstance(default_value, float):
+            return float(value)
+
+        if isinstance(default_value, list):
+            return [i.strip() for i in value.split(",") if i.strip() != ""]
+
+        return value
+
+##########################################################################################################################################
+#                                                 End Block : Config Operation Functions :                                               #
+##########################################################################################################################################
@@ -0,0 +1,464 @@
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+# Author : Devneet Mohanty                                                                                                               #
+# Project Name : Database Interaction Application                                                                                        #
+# Project Description : This project has been developed using the Flask libraries in order to create a web application which is able to  #
+#                       interact with MySQL, MongoDB and Cassandra database.                                                             #
+# Python File Description : The slow_query_operations.py file consists of the operations of the slow query log, which stores the         #
+#                           execution time and row count of every executed statement under the fingerprint of its literal free shape   #
+#                           in a local SQLite store, written by a single background thread, captures the plan of the statements slower  #
+#                           than the threshold, and ranks the statement shapes by their total and 99th percentile execution time.       #
+# Date Of Development : 29-05-2021                                                                                                       #
+##########################################################################################################################################
+#                                                       Header Block :                                                                   #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Importing Libraries & Initializing Variables :                           #
+##########################################################################################################################################
+
+import hashlib
+import json
+import math
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from src.setup_logger import logger
+from src.setup_config import config
+
+SLOW_QUERY_STORE_LOCK = threading.Lock()
+SLOW_QUERY_QUEUE = queue.Queue(maxsize=10000)
+SLOW_QUERY_WRITER = None
+SLOW_QUERY_SCHEMAS = set()
+SLOW_QUERY_TRIM_INTERVAL = 1000
+
+STRING_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL_PATTERN = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b")
+VALUE_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+TOP_CLAUSE_PATTERN = re.compile(r"\bTOP\s+\d+", re.IGNORECASE)
+SHOWPLAN_VALUE_PATTERN = re.compile(r'\b(ConstValue|ParameterCompiledValue|ParameterRuntimeValue|ScalarString)="[^"]*"')
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+##########################################################################################################################################
+#                                                 End Block : Importing Libraries & Initializing Variables :                             #
+##########################################################################################################################################
+
+
+##########################################################################################################################################
+#                                                 Start Block : Slow Query Operation Functions :                                         #
+##########################################################################################################################################
+
+class SlowQueryOperations :
+
+    ################################################
+    #     1) Initialising Function :               #
+    ################################################
+
+    def __init__(self):
+
+        '''
+
+        Functionality : Initialising the path of the SQLite store of the slow query log along with its limits from the application settings.
+                        The store only gets created once the first statement is recorded.
+
+        '''
+
+        self.log_object = logger()
+        config_object = config()
+
+        self.enabled = config_object.getValue("SLOW_QUERY_LOG_ENABLED")
+        self.threshold_seconds = config_object.getValue("SLOW_QUERY_THRESHOLD_SECONDS")
+        self.max_executions = config_object.getValue("SLOW_QUERY_MAX_EXECUTIONS")
+        self.data_directory = config_object.getValue("DATA_DIRECTORY")
+        self.store_path = os.path.join(self.data_directory, "slow_queries.sqlite")
+
+
+    ################################################
+    #     2) Record Query :                        #
+    ################################################
+
+    def record_query(self, backend, table_name, statement, elapsed_seconds, row_count, plan_capture=None):
+
+        '''
+
+        Functionality : Recording the execution of a statement under the fingerprint of its shape, capturing its plan when it was slower than
+                        the threshold. The execution is handed over to the background writer of the store, so that the request never waits
+                        for SQLite. Recording failures are logged and never raised, so that they cannot fail the database operation.
+        :param backend: The database backend the statement ran on.
+        :param table_name: The name identifying the table, without any connection credentials.
+        :param statement: The executed statement text.
+        :param elapsed_seconds: The execution time of the statement in seconds.
+        :param row_count: The number of rows returned or affected, or None if not known.
+        :param plan_capture: The function returning the plan of the statement, called only for the slow statements, if available.
+        :return: None
+
+        '''
+
+        if not self.enabled:
+            return
+
+        try:
+
+            fingerprint, shape = self.fingerprint_statement(statement)
+            plan = None
+
+            if elapsed_seconds >= self.threshold_seconds:
+
+                self.log_object.logToFile('warn', 'Slow ' + backend + ' query took ' + str(round(elapsed_seconds, 3)) + ' seconds : ' + shape)
+
+                if plan_capture is not None:
+
+                    try:
+                        plan = plan_capture()
+
+                    except Exception as e:
+                        self.log_object.logToFile('error', 'The plan of the slow query could not be captured : ' + str(e))
+
+            if plan is not None and not isinstance(plan, str):
+                plan = json.dumps(plan, default=str)
+
+            self._start_writer()
+            SLOW_QUERY_QUEUE.put_nowait((self.store_path, int(self.max_executions),
+                                         (fingerprint, backend, table_name, shape, plan, elapsed_seconds, row_count, time.time())))
+
+        except queue.Full:
+            self.log_object.logToFile('warn', 'The query could not be recorded as the slow query log queue is full....')
+
+        except Exception as e:
+            self.log_object.logToFile('error', 'The query could not be recorded in the slow query log : ' + str(e))
+
+
+    ################################################
+    #     3) Fingerprint Statement :               #
+    ################################################
+
+    def fingerprint_statement(self, statement):
+
+        '''
+
+        Functionality : Reducing a statement to its shape by replacing its string and number literals with placeholders, collapsing value
+                        lists and whitespace, so that the executions of the same filter with different values share a fingerprint.
+        :param statement: The statement text.
+        :return: fingerprint, shape
+
+        '''
+
+        shape = STRING_LITERAL_PATTERN.sub("?", statement)
+        shape = TOP_CLAUSE_PATTERN.sub("TOP ?", shape)
+        shape = NUMBER_LITERAL_PATTERN.sub("?", shape)
+        shape = WHITESPACE_PATTERN.sub(" ", shape).strip()
+        shape = VALUE_LIST_PATTERN.sub("(?+)", shape)
+
+        return hashlib.sha256(shape.encode("utf-8")).hexdigest()[:16], shape
+
+
+    ################################################
+    #     4) Shape MongoDB Query :                 #
+    ################################################
+
+    def shape_mongo_query(self, query):
+
+        '''
+
+        Functionality : Replacing the values of a MQL query with placeholders while keeping its field names and operators, since the MQL
+                        values cannot be told apart from the field names in the JSON text of the query.
+        :param query: The MQL query dictionary, or a value nested in it.
+        :return: shape --> The JSON text of the shaped query.
+
+        '''
+
+        def shape_value(value):
+
+            if isinstance(value, dict):
+                return {str(key): shape_value(item) for key, item in value.items()}
+
+            if isinstance(value, list) and any([isinstance(i, dict) for i in value]):
+                return [shape_value(i) for i in value]
+
+            if isinstance(value, list):
+                return ["?+"] if len(value) > 0 else []
+
+            return "?"
+
+        return json.dumps(shape_value(query), sort_keys=True)
+
+
+    ################################################
+    #     5) Shape MySQL Plan :                    #
+    ################################################
+
+    def shape_mysql_plan(self, plan):
+
+        '''
+
+        Functionality : Replacing the literal values of the conditions of a MySQL JSON plan with placeholders, keeping the access paths and
+                        the cost figures, so that no filter value of the statement gets stored with its plan.
+        :param plan: The JSON text of the EXPLAIN FORMAT=JSON plan.
+        :return: plan --> The JSON text of the shaped plan.
+
+        '''
+
+        def shape_value(key, value):
+
+            if isinstance(value, dict):
+                return {item_key: shape_value(item_key, item) for item_key, item in value.items()}
+
+            if isinstance(value, list):
+                return [shape_value(key, i) for i in value]
+
+            if isinstance(value, str) and key.endswith("condition"):
+                return self.fingerprint_statement(value)[1]
+
+            if isinstance(value, str):
+                return STRING_LITERAL_PATTERN.sub("?", value)
+
+            return value
+
+        return json.dumps(shape_value("", json.loads(plan)))
+
+
+    ################################################
+    #     6) Shape SQL Server Plan :               #
+    ################################################
+
+    def shape_showplan_xml(self, plan_xml):
+
+        '''
+
+        Functionality : Replacing the constant and parameter values of a SQL Server SHOWPLAN_XML plan with placeholders, so that no filter
+                        value of the statement gets stored with its plan.
+        :param plan_xml: The XML text of the plan.
+        :return: plan_xml
+
+        '''
+
+        return SHOWPLAN_VALUE_PATTERN.sub(lambda match: match.group(1) + '="?"', plan_xml)
+
+
+    ################################################
+    #     7) Get Slow Query Report :               #
+    ################################################
+
+    def get_slow_query_report(self, order_by="total", limit=50):
+
+        '''
+
+        Functionality : Ranking the recorded statement shapes by their total or 99th percentile execution time.
+        :param order_by: The ranking measure. Possible values are : "total" and "p99".
+        :param limit: The maximum number of statement shapes to be returned.
+        :return: report --> The list of statement shape dictionaries.
+
+        '''
+
+        if order_by not in ["total", "p99"]:
+            raise Exception("The slow queries can only be ranked by their total or p99 execution time.")
+
+        SLOW_QUERY_QUEUE.join()
+
+        if not os.path.exists(self.store_path):
+            return []
+
+        connection = self._connect()
+
+        try:
+            shapes = connection.execute("SELECT fingerprint, backend, table_name, shape, plan, plan_captured_at FROM query_shapes").fetchall()
+            executions = connection.execute("SELECT fingerprint, elapsed_seconds, row_count, executed_at FROM query_executions").fetchall()
+
+        finally:
+            connection.close()
+
+        shape_executions = {}
+
+        for fingerprint, elapsed_seconds, row_count, executed_at in executions:
+            shape_executions.setdefault(fingerprint, []).append((elapsed_seconds, row_count, executed_at))
+
+        report = []
+
+        for fingerprint, backend, table_name, shape, plan, plan_captured_at in shapes:
+
+            timings = shape_executions.get(fingerprint, [])
+
+            if len(timings) == 0:
+                continue
+
+            elapsed_values = sorted([i[0] for i in timings])
+            row_counts = [i[1] for i in timings if i[1] is not None and i[1] >= 0]
+
+            report.append({
+                "fingerprint": fingerprint,
+                "backend": backend,
+                "tableName": table_name,
+                "shape": shape,
+                "executions": len(elapsed_values),
+                "slowExecutions": len([i for i in elapsed_values if i >= self.threshold_seconds]),
+                "totalSeconds": round(sum(elapsed_values), 3),
+                "averageSeconds": round(sum(elapsed_values) / len(elapsed_values), 3),
+                "p99Seconds": round(self._percentile(elapsed_values, 0.99), 3),
+                "maxSeconds": round(elapsed_values[-1], 3),
+                "totalRows": sum(row_counts),
+                "lastSeen": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(max([i[2] for i in timings]))),
+                "plan": plan,
+                "planCapturedAt": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(plan_captured_at)) if plan_captured_at else ""
+            })
+
+        report.sort(key=lambda i: i["totalSeconds"] if order_by == "total" else i["p99Seconds"], reverse=True)
+
+        return report[:int(limit)]
+
+
+    ################################################
+    #     8) Percentile :                          #
+    ################################################
+
+    def _percentile(self, sorted_values, percentile):
+
+        '''
+
+        Functionality : Calculating the nearest rank percentile of the sorted values.
+        :param sorted_values: The ascending sorted list of values.
+        :param percentile: The percentile between 0 and 1.
+        :return: value
+
+        '''
+
+        return sorted_values[max(int(math.ceil(percentile * len(sorted_values))) - 1, 0)]
+
+
+    ################################################
+    #     9) Start Slow Query Writer :             #
+    ################################################
+
+    def _start_writer(self):
+
+        '''
+
+        Functionality : Starting the background thread writing the recorded executions into the store, unless it is already running.
+        :return: None
+
+        '''
+
+        global SLOW_QUERY_WRITER
+
+        with SLOW_QUERY_STORE_LOCK:
+
+            if SLOW_QUERY_WRITER is None or not SLOW_QUERY_WRITER.is_alive():
+                SLOW_QUERY_WRITER = threading.Thread(target=self._write_executions, name="slow-query-writer", daemon=True)
+                SLOW_QUERY_WRITER.start()
+
+
+    ################################################
+    #     10) Write Executions :                   #
+    ################################################
+
+    def _write_executions(self):
+
+        '''
+
+        Functionality : Writing the queued executions into their store over one long lived connection per store, committing every batch of
+                        queued executions at once and trimming the store to its most recent executions every SLOW_QUERY_TRIM_INTERVAL writes.
+        :return: None
+
+        '''
+
+        connections = {}
+        writes_since_trim = {}
+
+        while True:
+
+            items = [SLOW_QUERY_QUEUE.get()]
+
+            while len(items) < 500:
+
+                try:
+                    items.append(SLOW_QUERY_QUEUE.get_nowait())
+
+                except queue.Empty:
+                    break
+
+            try:
+
+                for store_path, max_executions, execution in items:
+
+                    if store_path not in connections:
+                        connections[store_path] = self._connect(store_path)
+                        writes_since_trim[store_path] = 0
+
+                    connection = connections[store_path]
+                    fingerprint, backend, table_name, shape, plan, elapsed_seconds, row_count, executed_at = execution
+
+                    connection.execute("INSERT OR IGNORE INTO query_shapes (fingerprint, backend, table_name, shape, plan, plan_captured_at) "
+                                       "VALUES (?, ?, ?, ?, NULL, NULL)", (fingerprint, backend, table_name, shape))
+
+                    if plan is not None:
+                        connection.execute("UPDATE query_shapes SET plan = ?, plan_captured_at = ? WHERE fingerprint = ?",
+                                           (plan, executed_at, fingerprint))
+
+                    cursor = connection.execute("INSERT INTO query_executions (fingerprint, elapsed_seconds, row_count, executed_at) "
+                                                "VALUES (?, ?, ?, ?)", (fingerprint, elapsed_seconds, row_count, executed_at))
+                    writes_since_trim[store_path] += 1
+
+                    if writes_since_trim[store_path] >= SLOW_QUERY_TRIM_INTERVAL:
+                        connection.execute("DELETE FROM query_executions WHERE id <= ?", (cursor.lastrowid - max_executions,))
+                        writes_since_trim[store_path] = 0
+
+                for connection in connections.values():
+                    connection.commit()
+
+            except Exception as e:
+
+                self.log_object.logToFile('error', 'The queries could not be written into the slow query log : ' + str(e))
+
+                for connection in connections.values():
+                    connection.close()
+
+                connections = {}
+
+            finally:
+
+                for item in items:
+                    SLOW_QUERY_QUEUE.task_done()
+
+
+    ################################################
+    #     11) Connect To Slow Query Store :        #
+    ################################################
+
+    def _connect(self, store_path=None):
+
+        '''
+
+        Functionality : Opening a connection to the SQLite store of the slow query log, creating its tables on the first connection of the
+                        process to the store.
+        :param store_path: The path of the store, the one of the application settings if not given.
+        :return: connection
+
+        '''
+
+        store_path = store_path or self.store_path
+
+        os.makedirs(os.path.dirname(store_path), exist_ok=True)
+
+        connection = sqlite3.connect(store_path, timeout=30)
+
+        with SLOW_QUERY_STORE_LOCK:
+
+            if store_path not in SLOW_QUERY_SCHEMAS:
+
+                connection.execute("CREATE TABLE IF NOT EXISTS query_shapes (fingerprint TEXT PRIMARY KEY, backend TEXT NOT NULL, "
+                                   "table_name TEXT NOT NULL, shape TEXT NOT NULL, plan TEXT, plan_captured_at REAL)")
+                connection.execute("CREATE TABLE IF NOT EXISTS query_executions (id INTEGER PRIMARY KEY AUTOINCREMENT, fingerprint TEXT NOT NULL, "
+                                   "elapsed_seconds REAL NOT NULL, row_count INTEGER, executed_at REAL NOT NULL)")
+                connection.commit()
+
+                SLOW_QUERY_SCHEMAS.add(store_path)
+
+        return connection
+
+##########################################################################################################################################
+#                                                 End Block : Slow Query Operation Functions :                                           #
+##########################################################################################################################################
@@ -18,7 +18,22 @@
 ##########################################################################################################################################
 
 from src.setup_logger import logger
+from src.query_operations import QueryOperations
+from src.cache_operations import CacheOperations, invalidates_cached_records
+from src.index_advisor_operations import IndexAdvisorOperations, records_filter_usage
+from src.metrics_operations import measures_phase
+from src.slow_query_operations import SlowQueryOperations
+from src.setup_config import config
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import math
 import pyodbc
+import queue
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+
+SHOWPLAN_NAMESPACE = {"showplan": "http://schemas.microsoft.com/sqlserver/2004/07/showplan"}
 
 ##########################################################################################################################################
 #                                                 End Block : Importing Libraries & Initializing Variables :                             #
@@ -35,6 +50,7 @@ class MicrosoftSQLServerOperations :
     #     1) Initialising Function :               #
     ################################################
 
+    @measures_phase("sqlserver", "connect")
     def __init__(self,username,password,db_name,server_name):
 
         '''
@@ -55,13 +71,18 @@ class MicrosoftSQLServerOperations :
         self.log_object = logger()
         self.log_object.logToFile('info','Establishing connection to the Microsoft SQL Server database....')
 
+        config_object = config()
+        self.query_timeout = config_object.getValue("QUERY_TIMEOUT_SECONDS")
+        self.export_timeout = config_object.getValue("EXPORT_TIMEOUT_SECONDS")
+
         try:
 
             if username == "" and password == "":
-                self.conn = pyodbc.connect(r'Driver=SQL Server;Server='+server_name+r';Trusted_Connection=yes;',autocommit=True)
+                self.connection_string = r'Driver=SQL Server;Server='+server_name+r';Trusted_Connection=yes;'
             else:
-                self.conn = pyodbc.connect(r'Driver=SQL Server;Server= {0} ;UID = {1}; PWD ={2};Trusted_Connection=yes;'.format(server_name,username,password),
-                                           autocommit=True)
+                self.connection_string = r'Driver=SQL Server;Server= {0} ;UID = {1}; PWD ={2};Trusted_Connection=yes;'.format(server_name,username,password)
+
+            self.conn = pyodbc.connect(self.connection_string,autocommit=True)
 
             self.cursor = self.conn.cursor()
             sql_query = "SELECT * FROM sys.databases WHERE name = '{0}'".format(self.db_name)
@@ -84,6 +105,8 @@ class MicrosoftSQLServerOperations :
     #     2) Creating Table :                      #
     ################################################
 
+    @measures_phase("sqlserver", "query")
+    @invalidates_cached_records
     def create_table(self,table_name,fields_dict):
 
         '''
@@ -133,6 +156,7 @@ class MicrosoftSQLServerOperations :
     #     3) Generating Table Schema :             #
     ################################################
 
+    @measures_phase("sqlserver", "schema lookup")
     def generate_schema(self,table_name):
 
         '''
@@ -169,6 +193,8 @@ class MicrosoftSQLServerOperations :
     #     4) Insert Single Record :                #
     ################################################
 
+    @measures_phase("sqlserver", "query")
+    @invalidates_cached_records
     def insert_into_table_single_record(self, table_name, insert_fields):
 
         '''
@@ -218,6 +244,8 @@ class MicrosoftSQLServerOperations :
     #     5) Insert Multiple Records :             #
     ################################################
 
+    @measures_phase("sqlserver", "query")
+    @invalidates_cached_records
     def insert_into_table_multiple_records(self, table_name, headers, values):
 
         '''
@@ -293,7 +321,9 @@ class MicrosoftSQLServerOperations :
     #     6) Fetching Records From Collection :       #
     ###################################################
 
-    def select_records(self, table_name, conditional_fields, rowLimit):
+    @measures_phase("sqlserver", "query")
+    @records_filter_usage("conditional_fields")
+    def select_records(self, table_name, conditional_fields, rowLimit, fetch_size=None):
 
         '''
 
@@ -301,7 +331,8 @@ class MicrosoftSQLServerOperations :
         :param table_name: The name of the table in the database from where the records need to be fetched.
         :param conditional_fields: The dictionary of conditional fields to be checked while fetching the records, if required.
         :param rowLimit: The row limit defining the number of records to be returned from the table.
-        :return: headers, results
+        :param fetch_size: The number of rows to be fetched per batch, if the records need to be fetched in batches.
+        :return: headers, results --> The results are returned as a generator of row batches when a fetch size is given.
 
         '''
 
@@ -367,11 +398,22 @@ class MicrosoftSQLServerOperations :
         self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
         self.log_object.logToFile('debug', 'Executing the query....')
 
+        self.cursor = self._apply_statement_timeout(self.conn, self.export_timeout)
+
+        start_time = time.perf_counter()
         self.cursor.execute(sql_query)
 
-        results = list(self.cursor.fetchall())
         headers = [i[0] for i in self.cursor.description]
 
+        if fetch_size is not None:
+            return headers, self._generate_record_batches(int(fetch_size),
+                                                          lambda row_count, end_time: self._record_slow_query(table_name, sql_query, start_time, row_count,
+                                                                                                     end_time=end_time))
+
+        results = list(self.cursor.fetchall())
+
+        self._record_slow_query(table_name, sql_query, start_time, len(results))
+
         self.log_object.logToFile('info', 'Closing the database connection....')
         self.conn.close()
 
@@ -382,6 +424,9 @@ class MicrosoftSQLServerOperations :
     #     7) Deleting Records :                       #
     ###################################################
 
+    @measures_phase("sqlserver", "query")
+    @records_filter_usage("conditional_fields")
+    @invalidates_cached_records
     def delete_records(self,table_name, conditional_fields):
 
         '''
@@ -395,65 +440,24 @@ class MicrosoftSQLServerOperations :
 
         self.log_object.logToFile('info', 'Deleting data from the table : ' + table_name)
 
-        initial_string = "DELETE FROM " + table_name
-
-        if len(conditional_fields) == 0:
-            conditional_string = ""
-
-        else:
-            conditional_string = " WHERE "
-
-            for idx, condition in enumerate(conditional_fields):
-
-                conditional_string += condition[0].strip() + " "
-
-                if condition[1].lower() == "equals":
-                    conditional_operator = "="
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "not equals":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "greater than":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "greater than equals":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "less than":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "less than equals":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "like":
-                    conditional_operator = "LIKE"
-                    conditional_string += conditional_operator + " '%" + condition[2] + "%' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "in":
-                    conditional_operator = "IN({0})"
-                    value = ""
-                    for val in condition[2].split(","):
-                        value+=val.replace("'","").strip()+","
-                    value = value.rstrip(",")
-                    conditional_string += conditional_operator.format(str(value)) + \
-                                          condition[3] + " "
+        conditional_string, parameters = QueryOperations().build_sql_conditional_string(conditional_fields, "?")
 
         self.log_object.logToFile('debug', 'Creating the SQL Query....')
 
-        sql_query = initial_string + conditional_string
+        sql_query = "DELETE FROM " + table_name
+
+        if conditional_string != "":
+            sql_query += " WHERE " + conditional_string
 
         self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
         self.log_object.logToFile('debug', 'Executing the query....')
 
-        self.cursor.execute(sql_query)
+        start_time = time.perf_counter()
+        self.cursor.execute(sql_query, *parameters)
         self.conn.commit()
 
+        self._record_slow_query(table_name, sql_query, start_time, self.cursor.rowcount, parameters)
+
         self.log_object.logToFile('info', 'Closing the database connection....')
         self.conn.close()
 
@@ -462,6 +466,9 @@ class MicrosoftSQLServerOperations :
     #     8) Updating Records :                       #
     ###################################################
 
+    @measures_phase("sqlserver", "query")
+    @records_filter_usage("conditional_fields")
+    @invalidates_cached_records
     def update_table(self,table_name, fields_to_be_updated, conditional_fields):
 
         '''
@@ -476,88 +483,755 @@ class MicrosoftSQLServerOperations :
 
         self.log_object.logToFile('info', 'Updating table data : ' + table_name)
 
-        initial_string = "UPDATE " + table_name
+        update_fields = [i for i in fields_to_be_updated.keys() if fields_to_be_updated[i].lower() != "no change"]
 
-        update_string = " SET"
+        if len(update_fields) == 0:
+            self.conn.close()
+            raise Exception("At least one field needs to be provided with a new value for updating the records.")
 
-        for idx,element in enumerate(list(fields_to_be_updated.keys())):
+        update_string = ", ".join([i + " = ?" for i in update_fields])
+        conditional_string, parameters = QueryOperations().build_sql_conditional_string(conditional_fields, "?")
+        parameters = [fields_to_be_updated[i] for i in update_fields] + parameters
 
-            if fields_to_be_updated[element].lower() == "no change" :
-                continue
+        self.log_object.logToFile('debug', 'Creating the SQL Query....')
 
-            else :
+        sql_query = "UPDATE " + table_name + " SET " + update_string
 
-                update_string+= " "+element+" = '"+fields_to_be_updated[element]+"'"
+        if conditional_string != "":
+            sql_query += " WHERE " + conditional_string
 
-                if idx != len(list(fields_to_be_updated)):
-                    update_string+= ","
-                else :
-                    update_string += ""
+        self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
+        self.log_object.logToFile('debug', 'Executing the query....')
 
-            if update_string[-1] == "," :
+        start_time = time.perf_counter()
+        self.cursor.execute(sql_query, *parameters)
+        self.conn.commit()
 
-                update_string = update_string.rstrip(",")
+        self._record_slow_query(table_name, sql_query, start_time, self.cursor.rowcount, parameters)
+
+        self.log_object.logToFile('info', 'Closing the database connection....')
+        self.conn.close()
+
+
+    ###################################################
+    #     9) Fetching Primary Key Fields :            #
+    ###################################################
+
+    @measures_phase("sqlserver", "schema lookup")
+    def get_primary_key_fields(self, table_name):
+
+        '''
+
+        Functionality : Fetching the ordered list of the primary key fields of the given table.
+        :param table_name: The name of the table in the database whose primary key fields need to be fetched.
+        :return: key_fields
+
+        '''
+
+        self.log_object.logToFile('debug', 'Fetching the primary key fields of the table : ' + table_name)
+
+        sql_query = "SELECT KU.COLUMN_NAME FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS TC " \
+                    "JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE KU ON TC.CONSTRAINT_NAME = KU.CONSTRAINT_NAME AND TC.TABLE_NAME = KU.TABLE_NAME " \
+                    "WHERE TC.CONSTRAINT_TYPE = 'PRIMARY KEY' AND TC.TABLE_NAME = ? ORDER BY KU.ORDINAL_POSITION"
+
+        self.cursor.execute(sql_query, table_name)
+
+        return [row[0] for row in self.cursor.fetchall()]
+
+
+    ###################################################
+    #     10) Browsing Records Page Wise :            #
+    ###################################################
+
+    @measures_phase("sqlserver", "query")
+    def browse_records(self, table_name, conditional_fields, page_size, continuation_token):
+
+        '''
+
+        Functionality : Fetching a single page of records from the specified table using keyset pagination on the primary key, so that
+                        every page costs the same as the first one.
+        :param table_name: The name of the table in the database from where the records need to be fetched.
+        :param conditional_fields: The list of conditional fields to be checked while fetching the records, if required.
+        :param page_size: The number of records to be returned in the page.
+        :param continuation_token: The continuation token returned with the previous page, or an empty string for the first page.
+        :return: headers, results, next_token --> The next token is None when the last page has been reached.
+
+        '''
+
+        self.log_object.logToFile('info', 'Browsing table data from the table : ' + table_name)
+
+        try:
+
+            query_object = QueryOperations()
+
+            key_fields = self.get_primary_key_fields(table_name)
+
+            if len(key_fields) == 0:
+                raise Exception("The table " + table_name + " does not have a primary key to paginate on.")
+
+            fingerprint = query_object.generate_query_fingerprint("Microsoft SQL Server", self.server_name, self.db_name, table_name, conditional_fields)
+
+            conditional_string, parameters = query_object.build_sql_conditional_string(conditional_fields, "?")
+
+            where_clauses = []
+
+            if conditional_string != "":
+                where_clauses.append("(" + conditional_string + ")")
+
+            if continuation_token != "":
+                last_values = query_object.decode_continuation_token(fingerprint, continuation_token)
+                keyset_string, keyset_parameters = query_object.build_keyset_condition(key_fields, last_values, "?")
+                where_clauses.append(keyset_string)
+                parameters.extend(keyset_parameters)
+
+            self.log_object.logToFile('debug', 'Creating the SQL Query....')
+
+            sql_query = "SELECT TOP " + str(int(page_size) + 1) + " * FROM " + table_name
+
+            if len(where_clauses) > 0:
+                sql_query += " WHERE " + " AND ".join(where_clauses)
+
+            sql_query += " ORDER BY " + ",".join(key_fields)
+
+            self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
+            self.log_object.logToFile('debug', 'Executing the query....')
+
+            self.cursor = self._apply_statement_timeout(self.conn, self.query_timeout)
+            self.cursor.execute(sql_query, *parameters)
+
+            results = list(self.cursor.fetchall())
+            headers = [i[0] for i in self.cursor.description]
+
+            next_token = None
+
+            if len(results) > int(page_size):
+                results = results[:int(page_size)]
+                key_indexes = [headers.index(i) for i in key_fields]
+                next_token = query_object.encode_continuation_token(fingerprint, [results[-1][i] for i in key_indexes])
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+        return headers, results, next_token
 
-        if len(conditional_fields) == 0:
-            conditional_string = ""
+
+    ###################################################
+    #     11) Exporting Records By Key Ranges :       #
+    ###################################################
+
+    @measures_phase("sqlserver", "query")
+    def export_records_key_ranges(self, table_name, conditional_fields, key_field, partition_count, worker_count, fetch_size=5000):
+
+        '''
+
+        Functionality : Exporting all the records of the specified table by splitting the key into ranges and reading them in parallel, each
+                        range on its own pooled connection, so that the export scales with the number of connections allowed.
+        :param table_name: The name of the table in the database from where the records need to be exported.
+        :param conditional_fields: The list of conditional fields to be checked while exporting the records, if required.
+        :param key_field: The integer or ordered key field the ranges are defined on. The first primary key field is used if empty.
+        :param partition_count: The number of key ranges to be created.
+        :param worker_count: The maximum number of key ranges read in parallel.
+        :param fetch_size: The number of records fetched per batch within a key range.
+        :return: headers, batches --> The batches are a generator of record lists, one per fetched batch, in key order.
+
+        '''
+
+        self.log_object.logToFile('info', 'Exporting table data by key ranges from the table : ' + table_name)
+
+        query_object = QueryOperations()
+
+        if key_field == "":
+
+            key_fields = self.get_primary_key_fields(table_name)
+
+            if len(key_fields) == 0:
+                self.conn.close()
+                raise Exception("The table " + table_name + " does not have a primary key, please provide the key field to partition on.")
+
+            key_field = key_fields[0]
+
+        conditional_string, parameters = query_object.build_sql_conditional_string(conditional_fields, "?")
+
+        where_string = " WHERE (" + conditional_string + ")" if conditional_string != "" else ""
+
+        self.cursor = self._apply_statement_timeout(self.conn, self.export_timeout)
+        self.cursor.execute("SELECT TOP 0 * FROM " + table_name)
+        headers = [i[0] for i in self.cursor.description]
+
+        self.log_object.logToFile('debug', 'Fetching the key range of the field : ' + key_field + '....')
+
+        self.cursor.execute("SELECT MIN(" + key_field + "), MAX(" + key_field + ") FROM " + table_name + where_string, *parameters)
+        min_value, max_value = self.cursor.fetchone()
+
+        if min_value is None:
+            boundaries = []
+
+        elif isinstance(min_value, int) and isinstance(max_value, int) and not isinstance(min_value, bool):
+            boundaries = query_object.split_integer_key_range(min_value, max_value, partition_count)
 
         else:
-            conditional_string = " WHERE "
 
-            for idx, condition in enumerate(conditional_fields):
+            self.log_object.logToFile('debug', 'The key field is not an integer, sampling the range boundaries....')
 
-                conditional_string += condition[0].strip() + " "
+            self.cursor.execute("SELECT COUNT_BIG(*) FROM " + table_name + where_string, *parameters)
+            record_count = self.cursor.fetchone()[0]
 
-                if condition[1].lower() == "equals":
-                    conditional_operator = "="
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "not equals":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "greater than":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "greater than equals":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "less than":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "less than equals":
-                    conditional_operator = "<>"
-                    conditional_string += conditional_operator + " '" + condition[2] + "' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "like":
-                    conditional_operator = "LIKE"
-                    conditional_string += conditional_operator + " '%" + condition[2] + "%' " + \
-                                          condition[3] + " "
-                elif condition[1].lower() == "in":
-                    conditional_operator = "IN({0})"
-                    value = ""
-                    for val in condition[2].split(","):
-                        value+=val.replace("'","").strip()+","
-                    value = value.rstrip(",")
-                    conditional_string += conditional_operator.format(str(value)) + \
-                                          condition[3] + " "
+            boundaries = []
 
-        self.log_object.logToFile('debug', 'Creating the SQL Query....')
+            for partition_idx in range(1, int(partition_count)):
 
-        sql_query = initial_string + update_string + conditional_string
+                self.cursor.execute("SELECT " + key_field + " FROM " + table_name + where_string + " ORDER BY " + key_field +
+                                    " OFFSET " + str(record_count * partition_idx // int(partition_count)) + " ROWS FETCH NEXT 1 ROWS ONLY",
+                                    *parameters)
+                boundary = self.cursor.fetchone()
 
-        self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
-        self.log_object.logToFile('debug', 'Executing the query....')
+                if boundary is not None and (len(boundaries) == 0 or boundary[0] > boundaries[-1]):
+                    boundaries.append(boundary[0])
 
-        self.cursor.execute(sql_query)
-        self.conn.commit()
+        range_queries = []
+
+        for range_string, range_parameters in query_object.build_key_range_conditions(key_field, boundaries, "?"):
+
+            sql_query = "SELECT * FROM " + table_name + " WHERE " + \
+                        ("(" + conditional_string + ") AND " if conditional_string != "" else "") + \
+                        "(" + range_string + ") ORDER BY " + key_field
+
+            range_queries.append((sql_query, parameters + range_parameters))
+
+        self.log_object.logToFile('debug', 'The key got split into ' + str(len(range_queries)) + ' ranges, first range query : ' + range_queries[0][0])
 
         self.log_object.logToFile('info', 'Closing the database connection....')
         self.conn.close()
 
+        return headers, self._generate_key_range_batches(range_queries, int(worker_count), int(fetch_size))
+
+
+    ###################################################
+    #     12) Generating Key Range Batches :          #
+    ###################################################
+
+    def _generate_key_range_batches(self, range_queries, worker_count, fetch_size):
+
+        '''
+
+        Functionality : Reading the key ranges on a bounded pool of worker threads, each using its own connection taken from the ODBC driver
+                        manager pool, and generating the records batch by batch in key order. Every range hands its batches over through a
+                        queue bounded to two batches, so the ranges read ahead of the one being generated wait instead of piling up in
+                        memory. When the generator gets closed early, such as on a client disconnect, the range queries still running get
+                        cancelled so that their connections go back to the pool.
+        :param range_queries: The list of (SQL query, parameters) tuples, one per key range, in key order.
+        :param worker_count: The maximum number of key ranges read in parallel.
+        :param fetch_size: The number of records fetched per batch within a key range.
+        :return: generator --> Yields the record list of every fetched batch.
+
+        '''
+
+        running_cursors = set()
+        reads_stopped = threading.Event()
+
+        def put_batch(range_queue, item):
+
+            while not reads_stopped.is_set():
+
+                try:
+                    range_queue.put(item, timeout=0.5)
+                    return True
+
+                except queue.Full:
+                    continue
+
+            return False
+
+        def read_key_range(range_queue, range_query):
+
+            try:
+
+                if reads_stopped.is_set():
+                    return
+
+                connection = pyodbc.connect(self.connection_string, autocommit=True)
+
+                try:
+                    cursor = self._apply_statement_timeout(connection, self.export_timeout)
+                    cursor.execute("USE " + self.db_name)
+
+                    running_cursors.add(cursor)
+
+                    try:
+                        cursor.execute(range_query[0], *range_query[1])
+
+                        while True:
+
+                            batch = cursor.fetchmany(fetch_size)
+
+                            if len(batch) == 0:
+                                break
+
+                            if not put_batch(range_queue, ("batch", batch)):
+                                return
+
+                    finally:
+                        running_cursors.discard(cursor)
+
+                finally:
+                    connection.close()
+
+                put_batch(range_queue, ("done", None))
+
+            except Exception as e:
+                put_batch(range_queue, ("error", e))
+
+        executor = ThreadPoolExecutor(max_workers=worker_count)
+        pending_queries = deque(range_queries)
+        running_queues = deque()
+
+        try:
+
+            while len(pending_queries) > 0 or len(running_queues) > 0:
+
+                while len(pending_queries) > 0 and len(running_queues) < worker_count:
+
+                    range_queue = queue.Queue(maxsize=2)
+                    executor.submit(read_key_range, range_queue, pending_queries.popleft())
+                    running_queues.append(range_queue)
+
+                item_type, item_value = running_queues[0].get()
+
+                if item_type == "error":
+                    raise item_value
+
+                elif item_type == "done":
+                    running_queues.popleft()
+
+                else:
+                    yield item_value
+
+            self.log_object.logToFile('info', 'All the key ranges got exported successfully....')
+
+        except GeneratorExit:
+
+            for running_cursor in list(running_cursors):
+                self._cancel_running_query(running_cursor)
+
+            raise
+
+        finally:
+
+            reads_stopped.set()
+            executor.shutdown(wait=True)
+
+
+    ###################################################
+    #     13) Generating Record Batches :             #
+    ###################################################
+
+    def _generate_record_batches(self, fetch_size, record_query=None):
+
+        '''
+
+        Functionality : Fetching the rows of the executed query batch by batch with fetchmany, closing the database connection once all the
+                        batches got fetched or the generator got closed. When the generator gets closed early, such as on a client disconnect,
+                        the query gets cancelled first so that the server stops producing its rows.
+        :param fetch_size: The number of rows to be fetched per batch.
+        :param record_query: The function recording the query in the slow query log with the fetched row count and the performance counter
+                             value from when the first batch got fetched, if required.
+        :return: generator --> Yields the row list of every batch.
+
+        '''
+
+        try:
+
+            row_count = 0
+            first_batch_time = None
+
+            while True:
+
+                batch = self.cursor.fetchmany(fetch_size)
+
+                if first_batch_time is None:
+                    first_batch_time = time.perf_counter()
+
+                if len(batch) == 0:
+                    break
+
+                row_count += len(batch)
+
+                yield batch
+
+            self.log_object.logToFile('info', 'All the record batches got fetched successfully....')
+
+            if record_query is not None:
+                record_query(row_count, first_batch_time)
+
+        except GeneratorExit:
+
+            self._cancel_running_query(self.cursor)
+            raise
+
+        finally:
+
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+
+    ###################################################
+    #     14) Fetching Cached Records :               #
+    ###################################################
+
+    def select_cached_records(self, table_name, conditional_fields, rowLimit):
+
+        '''
+
+        Functionality : Fetching the records in the same way as select_records, serving them from the query result cache when the same
+                        user ran the same query before and caching them otherwise. The cached results are kept per user, so that nobody
+                        gets served the rows of a table they have no grant to read.
+        :param table_name: The name of the table in the database from where the records need to be fetched.
+        :param conditional_fields: The dictionary of conditional fields to be checked while fetching the records, if required.
+        :param rowLimit: The row limit defining the number of records to be returned from the table.
+        :return: headers, results
+
+        '''
+
+        cache_object = CacheOperations()
+        table_key = self._get_cache_table_key(table_name)
+        fingerprint = QueryOperations().generate_query_fingerprint(table_key, self.username, conditional_fields, rowLimit)
+
+        cached_result = cache_object.get_records(fingerprint)
+
+        if cached_result is not None:
+
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+            return cached_result
+
+        generation = cache_object.get_table_generation(table_key)
+        headers, results = self.select_records(table_name, conditional_fields, rowLimit)
+        cache_object.put_records(fingerprint, table_key, (headers, [tuple(i) for i in results]), generation)
+
+        return headers, results
+
+
+    ###################################################
+    #     15) Fetching Cache Table Key :              #
+    ###################################################
+
+    def _get_cache_table_key(self, table_name):
+
+        '''
+
+        Functionality : Generating the key identifying the given table in the query result cache.
+        :param table_name: The name of the table.
+        :return: table_key
+
+        '''
+
+        return CacheOperations().generate_table_key("sqlserver", self.server_name, self.db_name, table_name)
+
+
+    ###################################################
+    #     16) Previewing Records :                    #
+    ###################################################
+
+    @measures_phase("sqlserver", "query")
+    def preview_records(self, table_name, conditional_fields):
+
+        '''
+
+        Functionality : Estimating the number of records matched by the conditions and the cost of reading them from the estimated execution
+                        plan (SHOWPLAN_XML) of the query, without running the query itself.
+        :param table_name: The name of the table in the database whose records need to be previewed.
+        :param conditional_fields: The dictionary of conditional fields to be checked, if required.
+        :return: preview --> The dictionary of estimatedRows, isLowerBound, estimatedCost, accessMethod and plan.
+
+        '''
+
+        self.log_object.logToFile('info', 'Previewing table data from the table : ' + table_name)
+
+        conditional_string, parameters = QueryOperations().build_sql_conditional_string(conditional_fields, "?")
+
+        sql_query = "SELECT * FROM " + table_name
+
+        if conditional_string != "":
+            sql_query += " WHERE " + conditional_string
+
+        self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
+        self.log_object.logToFile('debug', 'Fetching the estimated execution plan of the query....')
+
+        try:
+
+            self.cursor.execute("SET SHOWPLAN_XML ON")
+
+            try:
+                self.cursor.execute(sql_query, *parameters)
+                plan_xml = self.cursor.fetchone()[0]
+
+            finally:
+                self.cursor.execute("SET SHOWPLAN_XML OFF")
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+        plan_root = ElementTree.fromstring(plan_xml)
+        statement = plan_root.find(".//showplan:StmtSimple", SHOWPLAN_NAMESPACE)
+        operation = plan_root.find(".//showplan:RelOp", SHOWPLAN_NAMESPACE)
+
+        if statement is None:
+            raise Exception("The estimated execution plan of the query could not be read.")
+
+        return {
+            "estimatedRows": float(statement.get("StatementEstRows", 0)),
+            "isLowerBound": False,
+            "estimatedCost": float(statement.get("StatementSubTreeCost", 0)),
+            "accessMethod": operation.get("PhysicalOp", "") if operation is not None else "",
+            "plan": plan_xml
+        }
+
+
+    ###################################################
+    #     17) Aggregating Records :                   #
+    ###################################################
+
+    @measures_phase("sqlserver", "query")
+    def aggregate_records(self, table_name, conditional_fields, group_fields, aggregations):
+
+        '''
+
+        Functionality : Computing the aggregations for every group of the records matching the conditions through a GROUP BY query, so that
+                        only the aggregated rows get transferred from the database.
+        :param table_name: The name of the table in the database whose records need to be aggregated.
+        :param conditional_fields: The dictionary of conditional fields to be checked while aggregating the records, if required.
+        :param group_fields: The list of the fields to group the records by.
+        :param aggregations: The list of (function, field, alias) aggregation tuples.
+        :return: headers, results
+
+        '''
+
+        self.log_object.logToFile('info', 'Aggregating table data from the table : ' + table_name)
+
+        query_object = QueryOperations()
+        conditional_string, parameters = query_object.build_sql_conditional_string(conditional_fields, "?")
+        select_string, group_string = query_object.build_sql_aggregation_string(group_fields, aggregations, "FLOAT")
+
+        sql_query = "SELECT " + select_string + " FROM " + table_name
+
+        if conditional_string != "":
+            sql_query += " WHERE " + conditional_string
+
+        if group_string != "":
+            sql_query += " GROUP BY " + group_string + " ORDER BY " + group_string
+
+        self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
+        self.log_object.logToFile('debug', 'Executing the query....')
+
+        try:
+            self.cursor = self._apply_statement_timeout(self.conn, self.query_timeout)
+            self.cursor.execute(sql_query, *parameters)
+
+            headers = [i[0] for i in self.cursor.description]
+            results = [list(i) for i in self.cursor.fetchall()]
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+        self.log_object.logToFile('info', str(len(results)) + ' aggregated rows got fetched from the SQL Server database....')
+
+        return headers, results
+
+
+
+    ###################################################
+    #     18) Creating Index :                        #
+    ###################################################
+
+    @measures_phase("sqlserver", "query")
+    def create_index(self, table_name, index_name, index_fields, unique=False):
+
+        '''
+
+        Functionality : Creating an index on the given fields of the table, so that the filters on them do not need to scan the whole table.
+        :param table_name: The name of the table in the database where the index needs to be created.
+        :param index_name: The name of the index.
+        :param index_fields: The ordered list of the fields to be indexed.
+        :param unique: Whether the index needs to enforce unique values.
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('info', 'Creating index : ' + index_name + ' on the table : ' + table_name)
+
+        try:
+
+            if len(index_fields) == 0:
+                raise Exception("At least one field is required for creating an index.")
+
+            sql_query = "CREATE " + ("UNIQUE " if unique else "") + "INDEX " + index_name + " ON " + table_name + " (" + ", ".join(index_fields) + ")"
+
+            self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
+            self.log_object.logToFile('debug', 'Executing the query....')
+
+            self.cursor.execute(sql_query)
+            self.conn.commit()
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+        IndexAdvisorOperations().record_index(*self._get_index_advisor_table(table_name), index_name, index_fields)
+
+        self.log_object.logToFile('info', 'The index has been created in the SQL Server database....')
+
+
+    ###################################################
+    #     19) Dropping Index :                        #
+    ###################################################
+
+    @measures_phase("sqlserver", "query")
+    def drop_index(self, table_name, index_name):
+
+        '''
+
+        Functionality : Dropping an index from the table.
+        :param table_name: The name of the table in the database the index belongs to.
+        :param index_name: The name of the index.
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('info', 'Dropping index : ' + index_name + ' from the table : ' + table_name)
+
+        sql_query = "DROP INDEX " + index_name + " ON " + table_name
+
+        self.log_object.logToFile('debug', 'SQL query got created as : ' + sql_query)
+        self.log_object.logToFile('debug', 'Executing the query....')
+
+        try:
+            self.cursor.execute(sql_query)
+            self.conn.commit()
+
+        finally:
+            self.log_object.logToFile('info', 'Closing the database connection....')
+            self.conn.close()
+
+        IndexAdvisorOperations().remove_index(*self._get_index_advisor_table(table_name), index_name)
+
+        self.log_object.logToFile('info', 'The index has been dropped from the SQL Server database....')
+
+
+    ###################################################
+    #     20) Fetching Index Advisor Table :          #
+    ###################################################
+
+    def _get_index_advisor_table(self, table_name):
+
+        '''
+
+        Functionality : Fetching the backend and the name identifying the table in the index advisor, without any connection credentials.
+        :param table_name: The name of the table.
+        :return: backend, advisor_table
+
+        '''
+
+        return "sqlserver", self.server_name + "/" + self.db_name + "." + table_name
+
+
+    ###################################################
+    #     21) Recording Slow Query :                  #
+    ###################################################
+
+    def _record_slow_query(self, table_name, sql_query, start_time, row_count, parameters=None, end_time=None):
+
+        '''
+
+        Functionality : Recording the executed query in the slow query log, capturing its plan over the still open connection when it was
+                        slower than the threshold.
+        :param table_name: The name of the table the query ran on.
+        :param sql_query: The executed SQL query.
+        :param start_time: The performance counter value from before the query got executed.
+        :param row_count: The number of rows returned or affected by the query.
+        :param parameters: The parameters of the query, if any.
+        :param end_time: The performance counter value up to which the query gets timed, the current one if not given. A streamed query is
+                         timed up to its first batch, so that the time the client takes to download the rows is left out.
+        :return: None
+
+        '''
+
+        SlowQueryOperations().record_query(*self._get_index_advisor_table(table_name), sql_query, (end_time or time.perf_counter()) - start_time, row_count,
+                                           lambda: self._explain_statement(sql_query, parameters))
+
+
+    ###################################################
+    #     22) Explaining Statement :                  #
+    ###################################################
+
+    def _explain_statement(self, sql_query, parameters=None):
+
+        '''
+
+        Functionality : Fetching the estimated execution plan of a statement without executing it.
+        :param sql_query: The SQL statement to be explained.
+        :param parameters: The parameters of the statement, if any.
+        :return: plan
+
+        '''
+
+        self.cursor.execute("SET SHOWPLAN_XML ON")
+
+        try:
+            self.cursor.execute(sql_query, *(parameters or []))
+            return SlowQueryOperations().shape_showplan_xml(self.cursor.fetchone()[0])
+
+        finally:
+            self.cursor.execute("SET SHOWPLAN_XML OFF")
+
+
+    ###################################################
+    #     23) Applying Statement Timeout :            #
+    ###################################################
+
+    def _apply_statement_timeout(self, connection, timeout_seconds):
+
+        '''
+
+        Functionality : Setting the query timeout of the connection, after which the driver cancels the running statement. As pyodbc applies
+                        the timeout to the cursors created afterwards, a new cursor of the connection gets returned.
+        :param connection: The connection the timeout applies to.
+        :param timeout_seconds: The timeout in seconds, or 0 to disable it.
+        :return: cursor
+
+        '''
+
+        connection.timeout = int(math.ceil(max(timeout_seconds, 0)))
+
+        return connection.cursor()
+
+
+    ###################################################
+    #     24) Cancelling Running Query :              #
+    ###################################################
+
+    def _cancel_running_query(self, cursor):
+
+        '''
+
+        Functionality : Cancelling the statement running on the cursor, which can be called from another thread than the one executing it. A
+                        failure only gets logged, the statement then running until its timeout.
+        :param cursor: The cursor whose statement needs to be cancelled.
+        :return: None
+
+        '''
+
+        self.log_object.logToFile('warn', 'Cancelling the query running on a Microsoft SQL Server connection as its results are no longer read....')
+
+        try:
+            cursor.cancel()
+
+        except Exception as e:
+            self.log_object.logToFile('error', 'The query running on a Microsoft SQL Server connection could not be cancelled : ' + str(e))
+
 ##########################################################################################################################################
 #                                                 End Block : Microsoft SQL Server Operation Functions :                                                #
 ##########################################################################################################################################